@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import re
 import subprocess
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -16,7 +18,7 @@ from urllib import request as url_request
 from urllib.parse import urlencode
 
 from kil_prompt import build_kil_prompt
-from review_kil_brain import review_kil_brain
+from review_kil_brain import review_kil_brain, review_record
 
 ROOT = Path(__file__).resolve().parent.parent
 DOCS_DIR = ROOT / "docs"
@@ -33,6 +35,9 @@ GEMINI_ENDPOINT = (
     "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?{query}"
 )
 LLM_RESPONSE_TEXT_PREVIEW = 1200
+BATCH_DEFAULT_WORKERS = 4
+# ASCII record/unit separators keep commit messages from breaking the batch log format.
+BATCH_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ae%x1f%ad%x1f%s%x1f%b%x1f"
 
 REDACT_PATTERNS = [
     re.compile(r"\bsk_live_[A-Za-z0-9]{16,}\b"),
@@ -157,8 +162,12 @@ def get_patch_excerpt(commit: str) -> str:
             commit,
         ]
     )
+    return _build_patch_excerpt(raw.splitlines())
+
+
+def _build_patch_excerpt(raw_lines: List[str]) -> str:
     lines = []
-    for line in raw.splitlines():
+    for line in raw_lines:
         if line.startswith("Binary files") or "GIT binary patch" in line:
             continue
         lines.append(line)
@@ -443,6 +452,12 @@ def fallback_record(commit: Dict[str, str], files: List[Dict[str, str]]) -> Dict
     }
 
 
+COMMIT_MARKER_RE = re.compile(
+    r"^##\s*\[\d{4}-\d{2}-\d{2}\]\s*Commit:\s*(\S+)(?:\s|$)",
+    re.M,
+)
+
+
 def commit_entry_exists_in_markdown(commit_hash: str) -> bool:
     if not BRAIN_MD.exists():
         return False
@@ -470,16 +485,59 @@ def commit_entry_exists_in_index(commit_hash: str) -> bool:
     return False
 
 
+def load_existing_commits() -> set[str]:
+    """Read the brain markdown and index once and return every recorded commit hash."""
+    existing: set[str] = set()
+    if BRAIN_MD.exists():
+        try:
+            text = BRAIN_MD.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            text = ""
+        existing.update(COMMIT_MARKER_RE.findall(text))
+    if BRAIN_INDEX.exists():
+        for line in BRAIN_INDEX.read_text(encoding="utf-8", errors="ignore").splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("commit"):
+                existing.add(str(record["commit"]))
+    return existing
+
+
+def _file_ends_with_newline(path: Path) -> bool:
+    try:
+        with path.open("rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except OSError:
+        return True
+
+
 def append_knowledge(
-    commit: Dict[str, str], record: Dict[str, Any], source: str = "llm"
-) -> None:
+    commit: Dict[str, str],
+    record: Dict[str, Any],
+    source: str = "llm",
+    existing: Optional[set[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Append one commit entry; returns the index record, or None when already recorded.
+
+    When ``existing`` is given it replaces the per-call rescans of the brain
+    files and is updated in place with the appended commit.
+    """
     DOCS_DIR.mkdir(parents=True, exist_ok=True)
 
     commit_hash = commit.get("hash", "unknown")
-    if commit_entry_exists_in_markdown(commit_hash) or commit_entry_exists_in_index(
+    if existing is not None:
+        if commit_hash in existing:
+            return None
+    elif commit_entry_exists_in_markdown(commit_hash) or commit_entry_exists_in_index(
         commit_hash
     ):
-        return
+        return None
 
     ts = commit.get("date") or datetime.now(timezone.utc).isoformat()
     date_match = re.search(r"\b(20\d{2}-\d{2}-\d{2})\b", ts)
@@ -499,11 +557,10 @@ def append_knowledge(
         "",
     ]
 
+    needs_newline = BRAIN_MD.exists() and not _file_ends_with_newline(BRAIN_MD)
     with BRAIN_MD.open("a", encoding="utf-8", newline="\n") as f:
-        if BRAIN_MD.exists():
-            existing = BRAIN_MD.read_text(encoding="utf-8", errors="ignore")
-            if existing and not existing.endswith("\n"):
-                f.write("\n")
+        if needs_newline:
+            f.write("\n")
         f.write("\n".join(markdown_lines))
 
     index_record = {
@@ -522,6 +579,9 @@ def append_knowledge(
     }
     with BRAIN_INDEX.open("a", encoding="utf-8", newline="\n") as f:
         f.write(json.dumps(index_record, ensure_ascii=False) + "\n")
+    if existing is not None:
+        existing.add(commit_hash)
+    return index_record
 
 
 def log_error(commit_hash: Optional[str], stage: str, error_obj: BaseException) -> None:
@@ -541,7 +601,12 @@ def analyze(commit: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
     metadata = get_commit_metadata(commit)
     files = get_changed_files(commit)
     patch = get_patch_excerpt(commit)
+    return metadata, analyze_context(metadata, files, patch)
+
 
+def analyze_context(
+    metadata: Dict[str, str], files: List[Dict[str, str]], patch: str
+) -> Dict[str, Any]:
     context = {
         "commit": metadata,
         "changed_files": files,
@@ -551,11 +616,146 @@ def analyze(commit: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
     raw = call_gemini(prompt)
     normalized = coerce_result(raw)
     normalized["scope"] = normalized.get("scope") or infer_scope(files)
-    return metadata, normalized
+    return normalized
+
+
+def collect_commit_batch(rev_range: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Gather metadata, changed files and patch excerpts for a commit range in one git call.
+
+    Commits are returned oldest first. Merge commits carry no patch, as with
+    ``git log -p``.
+    """
+    args = [
+        "log",
+        "--reverse",
+        "--no-color",
+        "--date=iso-strict",
+        "--patch",
+        "--raw",
+        "--find-renames",
+        "--unified=3",
+        f"--format={BATCH_LOG_FORMAT}",
+    ]
+    # --max-count is applied before --reverse, so --limit trims after parsing.
+    raw = run_git([*args, rev_range, "--"])
+    commits: List[Dict[str, Any]] = []
+    for chunk in raw.split("\x1e"):
+        if not chunk.strip():
+            continue
+        fields = chunk.split("\x1f", 6)
+        if len(fields) < 7:
+            raise RuntimeError("commit batch format is unexpected")
+        commit_hash, author, email, date, subject, body, rest = fields
+        metadata = {
+            "hash": commit_hash.strip(),
+            "author": author,
+            "email": email,
+            "date": date,
+            "subject": subject,
+            "body": body.strip(),
+        }
+        files: List[Dict[str, str]] = []
+        patch_lines: List[str] = []
+        in_patch = False
+        for line in rest.splitlines():
+            if not in_patch and line.startswith(":"):
+                cols = line.split("\t")
+                status = cols[0].split()[-1] if cols[0].split() else ""
+                files.append({"status": status, "path": cols[-1].strip()})
+                continue
+            if line.startswith("diff "):
+                in_patch = True
+            if in_patch:
+                patch_lines.append(line)
+        commits.append(
+            {
+                "metadata": metadata,
+                "files": files,
+                "patch": _build_patch_excerpt(patch_lines),
+            }
+        )
+    if limit is not None and limit >= 0:
+        commits = commits[-limit:] if limit else []
+    return commits
+
+
+def _analyze_batch_item(item: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    metadata = item["metadata"]
+    try:
+        return analyze_context(metadata, item["files"], item["patch"]), "llm"
+    except Exception as exc:
+        log_error(metadata.get("hash"), "analyze", exc)
+        return fallback_record(metadata, item["files"]), "fallback"
+
+
+def run_batch(rev_range: str, *, workers: int = BATCH_DEFAULT_WORKERS, limit: Optional[int] = None) -> Dict[str, int]:
+    """Backfill knowledge for every commit in ``rev_range`` not yet recorded.
+
+    Model calls run concurrently (bounded by ``workers``); entries are appended
+    in commit order, oldest first.
+    """
+    existing = load_existing_commits()
+    batch = [
+        item
+        for item in collect_commit_batch(rev_range, limit=limit)
+        if item["metadata"]["hash"] not in existing
+    ]
+    counts = {"pending": len(batch), "appended": 0, "fallback": 0, "failed": 0}
+    if not batch:
+        return counts
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        # map() yields in submission order, so appends stay in commit order
+        # while later commits are still being analyzed.
+        for item, (record, source) in zip(batch, pool.map(_analyze_batch_item, batch)):
+            commit_hash = item["metadata"]["hash"]
+            try:
+                index_record = append_knowledge(item["metadata"], record, source=source, existing=existing)
+            except Exception as exc:
+                log_error(commit_hash, "append_knowledge", exc)
+                counts["failed"] += 1
+                continue
+            if index_record is None:
+                continue
+            counts["appended"] += 1
+            if source == "fallback":
+                counts["fallback"] += 1
+            try:
+                review_record(index_record)
+            except Exception as exc:
+                log_error(commit_hash, "review_kil_brain", exc)
+    return counts
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="KIL commit analyzer")
+    parser.add_argument(
+        "--range",
+        dest="rev_range",
+        help="analyze every commit in a git revision range (e.g. v1.0..HEAD) instead of HEAD only",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BATCH_DEFAULT_WORKERS,
+        help="concurrent model calls in --range mode",
+    )
+    parser.add_argument("--limit", type=int, help="only analyze the newest N commits of --range")
+    return parser.parse_args(argv)
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
     load_secret_env()
+    if args.rev_range:
+        try:
+            counts = run_batch(args.rev_range, workers=args.workers, limit=args.limit)
+        except Exception as exc:
+            log_error(None, "batch", exc)
+            return 1
+        print(json.dumps(counts, ensure_ascii=False))
+        return 0
+
     try:
         commit = get_commit_hash()
     except Exception as exc:
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Compare full-file reads with the seek-based tail reader on a large log."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+SHARED_LIB_DIR = Path(__file__).resolve().parent / "lib"
+if str(SHARED_LIB_DIR) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB_DIR))
+
+from tail_reader_common import tail_lines, tail_text  # noqa: E402
+
+LOG_LINE = '[run] 2026-01-31T12:00:00 playwright step="download" url=https://example.invalid/orders?page=1 ok\n'
+
+
+def _write_log(path: Path, size_mb: int) -> None:
+    block = (LOG_LINE * 4096).encode("utf-8")
+    target = size_mb * 1024 * 1024
+    written = 0
+    with path.open("wb") as handle:
+        while written < target:
+            handle.write(block)
+            written += len(block)
+
+
+def _full_read_text(path: Path, max_bytes: int) -> str:
+    data = path.read_bytes()
+    return data[-max_bytes:].decode("utf-8", errors="replace")
+
+
+def _full_read_lines(path: Path, max_lines: int) -> list[str]:
+    return path.read_text(encoding="utf-8", errors="replace").splitlines()[-max_lines:]
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", help="existing log to read (default: generate one)")
+    parser.add_argument("--size-mb", type=int, default=1024, help="size of the generated log")
+    parser.add_argument("--max-bytes", type=int, default=16000)
+    parser.add_argument("--max-lines", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-full-read", action="store_true", help="only time the tail reader")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(args.path) if args.path else Path(tmp) / "bench.log"
+        if not args.path:
+            _write_log(path, args.size_mb)
+        results: dict[str, object] = {"path": str(path), "size_bytes": path.stat().st_size}
+        cases = {
+            "tail_text": lambda: tail_text(path, max_bytes=args.max_bytes),
+            "tail_lines": lambda: tail_lines(path, max_lines=args.max_lines),
+        }
+        if not args.skip_full_read:
+            cases["full_read_text"] = lambda: _full_read_text(path, args.max_bytes)
+            cases["full_read_lines"] = lambda: _full_read_lines(path, args.max_lines)
+        for name, fn in cases.items():
+            results[f"{name}_seconds"] = round(_time(fn, args.repeat), 6)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
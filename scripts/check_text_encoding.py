@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Iterable, List
 
@@ -67,6 +70,13 @@ DISALLOWED_POWERSHELL_ENCODING_PATTERN = re.compile(
     r"\b(?:Set-Content|Add-Content|Out-File)\b[^\r\n]*\b-Encoding\s+['\"]?utf8['\"]?\b",
     re.IGNORECASE,
 )
+MOJIBAKE_HINT_RE = re.compile("|".join(re.escape(marker) for marker in sorted(MOJIBAKE_HINT_MARKERS)))
+
+CACHE_FILE_NAME = "text-encoding-check-cache.json"
+CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 200_000
+# Below this many files a process pool costs more than it saves.
+PARALLEL_MIN_FILES = 64
 
 def _is_dashboard_ui_file(path: Path) -> bool:
     normalized = path.as_posix()
@@ -74,10 +84,7 @@ def _is_dashboard_ui_file(path: Path) -> bool:
 
 
 def _has_mojibake_markers(text: str) -> bool:
-    for marker in MOJIBAKE_HINT_MARKERS:
-        if marker in text:
-            return True
-    return False
+    return MOJIBAKE_HINT_RE.search(text) is not None
 
 
 def _get_staged_files() -> list[str]:
@@ -174,14 +181,20 @@ def _looks_like_binary(data: bytes) -> bool:
 
 def _check_file(path: Path) -> list[str]:
     issues: list[str] = []
+    if path.suffix.lower() not in TEXT_EXTS:
+        # Only readability matters for non-text files; do not load their content.
+        try:
+            with path.open("rb"):
+                pass
+        except OSError as exc:
+            return [f"{path}: cannot read ({exc})"]
+        return issues
+
     try:
         raw = path.read_bytes()
     except OSError as exc:
         return [f"{path}: cannot read ({exc})"]
 
-    if not path.is_file() or path.suffix.lower() not in TEXT_EXTS:
-        return issues
-
     if _looks_like_binary(raw):
         return issues
 
@@ -199,12 +212,16 @@ def _check_file(path: Path) -> list[str]:
         )
 
     if path.suffix.lower() == ".ps1":
-        for lineno, line in enumerate(text.splitlines(), start=1):
-            if DISALLOWED_POWERSHELL_ENCODING_PATTERN.search(line):
-                issues.append(
-                    f"{path}:{lineno}: disallowed PowerShell encoding '-Encoding utf8'. "
-                    "Use UTF8Encoding($false) or utf8NoBOM."
-                )
+        reported: set[int] = set()
+        for match in DISALLOWED_POWERSHELL_ENCODING_PATTERN.finditer(text):
+            lineno = text.count("\n", 0, match.start()) + 1
+            if lineno in reported:
+                continue
+            reported.add(lineno)
+            issues.append(
+                f"{path}:{lineno}: disallowed PowerShell encoding '-Encoding utf8'. "
+                "Use UTF8Encoding($false) or utf8NoBOM."
+            )
 
     if text.startswith("\ufeff"):
         issues.append(
@@ -213,6 +230,135 @@ def _check_file(path: Path) -> list[str]:
     return issues
 
 
+def _rules_digest() -> str:
+    """Fingerprint of the check rules so a rule change invalidates cached results."""
+    material = json.dumps(
+        [
+            CACHE_VERSION,
+            sorted(TEXT_EXTS),
+            sorted(MOJIBAKE_HINT_MARKERS),
+            DISALLOWED_POWERSHELL_ENCODING_PATTERN.pattern,
+        ],
+        ensure_ascii=True,
+    )
+    return hashlib.sha1(material.encode("ascii")).hexdigest()
+
+
+def _cache_profile(path: Path) -> str:
+    # The checks applied depend on the path as well as the content.
+    suffix = path.suffix.lower()
+    dashboard = "d" if _is_dashboard_ui_file(path) else "-"
+    return f"{suffix}{dashboard}"
+
+
+def _git_output(args: list[str]) -> bytes | None:
+    try:
+        result = subprocess.run(["git", *args], check=False, capture_output=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _get_clean_blob_ids() -> dict[str, str]:
+    """Map tracked paths (relative to cwd) whose worktree content matches the index to their blob id."""
+    staged = _git_output(["ls-files", "-s", "-z"])
+    if staged is None:
+        return {}
+    blobs: dict[str, str] = {}
+    for record in staged.split(b"\0"):
+        if not record:
+            continue
+        meta, _, name = record.partition(b"\t")
+        fields = meta.split()
+        if len(fields) < 3 or fields[2] != b"0":
+            continue
+        blobs[name.decode("utf-8", errors="surrogateescape")] = fields[1].decode("ascii")
+
+    # --relative: ls-files names are relative to cwd, diff names to the repo root by default.
+    dirty = _git_output(["diff", "--name-only", "--relative", "-z", "--no-ext-diff"])
+    if dirty is None:
+        return {}
+    for name in dirty.split(b"\0"):
+        if name:
+            blobs.pop(name.decode("utf-8", errors="surrogateescape"), None)
+    return blobs
+
+
+def _cache_path() -> Path | None:
+    out = _git_output(["rev-parse", "--git-path", CACHE_FILE_NAME])
+    if out is None:
+        return None
+    value = out.decode("utf-8", errors="surrogateescape").strip()
+    return Path(value) if value else None
+
+
+def _load_cache(path: Path | None) -> list[str]:
+    if path is None or not path.exists():
+        return []
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    if not isinstance(data, dict) or data.get("rules") != _rules_digest():
+        return []
+    clean = data.get("clean")
+    return [str(item) for item in clean] if isinstance(clean, list) else []
+
+
+def _save_cache(path: Path | None, clean: list[str]) -> None:
+    if path is None:
+        return
+    payload = {"rules": _rules_digest(), "clean": clean[:MAX_CACHE_ENTRIES]}
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _check_paths(paths: list[Path], workers: int | None) -> list[list[str]]:
+    if workers == 1 or len(paths) < PARALLEL_MIN_FILES:
+        return [_check_file(path) for path in paths]
+    max_workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_check_file, paths, chunksize=chunksize))
+
+
+def _run_checks(paths: list[Path], *, use_cache: bool, workers: int | None) -> list[str]:
+    """Check paths, skipping tracked files whose clean blob already passed with the same rules."""
+    cache_path = _cache_path() if use_cache else None
+    blobs = _get_clean_blob_ids() if cache_path is not None else {}
+    previous = _load_cache(cache_path)
+    known_clean = set(previous)
+
+    pending: list[tuple[Path, str | None]] = []
+    current_clean: list[str] = []
+    for path in paths:
+        blob = blobs.get(path.as_posix())
+        key = f"{blob}:{_cache_profile(path)}" if blob else None
+        if key is not None and key in known_clean:
+            current_clean.append(key)
+            continue
+        pending.append((path, key))
+
+    issues: list[str] = []
+    results = _check_paths([path for path, _ in pending], workers)
+    for (_, key), file_issues in zip(pending, results):
+        if file_issues:
+            issues.extend(file_issues)
+        elif key is not None:
+            current_clean.append(key)
+
+    if cache_path is not None and pending:
+        seen = set(current_clean)
+        _save_cache(cache_path, current_clean + [key for key in previous if key not in seen])
+    return issues
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Validate staged text files are UTF-8 (without BOM)."
@@ -228,6 +374,16 @@ def main(argv: list[str] | None = None) -> int:
         action="append",
         help="Path to check (default: staged text files)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Check every file, ignoring results cached by git blob id.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for uncached files (default: CPU count, 1 disables the pool).",
+    )
     args = parser.parse_args(argv)
 
     paths: List[Path] = []
@@ -247,9 +403,7 @@ def main(argv: list[str] | None = None) -> int:
         print(f"No {scope_label} to check.")
         return 0
 
-    issues: list[str] = []
-    for path in paths:
-        issues.extend(_check_file(path))
+    issues = _run_checks(paths, use_cache=not args.no_cache, workers=args.workers)
 
     if issues:
         print("Encoding check failed.")
@@ -1,9 +1,39 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import hashlib
 import json
+import os
 from pathlib import Path
+import re
+import shutil
 from typing import Any, Callable
+import zipfile
+
+from audit_segment_common import iter_audit_event_rows
+from skill_runtime_common import write_json, write_text_atomic
+
+ARCHIVE_DIRNAME = "archive"
+ARCHIVE_ZIP_NAME = "full_snapshot.zip"
+ARCHIVE_MANIFEST_NAME = "manifest.json"
+ARCHIVE_CHECKSUMS_NAME = "checksums.sha256"
+# Remembers (size, mtime_ns) -> sha256 per source file so unchanged files are not re-hashed.
+ARCHIVE_HASH_INDEX_NAME = "hash_index.json"
+ARCHIVE_HASH_INDEX_VERSION = 1
+# Content-addressed blobs shared by every month; snapshots hardlink into it.
+ARCHIVE_STORE_DIRNAME = "_archive_store"
+ARCHIVE_CLEANUP_TARGETS = (
+    ("manual_inbox", ("manual", "inbox")),
+    ("mf_bulk_upload_inbox", ("mf_bulk_upload", "inbox")),
+    ("mf_csv_import_inbox", ("mf_csv_import", "inbox")),
+    ("debug", ("debug",)),
+)
+DEFAULT_ARCHIVE_HASH_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+# Already-compressed payloads are stored as-is instead of deflated again.
+_ZIP_STORED_SUFFIXES = {".pdf", ".zip", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".gz", ".xlsx"}
+_HASH_CHUNK_BYTES = 1024 * 1024
+_YM_DIR_RE = re.compile(r"^(\d{4})-(\d{2})$")
 
 
 def format_archive_snapshot_label(name: str) -> str:
@@ -30,20 +60,8 @@ def scan_archive_history(
         if not path.is_dir() or path.name == "_runs" or not ym_matcher(path.name):
             continue
         audit_path = path / "reports" / "audit_log.jsonl"
-        if not audit_path.exists():
-            continue
-        for line in audit_path.read_text(encoding="utf-8", errors="replace").splitlines():
-            text = str(line or "").strip()
-            if not text.startswith("{") or not text.endswith("}"):
-                continue
-            try:
-                obj = json.loads(text)
-            except Exception:
-                continue
-            if not isinstance(obj, dict):
-                continue
-            if str(obj.get("event_type") or "").strip() != "archive":
-                continue
+        # Sealed segments contribute archive rows from their rollups; only the active log is parsed.
+        for obj in iter_audit_event_rows(audit_path, "archive"):
             if str(obj.get("status") or "").strip() != "success":
                 continue
             action = str(obj.get("action") or "").strip()
@@ -133,3 +151,339 @@ def scan_archived_receipts(
         "snapshots": snapshots,
         "rows": rows,
     }
+
+
+def archive_store_root(artifact_root: Path) -> Path:
+    return artifact_root / ARCHIVE_STORE_DIRNAME / "sha256"
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _load_hash_index(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != ARCHIVE_HASH_INDEX_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {str(k): v for k, v in entries.items() if isinstance(v, dict)}
+
+
+def _month_from_dirname(name: str) -> tuple[int, int] | None:
+    match = _YM_DIR_RE.match(name)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def _collect_archive_sources(
+    output_root: Path,
+    runs_root: Path | None,
+    *,
+    ym: tuple[int, int] | None,
+    read_json: Callable[[Path], Any],
+) -> tuple[list[str], list[str], list[tuple[Path, str]], dict[str, int]]:
+    """Return (top-level names, empty dirs, (source, relative path) files, run counts)."""
+    top_level: list[str] = []
+    empty_dirs: list[str] = []
+    files: list[tuple[Path, str]] = []
+    for item in sorted(output_root.iterdir(), key=lambda p: p.name):
+        if item.name.lower() == ARCHIVE_DIRNAME:
+            continue
+        top_level.append(item.name)
+        if not item.is_dir():
+            files.append((item, item.name))
+            continue
+        for dirpath, dirnames, filenames in os.walk(item):
+            dirnames.sort()
+            rel_dir = Path(dirpath).relative_to(output_root).as_posix()
+            if not dirnames and not filenames:
+                empty_dirs.append(rel_dir)
+            for name in sorted(filenames):
+                files.append((Path(dirpath) / name, f"{rel_dir}/{name}"))
+
+    runs = {"meta_files": 0, "log_files": 0}
+    if runs_root is not None and runs_root.is_dir():
+        for meta_path in sorted(runs_root.glob("run_*.json")):
+            if ym is not None:
+                meta = read_json(meta_path)
+                params = meta.get("params") if isinstance(meta, dict) else None
+                try:
+                    matched = isinstance(params, dict) and (int(params.get("year")), int(params.get("month"))) == ym
+                except (TypeError, ValueError):
+                    matched = False
+                if not matched:
+                    continue
+            files.append((meta_path, f"runs/{meta_path.name}"))
+            runs["meta_files"] += 1
+            log_path = meta_path.with_suffix(".log")
+            if log_path.is_file():
+                files.append((log_path, f"runs/{log_path.name}"))
+                runs["log_files"] += 1
+    return top_level, empty_dirs, files, runs
+
+
+def _hash_sources(
+    files: list[tuple[Path, str]],
+    cached: dict[str, dict[str, Any]],
+    *,
+    workers: int,
+) -> tuple[dict[str, dict[str, Any]], int]:
+    """Return source path -> {size, mtime_ns, sha256}, hashing only files whose signature changed."""
+    entries: dict[str, dict[str, Any]] = {}
+    pending: list[tuple[str, Path, tuple[int, int]]] = []
+    for source, _ in files:
+        key = str(source)
+        signature = _file_signature(source)
+        if signature is None:
+            continue
+        entry = cached.get(key)
+        if entry is not None and entry.get("size") == signature[0] and entry.get("mtime_ns") == signature[1]:
+            entries[key] = entry
+        else:
+            pending.append((key, source, signature))
+    if pending:
+        if workers > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                digests = list(pool.map(lambda job: _sha256_file(job[1]), pending))
+        else:
+            digests = [_sha256_file(source) for _, source, _ in pending]
+        for (key, _, signature), digest in zip(pending, digests):
+            entries[key] = {"size": signature[0], "mtime_ns": signature[1], "sha256": digest}
+    return entries, len(pending)
+
+
+def _materialize(source: Path, target: Path, entry: dict[str, Any], store_root: Path) -> tuple[str, bool]:
+    """
+    Place `source` at `target` through the content store. Returns (sha256, deduplicated).
+
+    A blob already in the store is hardlinked; otherwise the file is copied and
+    the copy becomes the blob. Filesystems without hardlinks fall back to copies.
+    """
+    digest = str(entry["sha256"])
+    blob = store_root / digest[:2] / digest
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if blob.is_file():
+        try:
+            os.link(blob, target)
+            return digest, True
+        except OSError:
+            pass
+    shutil.copy2(source, target)
+    if _file_signature(source) != (entry["size"], entry["mtime_ns"]):
+        # The source changed after it was hashed; trust the copy that was archived.
+        digest = _sha256_file(target)
+        entry.update({"size": -1, "mtime_ns": -1, "sha256": digest})
+        blob = store_root / digest[:2] / digest
+    if not blob.exists():
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(target, blob)
+        except OSError:
+            pass
+    return digest, False
+
+
+def _write_snapshot_zip(zip_path: Path, dest: Path, members: list[str], empty_dirs: list[str]) -> None:
+    tmp = zip_path.with_name(f".{zip_path.name}.{os.getpid()}.tmp")
+    try:
+        with zipfile.ZipFile(tmp, "w", allowZip64=True) as archive:
+            for rel in empty_dirs:
+                archive.writestr(zipfile.ZipInfo(rel + "/"), b"")
+            for rel in members:
+                source = dest / rel
+                compress = zipfile.ZIP_STORED if source.suffix.lower() in _ZIP_STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+                info = zipfile.ZipInfo.from_file(source, rel)
+                info.compress_type = compress
+                # Stream each member so memory stays flat regardless of file size.
+                with source.open("rb") as src, archive.open(info, "w", force_zip64=True) as out:
+                    shutil.copyfileobj(src, out, _HASH_CHUNK_BYTES)
+        os.replace(tmp, zip_path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _cleanup_month_inboxes(output_root: Path) -> tuple[list[dict[str, Any]], int]:
+    rows: list[dict[str, Any]] = []
+    removed_total = 0
+    for key, parts in ARCHIVE_CLEANUP_TARGETS:
+        path = output_root.joinpath(*parts)
+        existed = path.exists()
+        removed = 0
+        if existed:
+            for entry in list(path.iterdir()):
+                if entry.is_dir() and not entry.is_symlink():
+                    shutil.rmtree(entry)
+                else:
+                    entry.unlink()
+                removed += 1
+        removed_total += removed
+        rows.append({"key": key, "path": str(path), "existed": bool(existed), "removed_entries": removed})
+    return rows, removed_total
+
+
+def _new_snapshot_dir(archive_root: Path, now: datetime) -> Path:
+    base = now.strftime("%Y%m%d_%H%M%S")
+    dest = archive_root / base
+    counter = 1
+    while dest.exists():
+        dest = archive_root / f"{base}_{counter}"
+        counter += 1
+    dest.mkdir(parents=True)
+    return dest
+
+
+def archive_month_outputs(
+    output_root: Path,
+    *,
+    store_root: Path,
+    runs_root: Path | None = None,
+    read_json: Callable[[Path], Any],
+    include_pdfs: bool = True,
+    include_debug: bool = False,
+    cleanup: bool = True,
+    workers: int = DEFAULT_ARCHIVE_HASH_WORKERS,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """
+    Snapshot a month directory into `archive/<YYYYMMDD_HHMMSS>/`.
+
+    Produces the same layout, manifest.json, checksums.sha256,
+    full_snapshot.zip and cleanup report as the former archive_outputs.ps1.
+    Files are hashed in parallel, unchanged files reuse the hash from the
+    previous run, and identical content is hardlinked from `store_root` so a
+    PDF archived in several months is stored once.
+    """
+    output_root = Path(output_root)
+    if not output_root.is_dir():
+        raise FileNotFoundError(f"Output root not found: {output_root}")
+    now = now or datetime.now()
+    ym = _month_from_dirname(output_root.name)
+    ym_label = f"{ym[0]:04d}-{ym[1]:02d}" if ym else ""
+
+    top_level, empty_dirs, files, runs = _collect_archive_sources(output_root, runs_root, ym=ym, read_json=read_json)
+    archive_root = output_root / ARCHIVE_DIRNAME
+    index_path = archive_root / ARCHIVE_HASH_INDEX_NAME
+    entries, hashed = _hash_sources(files, _load_hash_index(index_path), workers=workers)
+
+    dest = _new_snapshot_dir(archive_root, now)
+    for rel in empty_dirs:
+        (dest / rel).mkdir(parents=True, exist_ok=True)
+    checksums: dict[str, str] = {}
+    manifest_files: list[dict[str, Any]] = []
+    deduplicated = 0
+    bytes_total = 0
+    for source, rel in files:
+        entry = entries.get(str(source))
+        if entry is None:
+            # Vanished between the scan and the copy.
+            continue
+        digest, reused = _materialize(source, dest / rel, entry, store_root)
+        size = (dest / rel).stat().st_size
+        deduplicated += int(reused)
+        bytes_total += size
+        checksums[rel] = digest
+        manifest_files.append({"path": rel, "size": size, "sha256": digest})
+
+    zip_path = dest / ARCHIVE_ZIP_NAME
+    manifest_path = dest / ARCHIVE_MANIFEST_NAME
+    checksum_path = dest / ARCHIVE_CHECKSUMS_NAME
+    if checksums or empty_dirs:
+        _write_snapshot_zip(zip_path, dest, sorted(checksums), empty_dirs)
+
+    manifest = {
+        "created_at": now.isoformat(timespec="seconds"),
+        "ym": ym_label,
+        "output_root": str(output_root),
+        "archived_to": str(dest),
+        "options": {
+            "include_pdfs": bool(include_pdfs),
+            "include_debug": bool(include_debug),
+            "cleanup": bool(cleanup),
+        },
+        "source_top_level": top_level,
+        "copied_top_level": list(top_level),
+        "files_total": len(manifest_files),
+        "bytes_total": bytes_total,
+        "runs": {
+            "runs_root": str(runs_root) if runs_root is not None else "",
+            "meta_files": runs["meta_files"],
+            "log_files": runs["log_files"],
+        },
+        "zip_path": str(zip_path),
+        "incremental": {
+            "hashed_files": hashed,
+            "reused_hashes": len(entries) - hashed,
+            "deduplicated_files": deduplicated,
+            "store_root": str(store_root),
+        },
+        "files": manifest_files,
+    }
+    write_json(manifest_path, manifest)
+    checksums[ARCHIVE_MANIFEST_NAME] = _sha256_file(manifest_path)
+    if zip_path.exists():
+        checksums[ARCHIVE_ZIP_NAME] = _sha256_file(zip_path)
+    write_text_atomic(
+        checksum_path,
+        "".join(f"{digest}  {rel}\n" for rel, digest in sorted(checksums.items())),
+    )
+    try:
+        write_json(
+            index_path,
+            {"version": ARCHIVE_HASH_INDEX_VERSION, "entries": entries},
+            compact=True,
+            durable=False,
+        )
+    except OSError:
+        pass
+
+    cleanup_report = ""
+    cleanup_removed = 0
+    if cleanup:
+        targets, cleanup_removed = _cleanup_month_inboxes(output_root)
+        report_path = output_root / "reports" / "archive_cleanup_report.json"
+        write_json(
+            report_path,
+            {
+                "ym": ym_label,
+                "archived_to": str(dest),
+                "cleanup_enabled": True,
+                "executed_at": datetime.now().isoformat(timespec="seconds"),
+                "removed_total": cleanup_removed,
+                "targets": targets,
+            },
+        )
+        cleanup_report = str(report_path)
+
+    return {
+        "archived_to": str(dest),
+        "archive_zip": str(zip_path) if zip_path.exists() else "",
+        "archive_manifest": str(manifest_path),
+        "archive_checksums": str(checksum_path),
+        "cleanup_report": cleanup_report,
+        "cleanup_removed": cleanup_removed,
+        "files_total": len(manifest_files),
+        "hashed_files": hashed,
+        "deduplicated_files": deduplicated,
+    }
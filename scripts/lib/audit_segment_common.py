@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from collections import Counter, deque
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any, Iterable, Iterator
+
+from skill_runtime_common import locked_path, write_json
+
+AUDIT_SEGMENT_DIRNAME = "audit_log_segments"
+AUDIT_ROLLUP_SUFFIX = ".rollup.json"
+AUDIT_ROLLUP_VERSION = 1
+# The active log is sealed once it is past MIN and its first event is from an
+# earlier day, or unconditionally once it reaches MAX.
+AUDIT_SEGMENT_MIN_BYTES = 256 * 1024
+AUDIT_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+# Detail fields kept in rollup groups; enough to rebuild per-reason counters.
+AUDIT_ROLLUP_DETAIL_KEYS = ("reason_class", "reason_code", "retry_advice", "duplicate")
+# Most recent rows kept per event type so "recent" lists need no segment reads.
+AUDIT_ROLLUP_EVENT_LIMIT = 200
+
+_SEAL_LOCK = threading.Lock()
+
+
+def audit_segment_dir(path: Path) -> Path:
+    return path.parent / AUDIT_SEGMENT_DIRNAME
+
+
+def audit_row_ts(row: dict[str, Any]) -> str:
+    return str(row.get("ts") or row.get("at") or "").strip()
+
+
+def parse_audit_line(line: str) -> dict[str, Any] | None:
+    text = str(line or "").strip()
+    if not text.startswith("{") or not text.endswith("}"):
+        return None
+    try:
+        obj = json.loads(text)
+    except Exception:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def iter_audit_rows(path: Path) -> Iterator[dict[str, Any]]:
+    try:
+        handle = path.open("r", encoding="utf-8", errors="replace")
+    except OSError:
+        return
+    with handle:
+        for line in handle:
+            row = parse_audit_line(line)
+            if row is not None:
+                yield row
+
+
+def build_audit_rollup(rows: Iterable[dict[str, Any]], *, segment: str, size: int) -> dict[str, Any]:
+    event_types: dict[str, dict[str, Any]] = {}
+    recent: dict[str, deque[dict[str, Any]]] = {}
+    groups: Counter[str] = Counter()
+    total = 0
+    first_ts = ""
+    last_ts = ""
+    for row in rows:
+        total += 1
+        ts = audit_row_ts(row)
+        if ts and (not first_ts or ts < first_ts):
+            first_ts = ts
+        if ts and ts > last_ts:
+            last_ts = ts
+        event_type = str(row.get("event_type") or "").strip()
+        status = str(row.get("status") or "").strip()
+        entry = event_types.setdefault(
+            event_type,
+            {"count": 0, "first_ts": "", "last_ts": "", "by_status": {}},
+        )
+        entry["count"] += 1
+        if ts and (not entry["first_ts"] or ts < entry["first_ts"]):
+            entry["first_ts"] = ts
+        if ts and ts > entry["last_ts"]:
+            entry["last_ts"] = ts
+        entry["by_status"][status] = int(entry["by_status"].get(status, 0)) + 1
+        recent.setdefault(event_type, deque(maxlen=AUDIT_ROLLUP_EVENT_LIMIT)).append(row)
+
+        details = row.get("details") if isinstance(row.get("details"), dict) else {}
+        group_details = {key: details[key] for key in AUDIT_ROLLUP_DETAIL_KEYS if key in details}
+        groups[json.dumps([event_type, status, group_details], ensure_ascii=False, sort_keys=True)] += 1
+
+    for event_type, entry in event_types.items():
+        entry["events"] = list(recent[event_type])
+        entry["truncated"] = entry["count"] > len(entry["events"])
+
+    group_rows = []
+    for key, count in groups.items():
+        event_type, status, group_details = json.loads(key)
+        group_rows.append({"event_type": event_type, "status": status, "details": group_details, "count": count})
+    return {
+        "version": AUDIT_ROLLUP_VERSION,
+        "segment": segment,
+        "size": size,
+        "rows": total,
+        "first_ts": first_ts,
+        "last_ts": last_ts,
+        "event_types": event_types,
+        "groups": group_rows,
+    }
+
+
+def _rollup_path(segment: Path) -> Path:
+    return segment.with_name(segment.name + AUDIT_ROLLUP_SUFFIX)
+
+
+def _write_rollup(segment: Path, rollup: dict[str, Any]) -> None:
+    # The sidecar is a rebuildable cache, so skip fsync.
+    write_json(_rollup_path(segment), rollup, compact=True, durable=False)
+
+
+def load_audit_rollup(segment: Path) -> dict[str, Any]:
+    """Return the segment's rollup, rebuilding the sidecar if missing or stale."""
+    try:
+        size = segment.stat().st_size
+    except OSError:
+        size = -1
+    try:
+        rollup = json.loads(_rollup_path(segment).read_text(encoding="utf-8"))
+    except Exception:
+        rollup = None
+    if (
+        isinstance(rollup, dict)
+        and rollup.get("version") == AUDIT_ROLLUP_VERSION
+        and rollup.get("size") == size
+    ):
+        return rollup
+    rollup = build_audit_rollup(iter_audit_rows(segment), segment=segment.name, size=size)
+    try:
+        _write_rollup(segment, rollup)
+    except OSError:
+        pass
+    return rollup
+
+
+def list_audit_segments(path: Path) -> list[Path]:
+    directory = audit_segment_dir(path)
+    if not directory.is_dir():
+        return []
+    prefix = path.stem + "."
+    return sorted(
+        p for p in directory.iterdir() if p.name.startswith(prefix) and p.name.endswith(path.suffix) and p.is_file()
+    )
+
+
+def _compact_ts(ts: str) -> str:
+    digits = "".join(ch for ch in ts if ch.isdigit())[:14]
+    if len(digits) < 14:
+        return "unknown"
+    return f"{digits[:8]}T{digits[8:]}"
+
+
+def _first_row_ts(path: Path) -> str:
+    try:
+        with path.open("r", encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                row = parse_audit_line(line)
+                if row is not None:
+                    return audit_row_ts(row)
+    except OSError:
+        pass
+    return ""
+
+
+def should_seal_audit_log(path: Path, now: datetime) -> bool:
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return False
+    if size >= AUDIT_SEGMENT_MAX_BYTES:
+        return True
+    if size < AUDIT_SEGMENT_MIN_BYTES:
+        return False
+    first_ts = _first_row_ts(path)
+    return bool(first_ts) and first_ts[:10] < now.date().isoformat()
+
+
+def seal_audit_log(path: Path) -> Path | None:
+    """Move the active log into a time-bounded segment and write its rollup sidecar."""
+    if not path.exists():
+        return None
+    directory = audit_segment_dir(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    # Move the file aside first so appends racing the seal land in the segment
+    # before its rollup is computed; a later size mismatch rebuilds the sidecar.
+    sealing = directory / f"{path.stem}.sealing-{os.getpid()}-{threading.get_ident()}{path.suffix}"
+    try:
+        os.replace(path, sealing)
+    except FileNotFoundError:
+        # Another process sealed the log between the check and the move.
+        return None
+    size = sealing.stat().st_size
+    rollup = build_audit_rollup(iter_audit_rows(sealing), segment="", size=size)
+    base = f"{path.stem}.{_compact_ts(rollup['first_ts'])}_{_compact_ts(rollup['last_ts'])}"
+    segment = directory / f"{base}{path.suffix}"
+    counter = 1
+    while segment.exists():
+        segment = directory / f"{base}-{counter}{path.suffix}"
+        counter += 1
+    os.replace(sealing, segment)
+    rollup["segment"] = segment.name
+    try:
+        _write_rollup(segment, rollup)
+    except OSError:
+        pass
+    return segment
+
+
+def maybe_seal_audit_log(path: Path, now: datetime) -> Path | None:
+    # Cheap unlocked check first; appends only pay for the cross-process lock
+    # when a seal is due, and the check is repeated once the lock is held.
+    if not should_seal_audit_log(path, now):
+        return None
+    with _SEAL_LOCK, locked_path(audit_segment_dir(path) / path.stem):
+        if not should_seal_audit_log(path, now):
+            return None
+        return seal_audit_log(path)
+
+
+def iter_audit_log_bytes(path: Path, *, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield the raw log as one JSONL stream: sealed segments oldest first, then the active log."""
+    for source in [*list_audit_segments(path), path]:
+        try:
+            handle = source.open("rb")
+        except OSError:
+            continue
+        last = b"\n"
+        with handle:
+            while True:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    break
+                last = chunk[-1:]
+                yield chunk
+        if last != b"\n":
+            # Keep a torn final line from merging with the next file's first row.
+            yield b"\n"
+
+
+def read_audit_log(path: Path) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Return (rollups of sealed segments, oldest first; rows of the active log)."""
+    rollups = [load_audit_rollup(segment) for segment in list_audit_segments(path)]
+    return rollups, list(iter_audit_rows(path))
+
+
+def iter_audit_event_rows(path: Path, event_type: str) -> Iterator[dict[str, Any]]:
+    """Yield every row of one event type, oldest segment first, reading segments only when truncated."""
+    for segment in list_audit_segments(path):
+        entry = load_audit_rollup(segment).get("event_types", {}).get(event_type)
+        if not isinstance(entry, dict):
+            continue
+        if entry.get("truncated"):
+            for row in iter_audit_rows(segment):
+                if str(row.get("event_type") or "").strip() == event_type:
+                    yield row
+        else:
+            yield from entry.get("events") or []
+    needle = json.dumps(event_type, ensure_ascii=False)
+    try:
+        handle = path.open("r", encoding="utf-8", errors="replace")
+    except OSError:
+        return
+    with handle:
+        for line in handle:
+            # Skip the JSON decode for lines that cannot be of this event type.
+            if needle not in line:
+                continue
+            row = parse_audit_line(line)
+            if row is not None and str(row.get("event_type") or "").strip() == event_type:
+                yield row
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+TIMEOUT_RETURNCODE = 124
+OUTPUT_LIMIT_RETURNCODE = 125
+CANCELLED_RETURNCODE = 130
+DEFAULT_TAIL_CHARS = 4000
+DEFAULT_MAX_OUTPUT_BYTES = 256 * 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+# Readers may still be draining a pipe held open by an orphaned grandchild;
+# do not wait for them forever once the command itself is gone.
+READER_JOIN_SECONDS = 5.0
+KILL_GRACE_SECONDS = 3.0
+
+
+class RingBuffer:
+    """Keep the last `max_bytes` bytes written, in bounded memory."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(1, int(max_bytes))
+        self._chunks: deque[bytes] = deque()
+        self._size = 0
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        with self._lock:
+            self.total_bytes += len(data)
+            if len(data) >= self.max_bytes:
+                self._chunks.clear()
+                self._chunks.append(data[-self.max_bytes :])
+                self._size = self.max_bytes
+                return
+            self._chunks.append(data)
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                head = self._chunks[0]
+                overflow = self._size - self.max_bytes
+                if len(head) <= overflow:
+                    self._chunks.popleft()
+                    self._size -= len(head)
+                else:
+                    self._chunks[0] = head[overflow:]
+                    self._size -= overflow
+
+    def getvalue(self) -> bytes:
+        with self._lock:
+            return b"".join(self._chunks)
+
+    def tail_text(self, max_chars: int) -> str:
+        text = self.getvalue().decode("utf-8", errors="replace")
+        return text[-max_chars:] if max_chars > 0 else text
+
+
+def _popen_group_kwargs() -> dict[str, Any]:
+    if os.name == "nt":
+        return {"creationflags": getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
+    return {"start_new_session": True}
+
+
+def kill_process_tree(proc: subprocess.Popen[bytes]) -> None:
+    """Terminate `proc` and everything it spawned; never raises."""
+    if os.name == "nt":
+        try:
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                capture_output=True,
+                check=False,
+                timeout=30,
+            )
+        except Exception:
+            pass
+        try:
+            proc.kill()
+        except Exception:
+            pass
+        return
+    # start_new_session=True made the child a group leader, so its pid is
+    # also the group id shared by every descendant that did not detach.
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(proc.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            return
+        except Exception:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+            return
+        if sig == signal.SIGTERM:
+            try:
+                proc.wait(timeout=KILL_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                continue
+            # Leader exited; still sweep stragglers left in the group.
+
+
+def run_streaming_command(
+    cmd: str | Sequence[str],
+    *,
+    cwd: Path | str | None = None,
+    shell: bool = False,
+    timeout_seconds: float = 900,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    tail_chars: int = DEFAULT_TAIL_CHARS,
+    log_path: Path | None = None,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+    progress_interval_seconds: float = 1.0,
+    env: dict[str, str] | None = None,
+    cancel_event: threading.Event | None = None,
+) -> dict[str, Any]:
+    """
+    Run `cmd` with stdout/stderr streamed into ring buffers instead of memory.
+
+    Both streams are appended as they arrive to `log_path` (when given) and
+    only the last `tail_chars` characters of each are returned. The process
+    tree is killed when `timeout_seconds` elapses (returncode 124) or when the
+    combined output passes `max_output_bytes` (returncode 125; 0 disables the
+    limit). `on_progress` is called about every `progress_interval_seconds`
+    with a snapshot of the running command; its exceptions are ignored.
+    Setting `cancel_event` kills the tree early (returncode 130).
+    Raises OSError when the command cannot be started.
+    """
+    tail_chars = max(0, int(tail_chars))
+    # Four bytes per character covers any UTF-8 tail.
+    ring_bytes = max(1, tail_chars * 4)
+    stdout_ring = RingBuffer(ring_bytes)
+    stderr_ring = RingBuffer(ring_bytes)
+    output_limit = max(0, int(max_output_bytes))
+    limit_hit = threading.Event()
+    log_lock = threading.Lock()
+    log_handle = None
+    if log_path is not None:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_handle = log_path.open("wb")
+
+    started = time.monotonic()
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(cwd) if cwd is not None else None,
+            shell=shell,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            **_popen_group_kwargs(),
+        )
+    except Exception:
+        if log_handle is not None:
+            log_handle.close()
+        raise
+
+    def _output_bytes() -> int:
+        return stdout_ring.total_bytes + stderr_ring.total_bytes
+
+    def _pump(stream: Any, ring: RingBuffer) -> None:
+        read = getattr(stream, "read1", stream.read)
+        try:
+            while True:
+                chunk = read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if limit_hit.is_set():
+                    # Keep draining so the child never blocks on a full pipe
+                    # before it is killed, but stop recording.
+                    continue
+                ring.write(chunk)
+                if log_handle is not None:
+                    with log_lock:
+                        log_handle.write(chunk)
+                if output_limit and _output_bytes() > output_limit:
+                    limit_hit.set()
+        except (OSError, ValueError):
+            pass
+        finally:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    readers = [
+        threading.Thread(target=_pump, args=(proc.stdout, stdout_ring), daemon=True),
+        threading.Thread(target=_pump, args=(proc.stderr, stderr_ring), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    def _snapshot(state: str) -> dict[str, Any]:
+        return {
+            "state": state,
+            "pid": proc.pid,
+            "elapsed_seconds": round(time.monotonic() - started, 3),
+            "output_bytes": _output_bytes(),
+            "stdout_tail": stdout_ring.tail_text(tail_chars),
+            "stderr_tail": stderr_ring.tail_text(tail_chars),
+        }
+
+    def _report(state: str, **extra: Any) -> None:
+        if on_progress is None:
+            return
+        try:
+            on_progress({**_snapshot(state), **extra})
+        except Exception:
+            pass
+
+    timeout = max(1.0, float(timeout_seconds))
+    interval = max(0.05, float(progress_interval_seconds))
+    # Poll faster than the report interval so the output limit is enforced
+    # promptly even while progress is reported rarely.
+    poll = min(interval, 0.25)
+    deadline = started + timeout
+    next_report = started + interval
+    timed_out = False
+    cancelled = False
+    _report("running")
+    while True:
+        if limit_hit.is_set():
+            kill_process_tree(proc)
+            break
+        if cancel_event is not None and cancel_event.is_set():
+            cancelled = True
+            kill_process_tree(proc)
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            timed_out = True
+            kill_process_tree(proc)
+            break
+        try:
+            proc.wait(timeout=min(poll, remaining))
+            break
+        except subprocess.TimeoutExpired:
+            pass
+        if time.monotonic() >= next_report:
+            _report("running")
+            next_report = time.monotonic() + interval
+
+    try:
+        proc.wait(timeout=KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        kill_process_tree(proc)
+    for reader in readers:
+        reader.join(READER_JOIN_SECONDS)
+    if any(reader.is_alive() for reader in readers):
+        # The command exited but a background descendant still holds the pipes.
+        kill_process_tree(proc)
+        for reader in readers:
+            reader.join(READER_JOIN_SECONDS)
+    if log_handle is not None:
+        with log_lock:
+            log_handle.close()
+
+    output_limited = limit_hit.is_set()
+    stderr_tail = stderr_ring.tail_text(0)
+    if timed_out:
+        returncode = TIMEOUT_RETURNCODE
+        stderr_tail += "\ncommand timeout"
+    elif output_limited:
+        returncode = OUTPUT_LIMIT_RETURNCODE
+        stderr_tail += f"\noutput limit exceeded ({output_limit} bytes)"
+    elif cancelled:
+        returncode = CANCELLED_RETURNCODE
+        stderr_tail += "\ncommand cancelled"
+    else:
+        returncode = int(proc.returncode if proc.returncode is not None else 1)
+    result = {
+        "returncode": returncode,
+        "stdout": stdout_ring.tail_text(tail_chars),
+        "stderr": stderr_tail[-tail_chars:] if tail_chars else stderr_tail,
+        "timed_out": timed_out,
+        "output_limited": output_limited,
+        "cancelled": cancelled,
+        "output_bytes": _output_bytes(),
+        "duration_seconds": round(time.monotonic() - started, 3),
+    }
+    if log_path is not None:
+        result["log_path"] = str(log_path)
+    _report("finished", returncode=returncode)
+    return result
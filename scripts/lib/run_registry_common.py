@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import fnmatch
 import json
+import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable
 
+from audit_segment_common import maybe_seal_audit_log
+from tail_reader_common import tail_text as _read_tail_text
+
 
 def safe_int(value: Any) -> int | None:
     try:
@@ -37,13 +43,9 @@ def normalize_actor(actor: Any) -> dict[str, Any]:
 
 def tail_text(path: Path, *, max_bytes: int = 32000) -> str:
     try:
-        data = path.read_bytes()
+        return _read_tail_text(path, max_bytes=max_bytes)
     except Exception:
         return ""
-    limit = max(0, int(max_bytes))
-    if limit and len(data) > limit:
-        data = data[-limit:]
-    return data.decode("utf-8", errors="replace")
 
 
 def append_audit_event(
@@ -64,8 +66,11 @@ def append_audit_event(
     json_dumps: Callable[..., str] = json.dumps,
 ) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    current = now()
+    # Roll the active log into a sealed segment (with rollup sidecar) before it grows further.
+    maybe_seal_audit_log(path, current)
     entry: dict[str, Any] = {
-        "ts": now().isoformat(timespec="seconds"),
+        "ts": current.isoformat(timespec="seconds"),
         "ym": f"{year:04d}-{month:02d}",
         "year": year,
         "month": month,
@@ -86,48 +91,289 @@ def append_audit_event(
         handle.write(json_dumps(entry, ensure_ascii=False) + "\n")
 
 
-def running_mode_for_ym(
+RUN_META_GLOB = "run_*.json"
+RUN_INDEX_DIRNAME = "_index"
+RUN_INDEX_FILENAME = "run_registry.sqlite3"
+RUN_INDEX_SCHEMA_VERSION = 1
+# Directory mtimes this recent may still hide a same-tick file creation; rescan next time.
+_DIR_MTIME_SETTLE_NS = 2_000_000_000
+
+_RUN_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    name TEXT PRIMARY KEY,
+    run_id TEXT,
+    status TEXT,
+    year INTEGER,
+    month INTEGER,
+    mode TEXT,
+    started_at TEXT NOT NULL DEFAULT '',
+    meta TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_status_idx ON runs (status, started_at);
+CREATE INDEX IF NOT EXISTS runs_ym_idx ON runs (year, month, status);
+CREATE TABLE IF NOT EXISTS registry_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def run_index_path(runs_root: Path) -> Path:
+    return runs_root / RUN_INDEX_DIRNAME / RUN_INDEX_FILENAME
+
+
+def _connect_run_index(runs_root: Path) -> sqlite3.Connection:
+    path = run_index_path(runs_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=10.0, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+        if version != RUN_INDEX_SCHEMA_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS runs; DROP TABLE IF EXISTS registry_state;" + _RUN_INDEX_SCHEMA
+            )
+            conn.execute(f"PRAGMA user_version = {RUN_INDEX_SCHEMA_VERSION}")
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def _exact_int(value: Any) -> int | None:
+    # Mirror the strict equality the file scan used: "2026" must not match 2026.
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _run_index_row(name: str, meta: dict[str, Any]) -> tuple[Any, ...]:
+    params = meta.get("params") if isinstance(meta.get("params"), dict) else {}
+    return (
+        name,
+        str(meta.get("run_id") or "") or None,
+        str(meta.get("status") or ""),
+        _exact_int(params.get("year")),
+        _exact_int(params.get("month")),
+        str(params.get("mode") or ""),
+        str(meta.get("started_at") or ""),
+        json.dumps(meta, ensure_ascii=False),
+    )
+
+
+def _upsert_run_rows(conn: sqlite3.Connection, rows: list[tuple[Any, ...]]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO runs (name, run_id, status, year, month, mode, started_at, meta) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def _load_run_meta(path: Path, read_json: Callable[[Path], Any]) -> dict[str, Any] | None:
+    data = read_json(path)
+    return data if isinstance(data, dict) and data else None
+
+
+def _sync_run_index(conn: sqlite3.Connection, runs_root: Path, read_json: Callable[[Path], Any]) -> None:
+    """
+    Bring the index in line with the run JSON files.
+
+    New and deleted files are found by listing names only when the directory
+    mtime moved; running entries are always re-read because their files are
+    rewritten in place when a run finishes. Finished entries are otherwise
+    trusted, since every writer goes through `write_run_meta`.
+    """
+    try:
+        dir_mtime_ns = runs_root.stat().st_mtime_ns
+    except OSError:
+        conn.execute("DELETE FROM runs")
+        return
+    row = conn.execute("SELECT value FROM registry_state WHERE key = 'dir_mtime_ns'").fetchone()
+    stored_mtime = row[0] if row else None
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if stored_mtime != str(dir_mtime_ns):
+            on_disk = {path.name: path for path in runs_root.glob(RUN_META_GLOB)}
+            indexed = {name for (name,) in conn.execute("SELECT name FROM runs")}
+            vanished = indexed - set(on_disk)
+            if vanished:
+                conn.executemany("DELETE FROM runs WHERE name = ?", [(name,) for name in vanished])
+            rows = []
+            for name in sorted(set(on_disk) - indexed):
+                meta = _load_run_meta(on_disk[name], read_json)
+                if meta is not None:
+                    rows.append(_run_index_row(name, meta))
+            _upsert_run_rows(conn, rows)
+            settled = time.time_ns() - dir_mtime_ns > _DIR_MTIME_SETTLE_NS
+            conn.execute(
+                "INSERT OR REPLACE INTO registry_state (key, value) VALUES ('dir_mtime_ns', ?)",
+                (str(dir_mtime_ns) if settled else None,),
+            )
+
+        rows = []
+        for (name,) in conn.execute("SELECT name FROM runs WHERE status = 'running'").fetchall():
+            meta = _load_run_meta(runs_root / name, read_json)
+            if meta is None:
+                conn.execute("DELETE FROM runs WHERE name = ?", (name,))
+            else:
+                rows.append(_run_index_row(name, meta))
+        _upsert_run_rows(conn, rows)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _scan_run_files(
     *,
-    year: int,
-    month: int,
     runs_root: Path,
     read_json: Callable[[Path], Any],
-) -> str | None:
-    if not runs_root.exists():
-        return None
-
-    running_jobs: list[tuple[str, str]] = []
-    for path in runs_root.glob("run_*.json"):
-        data = read_json(path)
-        if not isinstance(data, dict):
-            continue
-        if data.get("status") != "running":
+    status: str | None,
+    year: int | None,
+    month: int | None,
+    mode: str | None,
+) -> list[tuple[Path, dict[str, Any]]]:
+    records: list[tuple[Path, dict[str, Any]]] = []
+    for path in runs_root.glob(RUN_META_GLOB):
+        data = _load_run_meta(path, read_json)
+        if data is None:
             continue
         params = data.get("params") if isinstance(data.get("params"), dict) else {}
-        if params.get("year") != year or params.get("month") != month:
+        if status is not None and data.get("status") != status:
             continue
-        running_jobs.append((str(data.get("started_at") or ""), str(params.get("mode") or "")))
+        if year is not None and params.get("year") != year:
+            continue
+        if month is not None and params.get("month") != month:
+            continue
+        if mode is not None and str(params.get("mode") or "") != mode:
+            continue
+        records.append((path, data))
+    records.sort(key=lambda item: str(item[1].get("started_at") or ""), reverse=True)
+    return records
+
+
+def list_run_records(
+    *,
+    runs_root: Path,
+    read_json: Callable[[Path], Any],
+    status: str | None = None,
+    year: int | None = None,
+    month: int | None = None,
+    mode: str | None = None,
+) -> list[tuple[Path, dict[str, Any]]]:
+    """Return (meta path, meta) pairs matching the filters, newest first."""
+    if not runs_root.exists():
+        return []
+    clauses: list[str] = []
+    args: list[Any] = []
+    for column, value in (("status", status), ("year", year), ("month", month), ("mode", mode)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            args.append(value)
+    sql = "SELECT name, meta FROM runs"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY started_at DESC"
+    try:
+        conn = _connect_run_index(runs_root)
+    except sqlite3.Error:
+        conn = None
+    if conn is not None:
+        try:
+            _sync_run_index(conn, runs_root, read_json)
+            return [(runs_root / name, json.loads(meta)) for name, meta in conn.execute(sql, args)]
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+    # The index is a cache of the JSON files; fall back to scanning them directly.
+    return _scan_run_files(
+        runs_root=runs_root,
+        read_json=read_json,
+        status=status,
+        year=year,
+        month=month,
+        mode=mode,
+    )
 
-    running_jobs.sort(key=lambda item: item[0], reverse=True)
-    if not running_jobs:
+
+def index_run_meta(path: Path, meta: dict[str, Any]) -> None:
+    """Record one run's metadata in the index of the directory that holds it."""
+    if not fnmatch.fnmatch(path.name, RUN_META_GLOB) or not run_index_path(path.parent).exists():
+        # No index yet: the first query imports every file, including this one.
+        return
+    try:
+        conn = _connect_run_index(path.parent)
+    except sqlite3.Error:
+        return
+    try:
+        with conn:
+            _upsert_run_rows(conn, [_run_index_row(path.name, meta)])
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
+
+
+def write_run_meta(
+    path: Path,
+    meta: dict[str, Any],
+    *,
+    write_json: Callable[[Path, Any], None],
+) -> None:
+    write_json(path, meta)
+    index_run_meta(path, meta)
+
+
+def rebuild_run_index(*, runs_root: Path, read_json: Callable[[Path], Any]) -> int:
+    """Re-import every run JSON file into a fresh index; returns the number indexed."""
+    if not runs_root.exists():
+        return 0
+    conn = _connect_run_index(runs_root)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM runs")
+            conn.execute("DELETE FROM registry_state")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        _sync_run_index(conn, runs_root, read_json)
+        return int(conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
+    finally:
+        conn.close()
+
+
+def running_mode_for_ym(
+    *,
+    year: int,
+    month: int,
+    runs_root: Path,
+    read_json: Callable[[Path], Any],
+) -> str | None:
+    records = list_run_records(
+        runs_root=runs_root,
+        read_json=read_json,
+        status="running",
+        year=year,
+        month=month,
+    )
+    if not records:
         return None
-    return running_jobs[0][1]
+    params = records[0][1].get("params") if isinstance(records[0][1].get("params"), dict) else {}
+    return str(params.get("mode") or "")
 
 
 def list_run_jobs(
     *,
     runs_root: Path,
     read_json: Callable[[Path], Any],
+    status: str | None = None,
 ) -> list[dict[str, Any]]:
-    if not runs_root.exists():
-        return []
-    items: list[dict[str, Any]] = []
-    for path in runs_root.glob("run_*.json"):
-        data = read_json(path) or {}
-        if isinstance(data, dict) and data:
-            items.append(data)
-    items.sort(key=lambda item: str(item.get("started_at") or ""), reverse=True)
-    return items
+    return [meta for _, meta in list_run_records(runs_root=runs_root, read_json=read_json, status=status)]
 
 
 def running_job_exists(jobs: list[dict[str, Any]]) -> bool:
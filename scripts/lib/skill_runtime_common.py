@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 import json
 import os
+import stat
+import tempfile
+import threading
+import time
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 SUPPORTED_DASHBOARD_UI_LOCALES = {"ja", "en"}
 ALLOW_UNSAFE_AX_HOME_ENV = "AX_ALLOW_UNSAFE_AX_HOME"
+# "0" skips fsync in write_json (rename stays atomic, but a power loss may drop the write).
+WRITE_JSON_FSYNC_ENV = "AX_WRITE_JSON_FSYNC"
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
@@ -197,6 +204,136 @@ def load_order_exclusions(path: Path | str | None) -> set[tuple[str, str]]:
     return out
 
 
-def write_json(path: Path, data: Any) -> None:
+_PATH_LOCKS_GUARD = threading.Lock()
+_PATH_LOCKS: dict[str, threading.RLock] = {}
+# Windows refuses to replace a file another process has open; readers let go quickly.
+_REPLACE_RETRY_SECONDS = (0.01, 0.05, 0.1, 0.25, 0.5)
+
+
+def _read_umask() -> int:
+    # os.umask can only be read by setting it; do it once at import, before
+    # other threads create files, rather than racing them on every write.
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _read_umask()
+
+
+def _path_lock(path: Path) -> threading.RLock:
+    key = os.path.normcase(os.path.abspath(path))
+    with _PATH_LOCKS_GUARD:
+        lock = _PATH_LOCKS.get(key)
+        if lock is None:
+            lock = _PATH_LOCKS[key] = threading.RLock()
+        return lock
+
+
+@contextmanager
+def locked_path(path: Path) -> Iterator[None]:
+    """
+    Hold the per-path advisory lock for a read-modify-write of `path`.
+
+    Threads in this process are serialized by an in-memory lock; other
+    processes are serialized through `<name>.lock` next to the file when the
+    platform supports file locking. `write_json` takes the same in-memory lock,
+    so it may be called while holding this.
+    """
+    with _path_lock(path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path.with_name(path.name + ".lock"), "a+b")
+        try:
+            try:
+                import fcntl
+
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            except ImportError:  # pragma: no cover - Windows
+                import msvcrt
+
+                handle.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            yield
+        finally:
+            handle.close()
+
+
+def _fsync_enabled() -> bool:
+    return str(os.environ.get(WRITE_JSON_FSYNC_ENV, "1") or "").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _fsync_dir(directory: Path) -> None:
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _replace(src: str, dst: Path) -> None:
+    for delay in _REPLACE_RETRY_SECONDS:
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            time.sleep(delay)
+    os.replace(src, dst)
+
+
+def _file_mode(path: Path) -> int:
+    """Mode for the replacement: the existing file's, else what open() would create."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def write_text_atomic(path: Path, text: str, *, durable: bool | None = None) -> None:
+    """Write `text` to a temp file in the same directory, fsync it and rename it over `path`."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    sync = _fsync_enabled() if durable is None else durable
+    with _path_lock(path):
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as handle:
+                handle.write(text)
+                handle.flush()
+                if sync:
+                    os.fsync(handle.fileno())
+            # mkstemp creates 0600; keep the mode readers of `path` had before.
+            os.chmod(tmp, _file_mode(path))
+            _replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    if sync:
+        _fsync_dir(path.parent)
+
+
+def write_json(path: Path, data: Any, *, compact: bool = False, durable: bool | None = None) -> None:
+    """
+    Atomically replace `path` with `data` as JSON.
+
+    Readers see either the previous file or the new one, never a partial
+    write. `compact=True` drops indentation for large machine-only files.
+    """
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+    write_text_atomic(path, text, durable=durable)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Read size when walking backwards; large enough that a typical 200-line tail
+# is one or two reads, small enough to stay cheap on short files.
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _skip_partial_char(data: bytes) -> bytes:
+    # A cut inside a multi-byte UTF-8 sequence leaves up to three continuation
+    # bytes (10xxxxxx) at the front; drop them instead of decoding garbage.
+    index = 0
+    while index < min(3, len(data)) and (data[index] & 0xC0) == 0x80:
+        index += 1
+    return data[index:]
+
+
+def tail_bytes(path: Path, *, max_bytes: int = 0, max_lines: int = 0, block_size: int = TAIL_BLOCK_SIZE) -> bytes:
+    """
+    Return the end of `path`, reading backwards from EOF in blocks.
+
+    `max_bytes` caps the result and moves its start to a UTF-8 character
+    boundary. `max_lines` stops the walk once the data holds more than that
+    many newlines, so the caller can split off the last `max_lines` lines.
+    With neither limit the whole file is returned. Raises OSError.
+    """
+    byte_limit = max(0, int(max_bytes))
+    line_limit = max(0, int(max_lines))
+    block = max(1, int(block_size))
+    with path.open("rb") as handle:
+        end = os.fstat(handle.fileno()).st_size
+        floor = max(0, end - byte_limit) if byte_limit else 0
+        if not line_limit:
+            handle.seek(floor)
+            data = handle.read(end - floor)
+            return _skip_partial_char(data) if floor else data
+
+        blocks: list[bytes] = []
+        newlines = 0
+        position = end
+        while position > floor and newlines <= line_limit:
+            start = max(floor, position - block)
+            handle.seek(start)
+            chunk = handle.read(position - start)
+            blocks.append(chunk)
+            newlines += chunk.count(b"\n")
+            position = start
+    data = b"".join(reversed(blocks))
+    return _skip_partial_char(data) if position else data
+
+
+def tail_text(path: Path, *, max_bytes: int = 0, errors: str = "replace") -> str:
+    """Decode the last `max_bytes` of `path` (the whole file when 0). Raises OSError."""
+    return tail_bytes(path, max_bytes=max_bytes).decode("utf-8", errors=errors)
+
+
+def tail_lines(path: Path, *, max_lines: int, max_bytes: int = 0, errors: str = "replace") -> list[str]:
+    """
+    Return the last `max_lines` lines of `path` (every line when 0), split
+    like `str.splitlines()` on the whole file. `max_bytes` bounds the read for
+    files with very long lines. Raises OSError.
+    """
+    line_limit = max(0, int(max_lines))
+    lines = tail_bytes(path, max_bytes=max_bytes, max_lines=line_limit).decode("utf-8", errors=errors).splitlines()
+    return lines[-line_limit:] if line_limit else lines
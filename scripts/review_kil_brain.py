@@ -128,6 +128,13 @@ def _append_review(record: ReviewResult) -> None:
         f.write(json.dumps(payload, ensure_ascii=False) + "\n")
 
 
+def review_record(record: Dict[str, Any]) -> ReviewResult:
+    """Review one AGENT_BRAIN_INDEX record and append the result to the review log."""
+    result = _infer_review_plan(record)
+    _append_review(result)
+    return result
+
+
 def review_kil_brain(commit_hash: Optional[str] = None) -> int:
     records = _load_latest_records()
     if not records:
@@ -145,8 +152,7 @@ def review_kil_brain(commit_hash: Optional[str] = None) -> int:
     if not target:
         return 0
 
-    result = _infer_review_plan(target)
-    _append_review(result)
+    review_record(target)
     return 0
 
 
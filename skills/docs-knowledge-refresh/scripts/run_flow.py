@@ -37,6 +37,18 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="treat bootstrap-added review dates as stale (for leak prevention)",
     )
+    ap.add_argument("--workers", type=int, help="parallel workers for document parsing")
+    ap.add_argument("--cache-file", help="audit cache path (default: AX_HOME/cache/knowledge_refresh/audit_cache.json)")
+    ap.add_argument("--no-cache", action="store_true", help="parse every document without the audit cache")
+    ap.add_argument("--check-links", action="store_true", help="check reachability of source URLs")
+    ap.add_argument("--link-timeout", type=float, help="per-request timeout in seconds for link checks")
+    ap.add_argument("--link-cache-ttl-hours", type=float, help="reuse link check results younger than this")
+    ap.add_argument(
+        "--link-cache-file",
+        help="link check cache path (default: AX_HOME/cache/knowledge_refresh/link_cache.json)",
+    )
+    ap.add_argument("--no-link-cache", action="store_true", help="recheck every source URL without the link cache")
+    ap.add_argument("--link-host-interval-ms", type=int, help="minimum interval between requests to one host")
     ap.add_argument(
         "--bootstrap-review-source",
         default="knowledge_refresh_weekly",
@@ -10,7 +10,9 @@ try:
         _as_bool,
         _as_int,
         _build_report_markdown,
+        _check_links,
         _now_utc_iso,
+        _scan_documents,
     )
     from .run_processing_config import _prepare_audit_context
     from .run_processing_items import _collect_audit_items
@@ -19,7 +21,9 @@ except Exception:  # pragma: no cover - direct script execution fallback
         _as_bool,
         _as_int,
         _build_report_markdown,
+        _check_links,
         _now_utc_iso,
+        _scan_documents,
     )
     from run_processing_config import _prepare_audit_context
     from run_processing_items import _collect_audit_items
@@ -67,6 +71,25 @@ def _execute_audit(
     if warn_within_days < 0:
         raise ValueError("warn_within_days must be >= 0")
 
+    parsed_documents, cache_stats = _scan_documents(
+        files,
+        cache_path=context["cache_path"],
+        workers=context["workers"],
+    )
+
+    link_results: dict[str, dict[str, Any]] | None = None
+    link_stats: dict[str, Any] | None = None
+    if context["check_links"]:
+        all_urls = sorted({url for parsed in parsed_documents.values() for url in parsed.get("source_urls") or []})
+        link_results, link_stats = _check_links(
+            all_urls,
+            cache_path=context["link_cache_path"],
+            ttl_hours=context["link_cache_ttl_hours"],
+            workers=context["workers"],
+            host_interval_ms=context["link_host_interval_ms"],
+            timeout=context["link_timeout"],
+        )
+
     items, stale_items, warning_items, fresh_items = _collect_audit_items(
         files,
         as_of,
@@ -82,6 +105,8 @@ def _execute_audit(
         dry_run=dry_run,
         cwd=Path.cwd(),
         scan_roots=context["scan_roots"],
+        parsed_documents=parsed_documents,
+        link_results=link_results,
     )
     bootstrap_items = [item for item in items if item.get("bootstrap_applied")]
 
@@ -126,6 +151,8 @@ def _execute_audit(
             "write_report_requested": write_report_requested,
             "write_report": write_report,
             "registry_path": registry.get("path"),
+            "workers": context["workers"],
+            "check_links": context["check_links"],
         },
         "summary": {
             "scanned": len(items),
@@ -135,6 +162,8 @@ def _execute_audit(
             "missing_scan_paths": len(missing_paths),
         },
         "missing_scan_paths": missing_paths,
+        "cache": cache_stats,
+        "links": link_stats,
         "items": items,
         "stale_items": stale_items,
         "warning_items": warning_items,
@@ -14,8 +14,14 @@ try:
         _ax_home,
         _blank_to_none,
         _coalesce,
+        _default_audit_cache_path,
         _discover_files,
         _load_registry,
+        DEFAULT_AUDIT_WORKERS,
+        DEFAULT_LINK_CACHE_TTL_HOURS,
+        DEFAULT_LINK_HOST_INTERVAL_MS,
+        DEFAULT_LINK_TIMEOUT_SECONDS,
+        _default_link_cache_path,
     )
 except Exception:  # pragma: no cover - direct script execution fallback
     from run_support import (
@@ -25,8 +31,14 @@ except Exception:  # pragma: no cover - direct script execution fallback
         _ax_home,
         _blank_to_none,
         _coalesce,
+        _default_audit_cache_path,
         _discover_files,
         _load_registry,
+        DEFAULT_AUDIT_WORKERS,
+        DEFAULT_LINK_CACHE_TTL_HOURS,
+        DEFAULT_LINK_HOST_INTERVAL_MS,
+        DEFAULT_LINK_TIMEOUT_SECONDS,
+        _default_link_cache_path,
     )
 
 
@@ -117,6 +129,62 @@ def _prepare_audit_context(args, raw_input: dict[str, Any]) -> dict[str, Any]:
         else (_ax_home() / "reports" / "knowledge_refresh")
     )
 
+    cache_cfg = config.get("cache") if isinstance(config.get("cache"), dict) else {}
+    cache_enabled = not args.no_cache and _as_bool(
+        _coalesce(params.get("audit_cache"), cache_cfg.get("enabled")),
+        default=True,
+    )
+    cache_path_raw = _blank_to_none(
+        _coalesce(args.cache_file, params.get("audit_cache_path"), cache_cfg.get("path"))
+    )
+    cache_path = (
+        (Path(cache_path_raw).expanduser() if cache_path_raw else _default_audit_cache_path())
+        if cache_enabled
+        else None
+    )
+    workers = _as_int(
+        _coalesce(args.workers, params.get("workers"), cache_cfg.get("workers")),
+        name="workers",
+        default=DEFAULT_AUDIT_WORKERS,
+    )
+    if workers <= 0:
+        raise ValueError("workers must be > 0")
+
+    links_cfg = config.get("links") if isinstance(config.get("links"), dict) else {}
+    check_links = _as_bool(
+        _coalesce(args.check_links or None, params.get("check_links"), links_cfg.get("enabled")),
+        default=False,
+    )
+    link_timeout = float(
+        _coalesce(args.link_timeout, params.get("link_timeout"), links_cfg.get("timeout_seconds"))
+        or DEFAULT_LINK_TIMEOUT_SECONDS
+    )
+    link_cache_ttl_hours = float(
+        _coalesce(
+            args.link_cache_ttl_hours,
+            params.get("link_cache_ttl_hours"),
+            links_cfg.get("cache_ttl_hours"),
+            DEFAULT_LINK_CACHE_TTL_HOURS,
+        )
+    )
+    link_host_interval_ms = _as_int(
+        _coalesce(args.link_host_interval_ms, params.get("link_host_interval_ms"), links_cfg.get("host_interval_ms")),
+        name="link_host_interval_ms",
+        default=DEFAULT_LINK_HOST_INTERVAL_MS,
+    )
+    link_cache_enabled = not args.no_link_cache and _as_bool(
+        _coalesce(params.get("link_cache"), links_cfg.get("cache_enabled")),
+        default=True,
+    )
+    link_cache_path_raw = _blank_to_none(
+        _coalesce(args.link_cache_file, params.get("link_cache_path"), links_cfg.get("cache_path"))
+    )
+    link_cache_path = (
+        (Path(link_cache_path_raw).expanduser() if link_cache_path_raw else _default_link_cache_path())
+        if link_cache_enabled
+        else None
+    )
+
     registry_path = _blank_to_none(
         _coalesce(args.registry, params.get("registry_path"), registry_cfg.get("path"))
     )
@@ -147,6 +215,13 @@ def _prepare_audit_context(args, raw_input: dict[str, Any]) -> dict[str, Any]:
         "write_report_requested": write_report_requested,
         "write_report": write_report,
         "report_dir": report_dir,
+        "cache_path": cache_path,
+        "workers": workers,
+        "check_links": check_links,
+        "link_timeout": link_timeout,
+        "link_cache_ttl_hours": link_cache_ttl_hours,
+        "link_host_interval_ms": link_host_interval_ms,
+        "link_cache_path": link_cache_path,
         "registry": registry,
         "files": files,
         "missing_paths": missing_paths,
@@ -9,26 +9,26 @@ from typing import Any
 
 try:
     from .run_support import (
-        URL_RE,
         _as_bool,
         _as_int,
         _blank_to_none,
-        _extract_review_date,
         _prepend_review_frontmatter,
         _load_text,
+        _parse_document,
+        _parsed_review_date,
         _rel_posix,
         _select_rule,
         _write_text,
     )
 except Exception:  # pragma: no cover - direct script execution fallback
     from run_support import (  # type: ignore
-        URL_RE,
         _as_bool,
         _as_int,
         _blank_to_none,
-        _extract_review_date,
         _prepend_review_frontmatter,
         _load_text,
+        _parse_document,
+        _parsed_review_date,
         _rel_posix,
         _select_rule,
         _write_text,
@@ -51,6 +51,8 @@ def _collect_audit_items(
     dry_run: bool = False,
     cwd: Path,
     scan_roots: list[Path] | None = None,
+    parsed_documents: dict[str, dict[str, Any]] | None = None,
+    link_results: dict[str, dict[str, Any]] | None = None,
 ) -> tuple[
     list[dict[str, Any]],
     list[dict[str, Any]],
@@ -68,9 +70,14 @@ def _collect_audit_items(
             scan_roots=scan_roots or [],
             cwd=cwd,
         )
-        text, encoding_used = _load_text(file_path)
-        review_date, review_date_key, review_source = _extract_review_date(text)
-        source_urls = sorted(set(URL_RE.findall(text)))
+        parsed = (parsed_documents or {}).get(str(file_path.resolve()))
+        if parsed is None:
+            parsed = _parse_document(file_path)
+        encoding_used = parsed["encoding_used"]
+        review_date = _parsed_review_date(parsed)
+        review_date_key = parsed["review_date_key"]
+        review_source = parsed["review_source"]
+        source_urls = parsed["source_urls"]
 
         matched_rule = _select_rule(rel_path, reg_rules)
         eff_max_age = default_max_age
@@ -112,6 +119,7 @@ def _collect_audit_items(
                 bootstrap_source = _blank_to_none(bootstrap_review_source) or "knowledge_refresh_weekly"
                 if not dry_run:
                     try:
+                        text, encoding_used = _load_text(file_path)
                         new_text, _ = _prepend_review_frontmatter(
                             text,
                             as_of.isoformat(),
@@ -156,6 +164,21 @@ def _collect_audit_items(
             state = "stale"
             reasons.append("source_url_missing")
 
+        link_health: dict[str, list[dict[str, Any]]] | None = None
+        if link_results is not None:
+            link_health = _summarize_link_health(source_urls, link_results)
+            if link_health["broken"]:
+                state = "stale"
+                reasons.append("link_broken")
+            if link_health["redirected"]:
+                if state == "fresh":
+                    state = "warning"
+                reasons.append("link_redirected")
+            if link_health["unreachable"]:
+                if state == "fresh":
+                    state = "warning"
+                reasons.append("link_unreachable")
+
         item = {
             "path": rel_path,
             "review_date": review_date_str,
@@ -173,6 +196,10 @@ def _collect_audit_items(
             "encoding_used": encoding_used,
             "bootstrap_applied": bootstrap_applied,
         }
+        if link_health is not None:
+            item["broken_links"] = link_health["broken"]
+            item["redirected_links"] = link_health["redirected"]
+            item["unreachable_links"] = link_health["unreachable"]
         items.append(item)
 
         if state == "stale":
@@ -185,6 +212,29 @@ def _collect_audit_items(
     return items, stale_items, warning_items, fresh_items
 
 
+def _summarize_link_health(
+    source_urls: list[str],
+    link_results: dict[str, dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    out: dict[str, list[dict[str, Any]]] = {"broken": [], "redirected": [], "unreachable": []}
+    seen: set[str] = set()
+    for raw in source_urls:
+        result = link_results.get(raw)
+        if not result or result["url"] in seen:
+            continue
+        seen.add(result["url"])
+        bucket = out.get(result.get("state") or "")
+        if bucket is None:
+            continue
+        entry = {"url": result["url"], "status": result.get("status")}
+        if result.get("state") == "redirected":
+            entry["final_url"] = result.get("final_url")
+        if result.get("error"):
+            entry["error"] = result.get("error")
+        bucket.append(entry)
+    return out
+
+
 def _normalize_match_path(
     file_path: Path,
     scan_roots: list[Path] | None = None,
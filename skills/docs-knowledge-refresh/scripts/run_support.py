@@ -5,20 +5,28 @@ try:
     from .run_support_constants import *  # noqa: F401,F403
     from .run_support_converters import *  # noqa: F401,F403
     from .run_support_io import *  # noqa: F401,F403
+    from .run_support_cache import *  # noqa: F401,F403
+    from .run_support_links import *  # noqa: F401,F403
 
     from .run_support_constants import __all__ as _constants_all
     from .run_support_converters import __all__ as _converters_all
     from .run_support_io import __all__ as _io_all
+    from .run_support_cache import __all__ as _cache_all
+    from .run_support_links import __all__ as _links_all
 except Exception:  # pragma: no cover - direct script execution fallback
     from run_support_constants import *  # type: ignore # noqa: F401,F403
     from run_support_converters import *  # type: ignore # noqa: F401,F403
     from run_support_io import *  # type: ignore # noqa: F401,F403
+    from run_support_cache import *  # type: ignore # noqa: F401,F403
+    from run_support_links import *  # type: ignore # noqa: F401,F403
 
     from run_support_constants import __all__ as _constants_all  # type: ignore
     from run_support_converters import __all__ as _converters_all  # type: ignore
     from run_support_io import __all__ as _io_all  # type: ignore
+    from run_support_cache import __all__ as _cache_all  # type: ignore
+    from run_support_links import __all__ as _links_all  # type: ignore
 
-__all__ = list(_constants_all + _converters_all + _io_all)
+__all__ = list(_constants_all + _converters_all + _io_all + _cache_all + _links_all)
 
-for _name in ("_constants_all", "_converters_all", "_io_all"):
+for _name in ("_constants_all", "_converters_all", "_io_all", "_cache_all", "_links_all"):
     del globals()[_name]
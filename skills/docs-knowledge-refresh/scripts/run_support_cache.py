@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Per-file audit cache and parallel document parsing for knowledge-refresh."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+try:
+    from .run_support_constants import URL_RE
+    from .run_support_converters import _extract_review_date
+    from .run_support_io import _ax_home, _load_text
+except Exception:  # pragma: no cover - direct script execution fallback
+    from run_support_constants import URL_RE  # type: ignore
+    from run_support_converters import _extract_review_date  # type: ignore
+    from run_support_io import _ax_home, _load_text  # type: ignore
+
+
+# Bump when parsing rules change so stale cache entries are ignored.
+AUDIT_CACHE_VERSION = 1
+DEFAULT_AUDIT_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+def _default_audit_cache_path() -> Path:
+    return _ax_home() / "cache" / "knowledge_refresh" / "audit_cache.json"
+
+
+def _load_audit_cache(path: Path | None) -> dict[str, dict[str, Any]]:
+    if path is None or not path.exists():
+        return {}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != AUDIT_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {str(k): v for k, v in entries.items() if isinstance(v, dict)}
+
+
+def _save_audit_cache(path: Path | None, entries: dict[str, dict[str, Any]]) -> None:
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    payload = {"version": AUDIT_CACHE_VERSION, "entries": entries}
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _parse_document(path: Path) -> dict[str, Any]:
+    """Decode one document and extract everything the audit needs from its text."""
+    text, encoding_used = _load_text(path)
+    review_date, review_date_key, review_source = _extract_review_date(text)
+    return {
+        "review_date": review_date.isoformat() if review_date else None,
+        "review_date_key": review_date_key,
+        "review_source": review_source,
+        "source_urls": sorted(set(URL_RE.findall(text))),
+        "encoding_used": encoding_used,
+    }
+
+
+def _parsed_review_date(entry: dict[str, Any]) -> dt.date | None:
+    raw = entry.get("review_date")
+    return dt.date.fromisoformat(raw) if raw else None
+
+
+def _scan_documents(
+    files: list[Path],
+    *,
+    cache_path: Path | None,
+    workers: int = DEFAULT_AUDIT_WORKERS,
+) -> tuple[dict[str, dict[str, Any]], dict[str, Any]]:
+    """
+    Parse documents, reusing cached results for files whose size and mtime are unchanged.
+
+    Returns a mapping of resolved path -> parsed entry, plus cache statistics.
+    Only entries for the given files are persisted, so deleted documents drop
+    out of the cache on the next run.
+    """
+    cached = _load_audit_cache(cache_path)
+    parsed: dict[str, dict[str, Any]] = {}
+    pending: list[tuple[str, Path, tuple[int, int] | None]] = []
+
+    for path in files:
+        key = str(path.resolve())
+        signature = _file_signature(path)
+        entry = cached.get(key)
+        if (
+            entry is not None
+            and signature is not None
+            and entry.get("size") == signature[0]
+            and entry.get("mtime_ns") == signature[1]
+        ):
+            parsed[key] = entry
+        else:
+            pending.append((key, path, signature))
+
+    if pending:
+        if workers > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(lambda job: _parse_document(job[1]), pending))
+        else:
+            results = [_parse_document(path) for _, path, _ in pending]
+        for (key, _, signature), result in zip(pending, results):
+            if signature is not None:
+                result["size"], result["mtime_ns"] = signature
+            parsed[key] = result
+
+    stats = {
+        "enabled": cache_path is not None,
+        "path": str(cache_path) if cache_path is not None else None,
+        "hits": len(files) - len(pending),
+        "misses": len(pending),
+    }
+    if cache_path is not None:
+        try:
+            _save_audit_cache(cache_path, {k: v for k, v in parsed.items() if "mtime_ns" in v})
+        except OSError as exc:
+            stats["write_error"] = str(exc)
+    return parsed, stats
+
+
+__all__ = [
+    "AUDIT_CACHE_VERSION",
+    "DEFAULT_AUDIT_WORKERS",
+    "_default_audit_cache_path",
+    "_load_audit_cache",
+    "_save_audit_cache",
+    "_parse_document",
+    "_parsed_review_date",
+    "_scan_documents",
+]
@@ -110,20 +110,46 @@ def _discover_files(
                 found[str(target.resolve())] = target
             continue
 
-        for item in target.rglob("*"):
-            if not item.is_file():
-                continue
-            if item.suffix.lower() not in exts:
-                continue
-            parts_lower = {p.lower() for p in item.parts}
-            if parts_lower & exclude:
-                continue
+        if {p.lower() for p in target.parts} & exclude:
+            continue
+        for item in _walk_files(target, exts, exclude):
             found[str(item.resolve())] = item
 
     files = sorted(found.values(), key=lambda p: str(p).replace("\\", "/"))
     return files, missing
 
 
+def _walk_files(root: Path, exts: set[str], exclude: set[str]) -> list[Path]:
+    """Collect matching files under root, pruning excluded directories before descending."""
+    out: list[Path] = []
+    stack = [str(root)]
+    visited: set[str] = set()
+    while stack:
+        current = stack.pop()
+        real = os.path.realpath(current)
+        if real in visited:
+            continue
+        visited.add(real)
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if entry.name.lower() not in exclude:
+                        stack.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if os.path.splitext(entry.name)[1].lower() in exts:
+                out.append(Path(entry.path))
+    return out
+
+
 def _candidate_existing_path(raw: str) -> Path | None:
     candidates = _candidate_paths(Path(raw))
     for candidate in candidates:
@@ -206,6 +232,17 @@ def _select_rule(rel_path: str, rules: list[dict[str, Any]]) -> dict[str, Any] |
     return None
 
 
+def _link_detail_lines(item: dict[str, Any]) -> list[str]:
+    lines: list[str] = []
+    for link in item.get("broken_links") or []:
+        lines.append(f"  - broken: {link['url']} (status={link.get('status')})")
+    for link in item.get("redirected_links") or []:
+        lines.append(f"  - redirected: {link['url']} -> {link.get('final_url')}")
+    for link in item.get("unreachable_links") or []:
+        lines.append(f"  - unreachable: {link['url']} ({link.get('error') or link.get('status')})")
+    return lines
+
+
 def _build_report_markdown(
     *,
     generated_at: str,
@@ -243,6 +280,7 @@ def _build_report_markdown(
             lines.append(
                 f"- [ ] `{item['path']}` (last={item.get('review_date')}, age={age}, max={max_age}, reasons={','.join(item.get('reasons') or [])})"
             )
+            lines.extend(_link_detail_lines(item))
     lines.append("")
     lines.append("## Warning Items")
     lines.append("")
@@ -255,6 +293,7 @@ def _build_report_markdown(
             lines.append(
                 f"- [ ] `{item['path']}` (last={item.get('review_date')}, age={age}, max={max_age}, reasons={','.join(item.get('reasons') or [])})"
             )
+            lines.extend(_link_detail_lines(item))
     lines.append("")
     lines.append("## Bootstrap Updates")
     lines.append("")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Optional link-health stage for knowledge-refresh audits."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+try:
+    from .run_support_io import _ax_home
+except Exception:  # pragma: no cover - direct script execution fallback
+    from run_support_io import _ax_home  # type: ignore
+
+
+LINK_CACHE_VERSION = 1
+DEFAULT_LINK_TIMEOUT_SECONDS = 10.0
+DEFAULT_LINK_CACHE_TTL_HOURS = 24.0
+DEFAULT_LINK_HOST_INTERVAL_MS = 500
+LINK_USER_AGENT = "docs-knowledge-refresh/1.0 (+link-health)"
+
+# Markdown and prose punctuation that URL_RE keeps at the end of a match.
+_TRAILING_URL_CHARS = ".,;:!?`*_]}>|、。）」"
+# Auth walls and bot blocks are not evidence that the page is gone.
+_RESTRICTED_STATUSES = {401, 403}
+# Statuses that say nothing about the link itself; they are retried next run.
+_TRANSIENT_STATUSES = {408, 425, 429}
+
+
+def _default_link_cache_path() -> Path:
+    return _ax_home() / "cache" / "knowledge_refresh" / "link_cache.json"
+
+
+def _normalize_link(url: str) -> str | None:
+    candidate = url.rstrip(_TRAILING_URL_CHARS)
+    parsed = urllib.parse.urlsplit(candidate)
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    return urllib.parse.urlunsplit(parsed._replace(fragment=""))
+
+
+def _load_link_cache(path: Path | None) -> dict[str, dict[str, Any]]:
+    if path is None or not path.exists():
+        return {}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != LINK_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {str(k): v for k, v in entries.items() if isinstance(v, dict)}
+
+
+def _save_link_cache(path: Path | None, entries: dict[str, dict[str, Any]]) -> None:
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    payload = {"version": LINK_CACHE_VERSION, "entries": entries}
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class _HostThrottle:
+    """Keep at least `interval` seconds between requests to the same host."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = max(0.0, interval)
+        self._guard = threading.Lock()
+        self._locks: dict[str, threading.Lock] = {}
+        self._last: dict[str, float] = {}
+
+    def wait(self, host: str) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.setdefault(host, threading.Lock())
+        lock.acquire()
+        last = self._last.get(host)
+        if last is not None:
+            remaining = self.interval - (time.monotonic() - last)
+            if remaining > 0:
+                time.sleep(remaining)
+        return lock
+
+    def release(self, host: str, lock: threading.Lock) -> None:
+        self._last[host] = time.monotonic()
+        lock.release()
+
+
+def _request_status(url: str, method: str, timeout: float) -> tuple[int, str]:
+    headers = {"User-Agent": LINK_USER_AGENT}
+    if method == "GET":
+        headers["Range"] = "bytes=0-0"
+    req = urllib.request.Request(url, method=method, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as res:
+            return int(res.status), res.geturl()
+    except urllib.error.HTTPError as exc:
+        return int(exc.code), exc.geturl() or url
+
+
+def _classify_link(url: str, status: int | None, final_url: str | None) -> str:
+    if status is None:
+        return "unreachable"
+    if status in _TRANSIENT_STATUSES or status >= 500:
+        return "unreachable"
+    if status in _RESTRICTED_STATUSES:
+        return "ok"
+    if status >= 400:
+        return "broken"
+    if final_url and final_url.rstrip("/") != url.rstrip("/"):
+        return "redirected"
+    return "ok"
+
+
+def _check_link(url: str, *, throttle: _HostThrottle, timeout: float) -> dict[str, Any]:
+    host = urllib.parse.urlsplit(url).netloc.lower()
+    status: int | None = None
+    final_url: str | None = None
+    error: str | None = None
+    method = "HEAD"
+    for method in ("HEAD", "GET"):
+        lock = throttle.wait(host)
+        try:
+            status, final_url = _request_status(url, method, timeout)
+            error = None
+        except Exception as exc:  # noqa: BLE001
+            status, final_url, error = None, None, f"{type(exc).__name__}: {exc}"
+        finally:
+            throttle.release(host, lock)
+        # Many servers reject or mishandle HEAD; retry once with a ranged GET.
+        if status is not None and status < 400:
+            break
+    return {
+        "state": _classify_link(url, status, final_url),
+        "status": status,
+        "method": method,
+        "final_url": final_url,
+        "error": error,
+        "checked_at": time.time(),
+    }
+
+
+def _check_links(
+    urls: list[str],
+    *,
+    cache_path: Path | None,
+    ttl_hours: float = DEFAULT_LINK_CACHE_TTL_HOURS,
+    workers: int = 8,
+    host_interval_ms: int = DEFAULT_LINK_HOST_INTERVAL_MS,
+    timeout: float = DEFAULT_LINK_TIMEOUT_SECONDS,
+) -> tuple[dict[str, dict[str, Any]], dict[str, Any]]:
+    """
+    Check each distinct URL once, reusing cached results younger than the TTL.
+
+    Returns a mapping of raw URL (as extracted from documents) -> result and
+    summary statistics. Unreachable results are not cached so transient
+    failures are retried on the next run.
+    """
+    normalized: dict[str, str] = {}
+    for url in urls:
+        link = _normalize_link(url)
+        if link:
+            normalized[url] = link
+    distinct = sorted(set(normalized.values()))
+
+    cached = _load_link_cache(cache_path)
+    now = time.time()
+    ttl_seconds = max(0.0, ttl_hours) * 3600.0
+    results: dict[str, dict[str, Any]] = {}
+    pending: list[str] = []
+    for link in distinct:
+        entry = cached.get(link)
+        if entry is not None and now - float(entry.get("checked_at") or 0) <= ttl_seconds:
+            results[link] = entry
+        else:
+            pending.append(link)
+
+    if pending:
+        throttle = _HostThrottle(host_interval_ms / 1000.0)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            checked = list(pool.map(lambda link: _check_link(link, throttle=throttle, timeout=timeout), pending))
+        results.update(zip(pending, checked))
+
+    if cache_path is not None:
+        keep = {k: v for k, v in cached.items() if now - float(v.get("checked_at") or 0) <= ttl_seconds}
+        keep.update({k: v for k, v in results.items() if v.get("state") != "unreachable"})
+        try:
+            _save_link_cache(cache_path, keep)
+        except OSError:
+            pass
+
+    by_url = {url: {"url": link, **results[link]} for url, link in normalized.items()}
+    states = [results[link]["state"] for link in distinct]
+    stats = {
+        "checked": len(distinct),
+        "cache_hits": len(distinct) - len(pending),
+        "requests": len(pending),
+        "ok": states.count("ok"),
+        "redirected": states.count("redirected"),
+        "broken": states.count("broken"),
+        "unreachable": states.count("unreachable"),
+        "cache_path": str(cache_path) if cache_path is not None else None,
+    }
+    return by_url, stats
+
+
+__all__ = [
+    "DEFAULT_LINK_CACHE_TTL_HOURS",
+    "DEFAULT_LINK_HOST_INTERVAL_MS",
+    "DEFAULT_LINK_TIMEOUT_SECONDS",
+    "_default_link_cache_path",
+    "_normalize_link",
+    "_check_links",
+]
@@ -28,3 +28,123 @@ def test_run_flow_parser_has_scan_argument() -> None:
 def test_entrypoint_run_module_exposes_main() -> None:
     main_script = _load_module(RUN_PATH, "docs_knowledge_run")
     assert callable(main_script.main)
+
+
+def test_discover_files_prunes_excluded_dirs_and_cache_skips_unchanged(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(SCRIPT_PATH.parent))
+    io_mod = _load_module(SCRIPT_PATH.parent / "run_support_io.py", "docs_knowledge_run_support_io")
+    cache_mod = _load_module(SCRIPT_PATH.parent / "run_support_cache.py", "docs_knowledge_run_support_cache")
+
+    docs = tmp_path / "docs"
+    (docs / "sub").mkdir(parents=True)
+    (docs / "node_modules").mkdir()
+    (docs / "a.md").write_text("---\nlast_reviewed: 2026-01-02\n---\nhttps://example.com/a\n", encoding="utf-8")
+    (docs / "sub" / "b.MD").write_text("最終確認日: 2026-01-03\n", encoding="utf-8")
+    (docs / "node_modules" / "c.md").write_text("ignored\n", encoding="utf-8")
+    (docs / "note.txt").write_text("ignored\n", encoding="utf-8")
+
+    files, missing = io_mod._discover_files([str(docs)], [".md"], ["node_modules"])
+    assert missing == []
+    assert [p.name for p in files] == ["a.md", "b.MD"]
+
+    cache_path = tmp_path / "cache.json"
+    parsed, stats = cache_mod._scan_documents(files, cache_path=cache_path, workers=2)
+    assert (stats["hits"], stats["misses"]) == (0, 2)
+    first = parsed[str(files[0].resolve())]
+    assert first["review_date"] == "2026-01-02"
+    assert first["source_urls"] == ["https://example.com/a"]
+    assert parsed[str(files[1].resolve())]["review_date_key"] == "body_marker"
+
+    (docs / "sub" / "b.MD").write_text("# B\n\n最終確認日: 2026-02-04\n", encoding="utf-8")
+    parsed, stats = cache_mod._scan_documents(files, cache_path=cache_path, workers=2)
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert parsed[str(files[1].resolve())]["review_date"] == "2026-02-04"
+
+
+def test_link_health_stage_against_local_fixture_server(tmp_path: Path, monkeypatch) -> None:
+    import http.server
+    import threading
+
+    monkeypatch.syspath_prepend(str(SCRIPT_PATH.parent))
+    flow = _load_module(SCRIPT_PATH, "docs_knowledge_run_flow_links")
+    hits: list[tuple[str, str]] = []
+
+    class _Handler(http.server.BaseHTTPRequestHandler):
+        def _respond(self, method: str) -> None:
+            hits.append((method, self.path))
+            if self.path == "/ok":
+                self.send_response(200)
+            elif self.path == "/moved":
+                self.send_response(301)
+                self.send_header("Location", "/ok")
+            elif self.path == "/no-head" and method == "HEAD":
+                self.send_response(405)
+            elif self.path == "/no-head":
+                self.send_response(200)
+            else:
+                self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_HEAD(self) -> None:  # noqa: N802
+            self._respond("HEAD")
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._respond("GET")
+
+        def log_message(self, *args) -> None:  # noqa: ANN002
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        header = "---\nlast_reviewed: 2026-01-10\n---\n"
+        (docs / "fresh.md").write_text(f"{header}{base}/ok\n{base}/no-head.\n", encoding="utf-8")
+        (docs / "moved.md").write_text(f"{header}{base}/moved\n{base}/ok\n", encoding="utf-8")
+        (docs / "broken.md").write_text(f"{header}`{base}/gone`\n", encoding="utf-8")
+
+        argv = [
+            "--scan", str(docs), "--as-of", "2026-01-12", "--dry-run", "--check-links",
+            "--link-host-interval-ms", "0", "--cache-file", str(tmp_path / "audit.json"),
+        ]
+        monkeypatch.setenv("AX_HOME", str(tmp_path / "ax"))
+        args = flow._build_parser().parse_args(argv)
+        out, code = flow._execute_audit(args, raw_input={})
+        assert code == 0
+        data = out["data"]
+        assert data["links"]["checked"] == 4
+        assert data["links"]["broken"] == 1
+        assert data["links"]["redirected"] == 1
+        by_path = {Path(item["path"]).name: item for item in data["items"]}
+        assert by_path["fresh.md"]["state"] == "fresh"
+        assert by_path["moved.md"]["state"] == "warning"
+        assert by_path["moved.md"]["reasons"] == ["link_redirected"]
+        assert by_path["broken.md"]["state"] == "stale"
+        assert by_path["broken.md"]["broken_links"][0]["status"] == 404
+        assert ("GET", "/no-head") in hits
+        assert hits.count(("HEAD", "/ok")) == 1
+
+        hits.clear()
+        out, _ = flow._execute_audit(flow._build_parser().parse_args(argv), raw_input={})
+        assert out["data"]["links"]["cache_hits"] == 4
+        assert hits == []
+
+        # --no-cache only skips the audit cache; the link cache has its own switch and path.
+        out, _ = flow._execute_audit(flow._build_parser().parse_args([*argv, "--no-cache"]), raw_input={})
+        assert out["data"]["links"]["cache_hits"] == 4
+        assert hits == []
+        out, _ = flow._execute_audit(flow._build_parser().parse_args([*argv, "--no-link-cache"]), raw_input={})
+        assert out["data"]["links"]["cache_hits"] == 0
+        assert hits.count(("HEAD", "/ok")) == 1
+        link_cache = tmp_path / "links.json"
+        flow._execute_audit(
+            flow._build_parser().parse_args([*argv, "--link-cache-file", str(link_cache)]), raw_input={}
+        )
+        assert link_cache.exists()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 import sys
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 SKILL_ROOT = Path(__file__).resolve().parent
 REPO_ROOT = SKILL_ROOT.parent.parent
@@ -39,13 +39,30 @@ from run_registry_common import (  # noqa: E402
     coerce_non_negative_int as _coerce_non_negative_int,
     latest_running_job as _latest_running_job_common,
     list_run_jobs as _list_run_jobs_common,
+    list_run_records as _list_run_records_common,
     normalize_actor as _normalize_audit_actor,
+    rebuild_run_index as _rebuild_run_index_common,
     running_job_exists as _running_job_exists_common,
     running_mode_for_ym as _running_mode_for_ym_common,
     safe_int as _safe_int_optional,
     tail_text as _tail_text,
+    write_run_meta as _write_run_meta_common,
+)
+from audit_segment_common import (  # noqa: E402
+    iter_audit_event_rows as _iter_audit_event_rows,
+    iter_audit_log_bytes as _iter_audit_log_bytes,
+    list_audit_segments as _list_audit_segments,
+    read_audit_log as _read_audit_log,
+)
+from state_store_common import (  # noqa: E402
+    read_state_collections as _read_state_collections_common,
+    state_store_path as _state_store_path_for_artifact,
+    update_state_collections as _update_state_collections_common,
+    write_state_collections as _write_state_collections_common,
 )
 from artifact_archive_common import (  # noqa: E402
+    archive_month_outputs as _archive_month_outputs_common,
+    archive_store_root as _archive_store_root_for_artifact,
     format_archive_snapshot_label as _format_archive_snapshot_label,
     scan_archive_history as _scan_archive_history_common,
     scan_archived_receipts as _scan_archived_receipts_common,
@@ -114,8 +131,8 @@ def load_order_exclusions(path: Path | str | None) -> set[tuple[str, str]]:
     return _load_order_exclusions(path)
 
 
-def write_json(path: Path, data: Any) -> None:
-    _write_json(path, data)
+def write_json(path: Path, data: Any, *, compact: bool = False) -> None:
+    _write_json(path, data, compact=compact)
 
 
 def workflow_templates_path() -> Path:
@@ -210,10 +227,95 @@ def list_run_jobs(
     *,
     runs_root_fn: Path | None = None,
     read_json_fn: Callable[[Path], Any] | None = None,
+    status: str | None = None,
 ) -> list[dict[str, Any]]:
     return _list_run_jobs_common(
         runs_root=runs_root_fn or runs_root(),
         read_json=read_json_fn or read_json,
+        status=status,
+    )
+
+
+def list_run_records(
+    *,
+    runs_root_fn: Path | None = None,
+    read_json_fn: Callable[[Path], Any] | None = None,
+    status: str | None = None,
+    year: int | None = None,
+    month: int | None = None,
+    mode: str | None = None,
+) -> list[tuple[Path, dict[str, Any]]]:
+    return _list_run_records_common(
+        runs_root=runs_root_fn or runs_root(),
+        read_json=read_json_fn or read_json,
+        status=status,
+        year=year,
+        month=month,
+        mode=mode,
+    )
+
+
+def write_run_meta(path: Path, meta: dict[str, Any]) -> None:
+    _write_run_meta_common(path, meta, write_json=write_json)
+
+
+def rebuild_run_index() -> int:
+    return _rebuild_run_index_common(runs_root=runs_root(), read_json=read_json)
+
+
+def state_store_path() -> Path:
+    return _state_store_path_for_artifact(artifact_root())
+
+
+def read_state_collections(
+    collections: tuple[str, ...],
+    *,
+    source: Path | None = None,
+    load_source: Callable[[Any], dict[str, dict[str, dict[str, Any]]]],
+) -> dict[str, dict[str, dict[str, Any]]]:
+    return _read_state_collections_common(
+        db_path=state_store_path(),
+        collections=collections,
+        source=source,
+        read_json=read_json,
+        load_source=load_source,
+    )
+
+
+def write_state_collections(
+    collections: dict[str, dict[str, dict[str, Any]]],
+    *,
+    base: dict[str, dict[str, dict[str, Any]]] | None = None,
+    source: Path | None = None,
+    snapshot: Any = None,
+) -> int:
+    return _write_state_collections_common(
+        db_path=state_store_path(),
+        collections=collections,
+        base=base,
+        source=source,
+        snapshot=snapshot,
+        write_json=write_json,
+    )
+
+
+def update_state_collections(
+    collections: tuple[str, ...],
+    mutate: Callable[[dict[str, dict[str, dict[str, Any]]]], Any],
+    *,
+    source: Path | None = None,
+    load_source: Callable[[Any], dict[str, dict[str, dict[str, Any]]]],
+    snapshot: Callable[[dict[str, dict[str, dict[str, Any]]]], Any] | None = None,
+) -> Any:
+    return _update_state_collections_common(
+        db_path=state_store_path(),
+        collections=collections,
+        mutate=mutate,
+        source=source,
+        read_json=read_json,
+        load_source=load_source,
+        snapshot=snapshot,
+        write_json=write_json,
     )
 
 
@@ -229,6 +331,22 @@ def format_archive_snapshot_label(name: str) -> str:
     return _format_archive_snapshot_label(name)
 
 
+def read_audit_log(path: Path) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    return _read_audit_log(path)
+
+
+def iter_audit_event_rows(path: Path, event_type: str) -> Iterator[dict[str, Any]]:
+    return _iter_audit_event_rows(path, event_type)
+
+
+def iter_audit_log_bytes(path: Path) -> Iterator[bytes]:
+    return _iter_audit_log_bytes(path)
+
+
+def list_audit_segments(path: Path) -> list[Path]:
+    return _list_audit_segments(path)
+
+
 def scan_archive_history(
     *,
     ym_matcher,
@@ -243,6 +361,24 @@ def scan_archive_history(
     )
 
 
+def archive_month_outputs(
+    output_root: Path,
+    *,
+    include_pdfs: bool = True,
+    include_debug: bool = False,
+    cleanup: bool = True,
+) -> dict[str, Any]:
+    return _archive_month_outputs_common(
+        output_root,
+        store_root=_archive_store_root_for_artifact(artifact_root()),
+        runs_root=runs_root(),
+        read_json=read_json,
+        include_pdfs=include_pdfs,
+        include_debug=include_debug,
+        cleanup=cleanup,
+    )
+
+
 def scan_archived_receipts(
     root: Any,
     *,
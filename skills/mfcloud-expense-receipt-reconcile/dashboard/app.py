@@ -17,6 +17,7 @@ from routes.api_workspace_worker import (
     stop_workflow_event_retry_worker,
 )
 from routes.pages import create_pages_router
+from services import ai_skill_tools
 from services import core_scheduler
 from dashboard_app_factory import create_dashboard_app
 
@@ -25,6 +26,8 @@ def _start_background_workers() -> None:
     # Start scheduler and retry workers so scheduled runs can execute unattended.
     core_scheduler.start_worker()
     start_workflow_event_retry_worker()
+    # Build the skill registry now so the first chat message does not pay for the scan.
+    ai_skill_tools.warm_skill_registry()
 
 
 def _stop_background_workers() -> None:
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import json
 import shlex
-from typing import Any
+from typing import Any, Iterator
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from services import ai_chat
 from services import ai_skill_router
@@ -120,6 +120,52 @@ def _handle_skill_chat_command(text: str) -> dict[str, Any] | None:
     return _build_local_skill_response(json.dumps(usage, ensure_ascii=False))
 
 
+def _prepare_chat(payload: dict[str, Any]) -> tuple[list[dict[str, str]], dict[str, str], dict[str, Any] | None]:
+    """Validate the request and answer it locally (skill command or skill routing) when possible."""
+    if "model" in payload:
+        raise HTTPException(status_code=400, detail="model field is not allowed.")
+    try:
+        messages = ai_chat.validate_messages(payload.get("messages"))
+        page_context = ai_chat.validate_page_context(payload.get("page_context"))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    command_response = _handle_skill_chat_command(messages[-1]["content"])
+    if command_response is not None:
+        return messages, page_context, command_response
+
+    latest_text = str(messages[-1]["content"] or "").strip()
+    if not latest_text.lower().startswith("/skill"):
+        try:
+            routed = ai_skill_router.route_chat(messages=messages, page_context=page_context)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        except ai_chat.UpstreamTimeoutError as exc:
+            raise HTTPException(status_code=504, detail=str(exc)) from exc
+        except ai_chat.UpstreamApiError as exc:
+            raise HTTPException(status_code=502, detail=str(exc)) from exc
+        if routed is not None:
+            return messages, page_context, routed
+    return messages, page_context, None
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _iter_chat_stream_events(stream: Iterator[tuple[str, Any]]) -> Iterator[str]:
+    try:
+        for kind, value in stream:
+            if kind == "delta":
+                yield _sse_event("delta", {"text": value})
+            else:
+                yield _sse_event("done", {"status": "ok", **value})
+    except ai_chat.UpstreamTimeoutError as exc:
+        yield _sse_event("error", {"status_code": 504, "detail": str(exc)})
+    except ai_chat.UpstreamApiError as exc:
+        yield _sse_event("error", {"status_code": 502, "detail": str(exc)})
+
+
 def register_api_ai_chat_routes(router: APIRouter) -> None:
     @router.get("/api/ai/chat/status")
     def api_ai_chat_status() -> JSONResponse:
@@ -127,30 +173,9 @@ def register_api_ai_chat_routes(router: APIRouter) -> None:
 
     @router.post("/api/ai/chat")
     def api_ai_chat(payload: dict[str, Any]) -> JSONResponse:
-        if "model" in payload:
-            raise HTTPException(status_code=400, detail="model field is not allowed.")
-        try:
-            messages = ai_chat.validate_messages(payload.get("messages"))
-            page_context = ai_chat.validate_page_context(payload.get("page_context"))
-        except ValueError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-        command_response = _handle_skill_chat_command(messages[-1]["content"])
-        if command_response is not None:
-            return JSONResponse(command_response)
-
-        latest_text = str(messages[-1]["content"] or "").strip()
-        if not latest_text.lower().startswith("/skill"):
-            try:
-                routed = ai_skill_router.route_chat(messages=messages, page_context=page_context)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
-            except ai_chat.UpstreamTimeoutError as exc:
-                raise HTTPException(status_code=504, detail=str(exc)) from exc
-            except ai_chat.UpstreamApiError as exc:
-                raise HTTPException(status_code=502, detail=str(exc)) from exc
-            if routed is not None:
-                return JSONResponse(routed)
+        messages, page_context, local_response = _prepare_chat(payload)
+        if local_response is not None:
+            return JSONResponse(local_response)
 
         try:
             result = ai_chat.chat(
@@ -166,3 +191,28 @@ def register_api_ai_chat_routes(router: APIRouter) -> None:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
         return JSONResponse({"status": "ok", **result})
+
+    @router.post("/api/ai/chat/stream")
+    def api_ai_chat_stream(payload: dict[str, Any]) -> StreamingResponse:
+        # Same contract as /api/ai/chat, delivered as SSE: "delta" events carry
+        # model text as it arrives (none in guardrail enforce mode), "done"
+        # carries the full (guardrail-checked) response body, and upstream
+        # failures become an "error" event.
+        messages, page_context, local_response = _prepare_chat(payload)
+        if local_response is not None:
+            events: Iterator[str] = iter([_sse_event("done", local_response)])
+        else:
+            try:
+                stream = ai_chat.chat_stream(
+                    messages=messages,
+                    page_context=page_context,
+                    policy_profile=ai_chat.POLICY_PROFILE_DASHBOARD_CHAT_STRICT,
+                )
+            except ai_chat.MissingApiKeyError as exc:
+                raise HTTPException(status_code=503, detail=str(exc)) from exc
+            events = _iter_chat_stream_events(stream)
+        return StreamingResponse(
+            events,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+        )
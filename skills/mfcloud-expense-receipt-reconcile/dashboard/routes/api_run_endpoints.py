@@ -29,6 +29,40 @@ def register_api_run_endpoints(router: APIRouter) -> None:
         return JSONResponse({"status": "ok", **result})
 
 
+    @router.get("/api/reconcile-rows/{ym}")
+    def api_reconcile_rows(
+        ym: str,
+        status: str | None = Query(default=None),
+        vendor: str | None = Query(default=None),
+        amount_min: int | None = Query(default=None),
+        amount_max: int | None = Query(default=None),
+        date_from: str | None = Query(default=None),
+        date_to: str | None = Query(default=None),
+        sort: str = Query(default="position"),
+        order: str = Query(default="asc"),
+        cursor: str | None = Query(default=None),
+        limit: int = Query(default=core.RUN_ROWS_DEFAULT_LIMIT, ge=1, le=core.RUN_ROWS_MAX_LIMIT),
+    ) -> JSONResponse:
+        ym = core._safe_ym(ym)
+        root = core._artifact_root() / ym
+        if not root.exists():
+            raise HTTPException(status_code=404, detail="Run not found.")
+        page = core._query_run_rows(
+            root / "reports",
+            status=status,
+            vendor=vendor,
+            amount_min=amount_min,
+            amount_max=amount_max,
+            date_from=date_from,
+            date_to=date_to,
+            sort=sort,
+            order=order,
+            cursor=cursor,
+            limit=limit,
+        )
+        return JSONResponse({"status": "ok", "ym": ym, **page}, headers={"Cache-Control": "no-store"})
+
+
     @router.get("/api/exclusions/{ym}")
     def api_get_exclusions(ym: str) -> JSONResponse:
         ym = core._safe_ym(ym)
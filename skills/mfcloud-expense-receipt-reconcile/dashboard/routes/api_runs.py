@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+import json
 import os
 import re
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from services import core
 
 ActorFromRequest = Callable[[Request], dict[str, str]]
@@ -18,6 +22,13 @@ ErrorToolRunner = Callable[..., dict[str, Any]]
 GetErrorReportsRoot = Callable[[], Path]
 GetReviewScriptPath = Callable[[], Path]
 
+RUN_LOG_TAIL_BYTES = 8000
+RUN_LOG_STREAM_POLL_SECONDS = 0.5
+RUN_LOG_STREAM_PID_CHECK_SECONDS = 5.0
+RUN_LOG_STREAM_HEARTBEAT_SECONDS = 15.0
+RUN_LOG_STREAM_MAX_SECONDS = 30 * 60
+RUN_LOG_STREAM_RETRY_MS = 2000
+
 DOCUMENT_FRESHNESS_ALLOWED_SUFFIXES = {
     ".md",
     ".markdown",
@@ -36,6 +47,12 @@ DOCUMENT_FRESHNESS_EXCLUDED_PREFIXES = (
     "AGENT_BRAIN",
     "KIL_",
 )
+GIT_HISTORY_TIMEOUT_SECONDS = 30
+_GIT_HISTORY_COMMIT_MARKER = "\x1ecommit "
+
+_git_history_lock = threading.Lock()
+# (repo root, pathspecs) -> (HEAD commit, relative path -> last commit ISO date)
+_git_history_cache: dict[tuple[str, tuple[str, ...]], tuple[str, dict[str, str]]] = {}
 
 
 def _resolve_document_freshness_roots() -> list[tuple[str, Path]]:
@@ -111,30 +128,127 @@ def _iter_document_freshness_targets() -> tuple[list[dict[str, str]], list[tuple
     return diagnostics, targets
 
 
-def _git_last_updated_at(path: Path, repo_root: Path) -> str | None:
+def _git_dir(repo_root: Path) -> Path | None:
+    for base in (repo_root, *repo_root.parents):
+        candidate = base / ".git"
+        if candidate.is_dir():
+            return candidate
+        if candidate.is_file():
+            # Worktrees and submodules point at the real git dir.
+            try:
+                text = candidate.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not text.startswith("gitdir:"):
+                return None
+            git_dir = Path(text[len("gitdir:") :].strip())
+            return git_dir if git_dir.is_absolute() else (base / git_dir)
+    return None
+
+
+def _git_head(repo_root: Path) -> str | None:
+    """Resolve HEAD by reading the git dir directly so cache checks spawn no process."""
+    git_dir = _git_dir(repo_root)
+    if git_dir is None:
+        return None
     try:
-        path.relative_to(repo_root)
-    except ValueError:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
         return None
+    if not head.startswith("ref:"):
+        return head or None
+    ref = head[len("ref:") :].strip()
+    ref_dirs = [git_dir]
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        ref_dirs.append(git_dir / common)
+    except OSError:
+        pass
+    for ref_dir in ref_dirs:
+        try:
+            value = (ref_dir / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            value = ""
+        if value:
+            return value
+        try:
+            packed = (ref_dir / "packed-refs").read_text(encoding="utf-8").splitlines()
+        except OSError:
+            continue
+        for line in packed:
+            sha, _, name = line.partition(" ")
+            if name.strip() == ref:
+                return sha
+    return None
+
+
+def _git_history_map(repo_root: Path, pathspecs: list[str]) -> dict[str, str] | None:
+    """
+    Return repo-relative path -> last commit date for everything under `pathspecs`.
+
+    One `git log --name-only` walk replaces a `git log -1` per file. The map is
+    cached per HEAD, so repeated requests spawn no git process until a new
+    commit (or checkout) moves HEAD.
+    """
+    head = _git_head(repo_root)
+    if head is None:
+        return None
+    cache_key = (str(repo_root), tuple(sorted(pathspecs)))
+    with _git_history_lock:
+        cached = _git_history_cache.get(cache_key)
+    if cached is not None and cached[0] == head:
+        return cached[1]
 
     try:
         result = subprocess.run(
-            ["git", "log", "-1", "--format=%cI", "--", str(path)],
+            [
+                "git",
+                "-c",
+                "core.quotepath=off",
+                "log",
+                f"--format={_GIT_HISTORY_COMMIT_MARKER}%cI",
+                "--name-only",
+                "--relative",
+                "--",
+                *pathspecs,
+            ],
             cwd=str(repo_root),
             capture_output=True,
             text=True,
+            encoding="utf-8",
+            errors="replace",
             check=False,
-            timeout=6,
+            timeout=GIT_HISTORY_TIMEOUT_SECONDS,
         )
     except Exception:
         return None
-
     if result.returncode != 0:
         return None
-    lines = [line.strip() for line in str(result.stdout or "").splitlines() if line.strip()]
-    if not lines:
+
+    history: dict[str, str] = {}
+    committed_at = ""
+    # splitlines() would also break on the record separator in the marker.
+    for line in str(result.stdout or "").split("\n"):
+        if line.startswith(_GIT_HISTORY_COMMIT_MARKER):
+            committed_at = line[len(_GIT_HISTORY_COMMIT_MARKER) :].strip()
+            continue
+        name = line.strip()
+        # The log is newest first, so the first date seen for a path is its last update.
+        if name and committed_at and name not in history:
+            history[name] = committed_at
+    with _git_history_lock:
+        _git_history_cache[cache_key] = (head, history)
+    return history
+
+
+def _git_last_updated_at(path: Path, repo_root: Path, history: dict[str, str] | None) -> str | None:
+    if history is None:
+        return None
+    try:
+        relative = path.relative_to(repo_root)
+    except ValueError:
         return None
-    return lines[0]
+    return history.get(relative.as_posix())
 
 
 def _normalize_datetime_iso(text: str | None) -> datetime | None:
@@ -147,8 +261,12 @@ def _normalize_datetime_iso(text: str | None) -> datetime | None:
         return None
 
 
-def _resolve_document_updated_at(path: Path, repo_root: Path) -> tuple[str | None, str]:
-    git_iso = _git_last_updated_at(path, repo_root)
+def _resolve_document_updated_at(
+    path: Path,
+    repo_root: Path,
+    history: dict[str, str] | None,
+) -> tuple[str | None, str]:
+    git_iso = _git_last_updated_at(path, repo_root, history)
     git_dt = _normalize_datetime_iso(git_iso)
     if git_dt is not None:
         return git_dt.isoformat(timespec="seconds"), "git"
@@ -170,6 +288,114 @@ def _classify_document_freshness(days: int | None, *, fresh_days: int, warning_d
     return "stale"
 
 
+def _sse_event(event: str, data: dict[str, Any], *, event_id: int | None = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False))
+    return "\n".join(lines) + "\n\n"
+
+
+def _initial_log_offset(log_path: Path) -> int:
+    # Match the polling endpoint: start from the last RUN_LOG_TAIL_BYTES, on a line boundary.
+    try:
+        size = log_path.stat().st_size
+    except OSError:
+        return 0
+    if size <= RUN_LOG_TAIL_BYTES:
+        return 0
+    start = size - RUN_LOG_TAIL_BYTES
+    try:
+        with log_path.open("rb") as f:
+            f.seek(start)
+            head = f.read(RUN_LOG_TAIL_BYTES)
+    except OSError:
+        return start
+    newline = head.find(b"\n")
+    return start + newline + 1 if newline >= 0 else start
+
+
+def _run_status_key(meta: dict[str, Any]) -> tuple[Any, ...]:
+    return (meta.get("status"), meta.get("returncode"), meta.get("finished_at"))
+
+
+async def _iter_run_log_events(
+    request: Request,
+    meta_path: Path,
+    meta: dict[str, Any],
+    offset: int,
+    *,
+    poll_seconds: float = RUN_LOG_STREAM_POLL_SECONDS,
+    max_seconds: float = RUN_LOG_STREAM_MAX_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    Follow a run log from `offset`, yielding SSE `log`/`status`/`end` events.
+
+    Each `log` event id is the byte offset after its text, so a reconnecting
+    EventSource resumes via Last-Event-ID without gaps or duplicates. Run metadata
+    is re-read only when its mtime changes, and the global reconcile runs only
+    once the run's own process has exited. Polling waits on the event loop, so
+    an idle stream holds no threadpool worker, and it stops once the client
+    has disconnected.
+    """
+    log_path = Path(str(meta.get("log_path") or "")) if meta.get("log_path") else meta_path.with_suffix(".log")
+    started = time.monotonic()
+    last_pid_check = started
+    last_sent = started
+    try:
+        meta_mtime = meta_path.stat().st_mtime_ns
+    except OSError:
+        meta_mtime = None
+    status_key = _run_status_key(meta)
+
+    yield f"retry: {RUN_LOG_STREAM_RETRY_MS}\n\n"
+    yield _sse_event("status", {"run": meta})
+
+    while True:
+        finished = meta.get("status") != "running"
+        while True:
+            text, next_offset = core._read_log_from_offset(log_path, offset, final=finished)
+            if not text:
+                offset = next_offset
+                break
+            offset = next_offset
+            last_sent = time.monotonic()
+            yield _sse_event("log", {"offset": offset, "text": text}, event_id=offset)
+
+        if finished:
+            yield _sse_event("end", {"status": meta.get("status"), "offset": offset}, event_id=offset)
+            return
+
+        now = time.monotonic()
+        if now - started >= max_seconds:
+            # Let the client reconnect from `offset` instead of streaming forever.
+            return
+        if await request.is_disconnected():
+            return
+        if now - last_pid_check >= RUN_LOG_STREAM_PID_CHECK_SECONDS:
+            last_pid_check = now
+            if not core._pid_alive(meta.get("pid")):
+                await asyncio.to_thread(core._reconcile_running_jobs)
+        try:
+            mtime = meta_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != meta_mtime:
+            meta_mtime = mtime
+            latest = core._read_json(meta_path)
+            if isinstance(latest, dict):
+                meta = latest
+                if _run_status_key(meta) != status_key:
+                    status_key = _run_status_key(meta)
+                    last_sent = now
+                    yield _sse_event("status", {"run": meta})
+                    continue
+        if now - last_sent >= RUN_LOG_STREAM_HEARTBEAT_SECONDS:
+            last_sent = now
+            yield ": keep-alive\n\n"
+        await asyncio.sleep(poll_seconds)
+
+
 def register_api_run_routes(
     router: APIRouter,
     *,
@@ -188,12 +414,23 @@ def register_api_run_routes(
         return error_reports_root() / "error_plans" / incident_id / "plan.json"
 
     def _set_incident_status(incident_dir: Path, status: str) -> None:
-        (incident_dir / "status.txt").write_text(f"{status}\n", encoding="utf-8")
+        # error_common also refreshes error_incident_index.json, which re-reads
+        # status.txt and incident.json, so write incident.json before this.
+        try:
+            from scripts.error_common import write_status
+        except Exception as exc:  # pragma: no cover - import failure should be rare
+            raise HTTPException(status_code=500, detail=f"error_common module load failed: {exc}") from exc
+        write_status(incident_dir, status)
 
     def _read_incident_payload(incident_dir: Path) -> dict[str, Any]:
         payload = core._read_json(incident_dir / "incident.json")
         return payload if isinstance(payload, dict) else {}
 
+    def _read_incident_run_progress(incident_id: str) -> dict[str, Any]:
+        # Written by error_exec_loop.py while verification commands stream output.
+        payload = core._read_json(error_reports_root() / "error_runs" / incident_id / "progress.json")
+        return payload if isinstance(payload, dict) else {}
+
     @router.post("/api/runs")
     def api_run(payload: dict[str, Any], request: Request) -> JSONResponse:
         actor = actor_from_request(request)
@@ -245,7 +482,7 @@ def register_api_run_routes(
         meta["status"] = "cancelled"
         meta["finished_at"] = datetime.now().isoformat(timespec="seconds")
         meta["returncode"] = -1
-        core._write_json(meta_path, meta)
+        core._write_run_meta(meta_path, meta)
         params = meta.get("params") if isinstance(meta.get("params"), dict) else {}
         try:
             year = int(params.get("year"))
@@ -277,9 +514,43 @@ def register_api_run_routes(
             raise HTTPException(status_code=404, detail="Run not found.")
     
         log_path = Path(meta.get("log_path") or "")
-        log_text = core._tail_text(log_path, max_bytes=8000)
+        log_text = core._tail_text(log_path, max_bytes=RUN_LOG_TAIL_BYTES)
         return JSONResponse({"run": meta, "log_tail": log_text}, headers={"Cache-Control": "no-store"})
+
+    @router.get("/api/runs/{run_id}/stream")
+    def api_run_stream(run_id: str, request: Request, offset: int | None = Query(None, ge=0)) -> StreamingResponse:
+        run_id = core._safe_run_id(run_id)
+        meta_path = core._runs_root() / f"{run_id}.json"
+        meta = core._read_json(meta_path)
+        if not isinstance(meta, dict) or not meta:
+            raise HTTPException(status_code=404, detail="Run not found.")
+
+        if offset is None:
+            last_event_id = str(request.headers.get("last-event-id") or "").strip()
+            if last_event_id.isdigit():
+                offset = int(last_event_id)
+        if offset is None:
+            log_path = Path(str(meta.get("log_path") or "")) if meta.get("log_path") else meta_path.with_suffix(".log")
+            offset = _initial_log_offset(log_path)
+        return StreamingResponse(
+            _iter_run_log_events(request, meta_path, meta, offset),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+        )
     
+    @router.get("/api/runs/{run_id}/timing")
+    def api_run_timing(run_id: str) -> JSONResponse:
+        run_id = core._safe_run_id(run_id)
+        meta_path = core._runs_root() / f"{run_id}.json"
+        meta = core._read_json(meta_path)
+        if not isinstance(meta, dict) or not meta:
+            raise HTTPException(status_code=404, detail="Run not found.")
+        timing_path = Path(str(meta.get("timing_path") or "")) if meta.get("timing_path") else meta_path.with_suffix(".timing.json")
+        timing = core._read_json(timing_path)
+        if not isinstance(timing, dict):
+            raise HTTPException(status_code=404, detail="Run timing not found.")
+        return JSONResponse({"run_id": run_id, "timing": timing}, headers={"Cache-Control": "no-store"})
+
     @router.get("/api/mf-draft-actions/{ym}")
     def api_get_mf_draft_actions(ym: str, limit_events: int = 0) -> JSONResponse:
         ym = core._safe_ym(ym)
@@ -288,9 +559,31 @@ def register_api_run_routes(
         return JSONResponse(payload, headers={"Cache-Control": "no-store"})
     
     @router.get("/api/errors/incidents")
-    def api_get_error_incidents() -> JSONResponse:
+    def api_get_error_incidents(
+        location: str = Query(default="inbox", pattern="^(inbox|resolved|escalated)$"),
+        status: str | None = Query(default=None, max_length=40),
+        ym: str | None = Query(default=None, max_length=7),
+        step: str | None = Query(default=None, max_length=80),
+        failure_class: str | None = Query(default=None, max_length=80),
+        signature: str | None = Query(default=None, max_length=400),
+        offset: int = Query(default=0, ge=0),
+        limit: int | None = Query(default=None, ge=1, le=1000),
+    ) -> JSONResponse:
+        args = ["--json", "--location", location, "--offset", str(offset)]
+        filters = (
+            ("--status", status),
+            ("--ym", ym),
+            ("--step", step),
+            ("--failure-class", failure_class),
+            ("--signature", signature),
+        )
+        for flag, value in filters:
+            if value:
+                args += [flag, value]
+        if limit is not None:
+            args += ["--limit", str(limit)]
         try:
-            payload = run_error_tool("error_status.py", ["--json"], timeout_seconds=30)
+            payload = run_error_tool("error_status.py", args, timeout_seconds=30)
         except HTTPException as exc:
             payload = {
                 "status": "degraded",
@@ -323,10 +616,19 @@ def register_api_run_routes(
         repo_root = core.SKILL_ROOT.parent.parent
         today = datetime.now().date()
         roots, targets = _iter_document_freshness_targets()
+        pathspecs: list[str] = []
+        for entry in roots:
+            if entry.get("status") != "ok":
+                continue
+            try:
+                pathspecs.append(Path(entry["path"]).relative_to(repo_root).as_posix() or ".")
+            except ValueError:
+                continue
+        history = _git_history_map(repo_root, pathspecs) if pathspecs else None
 
         items: list[dict[str, Any]] = []
         for area, path in targets:
-            updated_at, source = _resolve_document_updated_at(path, repo_root)
+            updated_at, source = _resolve_document_updated_at(path, repo_root, history)
             updated_dt = _normalize_datetime_iso(updated_at)
             days_since_update = max(0, (today - updated_dt.date()).days) if updated_dt is not None else None
             freshness = _classify_document_freshness(
@@ -494,6 +796,9 @@ def register_api_run_routes(
         )
         if isinstance(run_result, dict):
             payload["run_result"] = run_result
+        run_progress = _read_incident_run_progress(resolved_incident_id)
+        if run_progress:
+            payload["run_progress"] = run_progress
         handoff_dir = error_reports_root() / "error_handoffs" / resolved_incident_id
         handoff_json = core._read_json(handoff_dir / "handoff.json")
         if isinstance(handoff_json, dict):
@@ -502,6 +807,16 @@ def register_api_run_routes(
             payload["handoff_md_path"] = str(handoff_dir / "handoff.md")
         return JSONResponse(payload, headers={"Cache-Control": "no-store"})
     
+    @router.get("/api/errors/incidents/{incident_id}/progress")
+    def api_get_error_incident_progress(incident_id: str) -> JSONResponse:
+        resolved_incident_id = safe_incident_id(incident_id)
+        payload = {
+            "status": "ok",
+            "incident_id": resolved_incident_id,
+            "progress": _read_incident_run_progress(resolved_incident_id),
+        }
+        return JSONResponse(payload, headers={"Cache-Control": "no-store"})
+
     @router.post("/api/errors/incidents/{incident_id}/plan")
     def api_build_error_plan(incident_id: str, request: Request, payload: dict[str, Any] | None = None) -> JSONResponse:
         resolved_incident_id = safe_incident_id(incident_id)
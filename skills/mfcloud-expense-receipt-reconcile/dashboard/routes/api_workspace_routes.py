@@ -735,23 +735,80 @@ def _register_api_workspace_routes_impl(
     def _workflow_event_receipts_path():
         return core._artifact_root() / "_workflow_events" / "receipts.json"
 
-    def _read_workflow_event_receipts() -> dict[str, dict[str, Any]]:
-        raw = core._read_json(_workflow_event_receipts_path())
+    def _workflow_event_receipts_from_json(raw: Any) -> dict[str, dict[str, dict[str, Any]]]:
         receipts = raw.get("receipts") if isinstance(raw, dict) else {}
         if not isinstance(receipts, dict):
-            return {"receipts": {}}
+            receipts = {}
+        return {"workflow_event_receipts": {k: v for k, v in receipts.items() if isinstance(v, dict)}}
+
+    def _read_workflow_event_receipts() -> dict[str, dict[str, Any]]:
+        # receipts.json is imported into the state store on first use.
+        receipts = core._read_state_collections(
+            ("workflow_event_receipts",),
+            source=_workflow_event_receipts_path(),
+            load_source=_workflow_event_receipts_from_json,
+        )["workflow_event_receipts"]
         cleaned, changed = _clean_workflow_event_receipts(receipts)
-        state = {"receipts": cleaned}
         if changed:
-            _write_workflow_event_receipts(state)
-        return state
-
-    def _write_workflow_event_receipts(state: dict[str, Any]) -> None:
-        receipts = state.get("receipts") if isinstance(state, dict) else {}
-        payload = {"receipts": receipts if isinstance(receipts, dict) else {}}
-        path = _workflow_event_receipts_path()
-        path.parent.mkdir(parents=True, exist_ok=True)
-        core._write_json(path, payload)
+            _update_workflow_event_receipts(_touch_state_rows)
+        return {"receipts": cleaned}
+
+    def _touch_state_rows(rows: Any) -> None:
+        # Load every row so the updater re-cleans the whole collection.
+        for _ in rows.values():
+            pass
+
+    def _clean_touched_state_rows(
+        rows: Any,
+        keys: list[str],
+        clean: Callable[[dict[str, Any]], tuple[dict[str, dict[str, Any]], bool]],
+    ) -> None:
+        # Run the collection's cleaner on these rows only; it may normalize,
+        # rename or drop each one.
+        for key in keys:
+            row = rows.get(key)
+            if row is None:
+                continue
+            cleaned, _ = clean({key: row})
+            del rows[key]
+            rows.update(cleaned)
+
+    def _update_workflow_event_receipts(
+        mutate: Callable[[Any], Any],
+    ) -> tuple[Any, dict[str, dict[str, Any]]]:
+        # Runs inside one store write transaction, so concurrent writers serialize
+        # instead of overwriting each other. Only the receipts `mutate` touches are
+        # read and written; expiry and the size cap go through the created_at
+        # column. Returns the mutate result and the touched rows after cleaning.
+        def _apply(collections: dict[str, Any]) -> Any:
+            receipts = collections["workflow_event_receipts"]
+            result = mutate(receipts)
+            if isinstance(receipts, dict):
+                # No SQLite: the collection is a plain dict loaded from receipts.json.
+                cleaned, _ = _clean_workflow_event_receipts(receipts)
+                receipts.clear()
+                receipts.update(cleaned)
+                return result, dict(cleaned)
+            cutoff = (datetime.now() - timedelta(days=_workflow_event_receipt_ttl_days())).isoformat(timespec="seconds")
+            expired = receipts.select_keys("created_at != '' AND created_at < ?", (cutoff,))
+            _clean_touched_state_rows(
+                receipts,
+                list(dict.fromkeys([*receipts.touched_keys(), *expired])),
+                _clean_workflow_event_receipts,
+            )
+            overflow = len(receipts) - _workflow_event_max_receipts()
+            if overflow > 0:
+                for stale_key in receipts.select_keys(order_by="created_at, rowid", limit=overflow):
+                    del receipts[stale_key]
+            return result, {key: receipts[key] for key in receipts.touched_keys()}
+
+        return core._update_state_collections(
+            ("workflow_event_receipts",),
+            _apply,
+            source=_workflow_event_receipts_path(),
+            load_source=_workflow_event_receipts_from_json,
+            snapshot=lambda collections: {"receipts": collections["workflow_event_receipts"]},
+        )
 
     def _workflow_event_receipt_key(template_id: str, idempotency_key: str) -> str:
         return f"{template_id}:{idempotency_key}"
@@ -778,14 +835,8 @@ def _register_api_workspace_routes_impl(
     ) -> None:
         if not idempotency_key:
             return
-        state = _read_workflow_event_receipts()
-        receipts = state.get("receipts")
-        if not isinstance(receipts, dict):
-            receipts = {}
         key = _workflow_event_receipt_key(template_id, idempotency_key)
-        if key in receipts:
-            return
-        receipts[key] = {
+        row = {
             "template_id": template_id,
             "template_name": template_name,
             "action_key": action_key,
@@ -795,9 +846,8 @@ def _register_api_workspace_routes_impl(
             "run_id": run_id,
             "created_at": workflow_template_timestamp_now(),
         }
-        cleaned, _ = _clean_workflow_event_receipts(receipts)
-        state["receipts"] = cleaned
-        _write_workflow_event_receipts(state)
+        # The first receipt for a key wins, also when two requests race.
+        _update_workflow_event_receipts(lambda receipts: receipts.setdefault(key, row))
 
     def _workflow_event_retry_max_attempts() -> int:
         raw = os.environ.get(WORKFLOW_EVENT_RETRY_MAX_ATTEMPTS_ENV)
@@ -974,23 +1024,66 @@ def _register_api_workspace_routes_impl(
 
         return cleaned, changed
 
-    def _read_workflow_event_retry_jobs() -> dict[str, dict[str, Any]]:
-        raw = core._read_json(_workflow_event_retry_jobs_path())
+    def _workflow_event_retry_jobs_from_json(raw: Any) -> dict[str, dict[str, dict[str, Any]]]:
         jobs = raw.get("jobs") if isinstance(raw, dict) else {}
         if not isinstance(jobs, dict):
-            return {"jobs": {}}
+            jobs = {}
+        return {"workflow_event_retry_jobs": {k: v for k, v in jobs.items() if isinstance(v, dict)}}
+
+    def _read_workflow_event_retry_jobs() -> dict[str, dict[str, Any]]:
+        # retry_jobs.json is imported into the state store on first use.
+        jobs = core._read_state_collections(
+            ("workflow_event_retry_jobs",),
+            source=_workflow_event_retry_jobs_path(),
+            load_source=_workflow_event_retry_jobs_from_json,
+        )["workflow_event_retry_jobs"]
         cleaned, changed = _clean_workflow_event_retry_jobs(jobs)
-        state = {"jobs": cleaned}
         if changed:
-            _write_workflow_event_retry_jobs(state)
-        return state
-
-    def _write_workflow_event_retry_jobs(state: dict[str, Any]) -> None:
-        jobs = state.get("jobs") if isinstance(state, dict) else {}
-        payload = {"jobs": jobs if isinstance(jobs, dict) else {}}
-        path = _workflow_event_retry_jobs_path()
-        path.parent.mkdir(parents=True, exist_ok=True)
-        core._write_json(path, payload)
+            _update_workflow_event_retry_jobs(_touch_state_rows)
+        return {"jobs": cleaned}
+
+    def _update_workflow_event_retry_jobs(
+        mutate: Callable[[Any], Any],
+    ) -> tuple[Any, dict[str, dict[str, Any]]]:
+        # Same transaction rules as _update_workflow_event_receipts; terminal jobs
+        # expire and the cap is applied through the status/updated_at columns.
+        def _apply(collections: dict[str, Any]) -> Any:
+            jobs = collections["workflow_event_retry_jobs"]
+            result = mutate(jobs)
+            if isinstance(jobs, dict):
+                cleaned, _ = _clean_workflow_event_retry_jobs(jobs)
+                jobs.clear()
+                jobs.update(cleaned)
+                return result, dict(cleaned)
+            terminal = sorted(WORKFLOW_EVENT_RETRY_TERMINAL_STATUSES)
+            placeholders = ", ".join("?" for _ in terminal)
+            cutoff = (datetime.now() - timedelta(days=_workflow_event_retry_terminal_ttl_days())).isoformat(
+                timespec="seconds"
+            )
+            expired = jobs.select_keys(
+                f"status IN ({placeholders}) AND updated_at != '' AND updated_at < ?",
+                (*terminal, cutoff),
+            )
+            _clean_touched_state_rows(
+                jobs,
+                list(dict.fromkeys([*jobs.touched_keys(), *expired])),
+                _clean_workflow_event_retry_jobs,
+            )
+            overflow = len(jobs) - _workflow_event_retry_max_jobs()
+            if overflow > 0:
+                # Terminal jobs go first, then the least recently updated.
+                order_by = f"CASE WHEN status IN ({placeholders}) THEN 0 ELSE 1 END, updated_at, key"
+                for stale_key in jobs.select_keys(params=tuple(terminal), order_by=order_by, limit=overflow):
+                    del jobs[stale_key]
+            return result, {key: jobs[key] for key in jobs.touched_keys()}
+
+        return core._update_state_collections(
+            ("workflow_event_retry_jobs",),
+            _apply,
+            source=_workflow_event_retry_jobs_path(),
+            load_source=_workflow_event_retry_jobs_from_json,
+            snapshot=lambda collections: {"jobs": collections["workflow_event_retry_jobs"]},
+        )
 
     def _workflow_event_retry_backoff_seconds(attempts: int) -> int:
         safe_attempts = max(1, core._safe_non_negative_int(attempts, default=1))
@@ -1074,48 +1167,44 @@ def _register_api_workspace_routes_impl(
         if not key:
             return {"queued": False, "reason": "invalid_job_key", "retry_advice": normalized_retry_advice}
 
-        state = _read_workflow_event_retry_jobs()
-        jobs = state.get("jobs")
-        if not isinstance(jobs, dict):
-            jobs = {}
-        now_iso = workflow_template_timestamp_now()
-        existing = jobs.get(key) if isinstance(jobs.get(key), dict) else None
-        existing_status = str((existing or {}).get("status") or "").strip().lower()
-        is_active = existing_status in WORKFLOW_EVENT_RETRY_ACTIVE_STATUSES
-
-        next_retry_at = normalize_workflow_template_timestamp((existing or {}).get("next_retry_at"))
-        if not next_retry_at:
-            next_retry_at = (datetime.now() + timedelta(seconds=_workflow_event_retry_base_delay_seconds())).isoformat(
-                timespec="seconds"
-            )
+        def _enqueue(jobs: dict[str, dict[str, Any]]) -> bool:
+            now_iso = workflow_template_timestamp_now()
+            existing = jobs.get(key) if isinstance(jobs.get(key), dict) else None
+            existing_status = str((existing or {}).get("status") or "").strip().lower()
+            is_active = existing_status in WORKFLOW_EVENT_RETRY_ACTIVE_STATUSES
 
-        jobs[key] = {
-            "template_id": normalized_template_id,
-            "template_name": str(template_name or "").strip()[:WORKFLOW_EVENT_RETRY_TEMPLATE_NAME_CHARS],
-            "action_key": _normalize_step_action(action_key),
-            "event_name": str(event_name or "").strip()[:WORKFLOW_EVENT_MAX_EVENT_NAME_CHARS],
-            "source": str(source or "").strip()[:WORKFLOW_EVENT_MAX_SOURCE_CHARS],
-            "idempotency_key": normalized_idempotency_key,
-            "year": int(year),
-            "month": int(month),
-            "mfcloud_url": str(mfcloud_url or "").strip()[:WORKFLOW_EVENT_RETRY_URL_CHARS],
-            "notes": str(notes or "").strip()[:WORKFLOW_EVENT_RETRY_NOTES_CHARS],
-            "status": "pending",
-            "attempts": int((existing or {}).get("attempts") or 0) if is_active else 0,
-            "max_attempts": int((existing or {}).get("max_attempts") or _workflow_event_retry_max_attempts()),
-            "next_retry_at": next_retry_at,
-            "last_error": str(reason or "").strip()[:500],
-            "last_reason_class": str(reason_class or "").strip().lower()[:64],
-            "last_reason_code": str(reason_code or "").strip().lower()[:64],
-            "last_retry_advice": normalized_retry_advice,
-            "last_run_id": str((existing or {}).get("last_run_id") or "").strip()[:128],
-            "created_at": normalize_workflow_template_timestamp((existing or {}).get("created_at")) or now_iso,
-            "updated_at": now_iso,
-        }
-        cleaned, _ = _clean_workflow_event_retry_jobs(jobs)
-        state["jobs"] = cleaned
-        _write_workflow_event_retry_jobs(state)
+            next_retry_at = normalize_workflow_template_timestamp((existing or {}).get("next_retry_at"))
+            if not next_retry_at:
+                next_retry_at = (datetime.now() + timedelta(seconds=_workflow_event_retry_base_delay_seconds())).isoformat(
+                    timespec="seconds"
+                )
+
+            jobs[key] = {
+                "template_id": normalized_template_id,
+                "template_name": str(template_name or "").strip()[:WORKFLOW_EVENT_RETRY_TEMPLATE_NAME_CHARS],
+                "action_key": _normalize_step_action(action_key),
+                "event_name": str(event_name or "").strip()[:WORKFLOW_EVENT_MAX_EVENT_NAME_CHARS],
+                "source": str(source or "").strip()[:WORKFLOW_EVENT_MAX_SOURCE_CHARS],
+                "idempotency_key": normalized_idempotency_key,
+                "year": int(year),
+                "month": int(month),
+                "mfcloud_url": str(mfcloud_url or "").strip()[:WORKFLOW_EVENT_RETRY_URL_CHARS],
+                "notes": str(notes or "").strip()[:WORKFLOW_EVENT_RETRY_NOTES_CHARS],
+                "status": "pending",
+                "attempts": int((existing or {}).get("attempts") or 0) if is_active else 0,
+                "max_attempts": int((existing or {}).get("max_attempts") or _workflow_event_retry_max_attempts()),
+                "next_retry_at": next_retry_at,
+                "last_error": str(reason or "").strip()[:500],
+                "last_reason_class": str(reason_class or "").strip().lower()[:64],
+                "last_reason_code": str(reason_code or "").strip().lower()[:64],
+                "last_retry_advice": normalized_retry_advice,
+                "last_run_id": str((existing or {}).get("last_run_id") or "").strip()[:128],
+                "created_at": normalize_workflow_template_timestamp((existing or {}).get("created_at")) or now_iso,
+                "updated_at": now_iso,
+            }
+            return is_active
 
+        is_active, cleaned = _update_workflow_event_retry_jobs(_enqueue)
         current = cleaned.get(key) if isinstance(cleaned.get(key), dict) else {}
         return {
             "queued": True,
@@ -1136,25 +1225,22 @@ def _register_api_workspace_routes_impl(
         key = _workflow_event_retry_job_key(template_id, idempotency_key)
         if not key:
             return
-        state = _read_workflow_event_retry_jobs()
-        jobs = state.get("jobs")
-        if not isinstance(jobs, dict):
-            return
-        job = jobs.get(key)
-        if not isinstance(job, dict):
-            return
-        job["status"] = "succeeded"
-        job["next_retry_at"] = ""
-        job["last_error"] = ""
-        job["last_reason_class"] = ""
-        job["last_reason_code"] = ""
-        job["last_retry_advice"] = ""
-        if run_id:
-            job["last_run_id"] = str(run_id).strip()[:128]
-        job["updated_at"] = workflow_template_timestamp_now()
-        cleaned, _ = _clean_workflow_event_retry_jobs(jobs)
-        state["jobs"] = cleaned
-        _write_workflow_event_retry_jobs(state)
+
+        def _mark(jobs: dict[str, dict[str, Any]]) -> None:
+            job = jobs.get(key)
+            if not isinstance(job, dict):
+                return
+            job["status"] = "succeeded"
+            job["next_retry_at"] = ""
+            job["last_error"] = ""
+            job["last_reason_class"] = ""
+            job["last_reason_code"] = ""
+            job["last_retry_advice"] = ""
+            if run_id:
+                job["last_run_id"] = str(run_id).strip()[:128]
+            job["updated_at"] = workflow_template_timestamp_now()
+
+        _update_workflow_event_retry_jobs(_mark)
 
     def _workflow_event_status_for_http(status_code: int) -> str:
         if status_code in {400, 401, 403, 404, 409, 422}:
@@ -1665,10 +1751,64 @@ def _register_api_workspace_routes_impl(
         rows.sort(key=lambda row: (-int(row["count"]), str(row.get(key_name) or "")))
         return rows
 
+    def _workflow_event_summary_inputs(
+        rows: list[dict[str, Any]],
+        rollups: list[dict[str, Any]] | None,
+        event_type: str,
+    ) -> tuple[list[tuple[dict[str, Any], int]], list[dict[str, Any]], list[str]]:
+        # Sealed audit segments contribute pre-aggregated groups, their retained recent
+        # rows and time bounds; only the active log contributes individual rows.
+        weighted: list[tuple[dict[str, Any], int]] = []
+        recent_rows: list[dict[str, Any]] = []
+        bounds: list[str] = []
+        for rollup in rollups or []:
+            entry = (rollup.get("event_types") or {}).get(event_type) if isinstance(rollup, dict) else None
+            if not isinstance(entry, dict):
+                continue
+            for group in rollup.get("groups") or []:
+                if isinstance(group, dict) and group.get("event_type") == event_type:
+                    weighted.append((group, int(group.get("count") or 0)))
+            recent_rows.extend(row for row in entry.get("events") or [] if isinstance(row, dict))
+            bounds.extend(str(entry.get(key)) for key in ("first_ts", "last_ts") if entry.get(key))
+        for row in rows:
+            if isinstance(row, dict) and str(row.get("event_type") or "").strip() == event_type:
+                weighted.append((row, 1))
+                recent_rows.append(row)
+        return weighted, recent_rows, bounds
+
+    def _workflow_event_row_at(row: dict[str, Any]) -> str:
+        return str(row.get("at") or row.get("ts") or "").strip()
+
+    def _workflow_event_time_bounds(events: list[dict[str, Any]], bounds: list[str]) -> tuple[str, str]:
+        candidates = [str(row.get("at") or "") for row in events] + bounds
+        if not candidates:
+            return "", ""
+        return min(candidates), max(candidates)
+
+    def _workflow_event_row_fields(row: dict[str, Any]) -> dict[str, Any]:
+        status = str(row.get("status") or "").strip().lower()
+        if status not in {"success", "skipped", "rejected", "failed"}:
+            status = "unknown"
+        details = row.get("details") if isinstance(row.get("details"), dict) else {}
+        reason_class = str(details.get("reason_class") or "").strip().lower()
+        retry_advice = str(details.get("retry_advice") or "").strip().lower()
+        if not retry_advice:
+            retry_advice = _workflow_event_retry_advice(status=status, reason_class=reason_class)
+        duplicate_raw = details.get("duplicate")
+        return {
+            "status": status,
+            "details": details,
+            "reason_class": reason_class,
+            "reason_code": str(details.get("reason_code") or "").strip().lower(),
+            "retry_advice": retry_advice,
+            "duplicate": duplicate_raw if isinstance(duplicate_raw, bool) else None,
+        }
+
     def _summarize_workflow_event_audit_rows(
         rows: list[dict[str, Any]],
         *,
         recent_limit: int = 20,
+        rollups: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         status_counter: Counter[str] = Counter()
         reason_class_counter: Counter[str] = Counter()
@@ -1677,42 +1817,29 @@ def _register_api_workspace_routes_impl(
         duplicate_counter: Counter[str] = Counter()
         events: list[dict[str, Any]] = []
 
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            if str(row.get("event_type") or "").strip() != "workflow_event":
-                continue
-
-            status = str(row.get("status") or "").strip().lower()
-            if status not in {"success", "skipped", "rejected", "failed"}:
-                status = "unknown"
-            status_counter[status] += 1
-
-            details = row.get("details") if isinstance(row.get("details"), dict) else {}
-            reason_class = str(details.get("reason_class") or "").strip().lower()
-            reason_code = str(details.get("reason_code") or "").strip().lower()
-            if reason_class:
-                reason_class_counter[reason_class] += 1
-            if reason_code:
-                reason_code_counter[reason_code] += 1
-            retry_advice = str(details.get("retry_advice") or "").strip().lower()
-            if not retry_advice:
-                retry_advice = _workflow_event_retry_advice(status=status, reason_class=reason_class)
-            if retry_advice:
-                retry_advice_counter[retry_advice] += 1
-
-            duplicate_raw = details.get("duplicate")
-            duplicate_value: bool | None = None
-            duplicate_key = "unknown"
-            if isinstance(duplicate_raw, bool):
-                duplicate_value = duplicate_raw
-                duplicate_key = "true" if duplicate_raw else "false"
-            duplicate_counter[duplicate_key] += 1
-
+        weighted, recent_rows, bounds = _workflow_event_summary_inputs(rows, rollups, "workflow_event")
+        total = 0
+        for row, weight in weighted:
+            fields = _workflow_event_row_fields(row)
+            total += weight
+            status_counter[fields["status"]] += weight
+            if fields["reason_class"]:
+                reason_class_counter[fields["reason_class"]] += weight
+            if fields["reason_code"]:
+                reason_code_counter[fields["reason_code"]] += weight
+            if fields["retry_advice"]:
+                retry_advice_counter[fields["retry_advice"]] += weight
+            duplicate_value = fields["duplicate"]
+            duplicate_key = "unknown" if duplicate_value is None else ("true" if duplicate_value else "false")
+            duplicate_counter[duplicate_key] += weight
+
+        for row in recent_rows:
+            fields = _workflow_event_row_fields(row)
+            details = fields["details"]
             events.append(
                 {
-                    "at": str(row.get("at") or "").strip(),
-                    "status": status,
+                    "at": _workflow_event_row_at(row),
+                    "status": fields["status"],
                     "action": str(row.get("action") or "").strip(),
                     "run_id": str(row.get("run_id") or "").strip(),
                     "template_id": str(details.get("template_id") or "").strip(),
@@ -1721,23 +1848,21 @@ def _register_api_workspace_routes_impl(
                     "source": str(details.get("source") or "").strip(),
                     "idempotency_key": str(details.get("idempotency_key") or "").strip(),
                     "reason": str(details.get("reason") or "").strip(),
-                    "reason_class": reason_class,
-                    "reason_code": reason_code,
-                    "retry_advice": retry_advice,
-                    "duplicate": duplicate_value,
+                    "reason_class": fields["reason_class"],
+                    "reason_code": fields["reason_code"],
+                    "retry_advice": fields["retry_advice"],
+                    "duplicate": fields["duplicate"],
                 }
             )
 
         events.sort(key=lambda row: str(row.get("at") or ""), reverse=True)
         limit = max(1, min(int(recent_limit), 200))
         recent = events[:limit]
-
-        first_at = str(events[-1].get("at") or "") if events else ""
-        last_at = str(events[0].get("at") or "") if events else ""
+        first_at, last_at = _workflow_event_time_bounds(events, bounds)
 
         return {
             "event_type": "workflow_event",
-            "total": len(events),
+            "total": total,
             "first_at": first_at,
             "last_at": last_at,
             "by_status": {
@@ -1762,31 +1887,32 @@ def _register_api_workspace_routes_impl(
         rows: list[dict[str, Any]],
         *,
         recent_limit: int = 20,
+        rollups: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         status_counter: Counter[str] = Counter()
         reason_code_counter: Counter[str] = Counter()
         events: list[dict[str, Any]] = []
 
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            if str(row.get("event_type") or "").strip() != "workflow_event_notification":
-                continue
-
+        def _notification_status(row: dict[str, Any]) -> str:
             status = str(row.get("status") or "").strip().lower()
-            if status not in {"success", "failed", "skipped"}:
-                status = "unknown"
-            status_counter[status] += 1
+            return status if status in {"success", "failed", "skipped"} else "unknown"
 
+        weighted, recent_rows, bounds = _workflow_event_summary_inputs(rows, rollups, "workflow_event_notification")
+        total = 0
+        for row, weight in weighted:
+            total += weight
+            status_counter[_notification_status(row)] += weight
             details = row.get("details") if isinstance(row.get("details"), dict) else {}
             reason_code = str(details.get("reason_code") or "").strip().lower()
             if reason_code:
-                reason_code_counter[reason_code] += 1
+                reason_code_counter[reason_code] += weight
 
+        for row in recent_rows:
+            details = row.get("details") if isinstance(row.get("details"), dict) else {}
             events.append(
                 {
-                    "at": str(row.get("at") or "").strip(),
-                    "status": status,
+                    "at": _workflow_event_row_at(row),
+                    "status": _notification_status(row),
                     "action": str(row.get("action") or "").strip(),
                     "template_id": str(details.get("template_id") or "").strip(),
                     "template_name": str(details.get("template_name") or "").strip(),
@@ -1795,7 +1921,7 @@ def _register_api_workspace_routes_impl(
                     "idempotency_key": str(details.get("idempotency_key") or "").strip(),
                     "channel": str(details.get("channel") or "").strip().lower(),
                     "reason": str(details.get("reason") or "").strip(),
-                    "reason_code": reason_code,
+                    "reason_code": str(details.get("reason_code") or "").strip().lower(),
                     "attempts": core._safe_non_negative_int(details.get("attempts"), default=0),
                     "max_attempts": core._safe_non_negative_int(details.get("max_attempts"), default=0),
                 }
@@ -1804,13 +1930,11 @@ def _register_api_workspace_routes_impl(
         events.sort(key=lambda row: str(row.get("at") or ""), reverse=True)
         limit = max(1, min(int(recent_limit), 200))
         recent = events[:limit]
-
-        first_at = str(events[-1].get("at") or "") if events else ""
-        last_at = str(events[0].get("at") or "") if events else ""
+        first_at, last_at = _workflow_event_time_bounds(events, bounds)
 
         return {
             "event_type": "workflow_event_notification",
-            "total": len(events),
+            "total": total,
             "first_at": first_at,
             "last_at": last_at,
             "by_status": {
@@ -2519,10 +2643,9 @@ def _register_api_workspace_routes_impl(
     ) -> JSONResponse:
         normalized_ym = core._safe_ym(ym)
         audit_path = core._artifact_root() / normalized_ym / "reports" / "audit_log.jsonl"
-        raw_rows = core._read_jsonl(audit_path) if audit_path.exists() else []
-        rows = raw_rows if isinstance(raw_rows, list) else []
-        summary = _summarize_workflow_event_audit_rows(rows, recent_limit=recent_limit)
-        notification = _summarize_workflow_event_notification_rows(rows, recent_limit=recent_limit)
+        rollups, rows = core._read_audit_log(audit_path)
+        summary = _summarize_workflow_event_audit_rows(rows, recent_limit=recent_limit, rollups=rollups)
+        notification = _summarize_workflow_event_notification_rows(rows, recent_limit=recent_limit, rollups=rollups)
         retry_queue = _workflow_event_retry_queue_snapshot(limit=5)
         return JSONResponse(
             {
@@ -2598,6 +2721,9 @@ def _register_api_workspace_routes_impl(
         retrying = 0
         escalated = 0
         discarded = 0
+        # Runs start outside the store transaction, so only the jobs attempted
+        # here are written back; rows enqueued or changed meanwhile are kept.
+        attempted: dict[str, dict[str, Any]] = {}
 
         for key in candidate_keys:
             if processed >= limit:
@@ -2612,6 +2738,7 @@ def _register_api_workspace_routes_impl(
                 continue
 
             processed += 1
+            attempted[key] = job
             template_id = normalize_workflow_template_id(job.get("template_id"))
             template_name = str(job.get("template_name") or "").strip()
             action_key = _normalize_step_action(job.get("action_key"))
@@ -2897,13 +3024,11 @@ def _register_api_workspace_routes_impl(
             )
             succeeded += 1
 
-        cleaned, _ = _clean_workflow_event_retry_jobs(jobs)
-        state["jobs"] = cleaned
-        _write_workflow_event_retry_jobs(state)
+        _update_workflow_event_retry_jobs(lambda rows: rows.update(attempted))
 
         remaining_due = 0
         now_after = datetime.now()
-        for value in cleaned.values():
+        for value in _read_workflow_event_retry_jobs()["jobs"].values():
             if not isinstance(value, dict):
                 continue
             if str(value.get("status") or "").strip().lower() not in WORKFLOW_EVENT_RETRY_ACTIVE_STATUSES:
@@ -6,7 +6,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
 from services import core
@@ -887,27 +887,10 @@ def create_pages_router(templates: Jinja2Templates) -> APIRouter:
             raise HTTPException(status_code=404, detail="Run not found.")
 
         reports_dir = root / "reports"
-        missing_json = reports_dir / "missing_evidence_candidates.json"
-        data = core._read_json(missing_json) or {}
-        rows = data.get("rows") if isinstance(data, dict) else []
-        counts = data.get("counts") if isinstance(data, dict) else {}
-        merged_counts = dict(counts or {})
+        # Only the first page is rendered; run.js pages through /api/reconcile-rows.
+        first_page = core._query_run_rows(reports_dir)
+        merged_counts = dict(first_page["counts"])
         merged_counts.update(core._derive_order_counts_from_jsonl(root, ym))
-        rows = rows if isinstance(rows, list) else []
-        for row in rows:
-            mf_use_date = str(row.get("mf_use_date") or "").strip() or None
-            row["mf_use_date"] = mf_use_date or "-"
-            vendor = str(row.get("mf_vendor") or "")
-            memo = str(row.get("mf_memo") or "")
-            summary = core._compact_mf_summary(vendor, memo)
-            row["mf_summary"] = summary if summary else " ".join([vendor, memo]).strip()
-            amount = row.get("mf_amount_yen")
-            if isinstance(amount, (int, float)):
-                row["mf_amount_label"] = f"{int(amount):,}円"
-            elif isinstance(amount, str) and amount.strip().isdigit():
-                row["mf_amount_label"] = f"{int(amount.strip()):,}円"
-            else:
-                row["mf_amount_label"] = "-"
 
         exclusions = core._load_exclusions(reports_dir)
         orders = core._collect_orders(root, ym, exclusions)
@@ -941,8 +924,9 @@ def create_pages_router(templates: Jinja2Templates) -> APIRouter:
                 **_dashboard_context("status"),
                 "ym": ym,
                 "counts": merged_counts,
-                "rows": rows[:50],
-                "row_total": len(rows),
+                "rows": first_page["rows"],
+                "row_total": first_page["total"],
+                "rows_next_cursor": first_page["next_cursor"],
                 "orders": orders,
                 "orders_total": len(orders),
                 "excluded_count": excluded_count,
@@ -956,6 +940,7 @@ def create_pages_router(templates: Jinja2Templates) -> APIRouter:
                 "amazon_bulk_print_ready": amazon_bulk_print_ready,
                 "rakuten_bulk_print_ready": rakuten_bulk_print_ready,
                 "mf_draft_actions_exists": mf_draft_actions.exists(),
+                "run_timing": core._read_run_timing(reports_dir),
                 "file_labels": {
                     "missing_csv": "未添付候補CSV",
                     "missing_json": "未添付候補JSON",
@@ -964,6 +949,7 @@ def create_pages_router(templates: Jinja2Templates) -> APIRouter:
                     "audit_log": "監査ログ(JSONL)",
                     "mf_draft_actions": "MF下書き作成ログ(JSONL)",
                     "print_script": "印刷用スクリプト",
+                    "run_timing": "処理時間(JSON)",
                 },
             },
         )
@@ -1040,7 +1026,7 @@ def create_pages_router(templates: Jinja2Templates) -> APIRouter:
         return RedirectResponse(url=str(request.url_for("run_archived_receipts", ym=ym)))
 
     @router.get("/files/{ym}/{kind}")
-    def download_file(ym: str, kind: str) -> FileResponse:
+    def download_file(ym: str, kind: str) -> Response:
         ym = core._safe_ym(ym)
         root = core._artifact_root() / ym
         if not root.exists():
@@ -1054,10 +1040,20 @@ def create_pages_router(templates: Jinja2Templates) -> APIRouter:
             "audit_log": root / "reports" / "audit_log.jsonl",
             "mf_draft_actions": root / "reports" / "mf_draft_create_actions.jsonl",
             "print_script": root / "reports" / "print_all.ps1",
+            "run_timing": root / "reports" / "run_timing.json",
         }
         if kind not in mapping:
             raise HTTPException(status_code=404, detail="File not found.")
         path = mapping[kind]
+        if kind == "audit_log":
+            # Sealed segments hold the older history; serve them ahead of the active log.
+            if not path.exists() and not core._list_audit_segments(path):
+                raise HTTPException(status_code=404, detail="File not found.")
+            return StreamingResponse(
+                core._iter_audit_log_bytes(path),
+                media_type="application/x-ndjson",
+                headers={"Content-Disposition": f'attachment; filename="{path.name}"'},
+            )
         if not path.exists():
             raise HTTPException(status_code=404, detail="File not found.")
         return FileResponse(path)
@@ -4,12 +4,10 @@ import json
 import logging
 import os
 import re
-import socket
 from pathlib import Path
-from typing import Any
-from urllib import error as url_error
-from urllib import request as url_request
-from urllib.parse import urlencode
+from typing import Any, Iterator
+
+from services import ai_model_client
 
 KIL_GEMINI_MODEL_ENV = "KIL_GEMINI_MODEL"
 GEMINI_API_KEY_ENV = "GEMINI_API_KEY"
@@ -17,7 +15,6 @@ KIL_GEMINI_API_KEY_ENV = "KIL_GEMINI_API_KEY"
 KIL_AI_GUARDRAIL_MODE_ENV = "KIL_AI_GUARDRAIL_MODE"
 
 DEFAULT_GEMINI_MODEL = "gemini-flash-latest"
-GEMINI_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?{query}"
 GEMINI_TIMEOUT_SECONDS = 25
 
 POLICY_PROFILE_DASHBOARD_CHAT_STRICT = "dashboard_chat_strict"
@@ -159,17 +156,17 @@ def resolve_guardrail_mode() -> str:
 
 def get_chat_status() -> dict[str, Any]:
     model = resolve_model()
-    api_key = resolve_api_key()
-    if api_key:
+    backend = ai_model_client.get_backend()
+    if resolve_api_key() or not backend.requires_api_key:
         return {
             "ready": True,
-            "provider": "gemini",
+            "provider": backend.name,
             "model": model,
             "reason": None,
         }
     return {
         "ready": False,
-        "provider": "gemini",
+        "provider": backend.name,
         "model": model,
         "reason": "GEMINI_API_KEY is not configured.",
     }
@@ -371,6 +368,10 @@ def _build_safe_fallback_reply(messages: list[dict[str, str]], page_context: dic
     )
 
 
+def _guardrail_enforced(policy_profile: str) -> bool:
+    return policy_profile == POLICY_PROFILE_DASHBOARD_CHAT_STRICT and resolve_guardrail_mode() == AI_GUARDRAIL_MODE_ENFORCE
+
+
 def _apply_reply_guardrail(
     *,
     text: str,
@@ -417,86 +418,180 @@ def _extract_usage(response_payload: dict[str, Any]) -> dict[str, int]:
     }
 
 
-def _is_timeout_error(exc: BaseException) -> bool:
-    if isinstance(exc, TimeoutError):
-        return True
-    if isinstance(exc, socket.timeout):
-        return True
-    if isinstance(exc, url_error.URLError):
-        reason = getattr(exc, "reason", None)
-        if isinstance(reason, (TimeoutError, socket.timeout)):
-            return True
-        if isinstance(reason, str) and "timed out" in reason.lower():
-            return True
-    return "timed out" in str(exc).lower()
-
-
-def chat(
+def _build_request_body(
     messages: list[dict[str, str]],
     page_context: dict[str, str],
     *,
-    policy_profile: str = POLICY_PROFILE_DASHBOARD_CHAT_STRICT,
+    policy_profile: str,
 ) -> dict[str, Any]:
-    model = resolve_model()
-    api_key = resolve_api_key()
-    normalized_profile = _normalize_policy_profile(policy_profile)
-    if not api_key:
-        raise MissingApiKeyError("GEMINI_API_KEY is not configured.")
-
-    endpoint = GEMINI_ENDPOINT.format(model=model, query=urlencode({"key": api_key}))
-    body = {
-        "contents": _build_contents(messages, page_context, policy_profile=normalized_profile),
+    # Structured prompts (skill routing) are sampled greedily so identical
+    # prompts give identical answers and can be served from the response cache.
+    deterministic = policy_profile == POLICY_PROFILE_STRUCTURED_JSON
+    return {
+        "contents": _build_contents(messages, page_context, policy_profile=policy_profile),
         "generationConfig": {
-            "temperature": 0.2,
-            "topK": 20,
+            "temperature": 0.0 if deterministic else 0.2,
+            "topK": 1 if deterministic else 20,
             "topP": 0.9,
             "maxOutputTokens": 2048,
         },
     }
-    req = url_request.Request(
-        endpoint,
-        data=json.dumps(body).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    try:
-        with url_request.urlopen(req, timeout=GEMINI_TIMEOUT_SECONDS) as response:
-            raw = response.read().decode("utf-8", errors="replace")
-    except url_error.HTTPError as exc:
-        detail = ""
-        try:
-            detail = exc.read().decode("utf-8", errors="replace")
-        except Exception:
-            detail = ""
-        raise UpstreamApiError(f"Gemini API error: status={exc.code} {detail}".strip()) from exc
-    except url_error.URLError as exc:
-        if _is_timeout_error(exc):
-            raise UpstreamTimeoutError("Gemini API request timed out.") from exc
-        raise UpstreamApiError(f"Gemini API network error: {exc}") from exc
-    except TimeoutError as exc:
-        raise UpstreamTimeoutError("Gemini API request timed out.") from exc
 
-    try:
-        payload = json.loads(raw)
-    except Exception as exc:
-        raise UpstreamApiError("Gemini API returned invalid JSON payload.") from exc
 
-    if not isinstance(payload, dict):
-        raise UpstreamApiError("Gemini API returned unexpected payload.")
-    reply_text = _extract_response_text(payload)
+def _is_cacheable(body: dict[str, Any]) -> bool:
+    config = body.get("generationConfig") if isinstance(body.get("generationConfig"), dict) else {}
+    return config.get("temperature") == 0.0
+
+
+def _prepare_request(
+    policy_profile: str,
+) -> tuple[ai_model_client.ModelBackend, str, str | None, str]:
+    model = resolve_model()
+    api_key = resolve_api_key()
+    normalized_profile = _normalize_policy_profile(policy_profile)
+    backend = ai_model_client.get_backend()
+    if not api_key and backend.requires_api_key:
+        raise MissingApiKeyError("GEMINI_API_KEY is not configured.")
+    return backend, model, api_key, normalized_profile
+
+
+def _to_upstream_error(exc: ai_model_client.ModelClientError) -> AiChatError:
+    if isinstance(exc, ai_model_client.ModelTimeoutError):
+        return UpstreamTimeoutError("Gemini API request timed out.")
+    if isinstance(exc, ai_model_client.ModelHTTPError):
+        return UpstreamApiError(f"Gemini API error: status={exc.status} {exc.detail}".strip())
+    if isinstance(exc, ai_model_client.ModelNetworkError):
+        return UpstreamApiError(f"Gemini API network error: {exc}")
+    return UpstreamApiError(f"Gemini API returned {exc}.")
+
+
+def _chat_result(
+    *,
+    provider: str,
+    model: str,
+    reply_text: str,
+    usage_payload: dict[str, Any],
+    messages: list[dict[str, str]],
+    page_context: dict[str, str],
+    policy_profile: str,
+) -> dict[str, Any]:
     guarded_reply = _apply_reply_guardrail(
         text=reply_text,
         messages=messages,
         page_context=page_context,
-        policy_profile=normalized_profile,
+        policy_profile=policy_profile,
     )
-
     return {
-        "provider": "gemini",
+        "provider": provider,
         "model": model,
         "reply": {
             "role": "assistant",
             "content": guarded_reply,
         },
-        "usage": _extract_usage(payload),
+        "usage": _extract_usage(usage_payload),
     }
+
+
+def chat(
+    messages: list[dict[str, str]],
+    page_context: dict[str, str],
+    *,
+    policy_profile: str = POLICY_PROFILE_DASHBOARD_CHAT_STRICT,
+) -> dict[str, Any]:
+    backend, model, api_key, normalized_profile = _prepare_request(policy_profile)
+    body = _build_request_body(messages, page_context, policy_profile=normalized_profile)
+
+    cache = ai_model_client.response_cache
+    cache_key = cache.key(backend=backend.name, model=model, body=body) if _is_cacheable(body) else None
+    payload = cache.get(cache_key) if cache_key else None
+    cached = payload is not None
+    if payload is None:
+        try:
+            payload = backend.generate(model=model, api_key=api_key, body=body, timeout=GEMINI_TIMEOUT_SECONDS)
+        except ai_model_client.ModelClientError as exc:
+            raise _to_upstream_error(exc) from exc
+    reply_text = _extract_response_text(payload)
+    if cache_key and not cached:
+        cache.put(cache_key, payload)
+
+    return _chat_result(
+        provider=backend.name,
+        model=model,
+        reply_text=reply_text,
+        usage_payload=payload,
+        messages=messages,
+        page_context=page_context,
+        policy_profile=normalized_profile,
+    )
+
+
+def chat_stream(
+    messages: list[dict[str, str]],
+    page_context: dict[str, str],
+    *,
+    policy_profile: str = POLICY_PROFILE_DASHBOARD_CHAT_STRICT,
+) -> Iterator[tuple[str, Any]]:
+    """
+    Yield ("delta", text) for each streamed chunk, then ("done", result) where
+    result has the same shape as `chat()` and carries the guardrail-checked reply.
+
+    When the guardrail is enforced for the profile no deltas are yielded: the
+    raw text is only checked once complete, so only "done" reaches the client.
+
+    Configuration errors are raised before the first item; upstream failures
+    are raised from the iteration.
+    """
+    backend, model, api_key, normalized_profile = _prepare_request(policy_profile)
+    body = _build_request_body(messages, page_context, policy_profile=normalized_profile)
+    return _stream_chunks(
+        backend=backend,
+        model=model,
+        api_key=api_key,
+        body=body,
+        messages=messages,
+        page_context=page_context,
+        policy_profile=normalized_profile,
+    )
+
+
+def _stream_chunks(
+    *,
+    backend: ai_model_client.ModelBackend,
+    model: str,
+    api_key: str | None,
+    body: dict[str, Any],
+    messages: list[dict[str, str]],
+    page_context: dict[str, str],
+    policy_profile: str,
+) -> Iterator[tuple[str, Any]]:
+    parts: list[str] = []
+    usage_payload: dict[str, Any] = {}
+    emit_deltas = not _guardrail_enforced(policy_profile)
+    try:
+        for chunk in backend.stream(model=model, api_key=api_key, body=body, timeout=GEMINI_TIMEOUT_SECONDS):
+            if isinstance(chunk.get("usageMetadata"), dict):
+                usage_payload = chunk
+            candidates = chunk.get("candidates")
+            first = candidates[0] if isinstance(candidates, list) and candidates and isinstance(candidates[0], dict) else {}
+            content = first.get("content") if isinstance(first.get("content"), dict) else {}
+            chunk_parts = content.get("parts") if isinstance(content.get("parts"), list) else []
+            text = "".join(str(part.get("text") or "") for part in chunk_parts if isinstance(part, dict))
+            if text:
+                parts.append(text)
+                if emit_deltas:
+                    yield "delta", text
+    except ai_model_client.ModelClientError as exc:
+        raise _to_upstream_error(exc) from exc
+
+    reply_text = "".join(parts).strip()
+    if not reply_text:
+        raise UpstreamApiError("Gemini API returned empty response text.")
+    yield "done", _chat_result(
+        provider=backend.name,
+        model=model,
+        reply_text=reply_text,
+        usage_payload=usage_payload,
+        messages=messages,
+        page_context=page_context,
+        policy_profile=policy_profile,
+    )
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import hashlib
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Iterator
+from urllib.parse import urlencode
+
+MODEL_BACKEND_ENV = "AX_AI_CHAT_BACKEND"
+MODEL_BACKEND_GEMINI = "gemini"
+MODEL_BACKEND_FAKE = "fake"
+
+GEMINI_HOST = "generativelanguage.googleapis.com"
+GEMINI_GENERATE_PATH = "/v1beta/models/{model}:generateContent?{query}"
+GEMINI_STREAM_PATH = "/v1beta/models/{model}:streamGenerateContent?{query}"
+# Idle keep-alive connections kept per host; extra concurrent requests open and close their own.
+MAX_IDLE_CONNECTIONS = 4
+
+RESPONSE_CACHE_MAX_ENTRIES = 128
+RESPONSE_CACHE_TTL_SECONDS = 600.0
+
+
+class ModelClientError(RuntimeError):
+    """Base class for model transport errors."""
+
+
+class ModelHTTPError(ModelClientError):
+    """Raised when the model API answered with an error status."""
+
+    def __init__(self, status: int, detail: str) -> None:
+        super().__init__(f"status={status} {detail}".strip())
+        self.status = status
+        self.detail = detail
+
+
+class ModelTimeoutError(ModelClientError):
+    """Raised when the model API did not answer in time."""
+
+
+class ModelNetworkError(ModelClientError):
+    """Raised when the model API could not be reached."""
+
+
+def _is_timeout(exc: BaseException) -> bool:
+    if isinstance(exc, (TimeoutError, socket.timeout)):
+        return True
+    return "timed out" in str(exc).lower()
+
+
+class _ConnectionPool:
+    """LIFO pool of keep-alive HTTPS connections to one host."""
+
+    def __init__(self, host: str, *, max_idle: int = MAX_IDLE_CONNECTIONS) -> None:
+        self.host = host
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle: list[http.client.HTTPSConnection] = []
+
+    def acquire(self, timeout: float) -> tuple[http.client.HTTPSConnection, bool]:
+        """Return (connection, reused)."""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            return http.client.HTTPSConnection(self.host, timeout=timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def release(self, conn: http.client.HTTPSConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class ModelBackend(ABC):
+    """Transport for Gemini-style `generateContent` payloads."""
+
+    name = "base"
+    requires_api_key = True
+
+    @abstractmethod
+    def generate(self, *, model: str, api_key: str | None, body: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """Return the full response payload for one request."""
+
+    def stream(
+        self, *, model: str, api_key: str | None, body: dict[str, Any], timeout: float
+    ) -> Iterator[dict[str, Any]]:
+        """Yield response chunks; the default sends one chunk with the whole response."""
+        yield self.generate(model=model, api_key=api_key, body=body, timeout=timeout)
+
+    def close(self) -> None:
+        return None
+
+
+class GeminiBackend(ModelBackend):
+    name = MODEL_BACKEND_GEMINI
+
+    def __init__(self, host: str = GEMINI_HOST) -> None:
+        self._pool = _ConnectionPool(host)
+
+    def _open(
+        self, path: str, body: dict[str, Any], timeout: float
+    ) -> tuple[http.client.HTTPSConnection, http.client.HTTPResponse]:
+        data = json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        for attempt in range(2):
+            conn, reused = self._pool.acquire(timeout)
+            try:
+                conn.request("POST", path, body=data, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                conn.close()
+                # A pooled connection the server already dropped; retry once on a fresh one.
+                if reused and attempt == 0:
+                    continue
+                raise ModelNetworkError(str(exc)) from exc
+            except OSError as exc:
+                conn.close()
+                if _is_timeout(exc):
+                    raise ModelTimeoutError("request timed out") from exc
+                raise ModelNetworkError(str(exc)) from exc
+        raise ModelNetworkError("connection failed")  # pragma: no cover - loop always returns or raises
+
+    def _finish(self, conn: http.client.HTTPSConnection, response: http.client.HTTPResponse) -> None:
+        # readline() can reach the end of the body without marking the response
+        # closed; the connection only accepts a new request once it is.
+        if not response.isclosed():
+            try:
+                response.read()
+            except OSError:
+                conn.close()
+                return
+        if response.will_close:
+            conn.close()
+        else:
+            self._pool.release(conn)
+
+    def _raise_for_status(self, conn: http.client.HTTPSConnection, response: http.client.HTTPResponse) -> None:
+        if response.status < 400:
+            return
+        detail = response.read().decode("utf-8", errors="replace")
+        self._finish(conn, response)
+        raise ModelHTTPError(response.status, detail)
+
+    def generate(self, *, model: str, api_key: str | None, body: dict[str, Any], timeout: float) -> dict[str, Any]:
+        path = GEMINI_GENERATE_PATH.format(model=model, query=urlencode({"key": api_key or ""}))
+        conn, response = self._open(path, body, timeout)
+        self._raise_for_status(conn, response)
+        try:
+            raw = response.read()
+        except OSError as exc:
+            conn.close()
+            if _is_timeout(exc):
+                raise ModelTimeoutError("request timed out") from exc
+            raise ModelNetworkError(str(exc)) from exc
+        self._finish(conn, response)
+        try:
+            payload = json.loads(raw.decode("utf-8", errors="replace"))
+        except ValueError as exc:
+            raise ModelClientError("invalid JSON payload") from exc
+        if not isinstance(payload, dict):
+            raise ModelClientError("unexpected payload")
+        return payload
+
+    def stream(
+        self, *, model: str, api_key: str | None, body: dict[str, Any], timeout: float
+    ) -> Iterator[dict[str, Any]]:
+        path = GEMINI_STREAM_PATH.format(model=model, query=urlencode({"alt": "sse", "key": api_key or ""}))
+        conn, response = self._open(path, body, timeout)
+        self._raise_for_status(conn, response)
+        completed = False
+        try:
+            while True:
+                try:
+                    line = response.readline()
+                except OSError as exc:
+                    if _is_timeout(exc):
+                        raise ModelTimeoutError("request timed out") from exc
+                    raise ModelNetworkError(str(exc)) from exc
+                if not line:
+                    break
+                text = line.decode("utf-8", errors="replace").strip()
+                if not text.startswith("data:"):
+                    continue
+                try:
+                    chunk = json.loads(text[len("data:") :].strip())
+                except ValueError:
+                    continue
+                if isinstance(chunk, dict):
+                    yield chunk
+            completed = True
+        finally:
+            # A consumer that stops early leaves unread data on the socket, so it cannot be reused.
+            if completed:
+                self._finish(conn, response)
+            else:
+                conn.close()
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+def _fake_reply_text(body: dict[str, Any]) -> str:
+    contents = body.get("contents") if isinstance(body.get("contents"), list) else []
+    last = contents[-1] if contents and isinstance(contents[-1], dict) else {}
+    parts = last.get("parts") if isinstance(last.get("parts"), list) else []
+    prompt = "".join(str(part.get("text") or "") for part in parts if isinstance(part, dict)).strip()
+    config = body.get("generationConfig") if isinstance(body.get("generationConfig"), dict) else {}
+    if config.get("responseMimeType") == "application/json" or prompt.startswith("{"):
+        return json.dumps({"mode": "fallback", "reason": "fake backend"}, ensure_ascii=False)
+    return f"回答: {prompt[:200]}\n根拠: messages[{max(0, len(contents) - 1)}]\n不足情報: なし"
+
+
+class FakeModelBackend(ModelBackend):
+    """
+    Offline backend for tests and local UI work.
+
+    `responder(body)` returns a response payload or raises; without one the
+    backend echoes the last message in the dashboard reply format. Every
+    request body is kept in `requests`.
+    """
+
+    name = MODEL_BACKEND_FAKE
+    requires_api_key = False
+
+    def __init__(
+        self,
+        responder: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+        *,
+        stream_chunk_chars: int = 16,
+    ) -> None:
+        self.responder = responder
+        self.stream_chunk_chars = max(1, stream_chunk_chars)
+        self.requests: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def generate(self, *, model: str, api_key: str | None, body: dict[str, Any], timeout: float) -> dict[str, Any]:
+        with self._lock:
+            self.requests.append(body)
+        if self.responder is not None:
+            return self.responder(body)
+        text = _fake_reply_text(body)
+        return {
+            "candidates": [{"content": {"parts": [{"text": text}]}}],
+            "usageMetadata": {"promptTokenCount": 0, "candidatesTokenCount": len(text), "totalTokenCount": len(text)},
+        }
+
+    def stream(
+        self, *, model: str, api_key: str | None, body: dict[str, Any], timeout: float
+    ) -> Iterator[dict[str, Any]]:
+        payload = self.generate(model=model, api_key=api_key, body=body, timeout=timeout)
+        candidates = payload.get("candidates") if isinstance(payload.get("candidates"), list) else []
+        first = candidates[0] if candidates and isinstance(candidates[0], dict) else {}
+        content = first.get("content") if isinstance(first.get("content"), dict) else {}
+        parts = content.get("parts") if isinstance(content.get("parts"), list) else []
+        text = "".join(str(part.get("text") or "") for part in parts if isinstance(part, dict))
+        step = self.stream_chunk_chars
+        pieces = [text[i : i + step] for i in range(0, len(text), step)] or [""]
+        for index, piece in enumerate(pieces):
+            chunk: dict[str, Any] = {"candidates": [{"content": {"parts": [{"text": piece}]}}]}
+            if index == len(pieces) - 1 and "usageMetadata" in payload:
+                chunk["usageMetadata"] = payload["usageMetadata"]
+            yield chunk
+
+
+class ResponseCache:
+    """Thread-safe LRU of model responses with a TTL, for deterministic prompts only."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*, backend: str, model: str, body: dict[str, Any]) -> str:
+        raw = json.dumps([backend, model, body], ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_backend_lock = threading.Lock()
+_backend: ModelBackend | None = None
+_backend_override: ModelBackend | None = None
+response_cache = ResponseCache()
+
+
+def get_backend() -> ModelBackend:
+    """Return the override set by `set_backend`, else the backend named by AX_AI_CHAT_BACKEND."""
+    global _backend
+    if _backend_override is not None:
+        return _backend_override
+    wanted = str(os.environ.get(MODEL_BACKEND_ENV) or "").strip().lower() or MODEL_BACKEND_GEMINI
+    with _backend_lock:
+        if _backend is None or _backend.name != wanted:
+            if _backend is not None:
+                _backend.close()
+            _backend = FakeModelBackend() if wanted == MODEL_BACKEND_FAKE else GeminiBackend()
+        return _backend
+
+
+def set_backend(backend: ModelBackend | None) -> None:
+    """Install `backend` for every chat call (None restores the env-selected one) and drop cached responses."""
+    global _backend_override
+    with _backend_lock:
+        _backend_override = backend
+    response_cache.clear()
+
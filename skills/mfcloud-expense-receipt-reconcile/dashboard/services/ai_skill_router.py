@@ -18,7 +18,6 @@ MAX_ROUTER_HISTORY = 12
 MAX_ROUTER_SKILLS = 60
 MAX_ARGS = 40
 MAX_ARG_CHARS = 200
-MAX_RUNNERLESS_GUIDANCE_STEPS = 6
 
 _CONTROL_CONFIRM_PREFIX = "/confirm"
 _CONTROL_CANCEL_PREFIX = "/cancel"
@@ -64,7 +63,6 @@ _ARG_ALIASES_BY_SKILL: dict[str, dict[str, str]] = {
         "test": "--self-check",
     }
 }
-_SKILL_STEP_PATTERN = re.compile(r"^\s*(?:[-*+]|[0-9]{1,2}[.)])\s+(.*\S)\s*$")
 
 
 def _now_utc() -> datetime:
@@ -138,39 +136,11 @@ def _read_text(path: Path) -> str:
         return path.read_text(encoding="utf-8", errors="ignore")
 
 
-def _strip_front_matter(raw: str) -> str:
-    lines = str(raw or "").splitlines()
-    if not lines or lines[0].strip() != "---":
-        return str(raw or "")
-    for idx in range(1, len(lines)):
-        if lines[idx].strip() == "---":
-            return "\n".join(lines[idx + 1 :])
-    return str(raw or "")
-
-
 def _extract_skill_md_steps(skill_md: str) -> list[str]:
     path = Path(str(skill_md or "").strip())
     if not str(path) or not path.exists() or not path.is_file():
         return []
-    body = _strip_front_matter(_read_text(path))
-    out: list[str] = []
-    seen: set[str] = set()
-    for line in body.splitlines():
-        m = _SKILL_STEP_PATTERN.match(line)
-        if not m:
-            continue
-        text = re.sub(r"\s+", " ", str(m.group(1) or "")).strip()
-        if not text:
-            continue
-        if len(text) > 180:
-            text = text[:177] + "..."
-        if text in seen:
-            continue
-        seen.add(text)
-        out.append(text)
-        if len(out) >= MAX_RUNNERLESS_GUIDANCE_STEPS:
-            break
-    return out
+    return ai_skill_tools.extract_guidance_steps(_read_text(path))
 
 
 def _safe_json_load(value: Any) -> dict[str, Any] | None:
@@ -389,10 +359,7 @@ def _select_skill_with_model(
 
 def _find_skill(skills: list[dict[str, Any]], skill_id: str) -> dict[str, Any] | None:
     wanted = str(skill_id or "").strip().lower()
-    for row in skills:
-        if str(row.get("id") or "").strip().lower() == wanted:
-            return row
-    return None
+    return ai_skill_tools.skill_routing_index(skills)["by_id"].get(wanted)
 
 
 def _suggest_alternatives(skill_id: str, skills: list[dict[str, Any]]) -> list[str]:
@@ -433,7 +400,10 @@ def _build_runnerless_advice(
     ]
     if skill_md:
         lines.append(f"SKILL.md: {skill_md}")
-    steps = _extract_skill_md_steps(skill_md)
+    # Registry rows carry steps parsed at build time; only ad-hoc rows read SKILL.md here.
+    steps = ai_skill_tools.skill_routing_index(skills)["guidance_steps"].get(sid)
+    if steps is None:
+        steps = _extract_skill_md_steps(skill_md)
     if steps:
         lines.append("Suggested manual steps (from SKILL.md):")
         for idx, step in enumerate(steps, start=1):
@@ -522,8 +492,8 @@ def _should_try_skill_routing(*, latest_user_text: str, skills: list[dict[str, A
         return False
     if any(hint in lowered for hint in _SKILL_HINTS):
         return True
-    skill_ids = [str(row.get("id") or "").strip().lower() for row in skills]
-    return any(skill_id and skill_id in lowered for skill_id in skill_ids)
+    skill_ids = ai_skill_tools.skill_routing_index(skills)["ids"]
+    return any(skill_id in lowered for skill_id in skill_ids)
 
 
 def _handle_control_flow(*, messages: list[dict[str, str]], latest_user_text: str) -> dict[str, Any] | None:
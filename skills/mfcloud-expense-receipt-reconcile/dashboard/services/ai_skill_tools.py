@@ -7,10 +7,13 @@ import re
 import shlex
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
+from .core_shared import _write_json
+
 SKILL_DOC_NAME = "SKILL.md"
 SKILL_META_NAME = "skill.yaml"
 MAX_ARGS = 40
@@ -32,6 +35,10 @@ IGNORED_SKILL_PATH_PARTS = {
     ".venv",
 }
 ENV_KEY_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# The skill tree is re-stat'ed at most this often; reads in between touch no files.
+SKILL_REGISTRY_CHECK_INTERVAL_SECONDS = 2.0
+MAX_GUIDANCE_STEPS = 6
+GUIDANCE_STEP_PATTERN = re.compile(r"^\s*(?:[-*+]|[0-9]{1,2}[.)])\s+(.*\S)\s*$")
 
 
 class SkillError(RuntimeError):
@@ -253,25 +260,27 @@ def _normalize_kintone_failure(skill_id: str, stdout: str, stderr: str) -> str |
     return "Reconfiguration guide:\n- " + "\n- ".join(hints)
 
 
-def _iter_skill_dirs(root: Path) -> list[Path]:
-    candidates: list[Path] = []
-    for skill_md in root.rglob(SKILL_DOC_NAME):
-        if not skill_md.is_file():
-            continue
+def _walk_skill_tree(root: Path) -> tuple[list[Path], list[tuple[str, int]]]:
+    """Return (SKILL.md paths, (directory, mtime_ns) for every directory that can hold one)."""
+    skill_docs: list[Path] = []
+    dir_mtimes: list[tuple[str, int]] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Hidden and vendored directories never contribute skills, so they are not watched either.
+        dirnames[:] = sorted(
+            name for name in dirnames if not name.startswith(".") and name.lower() not in IGNORED_SKILL_PATH_PARTS
+        )
         try:
-            rel = skill_md.relative_to(root)
-        except Exception:
-            continue
-        rel_parts = [str(part) for part in rel.parts[:-1]]
-        if not rel_parts:
-            continue
-        lowered = [part.lower() for part in rel_parts]
-        if any(part.startswith(".") for part in rel_parts):
-            continue
-        if any(part in IGNORED_SKILL_PATH_PARTS for part in lowered):
+            dir_mtimes.append((dirpath, os.stat(dirpath).st_mtime_ns))
+        except OSError:
             continue
-        candidates.append(skill_md.parent)
+        if SKILL_DOC_NAME in filenames and Path(dirpath) != root:
+            skill_docs.append(Path(dirpath) / SKILL_DOC_NAME)
+    return skill_docs, dir_mtimes
 
+
+def _iter_skill_dirs(root: Path) -> list[Path]:
+    skill_docs, _ = _walk_skill_tree(root)
+    candidates = [skill_md.parent for skill_md in skill_docs if skill_md.is_file()]
     unique = {path.resolve(): path for path in candidates}
     ordered = sorted(
         unique.values(),
@@ -320,11 +329,6 @@ def _read_json(path: Path) -> Any:
             return None
 
 
-def _write_json(path: Path, payload: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-
-
 def _coerce_bool(value: Any) -> bool:
     if isinstance(value, bool):
         return value
@@ -399,57 +403,218 @@ def _build_execution_capabilities(*, has_runner: bool) -> dict[str, Any]:
     }
 
 
-def list_skills() -> list[dict[str, Any]]:
-    root = _skills_root()
-    allowlist = _parse_allowlist()
-    settings = get_permission_settings()
-    overrides = (
-        settings.get("overrides")
-        if isinstance(settings, dict) and isinstance(settings.get("overrides"), dict)
-        else {}
-    )
-    if not root.exists():
-        return []
+def _strip_front_matter(raw: str) -> str:
+    lines = str(raw or "").splitlines()
+    if not lines or lines[0].strip() != "---":
+        return str(raw or "")
+    for idx in range(1, len(lines)):
+        if lines[idx].strip() == "---":
+            return "\n".join(lines[idx + 1 :])
+    return str(raw or "")
 
-    out: list[dict[str, Any]] = []
-    seen_skill_ids: set[str] = set()
-    for skill_dir in _iter_skill_dirs(root):
-        skill_md = skill_dir / SKILL_DOC_NAME
-        metadata = _parse_front_matter(skill_md)
-        skill_id = _normalize_skill_id(metadata.get("name") or skill_dir.name)
-        if not skill_id:
+
+def extract_guidance_steps(raw: str) -> list[str]:
+    """Pick the first list items of a SKILL.md body as manual steps for runnerless skills."""
+    out: list[str] = []
+    seen: set[str] = set()
+    for line in _strip_front_matter(raw).splitlines():
+        m = GUIDANCE_STEP_PATTERN.match(line)
+        if not m:
             continue
-        if skill_id in seen_skill_ids:
+        text = re.sub(r"\s+", " ", str(m.group(1) or "")).strip()
+        if not text:
             continue
-        seen_skill_ids.add(skill_id)
-        runner = _detect_runner(skill_dir)
-        has_runner = runner is not None
-        admin_enabled = bool(overrides.get(skill_id, True))
-        env_allowed = _is_env_allowed(skill_id, has_runner, allowlist)
-        capabilities = _build_execution_capabilities(has_runner=has_runner)
-        allowed = _is_allowed(
+        if len(text) > 180:
+            text = text[:177] + "..."
+        if text in seen:
+            continue
+        seen.add(text)
+        out.append(text)
+        if len(out) >= MAX_GUIDANCE_STEPS:
+            break
+    return out
+
+
+def _file_mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class _SkillRegistry:
+    """
+    In-memory view of the skill tree, shared by every request.
+
+    Entries are rebuilt only when a watched directory or SKILL.md changes,
+    checked at most every SKILL_REGISTRY_CHECK_INTERVAL_SECONDS. The lock is
+    held only for in-memory lookups and the occasional rebuild, so concurrent
+    readers share one build and never see a partial registry.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._root: Path | None = None
+        self._signature: tuple[Any, ...] | None = None
+        self._checked_at = 0.0
+        self._entries: tuple[dict[str, Any], ...] = ()
+        self._permissions: tuple[tuple[str, int | None], dict[str, bool]] | None = None
+        self._view: tuple[tuple[Any, ...], list[dict[str, Any]], dict[str, Any]] | None = None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._signature = None
+            self._checked_at = 0.0
+            self._permissions = None
+            self._view = None
+
+    def invalidate_permissions(self) -> None:
+        with self._lock:
+            self._permissions = None
+            self._view = None
+            self._checked_at = 0.0
+
+    def _tree_signature(self, root: Path, skill_docs: list[Path], dir_mtimes: list[tuple[str, int]]) -> tuple[Any, ...]:
+        return (str(root), tuple(dir_mtimes), tuple((str(p), _file_mtime_ns(p)) for p in skill_docs))
+
+    def _current_signature(self, root: Path) -> tuple[Any, ...] | None:
+        # Cheap check: stat the directories and SKILL.md files seen at the last build.
+        if self._signature is None or self._signature[0] != str(root) or not self._signature[1]:
+            return None
+        _, dir_mtimes, doc_mtimes = self._signature
+        dirs = tuple((path, _file_mtime_ns(Path(path))) for path, _ in dir_mtimes)
+        docs = tuple((path, _file_mtime_ns(Path(path))) for path, _ in doc_mtimes)
+        return (str(root), dirs, docs)
+
+    def _build(self, root: Path) -> None:
+        skill_docs, dir_mtimes = _walk_skill_tree(root) if root.exists() else ([], [])
+        entries: list[dict[str, Any]] = []
+        seen_skill_ids: set[str] = set()
+        for skill_dir in _iter_skill_dirs(root) if root.exists() else []:
+            skill_md = skill_dir / SKILL_DOC_NAME
+            raw = _read_text(skill_md)
+            metadata = _parse_front_matter(skill_md)
+            skill_id = _normalize_skill_id(metadata.get("name") or skill_dir.name)
+            if not skill_id or skill_id in seen_skill_ids:
+                continue
+            seen_skill_ids.add(skill_id)
+            runner = _detect_runner(skill_dir)
+            entries.append(
+                {
+                    "id": skill_id,
+                    "name": metadata.get("name") or skill_dir.name,
+                    "description": metadata.get("description") or "",
+                    "skill_md": str(skill_md),
+                    "runner": str(runner) if runner else None,
+                    "guidance_steps": tuple(extract_guidance_steps(raw)),
+                }
+            )
+        self._entries = tuple(entries)
+        self._signature = self._tree_signature(root, skill_docs, dir_mtimes)
+        self._root = root
+        self._view = None
+
+    def _refresh(self, root: Path) -> None:
+        now = time.monotonic()
+        if self._root == root and now - self._checked_at < SKILL_REGISTRY_CHECK_INTERVAL_SECONDS:
+            return
+        current = self._current_signature(root)
+        if current is None or current != self._signature:
+            self._build(root)
+        permissions_path = _permissions_path()
+        permissions_key = (str(permissions_path), _file_mtime_ns(permissions_path))
+        if self._permissions is None or self._permissions[0] != permissions_key:
+            raw = _read_json(permissions_path)
+            src = raw if isinstance(raw, dict) else {}
+            self._permissions = (permissions_key, _normalize_permission_overrides(src.get("overrides")))
+            self._view = None
+        self._checked_at = now
+
+    def view(self, root: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        allowlist = _parse_allowlist()
+        with self._lock:
+            self._refresh(root)
+            overrides = self._permissions[1] if self._permissions else {}
+            # Builds and permission changes drop the view, so only the env allowlist keys it.
+            key = (allowlist is None, tuple(sorted(allowlist or ())))
+            if self._view is not None and self._view[0] == key:
+                return self._view[1], self._view[2]
+            rows = [_skill_row(entry, overrides=overrides, allowlist=allowlist) for entry in self._entries]
+            routing = _build_routing_index(rows, steps={e["id"]: list(e["guidance_steps"]) for e in self._entries})
+            self._view = (key, rows, routing)
+            return rows, routing
+
+
+def _skill_row(entry: dict[str, Any], *, overrides: dict[str, bool], allowlist: set[str] | None) -> dict[str, Any]:
+    skill_id = entry["id"]
+    has_runner = entry["runner"] is not None
+    admin_enabled = bool(overrides.get(skill_id, True))
+    capabilities = _build_execution_capabilities(has_runner=has_runner)
+    return {
+        "id": skill_id,
+        "name": entry["name"],
+        "description": entry["description"],
+        "skill_md": entry["skill_md"],
+        "has_runner": has_runner,
+        "runner": entry["runner"],
+        "api_executable": bool(capabilities["api_executable"]),
+        "agent_executable": bool(capabilities["agent_executable"]),
+        "api_unavailable_reason": capabilities["api_unavailable_reason"],
+        "env_allowed": _is_env_allowed(skill_id, has_runner, allowlist),
+        "admin_enabled": admin_enabled,
+        "allowed": _is_allowed(
             skill_id=skill_id,
             has_runner=has_runner,
             allowlist=allowlist,
             admin_enabled=admin_enabled,
-        )
-        out.append(
-            {
-                "id": skill_id,
-                "name": metadata.get("name") or skill_dir.name,
-                "description": metadata.get("description") or "",
-                "skill_md": str(skill_md),
-                "has_runner": has_runner,
-                "runner": str(runner) if runner else None,
-                "api_executable": bool(capabilities["api_executable"]),
-                "agent_executable": bool(capabilities["agent_executable"]),
-                "api_unavailable_reason": capabilities["api_unavailable_reason"],
-                "env_allowed": env_allowed,
-                "admin_enabled": admin_enabled,
-                "allowed": allowed,
-            }
-        )
-    return out
+        ),
+    }
+
+
+def _build_routing_index(skills: list[dict[str, Any]], *, steps: dict[str, list[str]] | None = None) -> dict[str, Any]:
+    by_id: dict[str, dict[str, Any]] = {}
+    for row in skills:
+        sid = _normalize_skill_id(row.get("id"))
+        if sid and sid not in by_id:
+            by_id[sid] = row
+    return {
+        "rows": skills,
+        "ids": tuple(by_id),
+        "by_id": by_id,
+        "guidance_steps": dict(steps or {}),
+    }
+
+
+_REGISTRY = _SkillRegistry()
+
+
+def warm_skill_registry() -> int:
+    """Build the registry ahead of the first chat message; returns the skill count."""
+    rows, _ = _REGISTRY.view(_skills_root())
+    return len(rows)
+
+
+def invalidate_skill_registry() -> None:
+    _REGISTRY.invalidate()
+
+
+def list_skills() -> list[dict[str, Any]]:
+    """Return the skill rows; the row dicts are shared with the registry and must not be mutated."""
+    rows, _ = _REGISTRY.view(_skills_root())
+    return list(rows)
+
+
+def skill_routing_index(skills: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Return id lookups and SKILL.md guidance steps for `skills` without touching the filesystem.
+
+    Rows returned by `list_skills()` reuse the registry's prebuilt index; any
+    other list gets an index built on the spot, without guidance steps.
+    """
+    rows, routing = _REGISTRY.view(_skills_root())
+    if len(skills) == len(rows) and all(a is b for a, b in zip(skills, rows)):
+        return routing
+    return _build_routing_index(skills)
 
 
 def _coerce_timeout(value: Any) -> int:
@@ -521,6 +686,7 @@ def set_skill_permission(skill_id: str, enabled: Any) -> dict[str, Any]:
             "updated_at": updated_at,
         },
     )
+    _REGISTRY.invalidate_permissions()
     return {
         "skill": resolved_skill_id,
         "enabled": normalized_enabled,
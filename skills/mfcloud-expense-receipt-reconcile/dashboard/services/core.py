@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from .core_artifacts import (
     _derive_order_counts_from_jsonl,
+    _read_run_timing,
     _resolve_form_defaults,
     _scan_archive_history,
     _scan_archived_receipts,
@@ -51,7 +52,9 @@ from .core_runs import (
     _assert_source_action_allowed,
     _get_latest_running_job,
     _mf_draft_actions_summary_for_ym,
+    _pid_alive,
     _preflight_global_path,
+    _read_log_from_offset,
     _reconcile_running_jobs,
     _running_mode_for_ym,
     _safe_run_id,
@@ -63,6 +66,11 @@ from .core_runs import (
     _tail_text,
     _workflow_state_for_ym,
 )
+from .core_run_rows import (
+    RUN_ROWS_DEFAULT_LIMIT,
+    RUN_ROWS_MAX_LIMIT,
+    _query_run_rows,
+)
 from .core_shared import (
     ORDER_ID_RE,
     SAFE_NAME_RE,
@@ -70,15 +78,22 @@ from .core_shared import (
     _artifact_root,
     _ax_home,
     _dashboard_ui_locale,
+    _iter_audit_log_bytes,
+    _list_audit_segments,
+    _read_audit_log,
     _read_json,
     _read_jsonl,
+    _read_state_collections,
     _read_workflow_templates_raw,
     _runs_root,
     _safe_non_negative_int,
     _sort_workflow_templates_rows,
+    _update_state_collections,
     _workflow_templates_path,
     _write_workflow_templates_raw,
     _write_json,
+    _write_run_meta,
+    _write_state_collections,
 )
 
 __all__ = [
@@ -90,6 +105,8 @@ __all__ = [
     "MONTH_CLOSE_CHECKLIST_KEYS",
     "PROVIDER_KEYS",
     "PROVIDER_LABELS",
+    "RUN_ROWS_DEFAULT_LIMIT",
+    "RUN_ROWS_MAX_LIMIT",
     "_archive_outputs_for_ym",
     "_append_audit_event",
     "_artifact_root",
@@ -115,9 +132,17 @@ __all__ = [
     "_mf_draft_actions_summary_for_ym",
     "_provider_inbox_dir_for_ym",
     "_provider_inbox_status_for_ym",
+    "_query_run_rows",
+    "_pid_alive",
     "_preflight_global_path",
+    "_iter_audit_log_bytes",
+    "_list_audit_segments",
+    "_read_audit_log",
     "_read_json",
+    "_read_run_timing",
+    "_read_log_from_offset",
     "_read_jsonl",
+    "_read_state_collections",
     "_read_workflow_templates_raw",
     "_read_month_close_checklist_for_ym",
     "_read_workflow",
@@ -145,9 +170,12 @@ __all__ = [
     "_run_provider_download_for_ym",
     "_run_mf_bulk_upload_for_ym",
     "_tail_text",
+    "_update_state_collections",
     "_workflow_state_for_ym",
     "_workflow_templates_path",
     "_write_workflow_templates_raw",
     "_write_json",
+    "_write_run_meta",
+    "_write_state_collections",
     "_write_workflow",
 ]
@@ -125,6 +125,32 @@ def _scan_artifacts() -> list[dict[str, Any]]:
     return items
 
 
+RUN_TIMING_FILE_NAME = "run_timing.json"
+
+
+def _read_run_timing(reports_dir: Path) -> dict[str, Any] | None:
+    """Latest pipeline timing for the month, with bar offsets/widths (%) for the waterfall."""
+    data = _read_json(reports_dir / RUN_TIMING_FILE_NAME)
+    if not isinstance(data, dict) or not isinstance(data.get("spans"), list):
+        return None
+    spans = [span for span in data["spans"] if isinstance(span, dict)]
+    ends = [float(span.get("start_ms") or 0) + float(span.get("duration_ms") or 0) for span in spans]
+    total_ms = max([float(data.get("duration_ms") or 0), *ends, 0.001])
+    bars: list[dict[str, Any]] = []
+    for span in spans:
+        start_ms = float(span.get("start_ms") or 0)
+        duration_ms = float(span.get("duration_ms") or 0)
+        bars.append(
+            {
+                **span,
+                "offset_pct": round(100.0 * start_ms / total_ms, 3),
+                # Keep instant spans visible as a sliver.
+                "width_pct": max(0.3, round(100.0 * duration_ms / total_ms, 3)),
+            }
+        )
+    return {**data, "total_ms": total_ms, "spans": bars}
+
+
 def _scan_archive_history(*, limit: int = 30) -> list[dict[str, Any]]:
     return _scan_archive_history_common(
         ym_matcher=lambda name: bool(YM_RE.match(str(name))),
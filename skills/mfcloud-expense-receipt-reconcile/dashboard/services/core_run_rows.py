@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import base64
+import json
+from pathlib import Path
+import threading
+from typing import Any
+import unicodedata
+
+from fastapi import HTTPException
+
+from .core_orders import _compact_mf_summary
+from .core_shared import _read_json, _write_json
+
+RUN_ROWS_SOURCE_NAME = "missing_evidence_candidates.json"
+RUN_ROWS_INDEX_NAME = "missing_evidence_rows.index.json"
+# Bump when the display fields change so persisted indexes are rebuilt.
+RUN_ROWS_INDEX_VERSION = 1
+RUN_ROWS_DEFAULT_LIMIT = 50
+RUN_ROWS_MAX_LIMIT = 500
+RUN_ROWS_SORTS = {"position", "use_date", "amount", "vendor"}
+RUN_ROWS_ORDERS = {"asc", "desc"}
+
+_index_cache_lock = threading.Lock()
+# reports dir -> (source signature, index); one entry per month viewed.
+_index_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _source_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _amount_yen(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def _fold(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _display_row(row: dict[str, Any], position: int) -> dict[str, Any]:
+    out = dict(row)
+    mf_use_date = str(row.get("mf_use_date") or "").strip() or None
+    out["mf_use_date"] = mf_use_date or "-"
+    vendor = str(row.get("mf_vendor") or "")
+    memo = str(row.get("mf_memo") or "")
+    summary = _compact_mf_summary(vendor, memo)
+    out["mf_summary"] = summary if summary else " ".join([vendor, memo]).strip()
+    amount = _amount_yen(row.get("mf_amount_yen"))
+    out["mf_amount_label"] = f"{amount:,}円" if amount is not None else "-"
+    out["position"] = position
+    return out
+
+
+def _index_keys(row: dict[str, Any], position: int) -> dict[str, Any]:
+    vendor = str(row.get("mf_vendor") or "")
+    return {
+        "position": position,
+        "use_date": str(row.get("mf_use_date") or "").strip(),
+        "amount": _amount_yen(row.get("mf_amount_yen")),
+        "vendor": _fold(vendor),
+        "search": _fold(f"{vendor} {row.get('mf_memo') or ''}"),
+        "row_type": str(row.get("row_type") or "").strip(),
+        "review_reason": str(row.get("review_reason") or "").strip(),
+    }
+
+
+def _build_run_rows_index(source: Path, signature: tuple[int, int]) -> dict[str, Any]:
+    data = _read_json(source) or {}
+    rows = data.get("rows") if isinstance(data, dict) else []
+    rows = [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else []
+    counts = data.get("counts") if isinstance(data, dict) else {}
+    return {
+        "version": RUN_ROWS_INDEX_VERSION,
+        "source_size": signature[0],
+        "source_mtime_ns": signature[1],
+        "counts": counts if isinstance(counts, dict) else {},
+        "rows": [_display_row(row, position) for position, row in enumerate(rows)],
+        "keys": [_index_keys(row, position) for position, row in enumerate(rows)],
+    }
+
+
+def _load_run_rows_index(reports_dir: Path) -> dict[str, Any]:
+    """
+    Return the display-ready row index for a month, rebuilding it only when
+    missing_evidence_candidates.json changed. Kept in memory and persisted
+    next to the report so a restarted dashboard does not re-derive it.
+    """
+    source = reports_dir / RUN_ROWS_SOURCE_NAME
+    signature = _source_signature(source)
+    if signature is None:
+        return {"version": RUN_ROWS_INDEX_VERSION, "counts": {}, "rows": [], "keys": []}
+    cache_key = str(reports_dir)
+    with _index_cache_lock:
+        cached = _index_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    index_path = reports_dir / RUN_ROWS_INDEX_NAME
+    index = _read_json(index_path)
+    if not (
+        isinstance(index, dict)
+        and index.get("version") == RUN_ROWS_INDEX_VERSION
+        and index.get("source_size") == signature[0]
+        and index.get("source_mtime_ns") == signature[1]
+        and isinstance(index.get("counts"), dict)
+        and isinstance(index.get("rows"), list)
+        and isinstance(index.get("keys"), list)
+    ):
+        index = _build_run_rows_index(source, signature)
+        try:
+            _write_json(index_path, index, compact=True)
+        except OSError:
+            pass
+    with _index_cache_lock:
+        _index_cache[cache_key] = (signature, index)
+    return index
+
+
+def _report_version(index: dict[str, Any]) -> str:
+    return f"{index.get('source_size', 0)}.{index.get('source_mtime_ns', 0)}"
+
+
+def _encode_cursor(sort: str, order: str, position: int, report: str) -> str:
+    raw = json.dumps([sort, order, position, report], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, *, sort: str, order: str, report: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, cursor_order, position, cursor_report = json.loads(
+            base64.urlsafe_b64decode(padded.encode("ascii"))
+        )
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    if cursor_sort != sort or cursor_order != order or not isinstance(position, int):
+        raise HTTPException(status_code=400, detail="Cursor does not match sort order.")
+    if cursor_report != report:
+        # Positions refer to the report the cursor was issued for; after a
+        # regeneration they would silently skip or repeat rows.
+        raise HTTPException(status_code=409, detail="Report changed since the cursor was issued; restart paging.")
+    return position
+
+
+def _matches(
+    keys: dict[str, Any],
+    *,
+    status: str | None,
+    vendor: str | None,
+    amount_min: int | None,
+    amount_max: int | None,
+    date_from: str | None,
+    date_to: str | None,
+) -> bool:
+    if status and status not in (keys["row_type"], keys["review_reason"]):
+        return False
+    if vendor and vendor not in keys["search"]:
+        return False
+    amount = keys["amount"]
+    if amount_min is not None and (amount is None or amount < amount_min):
+        return False
+    if amount_max is not None and (amount is None or amount > amount_max):
+        return False
+    use_date = keys["use_date"]
+    if date_from and (not use_date or use_date < date_from):
+        return False
+    if date_to and (not use_date or use_date > date_to):
+        return False
+    return True
+
+
+def _ordered_keys(keys: list[dict[str, Any]], *, sort: str, order: str) -> list[dict[str, Any]]:
+    if sort == "position":
+        return list(reversed(keys)) if order == "desc" else list(keys)
+    # Rows without a value for the sort field always come last, in report order.
+    present = [k for k in keys if k[sort] not in (None, "")]
+    missing = [k for k in keys if k[sort] in (None, "")]
+    present.sort(key=lambda k: k["position"])
+    present.sort(key=lambda k: k[sort], reverse=order == "desc")
+    return present + missing
+
+
+def _query_run_rows(
+    reports_dir: Path,
+    *,
+    status: str | None = None,
+    vendor: str | None = None,
+    amount_min: int | None = None,
+    amount_max: int | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    sort: str = "position",
+    order: str = "asc",
+    cursor: str | None = None,
+    limit: int = RUN_ROWS_DEFAULT_LIMIT,
+) -> dict[str, Any]:
+    sort = str(sort or "position").strip()
+    order = str(order or "asc").strip().lower()
+    if sort not in RUN_ROWS_SORTS:
+        raise HTTPException(status_code=400, detail="Invalid sort.")
+    if order not in RUN_ROWS_ORDERS:
+        raise HTTPException(status_code=400, detail="Invalid order.")
+    limit = max(1, min(int(limit), RUN_ROWS_MAX_LIMIT))
+    vendor_needle = _fold(str(vendor or "").strip())
+    status = str(status or "").strip() or None
+
+    index = _load_run_rows_index(reports_dir)
+    filtered = [
+        keys
+        for keys in index["keys"]
+        if _matches(
+            keys,
+            status=status,
+            vendor=vendor_needle,
+            amount_min=amount_min,
+            amount_max=amount_max,
+            date_from=str(date_from or "").strip() or None,
+            date_to=str(date_to or "").strip() or None,
+        )
+    ]
+    ordered = _ordered_keys(filtered, sort=sort, order=order)
+
+    start = 0
+    if cursor:
+        after = _decode_cursor(cursor, sort=sort, order=order, report=_report_version(index))
+        positions = [keys["position"] for keys in ordered]
+        try:
+            start = positions.index(after) + 1
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Cursor row is no longer in the result set.")
+    page = ordered[start : start + limit]
+    next_cursor = None
+    if page and start + limit < len(ordered):
+        next_cursor = _encode_cursor(sort, order, page[-1]["position"], _report_version(index))
+    return {
+        "rows": [index["rows"][keys["position"]] for keys in page],
+        "counts": dict(index["counts"]),
+        "total": len(index["keys"]),
+        "matched": len(ordered),
+        "next_cursor": next_cursor,
+        "sort": sort,
+        "order": order,
+        "limit": limit,
+    }
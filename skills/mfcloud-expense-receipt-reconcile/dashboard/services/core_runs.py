@@ -18,11 +18,13 @@ from .core_shared import (
     DEFAULT_RAKUTEN_URL,
     RUN_ID_RE,
     SKILL_ROOT,
+    _archive_month_outputs,
     _artifact_root,
     _read_json,
     _read_jsonl,
     _runs_root,
     _write_json,
+    _write_run_meta,
 )
 from . import core_runs_audit as _audit
 from . import core_runs_engine as _engine
@@ -106,7 +108,7 @@ def _capture_failed_run_incident(
         inferred_from=inferred_from,
         _safe_int_fn=_safe_int,
         _subprocess_fn=subprocess,
-        _write_json_fn=_write_json,
+        _write_json_fn=_write_run_meta,
         _append_audit_event_fn=_append_audit_event,
         _audit_log_path_fn=_paths._audit_log_path,
         _skill_root=SKILL_ROOT,
@@ -163,9 +165,8 @@ def _archive_outputs_for_ym(
         _collect_excluded_pdfs_fn=_collect_excluded_pdfs,
         _coerce_non_negative_int_fn=_coerce_non_negative_int,
         _write_json_fn=_write_json,
-        _subprocess_fn=subprocess,
+        _archive_month_fn=_archive_month_outputs,
         _artifact_root_fn=_artifact_root,
-        _read_json_fn=_read_json,
     )
 
 
@@ -173,6 +174,16 @@ def _tail_text(path: Path, max_bytes: int = 5000) -> str:
     return _state._tail_text(path, max_bytes=max_bytes)
 
 
+def _read_log_from_offset(
+    path: Path,
+    offset: int,
+    *,
+    max_bytes: int = 64_000,
+    final: bool = False,
+) -> tuple[str, int]:
+    return _state._read_log_from_offset(path, offset, max_bytes=max_bytes, final=final)
+
+
 def _infer_run_exit_code_from_log(log_path: Path) -> tuple[int | None, str | None]:
     return _state._infer_run_exit_code_from_log(log_path)
 
@@ -199,10 +210,10 @@ def _cancel_step_runs(
         step=step,
         allowed_modes=allowed_modes,
         actor=actor,
-        _scan_run_jobs_fn=_scan_run_jobs,
+        _scan_run_jobs_fn=_scan_running_jobs,
         _safe_int_fn=_safe_int,
         _terminate_pid_fn=_terminate_pid,
-        _write_json_fn=_write_json,
+        _write_json_fn=_write_run_meta,
         _append_audit_event_fn=_append_audit_event,
     )
 
@@ -239,12 +250,21 @@ def _scan_run_jobs() -> list[dict[str, Any]]:
     )
 
 
+def _scan_running_jobs() -> list[dict[str, Any]]:
+    return _engine._scan_run_jobs(
+        status="running",
+        _reconcile_running_jobs_fn=_reconcile_running_jobs,
+        _runs_root_fn=_runs_root,
+        _read_json_fn=_read_json,
+    )
+
+
 def _running_job_exists() -> bool:
-    return _engine._running_job_exists(_scan_run_jobs_fn=_scan_run_jobs)
+    return _engine._running_job_exists(_scan_run_jobs_fn=_scan_running_jobs)
 
 
 def _get_latest_running_job() -> dict[str, Any] | None:
-    return _engine._get_latest_running_job(_scan_run_jobs_fn=_scan_run_jobs)
+    return _engine._get_latest_running_job(_scan_run_jobs_fn=_scan_running_jobs)
 
 
 def _run_worker(process, meta_path: Path) -> None:
@@ -252,7 +272,7 @@ def _run_worker(process, meta_path: Path) -> None:
         process,
         meta_path,
         _read_json_fn=_read_json,
-        _write_json_fn=_write_json,
+        _write_json_fn=_write_run_meta,
         _safe_int_fn=_safe_int,
         _append_audit_event_fn=_append_audit_event,
         _capture_failed_run_incident_fn=_capture_failed_run_incident,
@@ -264,7 +284,7 @@ def _reconcile_running_jobs(
     *,
     _runs_root_fn=_runs_root,
     _read_json_fn=_read_json,
-    _write_json_fn=_write_json,
+    _write_json_fn=_write_run_meta,
     _safe_int_fn=_safe_int,
     _pid_alive_fn=_pid_alive,
     _infer_run_exit_code_from_log_fn=_infer_run_exit_code_from_log,
@@ -296,7 +316,7 @@ def _start_run(payload: dict[str, Any]) -> dict[str, Any]:
         _reset_workflow_for_redownload_fn=_reset_workflow_for_redownload,
         _remove_reconcile_outputs_only_fn=_remove_reconcile_outputs_only,
         _runs_root_fn=_runs_root,
-        _write_json_fn=_write_json,
+        _write_json_fn=_write_run_meta,
         _subprocess=subprocess,
         _threading=threading,
         _os=os,
@@ -15,7 +15,7 @@ from .core_shared import (
     _normalize_audit_actor,
     _safe_int_optional,
     _tail_text as _tail_text_common,
-    _write_json,
+    _write_run_meta,
 )
 
 _AUTH_REQUIRED_MARKERS = (
@@ -122,7 +122,7 @@ def _capture_failed_run_incident(
     inferred_from: str = "",
     _safe_int_fn=_safe_int,
     _subprocess_fn: Any = subprocess,
-    _write_json_fn=_write_json,
+    _write_json_fn=_write_run_meta,
     _append_audit_event_fn=_append_audit_event,
     _audit_log_path_fn=_audit_log_path,
     _skill_root: Path = SKILL_ROOT,
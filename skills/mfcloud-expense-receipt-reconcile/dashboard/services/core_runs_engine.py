@@ -17,10 +17,11 @@ from .core_shared import (
     _artifact_root,
     _latest_running_job as _latest_running_job_common,
     _list_run_jobs as _list_run_jobs_common,
+    _list_run_records,
     _read_json,
     _running_job_exists as _running_job_exists_common,
     _runs_root,
-    _write_json,
+    _write_run_meta,
     SKILL_ROOT,
 )
 from .core_runs_audit import _append_audit_event, _capture_failed_run_incident, _safe_int, _normalize_actor
@@ -98,7 +99,7 @@ def _run_worker(
     meta_path,
     *,
     _read_json_fn=_read_json,
-    _write_json_fn=_write_json,
+    _write_json_fn=_write_run_meta,
     _safe_int_fn=_safe_int,
     _append_audit_event_fn=_append_audit_event,
     _capture_failed_run_incident_fn=_capture_failed_run_incident,
@@ -142,24 +143,20 @@ def _reconcile_running_jobs(
     *,
     _runs_root_fn=_runs_root,
     _read_json_fn=_read_json,
-    _write_json_fn=_write_json,
+    _write_json_fn=_write_run_meta,
     _safe_int_fn=_safe_int,
     _pid_alive_fn=_pid_alive,
     _infer_run_exit_code_from_log_fn=_infer_run_exit_code_from_log,
     _record_download_result_fn=_record_download_result,
     _append_audit_event_fn=_append_audit_event,
     _capture_failed_run_incident_fn=_capture_failed_run_incident,
+    _list_run_records_fn=_list_run_records,
     _datetime_now=datetime.now,
 ) -> None:
     root = _runs_root_fn()
     if not root.exists():
         return
-    for p in root.glob("run_*.json"):
-        data = _read_json_fn(p)
-        if not isinstance(data, dict):
-            continue
-        if data.get("status") != "running":
-            continue
+    for p, data in _list_run_records_fn(runs_root_fn=root, read_json_fn=_read_json_fn, status="running"):
         if _pid_alive_fn(data.get("pid")):
             continue
         latest = _read_json_fn(p)
@@ -221,6 +218,7 @@ def _reconcile_running_jobs(
 
 def _scan_run_jobs(
     *,
+    status: str | None = None,
     _reconcile_running_jobs_fn=None,
     _runs_root_fn=_runs_root,
     _read_json_fn=_read_json,
@@ -230,6 +228,7 @@ def _scan_run_jobs(
     return _list_run_jobs_common(
         runs_root_fn=_runs_root_fn(),
         read_json_fn=_read_json_fn,
+        status=status,
     )
 
 
@@ -251,7 +250,7 @@ def _cancel_step_runs(
     _scan_run_jobs_fn=_scan_run_jobs,
     _safe_int_fn=_safe_int,
     _terminate_pid_fn=_terminate_pid,
-    _write_json_fn=_write_json,
+    _write_json_fn=_write_run_meta,
     _append_audit_event_fn=_append_audit_event,
     _runs_root_fn=_runs_root,
     _datetime_now=datetime.now,
@@ -303,7 +302,7 @@ def _start_run(
     _reset_workflow_for_redownload_fn=_reset_workflow_for_redownload,
     _remove_reconcile_outputs_only_fn=_remove_reconcile_outputs_only,
     _runs_root_fn=_runs_root,
-    _write_json_fn=_write_json,
+    _write_json_fn=_write_run_meta,
     _subprocess=subprocess,
     _threading=threading,
     _os=os,
@@ -378,6 +377,7 @@ def _start_run(
     run_id = f"run_{ts}"
     log_path = runs_root / f"{run_id}.log"
     meta_path = runs_root / f"{run_id}.json"
+    timing_path = runs_root / f"{run_id}.timing.json"
 
     auth_handoff = bool(payload.get("auth_handoff", True))
     auto_receipt_name = bool(payload.get("auto_receipt_name", True))
@@ -390,6 +390,8 @@ def _start_run(
         str(year),
         "--month",
         str(month),
+        "--timing-json",
+        str(timing_path),
     ]
     if auth_handoff:
         cmd += ["--interactive", "--headed"]
@@ -453,6 +455,7 @@ def _start_run(
         "pid": process.pid,
         "actor": actor,
         "log_path": str(log_path),
+        "timing_path": str(timing_path),
         "cmd": cmd,
         "params": {
             "year": year,
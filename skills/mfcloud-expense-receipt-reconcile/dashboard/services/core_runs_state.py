@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import shutil
-import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -18,7 +17,15 @@ from .core_runs_paths import (
     _preflight_global_path,
     _running_mode_for_ym,
 )
-from .core_shared import SKILL_ROOT, _artifact_root, _read_json, _read_jsonl, _write_json
+from .core_shared import (
+    _archive_month_outputs,
+    _artifact_root,
+    _iter_audit_event_rows,
+    _read_json,
+    _read_jsonl,
+    _tail_text as _tail_text_common,
+    _write_json,
+)
 
 STEP_RESET_SPECS: dict[str, dict[str, Any]] = {
     "amazon_download": {
@@ -336,33 +343,21 @@ def _mf_csv_import_state_for_ym(reports_dir: Path) -> dict[str, Any]:
 def _latest_archive_state_for_ym(year: int, month: int) -> dict[str, Any]:
     latest_success: dict[str, Any] | None = None
     audit_path = _audit_log_path(year, month)
-    if audit_path.exists():
-        for line in audit_path.read_text(encoding="utf-8", errors="replace").splitlines():
-            text = str(line or "").strip()
-            if not text.startswith("{") or not text.endswith("}"):
-                continue
-            try:
-                payload = json.loads(text)
-            except Exception:
-                continue
-            if not isinstance(payload, dict):
-                continue
-            if str(payload.get("event_type") or "").strip() != "archive":
-                continue
-            action = str(payload.get("action") or "").strip()
-            if action not in {"manual_archive", "month_close"}:
-                continue
-            if str(payload.get("status") or "").strip() != "success":
-                continue
-            details = payload.get("details") if isinstance(payload.get("details"), dict) else {}
-            latest_success = {
-                "created": True,
-                "created_at": str(payload.get("ts") or "").strip() or None,
-                "archived_to": str(details.get("archived_to") or "").strip() or None,
-                "include_pdfs": bool(details.get("include_pdfs")),
-                "include_debug": bool(details.get("include_debug")),
-                "cleanup": bool(details.get("cleanup")),
-            }
+    for payload in _iter_audit_event_rows(audit_path, "archive"):
+        action = str(payload.get("action") or "").strip()
+        if action not in {"manual_archive", "month_close"}:
+            continue
+        if str(payload.get("status") or "").strip() != "success":
+            continue
+        details = payload.get("details") if isinstance(payload.get("details"), dict) else {}
+        latest_success = {
+            "created": True,
+            "created_at": str(payload.get("ts") or "").strip() or None,
+            "archived_to": str(details.get("archived_to") or "").strip() or None,
+            "include_pdfs": bool(details.get("include_pdfs")),
+            "include_debug": bool(details.get("include_debug")),
+            "cleanup": bool(details.get("cleanup")),
+        }
     if latest_success:
         return latest_success
 
@@ -559,18 +554,46 @@ def _record_download_result(year: int, month: int, mode: str, exit_code: int) ->
 
 
 def _tail_text(path: Path, max_bytes: int = 5000) -> str:
-    if not path.exists():
-        return ""
+    return _tail_text_common(path, max_bytes=max_bytes)
+
+
+def _read_log_from_offset(
+    path: Path,
+    offset: int,
+    *,
+    max_bytes: int = 64_000,
+    final: bool = False,
+) -> tuple[str, int]:
+    """Read complete log lines appended after `offset`; returns (text, next_offset).
+
+    A trailing partial line is held back until its newline arrives (or `final`
+    is set) so multi-byte characters are never split between reads. An offset
+    past the end of the file means the log was truncated; reading restarts at 0.
+    """
     try:
         size = path.stat().st_size
+    except OSError:
+        return "", max(0, offset)
+    start = max(0, offset)
+    if start > size:
+        start = 0
+    if start == size:
+        return "", start
+    try:
         with path.open("rb") as f:
-            if size > max_bytes:
-                f.seek(0, 2)
-                f.seek(-max_bytes, 1)
-            data = f.read()
-        return data.decode("utf-8", errors="replace")
-    except Exception:
-        return ""
+            f.seek(start)
+            data = f.read(max(1, max_bytes))
+    except OSError:
+        return "", start
+    if not final or start + len(data) < size:
+        cut = data.rfind(b"\n")
+        if cut < 0:
+            # A single line longer than max_bytes is emitted in pieces.
+            if len(data) < max_bytes:
+                return "", start
+            cut = len(data) - 1
+        data = data[: cut + 1]
+    return data.decode("utf-8", errors="replace"), start + len(data)
 
 
 def _infer_run_exit_code_from_log(log_path: Path) -> tuple[int | None, str | None]:
@@ -643,10 +666,8 @@ def _archive_outputs_for_ym(
     _collect_excluded_pdfs_fn=_collect_excluded_pdfs,
     _coerce_non_negative_int_fn=_coerce_non_negative_int,
     _write_json_fn=_write_json,
-    _subprocess_fn: Any = subprocess,
+    _archive_month_fn=_archive_month_outputs,
     _artifact_root_fn=_artifact_root,
-    _skill_root=SKILL_ROOT,
-    _read_json_fn=_read_json,
 ) -> dict[str, Any]:
     ym = f"{year:04d}-{month:02d}"
     output_root = _artifact_root_fn() / ym
@@ -679,109 +700,25 @@ def _archive_outputs_for_ym(
         },
     )
 
-    script = _skill_root / "scripts" / "archive_outputs.ps1"
-    if not script.exists():
-        raise HTTPException(status_code=500, detail=f"archive script not found: {script}")
-
-    cmd = [
-        "powershell",
-        "-NoProfile",
-        "-ExecutionPolicy",
-        "Bypass",
-        "-File",
-        str(script),
-        "-OutputRoot",
-        str(output_root),
-    ]
-    if include_pdfs:
-        cmd.append("-IncludePdfs")
-    if include_debug:
-        cmd.append("-IncludeDebug")
-    if cleanup:
-        cmd.append("-Cleanup")
-    else:
-        cmd.append("-NoCleanup")
-
-    res = _subprocess_fn.run(
-        cmd,
-        cwd=str(script.parent),
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if res.returncode != 0:
-        raise HTTPException(
-            status_code=500,
-            detail=(
-                "archive_outputs.ps1 failed:\n"
-                f"cmd: {cmd}\n"
-                f"exit: {res.returncode}\n"
-                f"stdout:\n{res.stdout}\n"
-                f"stderr:\n{res.stderr}\n"
-            ),
+    try:
+        result = _archive_month_fn(
+            output_root,
+            include_pdfs=include_pdfs,
+            include_debug=include_debug,
+            cleanup=cleanup,
         )
-
-    archived_to = ""
-    cleanup_report = ""
-    cleanup_removed = 0
-    archive_zip = ""
-    archive_manifest = ""
-    archive_checksums = ""
-    for line in reversed((res.stdout or "").splitlines()):
-        text = str(line).strip()
-        if text.lower().startswith("archived to:"):
-            archived_to = text.split(":", 1)[1].strip()
-            continue
-        if text.lower().startswith("cleanup report:"):
-            cleanup_report = text.split(":", 1)[1].strip()
-            continue
-        if text.lower().startswith("cleanup removed:"):
-            cleanup_removed = _coerce_non_negative_int_fn(text.split(":", 1)[1].strip(), default=0)
-            continue
-        if text.lower().startswith("archive zip:"):
-            archive_zip = text.split(":", 1)[1].strip()
-            continue
-        if text.lower().startswith("archive manifest:"):
-            archive_manifest = text.split(":", 1)[1].strip()
-            continue
-        if text.lower().startswith("archive checksums:"):
-            archive_checksums = text.split(":", 1)[1].strip()
-            continue
-
-    if not archived_to:
-        archive_root = output_root / "archive"
-        candidates = [p for p in archive_root.glob("*") if p.is_dir()] if archive_root.exists() else []
-        if candidates:
-            candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            archived_to = str(candidates[0])
-
-    if not archived_to:
+    except (OSError, ValueError) as exc:
         raise HTTPException(
             status_code=500,
-            detail=(
-                "archive_outputs.ps1 did not report archive destination.\n"
-                f"stdout:\n{res.stdout}\n"
-                f"stderr:\n{res.stderr}\n"
-            ),
-        )
-
-    if cleanup and not cleanup_report:
-        fallback_cleanup = output_root / "reports" / "archive_cleanup_report.json"
-        if fallback_cleanup.exists():
-            cleanup_report = str(fallback_cleanup)
-
-    if not archive_manifest:
-        fallback_manifest = Path(archived_to) / "manifest.json"
-        if fallback_manifest.exists():
-            archive_manifest = str(fallback_manifest)
-    if not archive_zip:
-        fallback_zip = Path(archived_to) / "full_snapshot.zip"
-        if fallback_zip.exists():
-            archive_zip = str(fallback_zip)
-    if not archive_checksums:
-        fallback_checksums = Path(archived_to) / "checksums.sha256"
-        if fallback_checksums.exists():
-            archive_checksums = str(fallback_checksums)
+            detail=f"archive failed: {type(exc).__name__}: {exc}",
+        ) from exc
+
+    archived_to = str(result.get("archived_to") or "")
+    cleanup_report = str(result.get("cleanup_report") or "")
+    cleanup_removed = _coerce_non_negative_int_fn(result.get("cleanup_removed"), default=0)
+    archive_zip = str(result.get("archive_zip") or "")
+    archive_manifest = str(result.get("archive_manifest") or "")
+    archive_checksums = str(result.get("archive_checksums") or "")
 
     return {
         "status": "ok",
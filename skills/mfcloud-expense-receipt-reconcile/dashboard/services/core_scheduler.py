@@ -12,7 +12,7 @@ from typing import Any
 from fastapi import HTTPException
 
 from . import core_runs
-from .core_shared import _read_json, _write_json
+from .core_shared import _read_json, _read_state_collections, _write_state_collections
 
 SCHEDULER_ALLOWED_ACTION_KEYS = {
     "preflight",
@@ -67,6 +67,7 @@ _TIMER_STATE_COPY_KEYS = {
     "catch_up_policy",
     "recurrence",
 }
+_STATE_COLLECTIONS = ("scheduler_timers", "scheduler_once_receipts")
 _ONCE_RECEIPT_KEYS = {
     "template_id",
     "run_date",
@@ -77,6 +78,9 @@ _ONCE_RECEIPT_KEYS = {
 }
 
 _state_lock = threading.Lock()
+# Store rows as last read under _state_lock; a write deletes only what was
+# removed since, so rows another process wrote in between are kept.
+_state_base: dict[str, dict[str, dict[str, Any]]] = {}
 _worker_lock = threading.Lock()
 _worker_thread: threading.Thread | None = None
 _stop_event = threading.Event()
@@ -330,13 +334,9 @@ def _normalize_state(payload: Any) -> dict[str, Any]:
     return out
 
 
-def _read_state_unlocked() -> dict[str, Any]:
-    raw = _read_json(_state_path())
+def _state_collections_from_json(raw: Any) -> dict[str, dict[str, dict[str, Any]]]:
     if not isinstance(raw, dict):
-        return {
-            "template_timers": {_DEFAULT_TEMPLATE_ID: _default_state()},
-            "once_trigger_receipts": {},
-        }
+        return {"scheduler_timers": {}, "scheduler_once_receipts": {}}
 
     template_timers: dict[str, dict[str, Any]] = {}
     raw_timers = raw.get("template_timers")
@@ -354,12 +354,32 @@ def _read_state_unlocked() -> dict[str, Any]:
         template_timers[_DEFAULT_TEMPLATE_ID] = legacy_state
     elif _DEFAULT_TEMPLATE_ID not in template_timers and any(k in raw for k in _TIMER_STATE_KEYS):
         template_timers[_DEFAULT_TEMPLATE_ID] = legacy_state
+    return {
+        "scheduler_timers": template_timers,
+        "scheduler_once_receipts": _get_once_receipts(raw),
+    }
 
+
+def _read_state_unlocked() -> dict[str, Any]:
+    global _state_base
+    # scheduler_state.json is imported into the state store on first use.
+    collections = _read_state_collections(
+        _STATE_COLLECTIONS,
+        source=_state_path(),
+        load_source=_state_collections_from_json,
+    )
+    _state_base = collections
+    template_timers = {
+        template_id: _normalize_state(source_state)
+        for template_id, source_state in collections["scheduler_timers"].items()
+    }
     if not template_timers:
         template_timers[_DEFAULT_TEMPLATE_ID] = _default_state()
     return {
         "template_timers": template_timers,
-        "once_trigger_receipts": _get_once_receipts(raw),
+        "once_trigger_receipts": _get_once_receipts(
+            {"once_trigger_receipts": collections["scheduler_once_receipts"]}
+        ),
     }
 
 
@@ -377,14 +397,23 @@ def _write_state_unlocked(state: dict[str, Any]) -> None:
 
     if not timers:
         timers[_DEFAULT_TEMPLATE_ID] = _default_state()
-    default_state = timers.get(_DEFAULT_TEMPLATE_ID, _default_state())
+    once_receipts = _get_once_receipts(state)
+
+    # Only changed timer and receipt rows are written; scheduler_state.json is an opt-in snapshot.
+    _write_state_collections(
+        {"scheduler_timers": timers, "scheduler_once_receipts": once_receipts},
+        base=_state_base,
+        source=_state_path(),
+        snapshot=_state_snapshot,
+    )
 
-    path = _state_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = dict(default_state)
+
+def _state_snapshot(collections: dict[str, dict[str, dict[str, Any]]]) -> dict[str, Any]:
+    timers = collections.get("scheduler_timers") or {}
+    payload = dict(timers.get(_DEFAULT_TEMPLATE_ID) or _default_state())
     payload["template_timers"] = timers
-    payload["once_trigger_receipts"] = _get_once_receipts(state)
-    _write_json(path, payload)
+    payload["once_trigger_receipts"] = collections.get("scheduler_once_receipts") or {}
+    return payload
 
 
 def _normalize_template_id(template_id: Any) -> str:
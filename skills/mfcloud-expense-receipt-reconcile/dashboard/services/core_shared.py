@@ -13,20 +13,27 @@ if str(SKILL_ROOT) not in sys.path:
 
 from common import (  # noqa: E402
     append_audit_event_to_jsonl as _append_audit_event_to_jsonl,
+    archive_month_outputs as _archive_month_outputs,
     artifact_root as _artifact_root,
     ax_home as _ax_home,
     coerce_non_negative_int as _coerce_non_negative_int,
     dashboard_ui_locale as _dashboard_ui_locale,
     format_archive_snapshot_label as _format_archive_snapshot_label,
+    iter_audit_event_rows as _iter_audit_event_rows,
+    iter_audit_log_bytes as _iter_audit_log_bytes,
     latest_running_job as _latest_running_job,
+    list_audit_segments as _list_audit_segments,
     list_run_jobs as _list_run_jobs,
+    list_run_records as _list_run_records,
     normalize_audit_actor as _normalize_audit_actor,
     running_mode_for_ym as _running_mode_for_ym,
     running_job_exists as _running_job_exists,
     safe_int_optional as _safe_int_optional,
     scan_archive_history as _scan_archive_history,
     scan_archived_receipts as _scan_archived_receipts,
+    read_audit_log as _read_audit_log,
     read_json as _read_json,
+    read_state_collections as _read_state_collections,
     read_jsonl as _read_jsonl,
     read_workflow_templates_raw as _read_workflow_templates_raw,
     runs_root as _runs_root,
@@ -35,7 +42,10 @@ from common import (  # noqa: E402
     workflow_templates_path as _workflow_templates_path,
     write_workflow_templates_raw as _write_workflow_templates_raw,
     write_json as _write_json,
+    write_state_collections as _write_state_collections,
+    write_run_meta as _write_run_meta,
     tail_text as _tail_text,
+    update_state_collections as _update_state_collections,
     ym_default as _ym_default,
 )
 
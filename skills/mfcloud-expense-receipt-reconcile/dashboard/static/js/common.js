@@ -18,6 +18,7 @@
   const AI_CHAT_MAX_MESSAGES = 40;
   const AI_CHAT_STATUS_ENDPOINT = "/api/ai/chat/status";
   const AI_CHAT_ENDPOINT = "/api/ai/chat";
+  const AI_CHAT_STREAM_ENDPOINT = "/api/ai/chat/stream";
   const SIDEBAR_STATE_STORAGE_KEY = "dashboard-sidebar-state";
   const SIDEBAR_MODE_STORAGE_KEY = "dashboard-sidebar-mode";
   const SIDEBAR_WIDTH_STORAGE_KEY = "dashboard-sidebar-width";
@@ -1173,6 +1174,88 @@
     return context;
   }
 
+  function renderAiChatDraft(ui, text) {
+    if (!ui || !ui.log) return;
+    let body = ui.log.querySelector(".dashboard-ai-chat-item.is-streaming .dashboard-ai-chat-bubble-body");
+    if (!body) {
+      const item = document.createElement("div");
+      item.className = "dashboard-ai-chat-item is-assistant is-streaming";
+      const bubble = document.createElement("div");
+      bubble.className = "dashboard-ai-chat-bubble is-assistant";
+      body = document.createElement("div");
+      body.className = "dashboard-ai-chat-bubble-body";
+      bubble.appendChild(body);
+      item.appendChild(bubble);
+      ui.log.appendChild(item);
+    }
+    body.textContent = formatAssistantDisplayText(text);
+    ui.log.scrollTop = ui.log.scrollHeight;
+  }
+
+  async function readAiChatStream(res, onDelta) {
+    // POST bodies rule out EventSource, so parse the SSE frames off the fetch stream.
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (value) buffer += decoder.decode(value, { stream: !done });
+      let boundary = buffer.indexOf("\n\n");
+      while (boundary >= 0) {
+        const frame = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf("\n\n");
+        let event = "message";
+        const dataLines = [];
+        frame.split("\n").forEach((line) => {
+          if (line.startsWith("event:")) event = line.slice(6).trim();
+          else if (line.startsWith("data:")) dataLines.push(line.slice(5).trim());
+        });
+        const data = dataLines.length ? JSON.parse(dataLines.join("\n")) : {};
+        if (event === "delta") onDelta(String(data?.text || ""));
+        else if (event === "done") return data;
+        else if (event === "error") throw new Error(String(data?.detail || "AI stream failed."));
+      }
+      if (done) break;
+    }
+    throw new Error("AI stream ended unexpectedly.");
+  }
+
+  async function requestAiChatReply(ui, body, signal) {
+    const canStream = typeof window.TextDecoder === "function" && typeof window.ReadableStream === "function";
+    if (canStream) {
+      const res = await fetch(AI_CHAT_STREAM_ENDPOINT, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body,
+        signal,
+      });
+      // Older dashboards without the stream route fall through to the JSON endpoint.
+      if (res.status !== 404 && res.status !== 405) {
+        if (!res.ok || !res.body) {
+          const payload = await res.json().catch(() => ({}));
+          throw new Error(String(payload?.detail || `status=${res.status}`));
+        }
+        let draft = "";
+        return readAiChatStream(res, (text) => {
+          draft += text;
+          renderAiChatDraft(ui, draft);
+        });
+      }
+    }
+    const res = await fetch(AI_CHAT_ENDPOINT, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body,
+      signal,
+    });
+    const payload = await res.json().catch(() => ({}));
+    if (!res.ok) {
+      throw new Error(String(payload?.detail || `status=${res.status}`));
+    }
+    return payload;
+  }
+
   async function sendAiChat(ui, externalText = null) {
     if (!ui || ui.pending) return false;
     const hasExternalText = typeof externalText === "string";
@@ -1193,19 +1276,14 @@
     const controller = new AbortController();
     const timeout = setTimeout(() => controller.abort(), 25000);
     try {
-      const res = await fetch(AI_CHAT_ENDPOINT, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
+      const payload = await requestAiChatReply(
+        ui,
+        JSON.stringify({
           messages: ui.messages,
           page_context: collectAiChatPageContext(),
         }),
-        signal: controller.signal,
-      });
-      const payload = await res.json().catch(() => ({}));
-      if (!res.ok) {
-        throw new Error(String(payload?.detail || `status=${res.status}`));
-      }
+        controller.signal,
+      );
       const reply = sanitizeAiChatMessage(payload?.reply || {});
       if (!reply || reply.role !== "assistant") {
         throw new Error("AI response is invalid.");
@@ -1216,6 +1294,7 @@
       setAiChatStatus(ui, `接続中: ${String(payload?.model || "gemini")}`, "success");
       return true;
     } catch (error) {
+      renderAiChatMessages(ui);
       setAiChatStatus(ui, "送信に失敗しました。", "error");
       showToast(toFriendlyMessage(error), "error");
       return false;
@@ -40,6 +40,8 @@
 
   const planJsonEl = document.getElementById("errors-plan-json");
   const runResultJsonEl = document.getElementById("errors-run-result-json");
+  const runProgressEl = document.getElementById("errors-run-progress");
+  const RUN_PROGRESS_POLL_MS = 2000;
 
   const KIL_REVIEW_STATUS_LIMIT = 200;
   const DOCUMENT_TARGET_LIMIT = 500;
@@ -268,9 +270,62 @@
     if (!visible) {
       if (planJsonEl) planJsonEl.textContent = "{}";
       if (runResultJsonEl) runResultJsonEl.textContent = "{}";
+      if (runProgressEl) runProgressEl.textContent = "-";
     }
   }
 
+  function formatRunProgress(progress) {
+    if (!progress || typeof progress !== "object" || !progress.command) return "-";
+    const state = String(progress.state || "-");
+    const lines = [
+      `状態: ${state}${progress.final_status ? ` (${String(progress.final_status)})` : ""}`,
+      `ループ: ${toInt(progress.iteration, 0)} / コマンド: ${toInt(progress.command_index, 0)}/${toInt(progress.command_total, 0)}`,
+      `コマンド: ${String(progress.command)}`,
+      `経過: ${Number(progress.elapsed_seconds || 0).toFixed(1)}秒 / 出力: ${toInt(progress.output_bytes, 0)} bytes`,
+    ];
+    if (progress.returncode !== null && progress.returncode !== undefined) {
+      lines.push(`終了コード: ${String(progress.returncode)}`);
+    }
+    if (progress.log_path) lines.push(`ログ: ${String(progress.log_path)}`);
+    const activeCommands = Array.isArray(progress.active_commands) ? progress.active_commands : [];
+    if (activeCommands.length > 1) {
+      lines.push(`並列実行中: ${activeCommands.length}件`);
+      activeCommands.forEach((item) => {
+        lines.push(`  #${toInt(item?.command_index, 0)} ${String(item?.command || "")}`);
+      });
+    }
+    const stdoutTail = String(progress.stdout_tail || "");
+    const stderrTail = String(progress.stderr_tail || "");
+    if (stdoutTail) lines.push("", "[stdout]", stdoutTail);
+    if (stderrTail) lines.push("", "[stderr]", stderrTail);
+    return lines.join("\n");
+  }
+
+  function renderRunProgress(progress) {
+    if (runProgressEl) runProgressEl.textContent = formatRunProgress(progress);
+  }
+
+  function startRunProgressPolling(incidentId) {
+    const id = String(incidentId || "").trim();
+    if (!id) return () => {};
+    let stopped = false;
+    let timer = null;
+    const poll = async () => {
+      try {
+        const payload = await apiGetJson(`/api/errors/incidents/${encodeURIComponent(id)}/progress`);
+        if (!stopped && id === selectedIncidentId) renderRunProgress(payload.progress);
+      } catch {
+        // The loop request itself reports failures; progress is best effort.
+      }
+      if (!stopped) timer = window.setTimeout(poll, RUN_PROGRESS_POLL_MS);
+    };
+    timer = window.setTimeout(poll, RUN_PROGRESS_POLL_MS);
+    return () => {
+      stopped = true;
+      if (timer) window.clearTimeout(timer);
+    };
+  }
+
   function renderList() {
     if (!listEl) return;
     listEl.innerHTML = "";
@@ -333,6 +388,7 @@
 
     if (planJsonEl) planJsonEl.textContent = pretty(selectedDetail.plan || {});
     if (runResultJsonEl) runResultJsonEl.textContent = pretty(selectedDetail.run_result || {});
+    renderRunProgress(selectedDetail.run_progress);
   }
 
   async function refreshIncidents(options = {}) {
@@ -882,7 +938,13 @@
           archive_on_success: true,
           archive_on_escalate: true,
         };
-        const data = await apiPostJson(`/api/errors/incidents/${encodeURIComponent(selectedIncidentId)}/go`, payload);
+        const stopProgressPolling = startRunProgressPolling(selectedIncidentId);
+        let data;
+        try {
+          data = await apiPostJson(`/api/errors/incidents/${encodeURIComponent(selectedIncidentId)}/go`, payload);
+        } finally {
+          stopProgressPolling();
+        }
         await refreshIncidents({ keepSelection: true });
         const message = `実行完了: ${String(data.final_status || "不明")}`;
         setStatus(message, "success");
@@ -32,20 +32,87 @@
     return false;
   }
 
-  function startLogPolling(runId) {
-    activeLogRunId = String(runId || "").trim();
+  const LOG_STREAM_MAX_CHARS = 20000;
+  const LOG_STREAM_MAX_ERRORS = 3;
+  let activeLogStream = null;
+
+  function closeLogStream() {
+    if (activeLogStream) activeLogStream.close();
+    activeLogStream = null;
+  }
+
+  function startLogInterval() {
     clearInterval(window.__logTimer);
-    if (!activeLogRunId) return;
     window.__logTimer = setInterval(() => {
       if (!activeLogRunId) return;
       refreshLog(activeLogRunId);
     }, 2000);
   }
 
+  function appendLogText(text) {
+    if (!logEl || !text) return;
+    const next = `${logEl.textContent || ""}${text}`;
+    logEl.textContent = next.length > LOG_STREAM_MAX_CHARS ? next.slice(next.length - LOG_STREAM_MAX_CHARS) : next;
+  }
+
+  function startLogStream(runId) {
+    if (typeof window.EventSource !== "function") return false;
+    const source = new EventSource(`/api/runs/${encodeURIComponent(runId)}/stream`);
+    let errorCount = 0;
+    let received = false;
+    activeLogStream = source;
+    if (logEl) logEl.textContent = "";
+
+    source.addEventListener("log", (event) => {
+      if (activeLogStream !== source) return;
+      errorCount = 0;
+      const data = JSON.parse(event.data || "{}");
+      appendLogText(String(data.text || ""));
+    });
+    source.addEventListener("status", (event) => {
+      if (activeLogStream !== source) return;
+      errorCount = 0;
+      received = true;
+      const data = JSON.parse(event.data || "{}");
+      applyRunStatus(runId, data.run, { final: false });
+    });
+    source.addEventListener("end", () => {
+      if (activeLogStream !== source) return;
+      closeLogStream();
+      fetchStatus(runId).then((data) => {
+        if (data) applyRunStatus(runId, data.run, { final: true });
+      });
+    });
+    source.onerror = () => {
+      if (activeLogStream !== source) return;
+      errorCount += 1;
+      // EventSource reconnects on its own and resumes via Last-Event-ID; fall back to
+      // polling when the stream was never usable or keeps failing.
+      if (source.readyState === EventSource.CLOSED || !received || errorCount >= LOG_STREAM_MAX_ERRORS) {
+        closeLogStream();
+        if (activeLogRunId === runId) {
+          refreshLog(runId);
+          startLogInterval();
+        }
+      }
+    };
+    return true;
+  }
+
+  function startLogPolling(runId) {
+    activeLogRunId = String(runId || "").trim();
+    clearInterval(window.__logTimer);
+    closeLogStream();
+    if (!activeLogRunId) return;
+    if (startLogStream(activeLogRunId)) return;
+    startLogInterval();
+  }
+
   function stopLogPolling(runId) {
     const target = String(runId || "").trim();
     if (target && activeLogRunId && target !== activeLogRunId) return;
     clearInterval(window.__logTimer);
+    closeLogStream();
     activeLogRunId = "";
   }
 
@@ -111,11 +178,14 @@
     if (activeLogRunId && String(runId) !== activeLogRunId) return;
     const data = await fetchStatus(runId);
     if (!data) return;
-    updateRunSummary(data.run);
-
     if (logEl) logEl.textContent = data.log_tail || "";
+    applyRunStatus(runId, data.run, { final: true });
+  }
+
+  function applyRunStatus(runId, run, options = {}) {
+    updateRunSummary(run);
 
-    const status = String(data.run?.status || "");
+    const status = String(run?.status || "");
     const previousStatus = runStatusById[runId];
     if (status && previousStatus && previousStatus !== status) {
       if (status === "failed") {
@@ -132,12 +202,13 @@
       showError("(msg)");
     }
 
-    if (status && status !== "running") {
+    // While streaming, completion is handled once the `end` event has drained the log.
+    if (status && status !== "running" && options.final !== false) {
       const shouldAutoReload = awaitingRunFinalization && status === "success" && !autoReloadScheduled;
       awaitingRunFinalization = false;
       stopLogPolling(runId);
       scheduleStepSync();
-      const finishedMode = String(data.run?.params?.mode || "");
+      const finishedMode = String(run?.params?.mode || "");
       syncAfterRunCompletion(finishedMode)
         .catch(() => {})
         .finally(() => {
@@ -605,4 +605,131 @@
       });
     }
   }
+
+  const reconcileRowsSection = document.querySelector("[data-reconcile-rows]");
+  const reconcileRowsBody = document.getElementById("reconcile-rows-body");
+  const reconcileRowsMore = document.getElementById("reconcile-rows-more");
+  const reconcileRowsSummary = document.getElementById("reconcile-rows-summary");
+  const reconcileRowsFilterIds = [
+    "reconcile-rows-status",
+    "reconcile-rows-vendor",
+    "reconcile-rows-amount-min",
+    "reconcile-rows-amount-max",
+    "reconcile-rows-date-from",
+    "reconcile-rows-date-to",
+    "reconcile-rows-sort",
+  ];
+  let reconcileRowsCursor = String(reconcileRowsSection?.dataset.nextCursor || "").trim();
+  let reconcileRowsLoaded = reconcileRowsBody ? reconcileRowsBody.querySelectorAll("tr:not([data-reconcile-rows-empty])").length : 0;
+  let reconcileRowsRequest = 0;
+  let reconcileRowsFilterTimer = null;
+
+  function reconcileRowsValue(id) {
+    const el = document.getElementById(id);
+    return el ? String(el.value || "").trim() : "";
+  }
+
+  function reconcileRowsQuery(cursor) {
+    const params = new URLSearchParams();
+    const [sort, order] = (reconcileRowsValue("reconcile-rows-sort") || "position:asc").split(":");
+    params.set("sort", sort || "position");
+    params.set("order", order || "asc");
+    const pairs = [
+      ["status", "reconcile-rows-status"],
+      ["vendor", "reconcile-rows-vendor"],
+      ["amount_min", "reconcile-rows-amount-min"],
+      ["amount_max", "reconcile-rows-amount-max"],
+      ["date_from", "reconcile-rows-date-from"],
+      ["date_to", "reconcile-rows-date-to"],
+    ];
+    pairs.forEach(([key, id]) => {
+      const value = reconcileRowsValue(id);
+      if (value) params.set(key, value);
+    });
+    if (cursor) params.set("cursor", cursor);
+    return params.toString();
+  }
+
+  function renderReconcileRow(row) {
+    const tr = document.createElement("tr");
+    const linked = row.order_id
+      ? `${sourceLabel(row.order_source) || row.order_source || ""} / ${row.order_date ?? ""} / ${row.total_yen ?? ""}`
+      : "未突合";
+    [row.mf_use_date || "-", row.mf_amount_label || "-", row.mf_summary || "", linked].forEach((text, index) => {
+      const td = document.createElement("td");
+      if (index === 2) td.className = "wide";
+      td.textContent = String(text);
+      tr.appendChild(td);
+    });
+    return tr;
+  }
+
+  function setReconcileRowsEmpty(message) {
+    if (!reconcileRowsBody) return;
+    reconcileRowsBody.innerHTML = "";
+    const tr = document.createElement("tr");
+    tr.dataset.reconcileRowsEmpty = "1";
+    const td = document.createElement("td");
+    td.colSpan = 4;
+    td.className = "muted";
+    td.textContent = message;
+    tr.appendChild(td);
+    reconcileRowsBody.appendChild(tr);
+  }
+
+  async function loadReconcileRows({ append }) {
+    if (!reconcileRowsSection || !reconcileRowsBody) return;
+    const ym = String(reconcileRowsSection.dataset.ym || "").trim();
+    if (!ym) return;
+    const requestId = ++reconcileRowsRequest;
+    const query = reconcileRowsQuery(append ? reconcileRowsCursor : "");
+    if (reconcileRowsMore) reconcileRowsMore.disabled = true;
+    const res = await fetch(`/api/reconcile-rows/${encodeURIComponent(ym)}?${query}`, { cache: "no-store" }).catch(() => null);
+    if (requestId !== reconcileRowsRequest) return;
+    if (reconcileRowsMore) reconcileRowsMore.disabled = false;
+    if (append && res && res.status === 409) {
+      // The report was regenerated while paging; the cursor no longer applies.
+      showToast("未添付候補が更新されたため、先頭から読み込み直しました。");
+      loadReconcileRows({ append: false });
+      return;
+    }
+    const data = res && res.ok ? await res.json().catch(() => null) : null;
+    if (!data) {
+      showToast("未添付候補の取得に失敗しました。", "error");
+      return;
+    }
+    const rows = Array.isArray(data.rows) ? data.rows : [];
+    if (!append) {
+      reconcileRowsBody.innerHTML = "";
+      reconcileRowsLoaded = 0;
+    }
+    rows.forEach((row) => reconcileRowsBody.appendChild(renderReconcileRow(row && typeof row === "object" ? row : {})));
+    reconcileRowsLoaded += rows.length;
+    if (!reconcileRowsLoaded) {
+      setReconcileRowsEmpty(Number(data.total || 0) ? "条件に一致する候補がありません。" : "未添付候補がありません。");
+    }
+    reconcileRowsCursor = String(data.next_cursor || "");
+    if (reconcileRowsMore) reconcileRowsMore.hidden = !reconcileRowsCursor;
+    if (reconcileRowsSummary) {
+      const matched = Number(data.matched || 0);
+      const total = Number(data.total || 0);
+      const scope = matched === total ? `全 ${total} 件` : `該当 ${matched} 件 / 全 ${total} 件`;
+      reconcileRowsSummary.textContent = `${reconcileRowsLoaded} / ${scope}。CSV/JSONに全文があります。`;
+    }
+  }
+
+  if (reconcileRowsSection) {
+    if (reconcileRowsMore) {
+      reconcileRowsMore.addEventListener("click", () => loadReconcileRows({ append: true }));
+    }
+    reconcileRowsFilterIds.forEach((id) => {
+      const el = document.getElementById(id);
+      if (!el) return;
+      const eventName = el.tagName === "SELECT" || el.type === "date" ? "change" : "input";
+      el.addEventListener(eventName, () => {
+        clearTimeout(reconcileRowsFilterTimer);
+        reconcileRowsFilterTimer = setTimeout(() => loadReconcileRows({ append: false }), 250);
+      });
+    });
+  }
 })();
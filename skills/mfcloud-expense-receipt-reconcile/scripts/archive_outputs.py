@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SKILL_ROOT = SCRIPT_DIR.parent
+if str(SKILL_ROOT) not in sys.path:
+    sys.path.insert(0, str(SKILL_ROOT))
+
+from common import archive_month_outputs as _archive_month_outputs  # noqa: E402
+from common import artifact_root as _artifact_root  # noqa: E402
+from common import ym_to_dirname as _ym_to_dirname  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Archive a month's outputs into archive/<timestamp> and clean up inboxes")
+    ap.add_argument("--year", type=int)
+    ap.add_argument("--month", type=int)
+    ap.add_argument("--output-root", help="Path to artifacts root for target month")
+    ap.add_argument("--include-pdfs", action="store_true", help="Recorded in manifest options.")
+    ap.add_argument("--include-debug", action="store_true", help="Recorded in manifest options.")
+    ap.add_argument("--no-cleanup", action="store_true", help="Keep inbox and debug folders after archiving.")
+    args = ap.parse_args(argv)
+
+    if args.output_root:
+        output_root = Path(args.output_root).expanduser()
+    elif args.year and args.month:
+        if args.month < 1 or args.month > 12:
+            raise ValueError("month must be between 1 and 12.")
+        output_root = _artifact_root() / _ym_to_dirname(int(args.year), int(args.month))
+    else:
+        ap.error("--year and --month are required when --output-root is not specified.")
+
+    result = _archive_month_outputs(
+        output_root,
+        include_pdfs=bool(args.include_pdfs),
+        include_debug=bool(args.include_debug),
+        cleanup=not args.no_cleanup,
+    )
+    print(f"Archived to: {result['archived_to']}")
+    print(f"Archive zip: {result['archive_zip']}")
+    print(f"Archive manifest: {result['archive_manifest']}")
+    print(f"Archive checksums: {result['archive_checksums']}")
+    print(f"Cleanup report: {result['cleanup_report']}")
+    print(f"Cleanup removed: {result['cleanup_removed']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Time reconcile, dashboard scans and dashboard endpoints on a synthetic AX_HOME."""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SKILL_ROOT = SCRIPT_DIR.parent
+DASHBOARD_DIR = SKILL_ROOT / "dashboard"
+SHARED_LIB_DIR = SKILL_ROOT.parent.parent / "scripts" / "lib"
+for _path in (SKILL_ROOT, SCRIPT_DIR, DASHBOARD_DIR, SHARED_LIB_DIR):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from common import SKILL_SLUG  # noqa: E402
+from reconcile import reconcile  # noqa: E402
+from reconcile_batch import load_month_inputs  # noqa: E402
+from synthetic_month import MonthSizes, add_size_arguments, generate_months, sizes_from_args  # noqa: E402
+
+BENCH_VERSION = 1
+
+
+def _time(fn: Callable[[], object], repeat: int) -> list[float]:
+    durations: list[float] = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def _summary(durations: list[float]) -> dict[str, Any]:
+    return {
+        "best_seconds": round(min(durations), 6),
+        "median_seconds": round(statistics.median(durations), 6),
+        "runs": len(durations),
+    }
+
+
+def _month_dirs(artifact_root: Path) -> list[Path]:
+    return sorted(p for p in artifact_root.iterdir() if p.is_dir() and len(p.name) == 7 and p.name[4] == "-")
+
+
+def _reconcile_case(root: Path) -> Callable[[], object]:
+    year, month = (int(part) for part in root.name.split("-"))
+
+    def run() -> object:
+        # Parse and match together, as run_core_pipeline does per month; sources
+        # a real month lacks (no Rakuten or manual orders, no exclusions) are skipped.
+        inputs = load_month_inputs(root, year, month, require_expenses=False)
+        return reconcile(
+            orders=inputs.orders,
+            mf_expenses=inputs.mf_expenses,
+            year=year,
+            month=month,
+            date_window_days=7,
+            max_candidates_per_mf=5,
+        )
+
+    return run
+
+
+def _service_cases(latest: Path) -> dict[str, Callable[[], object]]:
+    from common import list_run_jobs
+    from services import core
+
+    reports_dir = latest / "reports"
+    return {
+        "reconcile": _reconcile_case(latest),
+        "scan_artifacts": core._scan_artifacts,
+        "collect_orders": lambda: core._collect_orders(latest, latest.name, core._load_exclusions(reports_dir)),
+        "list_run_jobs": list_run_jobs,
+        "scan_archive_history": core._scan_archive_history,
+    }
+
+
+def _endpoint_cases(latest: Path) -> tuple[dict[str, Callable[[], object]], str | None]:
+    try:
+        from fastapi import FastAPI
+        from fastapi.templating import Jinja2Templates
+        from fastapi.testclient import TestClient
+    except ImportError as exc:
+        return {}, f"fastapi unavailable: {exc}"
+    from common import list_run_jobs
+    from routes.api import create_api_router
+    from routes.pages import create_pages_router
+
+    # Routers only: the full app would also start the scheduler and retry workers.
+    app = FastAPI()
+    app.include_router(create_pages_router(Jinja2Templates(directory=str(DASHBOARD_DIR / "templates"))))
+    app.include_router(create_api_router())
+    client = TestClient(app)
+    ym = latest.name
+    paths = {
+        "page_expense": "/expense",
+        "page_run": f"/runs/{ym}",
+        "api_steps": f"/api/steps/{ym}",
+        "api_reconcile_rows": f"/api/reconcile-rows/{ym}",
+        "api_exclusions": f"/api/exclusions/{ym}",
+    }
+    jobs = list_run_jobs()
+    if jobs:
+        paths["api_run"] = f"/api/runs/{jobs[0]['run_id']}"
+
+    def _get(path: str) -> Callable[[], object]:
+        def run() -> object:
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f"GET {path} returned {response.status_code}")
+            return response
+
+        return run
+
+    return {f"endpoint:{name}": _get(path) for name, path in paths.items()}, None
+
+
+def run_benchmarks(ax_home: Path, *, repeat: int = 5, dashboard: bool = True) -> dict[str, Any]:
+    """Time every case against the newest month under `ax_home` (AX_HOME is set for the process)."""
+    os.environ["AX_HOME"] = str(ax_home)
+    artifact_root = ax_home / "artifacts" / SKILL_SLUG
+    months = _month_dirs(artifact_root)
+    if not months:
+        raise FileNotFoundError(f"no YYYY-MM folders under {artifact_root}")
+    latest = months[-1]
+
+    cases = _service_cases(latest)
+    skipped: dict[str, str] = {}
+    if dashboard:
+        endpoint_cases, reason = _endpoint_cases(latest)
+        cases.update(endpoint_cases)
+        if reason:
+            skipped["endpoints"] = reason
+
+    results: dict[str, Any] = {}
+    for name, fn in cases.items():
+        fn()  # warm caches and imports; the first call is not a steady-state sample
+        results[name] = _summary(_time(fn, repeat))
+    return {"ym": latest.name, "months": len(months), "results": results, "skipped": skipped}
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = 0.25,
+    min_delta_seconds: float = 0.002,
+) -> list[dict[str, Any]]:
+    """
+    Cases whose best time grew by more than `tolerance` (fraction) and by at
+    least `min_delta_seconds` over the baseline; the absolute floor keeps
+    sub-millisecond jitter from reading as a regression.
+    """
+    regressions: list[dict[str, Any]] = []
+    before = baseline.get("results") if isinstance(baseline.get("results"), dict) else {}
+    for name, row in (current.get("results") or {}).items():
+        old = before.get(name)
+        if not isinstance(old, dict):
+            continue
+        old_best = float(old.get("best_seconds") or 0.0)
+        new_best = float(row.get("best_seconds") or 0.0)
+        if new_best - old_best >= min_delta_seconds and new_best > old_best * (1.0 + tolerance):
+            regressions.append(
+                {
+                    "case": name,
+                    "baseline_seconds": old_best,
+                    "current_seconds": new_best,
+                    "ratio": round(new_best / old_best, 3) if old_best else None,
+                }
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ax-home", help="existing AX_HOME to time (default: generate one in a temp dir)")
+    parser.add_argument("--months", type=int, default=3, help="months to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-dashboard", action="store_true", help="do not time the HTTP endpoints")
+    parser.add_argument("--out", help="write the results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown as a fraction")
+    parser.add_argument("--min-delta-seconds", type=float, default=0.002)
+    add_size_arguments(parser)
+    args = parser.parse_args(argv)
+
+    sizes: MonthSizes = sizes_from_args(args)
+    with tempfile.TemporaryDirectory(prefix="bench_skill_") as tmp:
+        if args.ax_home:
+            ax_home = Path(args.ax_home).expanduser()
+            dataset: dict[str, Any] = {"ax_home": str(ax_home), "generated": False}
+        else:
+            ax_home = Path(tmp)
+            summary = generate_months(
+                ax_home,
+                end=(2026, 1),
+                months=int(args.months),
+                sizes=sizes,
+                seed=int(args.seed),
+            )
+            dataset = {"generated": True, "seed": summary["seed"], "months": int(args.months), "sizes": summary["sizes"]}
+        bench = run_benchmarks(ax_home, repeat=int(args.repeat), dashboard=not args.skip_dashboard)
+
+    results: dict[str, Any] = {
+        "version": BENCH_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": int(args.repeat),
+        "dataset": dataset,
+        **bench,
+    }
+    exit_code = 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare_results(
+            results,
+            baseline,
+            tolerance=float(args.tolerance),
+            min_delta_seconds=float(args.min_delta_seconds),
+        )
+        results["comparison"] = {"baseline": str(args.compare), "tolerance": float(args.tolerance), "regressions": regressions}
+        exit_code = 1 if regressions else 0
+    if args.out:
+        out = Path(args.out).expanduser()
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
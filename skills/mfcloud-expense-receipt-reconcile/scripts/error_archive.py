@@ -16,6 +16,7 @@ from error_common import (
     read_json,
     read_text,
     redact_text,
+    refresh_incident_index,
     resolve_reports_root,
     write_json,
     write_status,
@@ -104,6 +105,7 @@ def main() -> int:
             "destination": str(destination_dir),
         },
     )
+    refresh_incident_index(reports_root, incident_id)
 
     print(
         json.dumps(
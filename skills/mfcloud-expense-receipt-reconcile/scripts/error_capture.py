@@ -16,12 +16,19 @@ if str(SKILL_ROOT) not in sys.path:
 
 from common import artifact_root, read_json as read_common_json, runs_root  # noqa: E402
 from error_common import (  # noqa: E402
+    MAX_CLUSTER_RUN_IDS,
     STATUS_VALUES,
+    append_occurrence,
     build_incident_id,
     ensure_error_dirs,
+    error_cluster_id,
+    find_open_cluster,
+    locked_cluster_index,
+    new_cluster_entry,
     normalize_incident_id,
     now_utc_iso,
     read_json,
+    record_cluster_occurrence,
     redact_json,
     redact_text,
     resolve_reports_root,
@@ -56,6 +63,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--max-audit-lines", type=int, default=200, help="Tail line count for audit capture")
     parser.add_argument("--root", default="", help="Reports root override")
     parser.add_argument("--force", action="store_true", help="Overwrite existing incident folder")
+    parser.add_argument(
+        "--no-cluster",
+        action="store_true",
+        help="Always create a new incident instead of attaching to an open one with the same error signature",
+    )
     return parser.parse_args()
 
 
@@ -121,12 +133,19 @@ def _error_signature(failure_class: str, step: str, message: str) -> str:
     return redact_text(joined)
 
 
-def main() -> int:
-    args = parse_args()
-    reports_root = resolve_reports_root(args.root)
-    dirs = ensure_error_dirs(reports_root)
-
-    incident_id = normalize_incident_id(args.incident_id) if args.incident_id else build_incident_id(args.run_id)
+def _capture_incident(
+    args: argparse.Namespace,
+    dirs: dict[str, Path],
+    incident_id: str,
+    *,
+    cluster_id: str,
+    message: str,
+    failure_class: str,
+    step: str,
+    now: str,
+    log_path: Path | None,
+    audit_path: Path | None,
+) -> dict[str, Any]:
     incident_dir = dirs["inbox"] / incident_id
     if incident_dir.exists() and not args.force:
         raise SystemExit(f"incident already exists: {incident_dir}")
@@ -136,27 +155,17 @@ def main() -> int:
     existing = read_json(incident_dir / "incident.json")
     existing = existing if isinstance(existing, dict) else {}
 
-    log_path = Path(args.log_path).expanduser() if str(args.log_path).strip() else _default_log_path(args.run_id)
-    audit_path = (
-        Path(args.audit_path).expanduser()
-        if str(args.audit_path).strip()
-        else _default_audit_path(args.year, args.month)
-    )
-
     log_tail = tail_text(log_path, max_bytes=args.max_log_bytes) if log_path else ""
     audit_tail = tail_lines(audit_path, max_lines=args.max_audit_lines) if audit_path else ""
 
-    message = str(args.message or "").strip() or "failure captured"
-    failure_class = str(args.failure_class or "").strip() or "unknown"
-    step = str(args.step or "").strip()
-    now = now_utc_iso()
+    run_id = str(args.run_id or "").strip()
     ym = _safe_ym(args.year, args.month)
 
     context_payload = _load_context(args.context_path, args.context_json)
     context_payload["capture"] = {
         "captured_at": now,
         "script": "error_capture.py",
-        "run_id": str(args.run_id or "").strip(),
+        "run_id": run_id,
         "year": args.year,
         "month": args.month,
         "step": step,
@@ -179,6 +188,11 @@ def main() -> int:
             "failure_class": failure_class,
             "message": redact_text(message),
             "error_signature": _error_signature(failure_class, step, message),
+            "cluster_id": cluster_id,
+            "occurrence_count": 1,
+            "first_seen_at": now,
+            "last_seen_at": now,
+            "run_ids": [run_id] if run_id else [],
             "evidence": {
                 "log_tail_file": "log_tail.txt",
                 "audit_tail_file": "audit_tail.jsonl",
@@ -198,18 +212,142 @@ def main() -> int:
     write_json(incident_dir / "context.json", context_payload)
     write_json(incident_dir / "incident.json", incident_payload)
 
-    result = {
+    return {
+        "status": "ok",
+        "incident_id": incident_id,
+        "incident_dir": str(incident_dir),
+        "reports_root": str(dirs["reports_root"]),
+        "created_at": incident_payload.get("created_at"),
+        "updated_at": incident_payload.get("updated_at"),
+        "cluster_id": cluster_id,
+        "occurrence_count": 1,
+        "deduplicated": False,
+    }
+
+
+def _attach_occurrence(
+    args: argparse.Namespace,
+    dirs: dict[str, Path],
+    cluster_id: str,
+    entry: dict[str, Any],
+    *,
+    message: str,
+    now: str,
+    log_path: Path | None,
+    audit_path: Path | None,
+) -> dict[str, Any]:
+    """Record a repeat failure on the cluster's open incident instead of opening a new one."""
+    incident_id = str(entry.get("incident_id") or "")
+    incident_dir = dirs["inbox"] / incident_id
+    run_id = str(args.run_id or "").strip()
+    record_cluster_occurrence(entry, seen_at=now)
+
+    incident_payload = read_json(incident_dir / "incident.json")
+    incident_payload = incident_payload if isinstance(incident_payload, dict) else {}
+    run_ids = [str(item) for item in incident_payload.get("run_ids") or [] if str(item or "").strip()]
+    if run_id and run_id not in run_ids:
+        run_ids = (run_ids + [run_id])[-MAX_CLUSTER_RUN_IDS:]
+    incident_payload.update(
+        {
+            "cluster_id": cluster_id,
+            "occurrence_count": entry["occurrence_count"],
+            "first_seen_at": entry["first_seen_at"],
+            "last_seen_at": entry["last_seen_at"],
+            "run_ids": run_ids,
+            "updated_at": now,
+        }
+    )
+    append_occurrence(
+        incident_dir,
+        {
+            "captured_at": now,
+            "run_id": run_id,
+            "message": redact_text(message),
+            "log_path": str(log_path) if log_path else "",
+            "audit_path": str(audit_path) if audit_path else "",
+        },
+    )
+    write_json(incident_dir / "incident.json", incident_payload)
+
+    return {
         "status": "ok",
         "incident_id": incident_id,
         "incident_dir": str(incident_dir),
         "reports_root": str(dirs["reports_root"]),
         "created_at": incident_payload.get("created_at"),
         "updated_at": incident_payload.get("updated_at"),
+        "cluster_id": cluster_id,
+        "occurrence_count": entry["occurrence_count"],
+        "deduplicated": True,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    reports_root = resolve_reports_root(args.root)
+    dirs = ensure_error_dirs(reports_root)
+
+    log_path = Path(args.log_path).expanduser() if str(args.log_path).strip() else _default_log_path(args.run_id)
+    audit_path = (
+        Path(args.audit_path).expanduser()
+        if str(args.audit_path).strip()
+        else _default_audit_path(args.year, args.month)
+    )
+
+    message = str(args.message or "").strip() or "failure captured"
+    failure_class = str(args.failure_class or "").strip() or "unknown"
+    step = str(args.step or "").strip()
+    now = now_utc_iso()
+    capture_kwargs: dict[str, Any] = {
+        "message": message,
+        "failure_class": failure_class,
+        "step": step,
+        "now": now,
+        "log_path": log_path,
+        "audit_path": audit_path,
     }
+
+    if args.incident_id or args.no_cluster:
+        # An explicit incident id names the folder to (re)capture, so only
+        # auto-named captures are folded into an open cluster.
+        incident_id = normalize_incident_id(args.incident_id) if args.incident_id else build_incident_id(args.run_id)
+        result = _capture_incident(args, dirs, incident_id, cluster_id="", **capture_kwargs)
+    else:
+        with locked_cluster_index(reports_root) as index:
+            match = find_open_cluster(
+                index,
+                inbox_dir=dirs["inbox"],
+                failure_class=failure_class,
+                step=step,
+                message=message,
+            )
+            if match is not None:
+                cluster_id, entry = match
+                result = _attach_occurrence(
+                    args,
+                    dirs,
+                    cluster_id,
+                    entry,
+                    message=message,
+                    now=now,
+                    log_path=log_path,
+                    audit_path=audit_path,
+                )
+            else:
+                cluster_id = error_cluster_id(failure_class, step, message)
+                incident_id = build_incident_id(args.run_id)
+                result = _capture_incident(args, dirs, incident_id, cluster_id=cluster_id, **capture_kwargs)
+                index["clusters"][cluster_id] = new_cluster_entry(
+                    incident_id=incident_id,
+                    failure_class=failure_class,
+                    step=step,
+                    message=message,
+                    seen_at=now,
+                )
+
     print(json.dumps(result, ensure_ascii=False, indent=2))
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
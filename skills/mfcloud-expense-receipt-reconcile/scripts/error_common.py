@@ -3,21 +3,37 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+import sys
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 SKILL_ROOT = SCRIPT_DIR.parent
 REPORTS_ROOT_DEFAULT = SKILL_ROOT / "reports"
+SHARED_LIB_DIR = SKILL_ROOT.parent.parent / "scripts" / "lib"
+if str(SHARED_LIB_DIR) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB_DIR))
+
+from skill_runtime_common import locked_path, write_json as _write_json_atomic  # noqa: E402
+from tail_reader_common import tail_bytes as _tail_bytes, tail_lines as _tail_lines  # noqa: E402
 
 INBOX_DIR_NAME = "error_inbox"
 ARCHIVE_DIR_NAME = "error_archive"
 PLANS_DIR_NAME = "error_plans"
 RUNS_DIR_NAME = "error_runs"
 HANDOFFS_DIR_NAME = "error_handoffs"
+CLUSTER_INDEX_FILE_NAME = "error_clusters.json"
+OCCURRENCES_FILE_NAME = "occurrences.jsonl"
+INCIDENT_INDEX_FILE_NAME = "error_incident_index.json"
+INCIDENT_INDEX_VERSION = 1
+INCIDENT_LOCATION_INBOX = "inbox"
+INCIDENT_LOCATIONS = (INCIDENT_LOCATION_INBOX, "resolved", "escalated")
 
 # Keep "planned" for backward compatibility with existing incidents.
 STATUS_VALUES = {
@@ -31,20 +47,58 @@ STATUS_VALUES = {
     "escalated",
 }
 ARCHIVE_RESULTS = {"resolved", "escalated"}
+# Upper bound on how far tail_lines() reads back when lines are very long.
+TAIL_LINES_MAX_BYTES = 4 * 1024 * 1024
 SAFE_INCIDENT_ID_RE = re.compile(r"^[A-Za-z0-9._-]+$")
 
-EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
-QUERY_SECRET_RE = re.compile(
-    r"([?&](?:token|api[_-]?key|access_token|refresh_token|session|sig|signature|key)=)[^&\s]+",
-    re.IGNORECASE,
+# Token-set similarity above which two messages of the same class and step
+# are treated as the same failure even after normalization differs.
+CLUSTER_SIMILARITY_THRESHOLD = 0.8
+MAX_CLUSTER_RUN_IDS = 50
+# Volatile fragments replaced before signatures are compared. Short numbers
+# are kept on purpose: return codes and HTTP statuses tell failures apart.
+_VOLATILE_MESSAGE_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE), "<uuid>"),
+    (
+        re.compile(r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"),
+        "<ts>",
+    ),
+    (re.compile(r"\b\d{4}[-/]\d{2}[-/]\d{2}\b"), "<date>"),
+    (re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?\b"), "<time>"),
+    (re.compile(r"\b(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{8,}\b", re.IGNORECASE), "<hex>"),
+    (re.compile(r"\d{4,}"), "<n>"),
 )
-BEARER_RE = re.compile(r"(?im)(authorization\s*:\s*bearer\s+)[A-Za-z0-9._~+/\-]+")
-COOKIE_RE = re.compile(r"(?im)(cookie\s*:\s*).+$")
-GENERIC_SECRET_RE = re.compile(
-    r"(?i)\b(api[_-]?key|access[_-]?token|refresh[_-]?token|session[_-]?id|password)\b"
+_SIGNATURE_TOKEN_RE = re.compile(r"[\w<>]+")
+
+_EMAIL_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
+_QUERY_SECRET_PATTERN = r"([?&](?:token|api[_-]?key|access_token|refresh_token|session|sig|signature|key)=)[^&\s]+"
+_BEARER_PATTERN = r"(authorization\s*:\s*bearer\s+)[A-Za-z0-9._~+/\-]+"
+_COOKIE_PATTERN = r"(cookie\s*:\s*).+$"
+_GENERIC_SECRET_PATTERN = (
+    r"\b(api[_-]?key|access[_-]?token|refresh[_-]?token|session[_-]?id|password)\b"
     r"(\s*[:=]\s*|\"\s*:\s*|'\s*:\s*)"
     r"([^\s\"'&,]+)"
 )
+EMAIL_RE = re.compile(_EMAIL_PATTERN)
+QUERY_SECRET_RE = re.compile(_QUERY_SECRET_PATTERN, re.IGNORECASE)
+BEARER_RE = re.compile(_BEARER_PATTERN, re.IGNORECASE | re.MULTILINE)
+COOKIE_RE = re.compile(_COOKIE_PATTERN, re.IGNORECASE | re.MULTILINE)
+GENERIC_SECRET_RE = re.compile(_GENERIC_SECRET_PATTERN, re.IGNORECASE)
+# Redaction rules in the order they have always been applied. Each rule lists
+# literals its pattern cannot match without: every group needs at least one
+# of its literals in the case-folded text. A rule whose literals are absent is
+# skipped, which cannot change the output: replacements only add the
+# bracketed "[REDACTED...]" markers, so a later rule never gains a literal it
+# lacked in the original text.
+_REDACTION_RULES: tuple[tuple[str, re.Pattern[str], str, tuple[tuple[str, ...], ...]], ...] = (
+    ("query", QUERY_SECRET_RE, r"\1[REDACTED]", (("?", "&"), ("=",), ("token", "key", "session", "sig"))),
+    ("bearer", BEARER_RE, r"\1[REDACTED]", ((":",), ("authorization",), ("bearer",))),
+    ("cookie", COOKIE_RE, r"\1[REDACTED]", ((":",), ("cookie",))),
+    ("generic", GENERIC_SECRET_RE, r"\1\2[REDACTED]", ((":", "="), ("key", "token", "session", "password"))),
+    ("email", EMAIL_RE, "[REDACTED_EMAIL]", (("@",), (".",))),
+)
+# Every rule needs "=", ":" or "@"; strings without them skip all work.
+_REDACTION_TRIGGER_CHARS = ("=", ":", "@")
 
 
 def now_utc_iso() -> str:
@@ -102,6 +156,8 @@ def ensure_error_dirs(reports_root: Path) -> dict[str, Path]:
 def write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if path.name == "incident.json":
+        _refresh_index_for_incident_dir(path.parent)
 
 
 def read_json(path: Path) -> Any:
@@ -124,13 +180,23 @@ def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="ignore")
 
 
+def _redaction_fold(value: str) -> str:
+    folded = value.casefold()
+    if folded.isascii():
+        return folded
+    # re.IGNORECASE also matches "ı" and "İ" (casefolds to "i" + U+0307)
+    # against "i"; fold them so the literal checks never miss a match.
+    return folded.replace("\u0307", "").replace("\u0131", "i")
+
+
 def redact_text(text: str) -> str:
     value = str(text or "")
-    value = QUERY_SECRET_RE.sub(r"\1[REDACTED]", value)
-    value = BEARER_RE.sub(r"\1[REDACTED]", value)
-    value = COOKIE_RE.sub(r"\1[REDACTED]", value)
-    value = GENERIC_SECRET_RE.sub(r"\1\2[REDACTED]", value)
-    value = EMAIL_RE.sub("[REDACTED_EMAIL]", value)
+    if not any(char in value for char in _REDACTION_TRIGGER_CHARS):
+        return value
+    folded = _redaction_fold(value)
+    for _name, pattern, replacement, required in _REDACTION_RULES:
+        if all(any(literal in folded for literal in group) for group in required):
+            value = pattern.sub(replacement, value)
     return value
 
 
@@ -147,20 +213,14 @@ def redact_json(value: Any) -> Any:
 def tail_text(path: Path, max_bytes: int = 16000) -> str:
     if not path.exists():
         return ""
-    raw = path.read_bytes()
-    limit = max(0, int(max_bytes))
-    if limit and len(raw) > limit:
-        raw = raw[-limit:]
+    raw = _tail_bytes(path, max_bytes=max_bytes)
     return redact_text(raw.decode("utf-8", errors="ignore"))
 
 
 def tail_lines(path: Path, max_lines: int = 200) -> str:
     if not path.exists():
         return ""
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    limit = max(0, int(max_lines))
-    if limit:
-        lines = lines[-limit:]
+    lines = _tail_lines(path, max_lines=max_lines, max_bytes=TAIL_LINES_MAX_BYTES, errors="ignore")
     out = "\n".join(lines)
     if out:
         out += "\n"
@@ -182,6 +242,7 @@ def write_status(incident_dir: Path, status: str) -> None:
     if normalized not in STATUS_VALUES:
         raise ValueError(f"Invalid status: {status!r}")
     write_text(incident_dir / "status.txt", normalized + "\n")
+    _refresh_index_for_incident_dir(incident_dir)
 
 
 def incident_updated_at_iso(incident_dir: Path) -> str:
@@ -194,42 +255,327 @@ def incident_updated_at_iso(incident_dir: Path) -> str:
     return datetime.fromtimestamp(latest, tz=timezone.utc).isoformat(timespec="seconds")
 
 
-def list_inbox_incidents(reports_root: Path) -> list[dict[str, Any]]:
-    dirs = ensure_error_dirs(reports_root)
-    rows: list[dict[str, Any]] = []
+def _positive_int(value: Any, default: int) -> int:
     try:
-        children = list(dirs["inbox"].iterdir())
+        parsed = int(value)
     except Exception:
-        return rows
-    for child in children:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _incident_location_dirs(reports_root: Path) -> dict[str, Path]:
+    archive_root = reports_root / ARCHIVE_DIR_NAME
+    return {
+        INCIDENT_LOCATION_INBOX: reports_root / INBOX_DIR_NAME,
+        "resolved": archive_root / "resolved",
+        "escalated": archive_root / "escalated",
+    }
+
+
+def _incident_dir_names(directory: Path) -> set[str]:
+    names: set[str] = set()
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return names
+    for entry in entries:
         try:
-            is_dir = child.is_dir()
-        except Exception:
-            continue
-        if not is_dir:
+            if entry.is_dir():
+                names.add(entry.name)
+        except OSError:
             continue
-        payload = read_json(child / "incident.json")
-        payload = payload if isinstance(payload, dict) else {}
-        planner = payload.get("planner") if isinstance(payload.get("planner"), dict) else {}
+    return names
+
+
+def _incident_source_stamp(incident_dir: Path) -> str:
+    # mtime and size of the files a row is built from; a mismatch means a writer
+    # bypassed write_status/write_json and the row must be re-read.
+    parts = []
+    for name in ("status.txt", "incident.json"):
         try:
-            updated_at = str(payload.get("updated_at") or "").strip() or incident_updated_at_iso(child)
-        except Exception:
-            updated_at = str(payload.get("updated_at") or "").strip()
-        row = {
-            "incident_id": child.name,
-            "status": read_status(child),
-            "plan_state": str(payload.get("plan_state") or "").strip(),
-            "step": str(payload.get("step") or "").strip(),
-            "failure_class": str(payload.get("failure_class") or "").strip(),
-            "run_id": str(payload.get("run_id") or "").strip(),
-            "ym": str(payload.get("ym") or "").strip(),
-            "message": str(payload.get("message") or "").strip(),
-            "execution_owner": str(payload.get("execution_owner") or "").strip(),
-            "approval_required": bool(payload.get("approval_required")),
-            "planner_mode": str(planner.get("mode") or "").strip(),
-            "updated_at": updated_at,
-            "path": str(child),
-        }
-        rows.append(row)
-    rows.sort(key=lambda row: str(row.get("updated_at") or ""), reverse=True)
-    return rows
+            st = (incident_dir / name).stat()
+        except OSError:
+            parts.append("-")
+            continue
+        parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+    return "|".join(parts)
+
+
+def _incident_index_row(incident_dir: Path) -> dict[str, Any]:
+    stamp = _incident_source_stamp(incident_dir)
+    payload = read_json(incident_dir / "incident.json")
+    payload = payload if isinstance(payload, dict) else {}
+    planner = payload.get("planner") if isinstance(payload.get("planner"), dict) else {}
+    try:
+        updated_at = str(payload.get("updated_at") or "").strip() or incident_updated_at_iso(incident_dir)
+    except Exception:
+        updated_at = str(payload.get("updated_at") or "").strip()
+    return {
+        "incident_id": incident_dir.name,
+        "status": read_status(incident_dir),
+        "plan_state": str(payload.get("plan_state") or "").strip(),
+        "step": str(payload.get("step") or "").strip(),
+        "failure_class": str(payload.get("failure_class") or "").strip(),
+        "run_id": str(payload.get("run_id") or "").strip(),
+        "ym": str(payload.get("ym") or "").strip(),
+        "message": str(payload.get("message") or "").strip(),
+        "execution_owner": str(payload.get("execution_owner") or "").strip(),
+        "approval_required": bool(payload.get("approval_required")),
+        "planner_mode": str(planner.get("mode") or "").strip(),
+        "occurrence_count": _positive_int(payload.get("occurrence_count"), 1),
+        "error_signature": str(payload.get("error_signature") or "").strip(),
+        "cluster_id": str(payload.get("cluster_id") or "").strip(),
+        "updated_at": updated_at,
+        "source_stamp": stamp,
+    }
+
+
+def incident_index_path(reports_root: Path) -> Path:
+    return reports_root / INCIDENT_INDEX_FILE_NAME
+
+
+def _valid_incident_index(payload: Any) -> bool:
+    return (
+        isinstance(payload, dict)
+        and payload.get("version") == INCIDENT_INDEX_VERSION
+        and isinstance(payload.get("locations"), dict)
+        and all(isinstance(payload["locations"].get(location), dict) for location in INCIDENT_LOCATIONS)
+    )
+
+
+def load_incident_index(reports_root: Path, *, rebuild: bool = False) -> dict[str, Any]:
+    """
+    Return {"version", "locations": {location: {incident_id: row}}}.
+
+    Writers keep rows current (see refresh_incident_index); each load lists
+    the inbox/archive directories and stats every incident's status.txt and
+    incident.json to detect drift from folders added, removed or moved by
+    hand and from writers that skipped this module, and re-reads just those
+    incidents. A missing or unreadable index, or `rebuild=True`, rescans
+    everything.
+    """
+    path = incident_index_path(reports_root)
+    location_dirs = _incident_location_dirs(reports_root)
+    on_disk = {location: _incident_dir_names(directory) for location, directory in location_dirs.items()}
+    index = None if rebuild else read_json(path)
+    if _valid_incident_index(index) and all(
+        set(index["locations"][location]) == on_disk[location]
+        and not _stale_incident_ids(index["locations"][location], location_dirs[location])
+        for location in INCIDENT_LOCATIONS
+    ):
+        return index
+
+    with locked_path(path):
+        index = None if rebuild else read_json(path)
+        if not _valid_incident_index(index):
+            index = {"version": INCIDENT_INDEX_VERSION, "locations": {location: {} for location in INCIDENT_LOCATIONS}}
+        for location, directory in location_dirs.items():
+            rows: dict[str, Any] = index["locations"][location]
+            names = _incident_dir_names(directory)
+            for incident_id in set(rows) - names:
+                rows.pop(incident_id, None)
+            for incident_id in (names - set(rows)) | _stale_incident_ids(rows, directory):
+                rows[incident_id] = _incident_index_row(directory / incident_id)
+        _write_json_atomic(path, index, compact=True, durable=False)
+    return index
+
+
+def _stale_incident_ids(rows: dict[str, Any], directory: Path) -> set[str]:
+    return {
+        incident_id
+        for incident_id, row in rows.items()
+        if not isinstance(row, dict) or row.get("source_stamp") != _incident_source_stamp(directory / incident_id)
+    }
+
+
+def refresh_incident_index(reports_root: Path, incident_id: str) -> None:
+    """Re-read one incident in every location; a no-op until the index has been built."""
+    path = incident_index_path(reports_root)
+    if not path.exists():
+        return
+    with locked_path(path):
+        index = read_json(path)
+        if not _valid_incident_index(index):
+            return
+        for location, directory in _incident_location_dirs(reports_root).items():
+            rows = index["locations"][location]
+            incident_dir = directory / incident_id
+            if incident_dir.is_dir():
+                rows[incident_id] = _incident_index_row(incident_dir)
+            else:
+                rows.pop(incident_id, None)
+        _write_json_atomic(path, index, compact=True, durable=False)
+
+
+def _refresh_index_for_incident_dir(incident_dir: Path) -> None:
+    parent = incident_dir.parent
+    if parent.name == INBOX_DIR_NAME:
+        reports_root = parent.parent
+    elif parent.parent.name == ARCHIVE_DIR_NAME and parent.name in ARCHIVE_RESULTS:
+        reports_root = parent.parent.parent
+    else:
+        return
+    refresh_incident_index(reports_root, incident_dir.name)
+
+
+def query_incidents(
+    reports_root: Path,
+    *,
+    location: str = INCIDENT_LOCATION_INBOX,
+    status: str | None = None,
+    ym: str | None = None,
+    step: str | None = None,
+    failure_class: str | None = None,
+    signature: str | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+) -> dict[str, Any]:
+    """
+    Filter one location of the incident index, newest first. `signature`
+    matches either the cluster id or the error signature text. Returns rows
+    (with their current `path`), `total` in the location and `matched`.
+    """
+    if location not in INCIDENT_LOCATIONS:
+        raise ValueError(f"Invalid location: {location!r}")
+    ensure_error_dirs(reports_root)
+    index = load_incident_index(reports_root)
+    directory = _incident_location_dirs(reports_root)[location]
+    rows = list(index["locations"][location].values())
+    wanted_status = str(status or "").strip().lower()
+    wanted_signature = str(signature or "").strip()
+    matched = [
+        row
+        for row in rows
+        if (not wanted_status or row.get("status") == wanted_status)
+        and (not ym or row.get("ym") == ym)
+        and (not step or row.get("step") == step)
+        and (not failure_class or row.get("failure_class") == failure_class)
+        and (
+            not wanted_signature
+            or row.get("cluster_id") == wanted_signature
+            or row.get("error_signature") == wanted_signature
+        )
+    ]
+    matched.sort(key=lambda row: str(row.get("updated_at") or ""), reverse=True)
+    start = max(0, int(offset))
+    page = matched[start : start + int(limit)] if limit is not None else matched[start:]
+    return {
+        "rows": [
+            {
+                **{key: value for key, value in row.items() if key != "source_stamp"},
+                "path": str(directory / str(row.get("incident_id") or "")),
+            }
+            for row in page
+        ],
+        "total": len(rows),
+        "matched": len(matched),
+        "counts": {name: len(index["locations"][name]) for name in INCIDENT_LOCATIONS},
+    }
+
+
+def list_inbox_incidents(reports_root: Path) -> list[dict[str, Any]]:
+    return query_incidents(reports_root)["rows"]
+
+
+def normalize_error_message(message: str) -> str:
+    value = redact_text(" ".join(str(message or "").split()))
+    for pattern, placeholder in _VOLATILE_MESSAGE_PATTERNS:
+        value = pattern.sub(placeholder, value)
+    return value.lower()[:240]
+
+
+def error_cluster_id(failure_class: str, step: str, message: str) -> str:
+    key = " | ".join([failure_class.strip().lower(), step.strip().lower(), normalize_error_message(message)])
+    return "cluster_" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def _signature_tokens(normalized_message: str) -> set[str]:
+    return set(_SIGNATURE_TOKEN_RE.findall(normalized_message))
+
+
+def _token_similarity(left: set[str], right: set[str]) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def cluster_index_path(reports_root: Path) -> Path:
+    return reports_root / CLUSTER_INDEX_FILE_NAME
+
+
+@contextmanager
+def locked_cluster_index(reports_root: Path) -> Iterator[dict[str, Any]]:
+    """
+    Yield the cluster index ({"clusters": {cluster_id: entry}}) under a
+    cross-process lock and write it back when the block exits cleanly.
+    """
+    path = cluster_index_path(reports_root)
+    with locked_path(path):
+        payload = read_json(path)
+        index = payload if isinstance(payload, dict) and isinstance(payload.get("clusters"), dict) else {"clusters": {}}
+        yield index
+        _write_json_atomic(path, index)
+
+
+def find_open_cluster(
+    index: dict[str, Any],
+    *,
+    inbox_dir: Path,
+    failure_class: str,
+    step: str,
+    message: str,
+) -> tuple[str, dict[str, Any]] | None:
+    """
+    Return (cluster_id, entry) of an open cluster for this failure: an exact
+    normalized-signature match first, else the most similar message with the
+    same failure class and step. Entries whose incident has left the inbox
+    (archived as resolved/escalated) are dropped, so a regression opens a new
+    cluster.
+    """
+    clusters: dict[str, Any] = index.setdefault("clusters", {})
+    for cluster_id in [key for key, entry in clusters.items() if not (inbox_dir / str(entry.get("incident_id") or "")).is_dir()]:
+        clusters.pop(cluster_id, None)
+
+    cluster_id = error_cluster_id(failure_class, step, message)
+    entry = clusters.get(cluster_id)
+    if isinstance(entry, dict):
+        return cluster_id, entry
+
+    tokens = _signature_tokens(normalize_error_message(message))
+    best: tuple[float, str, dict[str, Any]] | None = None
+    for candidate_id, candidate in clusters.items():
+        if not isinstance(candidate, dict):
+            continue
+        if candidate.get("failure_class") != failure_class.strip().lower() or candidate.get("step") != step.strip().lower():
+            continue
+        score = _token_similarity(tokens, _signature_tokens(str(candidate.get("normalized_message") or "")))
+        if score >= CLUSTER_SIMILARITY_THRESHOLD and (best is None or score > best[0]):
+            best = (score, candidate_id, candidate)
+    if best is None:
+        return None
+    return best[1], best[2]
+
+
+def new_cluster_entry(*, incident_id: str, failure_class: str, step: str, message: str, seen_at: str) -> dict[str, Any]:
+    return {
+        "incident_id": incident_id,
+        "failure_class": failure_class.strip().lower(),
+        "step": step.strip().lower(),
+        "normalized_message": normalize_error_message(message),
+        "occurrence_count": 1,
+        "first_seen_at": seen_at,
+        "last_seen_at": seen_at,
+    }
+
+
+def record_cluster_occurrence(entry: dict[str, Any], *, seen_at: str) -> dict[str, Any]:
+    entry["occurrence_count"] = int(entry.get("occurrence_count") or 1) + 1
+    entry["first_seen_at"] = str(entry.get("first_seen_at") or seen_at)
+    entry["last_seen_at"] = seen_at
+    return entry
+
+
+def append_occurrence(incident_dir: Path, occurrence: dict[str, Any]) -> None:
+    path = incident_dir / OCCURRENCES_FILE_NAME
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(occurrence, ensure_ascii=False) + "\n")
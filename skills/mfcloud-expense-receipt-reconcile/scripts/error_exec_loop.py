@@ -7,11 +7,13 @@ import argparse
 import json
 import subprocess
 import sys
+import threading
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from error_common import (
     ensure_error_dirs,
@@ -23,12 +25,25 @@ from error_common import (
     write_status,
 )
 
+# error_common puts the shared scripts/lib directory on sys.path.
+from command_runner_common import (  # noqa: E402
+    CANCELLED_RETURNCODE,
+    DEFAULT_MAX_OUTPUT_BYTES,
+    run_streaming_command,
+)
+from skill_runtime_common import write_json as _write_json_atomic  # noqa: E402
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 SKILL_ROOT = SCRIPT_DIR.parent
 DEFAULT_COMMIT_MESSAGE_TEMPLATE = "chore(error): resolve {incident_id} by pdca loop"
 ALLOWED_COMMIT_SCOPES = {"incident", "plan", "run"}
 DEFAULT_COMMIT_SCOPE = "incident"
 
+COMMAND_TAIL_CHARS = 4000
+PROGRESS_FILE_NAME = "progress.json"
+PROGRESS_TAIL_CHARS = 2000
+PROGRESS_INTERVAL_SECONDS = 1.0
+
 DISALLOWED_SNIPPETS = (
     "git reset --hard",
     "git checkout --",
@@ -89,6 +104,29 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--commit-remote", default="origin", help="Git remote for push")
     parser.add_argument("--commit-branch", default="", help="Git branch for push")
     parser.add_argument("--commit-scope", default=DEFAULT_COMMIT_SCOPE, help="incident|plan|run")
+    parser.add_argument(
+        "--command-timeout-seconds",
+        type=int,
+        default=900,
+        help="Wall-clock limit per verification command (process tree is killed)",
+    )
+    parser.add_argument(
+        "--max-output-mb",
+        type=int,
+        default=DEFAULT_MAX_OUTPUT_BYTES // (1024 * 1024),
+        help="Combined stdout/stderr limit per verification command",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=4,
+        help="Worker count for verification groups marked parallel",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop verification at the first failing command (plan groups may override)",
+    )
     parser.add_argument("--archive-on-success", action="store_true", help="Archive as resolved when checks pass")
     parser.add_argument("--archive-on-escalate", action="store_true", help="Archive as escalated on limit hit")
     return parser.parse_args(argv)
@@ -124,7 +162,45 @@ def _safe_str(value: object, *, default: str = "") -> str:
     return text if text else default
 
 
-def _run_command(cmd: str, timeout_seconds: int = 900) -> dict[str, Any]:
+def _stream_command(
+    cmd: str | list[str],
+    command_text: str,
+    *,
+    shell: bool,
+    cwd: Path | None,
+    timeout_seconds: int,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    log_path: Path | None = None,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+    cancel_event: threading.Event | None = None,
+) -> dict[str, Any]:
+    try:
+        result = run_streaming_command(
+            cmd,
+            cwd=cwd or SKILL_ROOT,
+            shell=shell,
+            timeout_seconds=max(1, int(timeout_seconds)),
+            max_output_bytes=max_output_bytes,
+            tail_chars=COMMAND_TAIL_CHARS,
+            log_path=log_path,
+            on_progress=on_progress,
+            progress_interval_seconds=PROGRESS_INTERVAL_SECONDS,
+            cancel_event=cancel_event,
+        )
+    except Exception as exc:
+        return {"command": command_text, "returncode": 1, "stdout": "", "stderr": f"exception: {exc}"}
+    return {"command": command_text, **result}
+
+
+def _run_command(
+    cmd: str,
+    timeout_seconds: int = 900,
+    *,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    log_path: Path | None = None,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+    cancel_event: threading.Event | None = None,
+) -> dict[str, Any]:
     command_text = str(cmd or "").strip()
     if not command_text:
         return {"command": command_text, "returncode": 1, "stdout": "", "stderr": "empty command"}
@@ -137,61 +213,30 @@ def _run_command(cmd: str, timeout_seconds: int = 900) -> dict[str, Any]:
                 "stdout": "",
                 "stderr": f"blocked command pattern: {bad}",
             }
-    try:
-        result = subprocess.run(
-            command_text,
-            cwd=str(SKILL_ROOT),
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=max(1, int(timeout_seconds)),
-            check=False,
-        )
-        return {
-            "command": command_text,
-            "returncode": int(result.returncode),
-            "stdout": str(result.stdout or "")[-4000:],
-            "stderr": str(result.stderr or "")[-4000:],
-        }
-    except subprocess.TimeoutExpired as exc:
-        return {
-            "command": command_text,
-            "returncode": 124,
-            "stdout": str(exc.stdout or "")[-4000:],
-            "stderr": (str(exc.stderr or "") + "\ncommand timeout")[-4000:],
-        }
-    except Exception as exc:
-        return {"command": command_text, "returncode": 1, "stdout": "", "stderr": f"exception: {exc}"}
+    return _stream_command(
+        command_text,
+        command_text,
+        shell=True,
+        cwd=SKILL_ROOT,
+        timeout_seconds=timeout_seconds,
+        max_output_bytes=max_output_bytes,
+        log_path=log_path,
+        on_progress=on_progress,
+        cancel_event=cancel_event,
+    )
 
 
 def _run_subprocess_command(cmd: list[str], *, cwd: Path | None = None, timeout_seconds: int = 900) -> dict[str, Any]:
     if not cmd:
         return {"command": "", "returncode": 1, "stdout": "", "stderr": "empty command"}
     command_text = " ".join(str(item) for item in cmd).strip()
-    try:
-        result = subprocess.run(
-            cmd,
-            cwd=str(cwd or SKILL_ROOT),
-            capture_output=True,
-            text=True,
-            timeout=max(1, int(timeout_seconds)),
-            check=False,
-        )
-        return {
-            "command": command_text,
-            "returncode": int(result.returncode),
-            "stdout": str(result.stdout or "")[-4000:],
-            "stderr": str(result.stderr or "")[-4000:],
-        }
-    except subprocess.TimeoutExpired as exc:
-        return {
-            "command": command_text,
-            "returncode": 124,
-            "stdout": str(exc.stdout or "")[-4000:],
-            "stderr": (str(exc.stderr or "") + "\ncommand timeout")[-4000:],
-        }
-    except Exception as exc:
-        return {"command": command_text, "returncode": 1, "stdout": "", "stderr": f"exception: {exc}"}
+    return _stream_command(
+        [str(item) for item in cmd],
+        command_text,
+        shell=False,
+        cwd=cwd,
+        timeout_seconds=timeout_seconds,
+    )
 
 
 def _run_git_command(args: list[str], *, timeout_seconds: int = 900) -> dict[str, Any]:
@@ -407,13 +452,205 @@ def _archive_incident(root: Path, incident_id: str, result: str, reason: str) ->
     return payload
 
 
+def _write_progress(run_dir: Path, payload: dict[str, Any]) -> None:
+    # Progress is advisory for the dashboard; never fail the loop over it.
+    # The progress endpoint reads this file while the loop runs, so replace it
+    # atomically; losing the last update on a crash is harmless.
+    try:
+        _write_json_atomic(run_dir / PROGRESS_FILE_NAME, payload, durable=False)
+    except OSError:
+        pass
+
+
+def _verification_groups(plan: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Return the plan's verification steps as ordered command groups.
+
+    `verification_groups` entries look like
+    {"name": "checks", "parallel": true, "fail_fast": false, "commands": [...]};
+    plans that only list `verification_commands` run them as one sequential group.
+    """
+    groups: list[dict[str, Any]] = []
+    raw_groups = plan.get("verification_groups")
+    if isinstance(raw_groups, list):
+        for position, raw in enumerate(raw_groups, start=1):
+            if not isinstance(raw, dict) or not isinstance(raw.get("commands"), list):
+                continue
+            commands = [str(cmd).strip() for cmd in raw["commands"] if str(cmd).strip()]
+            if not commands:
+                continue
+            fail_fast = raw.get("fail_fast")
+            groups.append(
+                {
+                    "name": _safe_str(raw.get("name"), default=f"group_{position}"),
+                    "parallel": _safe_bool(raw.get("parallel"), default=False),
+                    "fail_fast": None if fail_fast is None else _safe_bool(fail_fast, default=False),
+                    "commands": commands,
+                }
+            )
+    if groups:
+        return groups
+    commands = plan.get("verification_commands") if isinstance(plan.get("verification_commands"), list) else []
+    commands = [str(cmd).strip() for cmd in commands if str(cmd).strip()]
+    if not commands:
+        return []
+    return [{"name": "default", "parallel": False, "fail_fast": None, "commands": commands}]
+
+
+def _skipped_result(command: str) -> dict[str, Any]:
+    return {
+        "command": command,
+        "returncode": CANCELLED_RETURNCODE,
+        "stdout": "",
+        "stderr": "skipped after an earlier command failed",
+        "skipped": True,
+    }
+
+
+def _is_skipped(result: dict[str, Any]) -> bool:
+    return bool(result.get("skipped") or result.get("cancelled"))
+
+
+def _run_verification_commands(
+    groups: list[dict[str, Any]],
+    *,
+    run_dir: Path,
+    incident_id: str,
+    iteration: int,
+    timeout_seconds: int,
+    max_output_bytes: int,
+    max_parallel: int = 1,
+    fail_fast: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Run every group in order and return one result per command, in plan order.
+
+    Commands of a `parallel` group share a pool of at most `max_parallel`
+    workers. With fail-fast, a failure skips or cancels only commands declared
+    after it, so the first failing command in plan order always runs to
+    completion and the loop signature does not depend on completion order.
+    """
+    entries = [(group, command) for group in groups for command in group["commands"]]
+    total = len(entries)
+    results: list[dict[str, Any] | None] = [None] * total
+    progress_lock = threading.Lock()
+    active: dict[int, dict[str, Any]] = {}
+
+    def _run_one(index: int, command: str, cancel_event: threading.Event | None) -> dict[str, Any]:
+        log_path = run_dir / "logs" / f"attempt_{iteration:02d}_cmd_{index:02d}.log"
+        base = {
+            "incident_id": incident_id,
+            "iteration": iteration,
+            "command_index": index,
+            "command_total": total,
+            "command": command,
+            "log_path": str(log_path),
+            "started_at": now_utc_iso(),
+        }
+
+        def _on_progress(snapshot: dict[str, Any]) -> None:
+            state = snapshot.get("state")
+            with progress_lock:
+                if state == "running":
+                    active[index] = {
+                        "command_index": index,
+                        "command": command,
+                        "elapsed_seconds": snapshot.get("elapsed_seconds"),
+                        "output_bytes": snapshot.get("output_bytes"),
+                    }
+                else:
+                    active.pop(index, None)
+                _write_progress(
+                    run_dir,
+                    {
+                        **base,
+                        "state": state,
+                        "updated_at": now_utc_iso(),
+                        "elapsed_seconds": snapshot.get("elapsed_seconds"),
+                        "output_bytes": snapshot.get("output_bytes"),
+                        "returncode": snapshot.get("returncode"),
+                        "stdout_tail": str(snapshot.get("stdout_tail") or "")[-PROGRESS_TAIL_CHARS:],
+                        "stderr_tail": str(snapshot.get("stderr_tail") or "")[-PROGRESS_TAIL_CHARS:],
+                        "active_commands": [active[key] for key in sorted(active)],
+                    },
+                )
+
+        return _run_command(
+            command,
+            timeout_seconds,
+            max_output_bytes=max_output_bytes,
+            log_path=log_path,
+            on_progress=_on_progress,
+            cancel_event=cancel_event,
+        )
+
+    def _failed(result: dict[str, Any]) -> bool:
+        return _coerce_returncode(result.get("returncode")) != 0 and not _is_skipped(result)
+
+    position = 0
+    stop = False
+    for group in groups:
+        indexes = list(range(position + 1, position + 1 + len(group["commands"])))
+        position += len(indexes)
+        group_fail_fast = fail_fast if group["fail_fast"] is None else bool(group["fail_fast"])
+        if stop:
+            for index in indexes:
+                results[index - 1] = _skipped_result(entries[index - 1][1])
+            continue
+
+        workers = min(max(1, int(max_parallel)), len(indexes)) if group["parallel"] else 1
+        if workers <= 1:
+            for index in indexes:
+                command = entries[index - 1][1]
+                if stop:
+                    results[index - 1] = _skipped_result(command)
+                    continue
+                result = _run_one(index, command, None)
+                results[index - 1] = result
+                if group_fail_fast and _failed(result):
+                    stop = True
+            continue
+
+        state_lock = threading.Lock()
+        first_failed = [total + 1]
+        cancel_events = {index: threading.Event() for index in indexes}
+
+        def _task(index: int) -> dict[str, Any]:
+            command = entries[index - 1][1]
+            with state_lock:
+                if index > first_failed[0]:
+                    return _skipped_result(command)
+            result = _run_one(index, command, cancel_events[index])
+            if group_fail_fast and _failed(result):
+                with state_lock:
+                    if index < first_failed[0]:
+                        first_failed[0] = index
+                        for later, event in cancel_events.items():
+                            if later > index:
+                                event.set()
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="verify") as pool:
+            futures = {index: pool.submit(_task, index) for index in indexes}
+            for index in indexes:
+                results[index - 1] = futures[index].result()
+        if group_fail_fast and first_failed[0] <= total:
+            stop = True
+
+    return [result for result in results if result is not None]
+
+
 def _loop_signature_from_results(command_results: list[dict[str, Any]]) -> str:
-    if not command_results:
+    # Results are in plan order and commands skipped or cancelled after an
+    # earlier failure are ignored, so the signature names the first failing
+    # command in plan order however parallel groups finished.
+    completed = [item for item in command_results if not _is_skipped(item)]
+    if not completed:
         return ""
-    if all(_coerce_returncode(item.get("returncode")) == 0 for item in command_results):
+    if all(_coerce_returncode(item.get("returncode")) == 0 for item in completed):
         return ""
     first_failed = next(
-        (item for item in command_results if _coerce_returncode(item.get("returncode")) != 0),
+        (item for item in completed if _coerce_returncode(item.get("returncode")) != 0),
         {},
     )
     return f"{first_failed.get('command', '')}::rc={_coerce_returncode(first_failed.get('returncode'))}"[:300]
@@ -438,8 +675,8 @@ def execute_error_loop(args: argparse.Namespace) -> dict[str, Any]:
     if not isinstance(plan, dict):
         raise SystemExit(f"plan missing: {plan_path}")
 
-    verification_commands = plan.get("verification_commands") if isinstance(plan.get("verification_commands"), list) else []
-    verification_commands = [str(cmd).strip() for cmd in verification_commands if str(cmd).strip()]
+    verification_groups = _verification_groups(plan)
+    verification_commands = [command for group in verification_groups for command in group["commands"]]
     if not verification_commands:
         raise SystemExit("plan has no verification_commands")
 
@@ -447,6 +684,10 @@ def execute_error_loop(args: argparse.Namespace) -> dict[str, Any]:
     no_progress_limit = _safe_int(args.no_progress_limit, default=2, minimum=1)
     auto_replan_on_no_progress = bool(_safe_bool(args.auto_replan_on_no_progress, default=True))
     commit_on_resolve = bool(_safe_bool(args.commit_on_resolve, default=True))
+    command_timeout_seconds = _safe_int(args.command_timeout_seconds, default=900, minimum=1)
+    max_output_bytes = _safe_int(args.max_output_mb, default=256, minimum=1) * 1024 * 1024
+    max_parallel = _safe_int(args.max_parallel, default=4, minimum=1)
+    fail_fast = bool(_safe_bool(args.fail_fast, default=False))
 
     incident["status"] = "running"
     incident["updated_at"] = now_utc_iso()
@@ -459,6 +700,10 @@ def execute_error_loop(args: argparse.Namespace) -> dict[str, Any]:
         "no_progress_limit": no_progress_limit,
         "auto_replan_on_no_progress": auto_replan_on_no_progress,
         "commit_on_resolve": commit_on_resolve,
+        "command_timeout_seconds": command_timeout_seconds,
+        "max_output_bytes": max_output_bytes,
+        "max_parallel": max_parallel,
+        "fail_fast": fail_fast,
     }
     write_json(incident_dir / "incident.json", incident)
     write_status(incident_dir, "running")
@@ -529,7 +774,16 @@ def execute_error_loop(args: argparse.Namespace) -> dict[str, Any]:
 
         iteration = current_loops + 1
         attempt_started = now_utc_iso()
-        command_results = [_run_command(cmd) for cmd in verification_commands]
+        command_results = _run_verification_commands(
+            verification_groups,
+            run_dir=run_dir,
+            incident_id=incident_id,
+            iteration=iteration,
+            timeout_seconds=command_timeout_seconds,
+            max_output_bytes=max_output_bytes,
+            max_parallel=max_parallel,
+            fail_fast=fail_fast,
+        )
         passed = all(_coerce_returncode(item.get("returncode")) == 0 for item in command_results)
         signature = _loop_signature_from_results(command_results)
 
@@ -553,6 +807,7 @@ def execute_error_loop(args: argparse.Namespace) -> dict[str, Any]:
             "started_at": attempt_started,
             "finished_at": now_utc_iso(),
             "verification_commands": verification_commands,
+            "verification_groups": verification_groups,
             "command_results": command_results,
             "verification_passed": passed,
             "error_signature": signature,
@@ -676,6 +931,16 @@ def execute_error_loop(args: argparse.Namespace) -> dict[str, Any]:
         "commit": commit_payload,
     }
     write_json(run_dir / "run_result.json", result_payload)
+    progress = read_json(run_dir / PROGRESS_FILE_NAME)
+    _write_progress(
+        run_dir,
+        {
+            **(progress if isinstance(progress, dict) else {"incident_id": incident_id}),
+            "state": "completed",
+            "final_status": final_status,
+            "updated_at": now_utc_iso(),
+        },
+    )
     return result_payload
 
 
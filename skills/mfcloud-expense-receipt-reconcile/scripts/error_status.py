@@ -7,7 +7,14 @@ import argparse
 import json
 from pathlib import Path
 
-from error_common import ensure_error_dirs, list_inbox_incidents, normalize_incident_id, resolve_reports_root
+from error_common import (
+    INCIDENT_LOCATIONS,
+    ensure_error_dirs,
+    load_incident_index,
+    normalize_incident_id,
+    query_incidents,
+    resolve_reports_root,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -15,15 +22,18 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--root", default="", help="Reports root override")
     parser.add_argument("--incident-id", default="", help="Show one incident in detail")
     parser.add_argument("--json", action="store_true", help="Print json")
+    parser.add_argument("--location", default="inbox", choices=INCIDENT_LOCATIONS, help="Incident bucket to list")
+    parser.add_argument("--status", default="", help="Filter by status")
+    parser.add_argument("--ym", default="", help="Filter by YYYY-MM")
+    parser.add_argument("--step", default="", help="Filter by step")
+    parser.add_argument("--failure-class", default="", help="Filter by failure class")
+    parser.add_argument("--signature", default="", help="Filter by cluster id or error signature")
+    parser.add_argument("--offset", type=int, default=0, help="Skip this many matching incidents")
+    parser.add_argument("--limit", type=int, default=None, help="Return at most this many incidents")
+    parser.add_argument("--reindex", action="store_true", help="Rebuild the incident index from a full scan")
     return parser.parse_args()
 
 
-def _count_child_dirs(path: Path) -> int:
-    if not path.exists():
-        return 0
-    return sum(1 for child in path.iterdir() if child.is_dir())
-
-
 def _read_incident_payload(path: Path) -> dict:
     incident_json = path / "incident.json"
     if not incident_json.exists():
@@ -72,14 +82,30 @@ def main() -> int:
     args = parse_args()
     reports_root = resolve_reports_root(args.root)
     dirs = ensure_error_dirs(reports_root)
-    incidents = list_inbox_incidents(reports_root)
+    if args.reindex:
+        load_incident_index(reports_root, rebuild=True)
+    query = query_incidents(
+        reports_root,
+        location=args.location,
+        status=args.status or None,
+        ym=args.ym or None,
+        step=args.step or None,
+        failure_class=args.failure_class or None,
+        signature=args.signature or None,
+        offset=args.offset,
+        limit=args.limit,
+    )
+    incidents = query["rows"]
 
     result = {
         "status": "ok",
         "reports_root": str(reports_root),
-        "inbox_count": len(incidents),
-        "archive_resolved_count": _count_child_dirs(dirs["archive_resolved"]),
-        "archive_escalated_count": _count_child_dirs(dirs["archive_escalated"]),
+        "inbox_count": query["counts"]["inbox"],
+        "archive_resolved_count": query["counts"]["resolved"],
+        "archive_escalated_count": query["counts"]["escalated"],
+        "location": args.location,
+        "matched_count": query["matched"],
+        "offset": max(0, args.offset),
         "incidents": incidents,
     }
 
@@ -93,6 +119,8 @@ def main() -> int:
 
     print(f"reports_root: {result['reports_root']}")
     print(f"unresolved_inbox: {result['inbox_count']}")
+    if args.location != "inbox" or result["matched_count"] != result["inbox_count"] or args.limit is not None:
+        print(f"listing: {args.location} matched={result['matched_count']} shown={len(incidents)}")
     print(
         f"archive: resolved={result['archive_resolved_count']} escalated={result['archive_escalated_count']}"
     )
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
-from datetime import date, datetime
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+import hashlib
 import json
 from pathlib import Path
 import re
 import sys
-from typing import Any
+from typing import Any, Callable
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 SKILL_ROOT = SCRIPT_DIR.parent
@@ -17,6 +18,7 @@ if str(SKILL_ROOT) not in sys.path:
 
 from common import (  # noqa: E402
     load_order_exclusions as _load_exclusions,
+    read_json as _read_json,
     read_jsonl as _read_jsonl,
     write_json as _write_json,
 )
@@ -204,7 +206,169 @@ def _vendor_matches_for_fallback(expense: MfExpense, order: Order) -> bool:
     return any(token in vendor_text for token in hint_tokens)
 
 
-def reconcile(
+class OrderIndex:
+    """
+    Orders bucketed by amount (for exact matching) and by date (for the
+    manual date/vendor fallback). Buckets keep the input order, so candidates
+    tie-break exactly like a linear scan over the same list.
+    """
+
+    def __init__(self, orders: list[Order]) -> None:
+        self.by_amount: dict[int, list[Order]] = {}
+        self.manual_by_date: dict[date, list[Order]] = {}
+        for order in orders:
+            if order.order_date is None:
+                continue
+            if order.total_yen is not None:
+                self.by_amount.setdefault(order.total_yen, []).append(order)
+            if order.source == "manual":
+                self.manual_by_date.setdefault(order.order_date, []).append(order)
+
+    def amount_matches(self, amount_yen: int, use_date: date, window_days: int) -> list[tuple[Order, int]]:
+        out: list[tuple[Order, int]] = []
+        for order in self.by_amount.get(amount_yen, ()):
+            diff = _days_diff(use_date, order.order_date)
+            if diff is not None and diff <= window_days:
+                out.append((order, diff))
+        return out
+
+    def manual_on(self, use_date: date) -> list[Order]:
+        return list(self.manual_by_date.get(use_date, ()))
+
+
+def _needs_review_row(base: dict[str, Any], reason: str) -> dict[str, Any]:
+    return {
+        **base,
+        "row_type": "needs_review",
+        "review_reason": reason,
+        "rank": None,
+        "order_id": None,
+        "order_date": None,
+        "total_yen": None,
+        "order_source": None,
+        "pdf_path": None,
+        "diff_days": None,
+        "score": None,
+        "match_strategy": None,
+    }
+
+
+def _expense_rows(
+    expense: MfExpense,
+    index: OrderIndex,
+    date_window_days: int,
+    max_candidates_per_mf: int,
+) -> tuple[list[dict[str, Any]], bool]:
+    """
+    Report rows for one missing-evidence expense, plus whether the manual
+    date/vendor fallback found candidates. The rows only depend on the expense
+    itself and on orders dated within the window around its use date.
+    """
+    base = {
+        "mf_expense_id": expense.expense_id,
+        "mf_use_date": expense.use_date.isoformat() if expense.use_date else None,
+        "mf_amount_yen": expense.amount_yen,
+        "mf_vendor": expense.vendor,
+        "mf_memo": expense.memo,
+        "mf_detail_url": expense.detail_url,
+    }
+
+    if expense.use_date is None:
+        return [_needs_review_row(base, "missing_use_date")], False
+
+    if expense.amount_yen is None:
+        return [_needs_review_row(base, "missing_amount")], False
+
+    strict_candidates: list[dict[str, Any]] = []
+    for order, diff in index.amount_matches(expense.amount_yen, expense.use_date, date_window_days):
+        score = 100
+        score += max(0, 20 - 2 * diff)
+        vendor_text = f"{expense.vendor} {expense.memo}"
+        if order.source == "amazon" and _looks_like_amazon(vendor_text):
+            score += 10
+        if order.source == "rakuten" and _looks_like_rakuten(vendor_text):
+            score += 10
+
+        strict_candidates.append(
+            {
+                "order_id": order.order_id,
+                "order_date": order.order_date.isoformat() if order.order_date else None,
+                "total_yen": order.total_yen,
+                "pdf_path": order.pdf_path,
+                "receipt_url": order.receipt_url,
+                "order_source": order.source,
+                "diff_days": diff,
+                "score": score,
+                "match_strategy": "amount_date_exact",
+            }
+        )
+
+    candidates = strict_candidates
+    used_fallback = False
+    if not candidates:
+        fallback_candidates: list[dict[str, Any]] = []
+        # Fallback is intentionally scoped to manual/provider imports:
+        # when receipts are foreign-currency (e.g. USD), amount equality often fails.
+        for order in index.manual_on(expense.use_date):
+            diff = 0
+            if not _vendor_matches_for_fallback(expense, order):
+                continue
+
+            score = 70
+            if order.provider:
+                score += 8
+            if order.source_hint in {"amazon", "rakuten"}:
+                score += 4
+
+            fallback_candidates.append(
+                {
+                    "order_id": order.order_id,
+                    "order_date": order.order_date.isoformat() if order.order_date else None,
+                    "total_yen": order.total_yen,
+                    "pdf_path": order.pdf_path,
+                    "receipt_url": order.receipt_url,
+                    "order_source": order.source,
+                    "diff_days": diff,
+                    "score": score,
+                    "match_strategy": "date_vendor_fallback",
+                }
+            )
+        fallback_candidates.sort(key=lambda x: (-int(x["score"]), int(x["diff_days"]), str(x.get("order_id") or "")))
+        candidates = fallback_candidates
+        used_fallback = bool(candidates)
+
+    candidates.sort(key=lambda x: (-int(x["score"]), int(x["diff_days"]), str(x.get("order_id") or "")))
+    candidates = candidates[: max(0, int(max_candidates_per_mf))]
+
+    if not candidates:
+        return [_needs_review_row(base, "no_candidate_in_window")], used_fallback
+
+    rows = [
+        {
+            **base,
+            "row_type": "candidate",
+            "review_reason": None,
+            "rank": rank,
+            "order_id": cand["order_id"],
+            "order_date": cand["order_date"],
+            "total_yen": cand["total_yen"],
+            "order_source": cand["order_source"],
+            "pdf_path": cand["pdf_path"],
+            "diff_days": cand["diff_days"],
+            "score": cand["score"],
+            "match_strategy": cand["match_strategy"],
+        }
+        for rank, cand in enumerate(candidates, start=1)
+    ]
+    return rows, used_fallback
+
+
+# Returns the rows and fallback flag of a previous run for an expense whose
+# result cannot have changed, or None to re-evaluate it.
+ReuseLookup = Callable[[MfExpense], "tuple[list[dict[str, Any]], bool] | None"]
+
+
+def _reconcile(
     *,
     orders: list[Order],
     mf_expenses: list[MfExpense],
@@ -212,8 +376,11 @@ def reconcile(
     month: int,
     date_window_days: int,
     max_candidates_per_mf: int,
-) -> dict[str, Any]:
+    candidate_index: OrderIndex | None = None,
+    reuse: ReuseLookup | None = None,
+) -> tuple[dict[str, Any], list[tuple[MfExpense, bool, bool]]]:
     orders_in_month = [o for o in orders if _in_year_month(o.order_date, year, month)]
+    index = candidate_index if candidate_index is not None else OrderIndex(orders_in_month)
     mf_in_month = [e for e in mf_expenses if _in_year_month(e.use_date, year, month)]
     mf_unknown_date = [e for e in mf_expenses if e.use_date is None]
 
@@ -233,183 +400,33 @@ def reconcile(
     rakuten_in_month = [o for o in rakuten_all if _in_year_month(o.order_date, year, month)]
     manual_in_month = [o for o in manual_all if _in_year_month(o.order_date, year, month)]
 
-    needs_review_missing_use_date = 0
-    needs_review_missing_amount = 0
-    needs_review_no_candidate = 0
+    review_reasons = {"missing_use_date": 0, "missing_amount": 0, "no_candidate_in_window": 0}
     matched_by_fallback = 0
-    needs_review_expense_ids: set[str] = set()
-    matched_expense_ids: set[str] = set()
+    matched_expenses = 0
+    spillover_candidates = 0
+    month_prefix = f"{year:04d}-{month:02d}"
 
     rows: list[dict[str, Any]] = []
+    evaluated: list[tuple[MfExpense, bool, bool]] = []
     for expense in mf_missing:
-        base = {
-            "mf_expense_id": expense.expense_id,
-            "mf_use_date": expense.use_date.isoformat() if expense.use_date else None,
-            "mf_amount_yen": expense.amount_yen,
-            "mf_vendor": expense.vendor,
-            "mf_memo": expense.memo,
-            "mf_detail_url": expense.detail_url,
-        }
-
-        if expense.use_date is None:
-            needs_review_missing_use_date += 1
-            needs_review_expense_ids.add(expense.expense_id)
-            rows.append(
-                {
-                    **base,
-                    "row_type": "needs_review",
-                    "review_reason": "missing_use_date",
-                    "rank": None,
-                    "order_id": None,
-                    "order_date": None,
-                    "total_yen": None,
-                    "order_source": None,
-                    "pdf_path": None,
-                    "diff_days": None,
-                    "score": None,
-                    "match_strategy": None,
-                }
-            )
+        reused = reuse(expense) if reuse is not None else None
+        if reused is not None:
+            expense_rows, used_fallback = reused
+        else:
+            expense_rows, used_fallback = _expense_rows(expense, index, date_window_days, max_candidates_per_mf)
+        evaluated.append((expense, used_fallback, reused is not None))
+        rows.extend(expense_rows)
+
+        if used_fallback:
+            matched_by_fallback += 1
+        head = expense_rows[0]
+        if head["row_type"] == "needs_review":
+            review_reasons[head["review_reason"]] += 1
             continue
+        matched_expenses += 1
+        spillover_candidates += sum(1 for row in expense_rows if not str(row["order_date"] or "").startswith(month_prefix))
 
-        if expense.amount_yen is None:
-            needs_review_missing_amount += 1
-            needs_review_expense_ids.add(expense.expense_id)
-            rows.append(
-                {
-                    **base,
-                    "row_type": "needs_review",
-                    "review_reason": "missing_amount",
-                    "rank": None,
-                    "order_id": None,
-                    "order_date": None,
-                    "total_yen": None,
-                    "order_source": None,
-                    "pdf_path": None,
-                    "diff_days": None,
-                    "score": None,
-                    "match_strategy": None,
-                }
-            )
-            continue
-
-        strict_candidates: list[dict[str, Any]] = []
-        for order in orders_in_month:
-            if order.total_yen is None:
-                continue
-            if order.total_yen != expense.amount_yen:
-                continue
-            diff = _days_diff(expense.use_date, order.order_date)
-            if diff is None or diff > date_window_days:
-                continue
-
-            score = 100
-            score += max(0, 20 - 2 * diff)
-            vendor_text = f"{expense.vendor} {expense.memo}"
-            if order.source == "amazon" and _looks_like_amazon(vendor_text):
-                score += 10
-            if order.source == "rakuten" and _looks_like_rakuten(vendor_text):
-                score += 10
-
-            strict_candidates.append(
-                {
-                    "order_id": order.order_id,
-                    "order_date": order.order_date.isoformat() if order.order_date else None,
-                    "total_yen": order.total_yen,
-                    "pdf_path": order.pdf_path,
-                    "receipt_url": order.receipt_url,
-                    "order_source": order.source,
-                    "diff_days": diff,
-                    "score": score,
-                    "match_strategy": "amount_date_exact",
-                }
-            )
-
-        candidates = strict_candidates
-        if not candidates:
-            fallback_candidates: list[dict[str, Any]] = []
-            for order in orders_in_month:
-                # Fallback is intentionally scoped to manual/provider imports:
-                # when receipts are foreign-currency (e.g. USD), amount equality often fails.
-                if order.source != "manual":
-                    continue
-                diff = _days_diff(expense.use_date, order.order_date)
-                if diff is None or diff != 0:
-                    continue
-                if not _vendor_matches_for_fallback(expense, order):
-                    continue
-
-                score = 70
-                if order.provider:
-                    score += 8
-                if order.source_hint in {"amazon", "rakuten"}:
-                    score += 4
-
-                fallback_candidates.append(
-                    {
-                        "order_id": order.order_id,
-                        "order_date": order.order_date.isoformat() if order.order_date else None,
-                        "total_yen": order.total_yen,
-                        "pdf_path": order.pdf_path,
-                        "receipt_url": order.receipt_url,
-                        "order_source": order.source,
-                        "diff_days": diff,
-                        "score": score,
-                        "match_strategy": "date_vendor_fallback",
-                    }
-                )
-            fallback_candidates.sort(key=lambda x: (-int(x["score"]), int(x["diff_days"]), str(x.get("order_id") or "")))
-            candidates = fallback_candidates
-            if candidates:
-                matched_by_fallback += 1
-
-        candidates.sort(key=lambda x: (-int(x["score"]), int(x["diff_days"]), str(x.get("order_id") or "")))
-        candidates = candidates[: max(0, int(max_candidates_per_mf))]
-
-        if not candidates:
-            needs_review_no_candidate += 1
-            needs_review_expense_ids.add(expense.expense_id)
-            rows.append(
-                {
-                    **base,
-                    "row_type": "needs_review",
-                    "review_reason": "no_candidate_in_window",
-                    "rank": None,
-                    "order_id": None,
-                    "order_date": None,
-                    "total_yen": None,
-                    "order_source": None,
-                    "pdf_path": None,
-                    "diff_days": None,
-                    "score": None,
-                    "match_strategy": None,
-                }
-            )
-            continue
-
-        matched_expense_ids.add(expense.expense_id)
-        for rank, cand in enumerate(candidates, start=1):
-            rows.append(
-                {
-                    **base,
-                    "row_type": "candidate",
-                    "review_reason": None,
-                    "rank": rank,
-                    "order_id": cand["order_id"],
-                    "order_date": cand["order_date"],
-                    "total_yen": cand["total_yen"],
-                    "order_source": cand["order_source"],
-                    "pdf_path": cand["pdf_path"],
-                    "diff_days": cand["diff_days"],
-                    "score": cand["score"],
-                    "match_strategy": cand["match_strategy"],
-                }
-            )
-
-    needs_review_count = len(needs_review_expense_ids)
-    matched_expenses = len(matched_expense_ids)
-
-    return {
+    data = {
         "year": year,
         "month": month,
         "counts": {
@@ -428,14 +445,248 @@ def reconcile(
             "mf_missing_evidence": len(mf_missing),
             "matched_expenses": matched_expenses,
             "matched_by_fallback_date_vendor": matched_by_fallback,
-            "needs_review_count": needs_review_count,
-            "needs_review_missing_use_date": needs_review_missing_use_date,
-            "needs_review_missing_amount": needs_review_missing_amount,
-            "needs_review_no_candidate_in_window": needs_review_no_candidate,
+            "needs_review_count": sum(review_reasons.values()),
+            "needs_review_missing_use_date": review_reasons["missing_use_date"],
+            "needs_review_missing_amount": review_reasons["missing_amount"],
+            "needs_review_no_candidate_in_window": review_reasons["no_candidate_in_window"],
             "report_rows": len(rows),
+            **({"spillover_candidates": spillover_candidates} if candidate_index is not None else {}),
         },
         "rows": rows,
     }
+    return data, evaluated
+
+
+def reconcile(
+    *,
+    orders: list[Order],
+    mf_expenses: list[MfExpense],
+    year: int,
+    month: int,
+    date_window_days: int,
+    max_candidates_per_mf: int,
+    candidate_index: OrderIndex | None = None,
+) -> dict[str, Any]:
+    """
+    Match the month's missing-evidence MF expenses against orders.
+
+    Candidates come from the month's own orders unless `candidate_index` is
+    given; the batch driver passes an index over several months so expenses
+    near a month boundary can match orders dated in the neighbouring month.
+    Counts always describe `orders` and `mf_expenses`.
+    """
+    data, _ = _reconcile(
+        orders=orders,
+        mf_expenses=mf_expenses,
+        year=year,
+        month=month,
+        date_window_days=date_window_days,
+        max_candidates_per_mf=max_candidates_per_mf,
+        candidate_index=candidate_index,
+    )
+    return data
+
+
+# Bump whenever matching or row layout changes, so saved state from an older
+# version forces one full run instead of reusing stale rows.
+RECONCILE_STATE_VERSION = 1
+
+
+def state_path_for(out_json: Path) -> Path:
+    return out_json.with_name(f"{out_json.stem}.state.json")
+
+
+def _fingerprint(values: dict[str, Any]) -> str:
+    payload = json.dumps(values, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _order_state_entries(orders: list[Order]) -> dict[str, dict[str, Any]]:
+    # Candidates with the same order id tie-break by input order, so the key
+    # is the order id plus its position among orders sharing that id.
+    entries: dict[str, dict[str, Any]] = {}
+    positions: dict[str, int] = {}
+    for order in orders:
+        position = positions.get(order.order_id, 0)
+        positions[order.order_id] = position + 1
+        entries[json.dumps([order.order_id, position], ensure_ascii=False)] = {
+            "fingerprint": _fingerprint(asdict(order)),
+            "order_date": order.order_date.isoformat() if order.order_date else None,
+        }
+    return entries
+
+
+def _full_run_reason(
+    previous: dict[str, Any] | None,
+    state: dict[str, Any] | None,
+    params: dict[str, Any],
+) -> str | None:
+    if not isinstance(previous, dict) or not isinstance(previous.get("rows"), list):
+        return "no_previous_report"
+    if not isinstance(state, dict):
+        return "no_state"
+    if state.get("version") != RECONCILE_STATE_VERSION:
+        return "state_version_changed"
+    if state.get("params") != params:
+        return "params_changed"
+    if not isinstance(state.get("orders"), dict) or not isinstance(state.get("expenses"), dict):
+        return "invalid_state"
+    return None
+
+
+def reconcile_incremental(
+    *,
+    orders: list[Order],
+    mf_expenses: list[MfExpense],
+    year: int,
+    month: int,
+    date_window_days: int,
+    max_candidates_per_mf: int,
+    previous: dict[str, Any] | None,
+    state: dict[str, Any] | None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Same result as `reconcile`, re-evaluating only what may have changed.
+
+    `previous` is the last report and `state` the fingerprints saved with it.
+    An expense keeps its previous rows unless its own fingerprint changed or
+    an order dated within `date_window_days` of its use date was added,
+    removed or changed. Without usable state (missing, other parameters or
+    another state version) every expense is evaluated. Returns the report and
+    the state to save next to it; `state["last_run"]` describes the run.
+    """
+    window = max(0, int(date_window_days))
+    params = {
+        "year": int(year),
+        "month": int(month),
+        "date_window_days": int(date_window_days),
+        "max_candidates_per_mf": int(max_candidates_per_mf),
+    }
+    order_entries = _order_state_entries([o for o in orders if _in_year_month(o.order_date, year, month)])
+    reason = _full_run_reason(previous, state, params)
+
+    reusable: dict[str, tuple[str, list[dict[str, Any]], bool]] = {}
+    affected_dates: set[date] = set()
+    changed_orders = 0
+    if reason is None:
+        assert previous is not None and state is not None
+        old_orders: dict[str, Any] = state["orders"]
+        changed_dates: set[date] = set()
+        for key in old_orders.keys() | order_entries.keys():
+            old, new = old_orders.get(key), order_entries.get(key)
+            if old == new:
+                continue
+            changed_orders += 1
+            for entry in (old, new):
+                changed = _to_date(entry.get("order_date")) if isinstance(entry, dict) else None
+                if changed is not None:
+                    changed_dates.add(changed)
+        affected_dates = {d + timedelta(days=offset) for d in changed_dates for offset in range(-window, window + 1)}
+
+        previous_rows: dict[str, list[dict[str, Any]]] = {}
+        for row in previous["rows"]:
+            if isinstance(row, dict):
+                previous_rows.setdefault(str(row.get("mf_expense_id") or ""), []).append(row)
+        for expense_id, entry in state["expenses"].items():
+            if isinstance(entry, dict) and expense_id in previous_rows:
+                reusable[expense_id] = (str(entry.get("fingerprint") or ""), previous_rows[expense_id], bool(entry.get("fallback")))
+
+    fingerprints: dict[str, str] = {}
+
+    def _expense_fingerprint(expense: MfExpense) -> str:
+        if expense.expense_id not in fingerprints:
+            fingerprints[expense.expense_id] = _fingerprint(asdict(expense))
+        return fingerprints[expense.expense_id]
+
+    def _reuse(expense: MfExpense) -> tuple[list[dict[str, Any]], bool] | None:
+        hit = reusable.get(expense.expense_id)
+        if hit is None or hit[0] != _expense_fingerprint(expense):
+            return None
+        if expense.use_date is not None and expense.use_date in affected_dates:
+            return None
+        return hit[1], hit[2]
+
+    data, evaluated = _reconcile(
+        orders=orders,
+        mf_expenses=mf_expenses,
+        year=year,
+        month=month,
+        date_window_days=date_window_days,
+        max_candidates_per_mf=max_candidates_per_mf,
+        reuse=_reuse if reason is None else None,
+    )
+    reused = sum(1 for _, _, was_reused in evaluated if was_reused)
+    new_state = {
+        "version": RECONCILE_STATE_VERSION,
+        "params": params,
+        "orders": order_entries,
+        "expenses": {
+            expense.expense_id: {"fingerprint": _expense_fingerprint(expense), "fallback": used_fallback}
+            for expense, used_fallback, _ in evaluated
+        },
+        "last_run": {
+            "mode": "full" if reason else "incremental",
+            "full_reason": reason,
+            "changed_orders": changed_orders,
+            "reused_expenses": reused,
+            "reevaluated_expenses": len(evaluated) - reused,
+        },
+    }
+    return data, new_state
+
+
+def load_orders(
+    *,
+    amazon_orders_jsonl: Path | None,
+    rakuten_orders_jsonl: Path | None,
+    manual_orders_jsonl: Path | None,
+    exclude_orders_json: Path | str | None = None,
+) -> list[Order]:
+    amazon_raw = _read_jsonl(amazon_orders_jsonl, required=True, strict=True) if amazon_orders_jsonl else []
+    rakuten_raw = _read_jsonl(rakuten_orders_jsonl, required=True, strict=True) if rakuten_orders_jsonl else []
+    manual_raw = _read_jsonl(manual_orders_jsonl, required=True, strict=True) if manual_orders_jsonl else []
+    exclusions = _load_exclusions(exclude_orders_json)
+    if exclusions:
+        amazon_raw = [x for x in amazon_raw if not _is_excluded(x, exclusions, "amazon")]
+        rakuten_raw = [x for x in rakuten_raw if not _is_excluded(x, exclusions, "rakuten")]
+    orders = [o for o in (Order.from_obj(x, default_source="amazon") for x in amazon_raw) if o]
+    orders += [o for o in (Order.from_obj(x, default_source="rakuten") for x in rakuten_raw) if o]
+    orders += [o for o in (Order.from_obj(x, default_source="manual") for x in manual_raw) if o]
+    return _dedupe_orders(orders)
+
+
+def load_mf_expenses(path: Path) -> list[MfExpense]:
+    mf_raw = _read_jsonl(path, required=True, strict=True)
+    return [e for e in (MfExpense.from_obj(x) for x in mf_raw) if e]
+
+
+def write_reports(data: dict[str, Any], *, out_json: Path, out_csv: Path) -> None:
+    _write_json(out_json, data)
+    _write_csv(out_csv, data["rows"])
+
+
+def _report_digest(out_json: Path) -> str | None:
+    try:
+        return hashlib.sha1(out_json.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_incremental_inputs(out_json: Path) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """
+    Previous report and saved state for `reconcile_incremental`. The state is
+    dropped when the report was rewritten by anything else since it was saved
+    (e.g. `reconcile_batch.py`), because its fingerprints no longer describe it.
+    """
+    state = _read_json(state_path_for(out_json))
+    if not isinstance(state, dict) or state.get("report_sha1") != _report_digest(out_json):
+        return None, None
+    previous = _read_json(out_json)
+    return (previous if isinstance(previous, dict) else None), state
+
+
+def write_state(state: dict[str, Any], *, out_json: Path) -> None:
+    _write_json(state_path_for(out_json), {**state, "report_sha1": _report_digest(out_json)}, compact=True)
 
 
 def _write_csv(path: Path, rows: list[dict[str, Any]]) -> None:
@@ -481,6 +732,11 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--month", type=int, required=True)
     ap.add_argument("--date-window-days", type=int, default=7)
     ap.add_argument("--max-candidates-per-mf", type=int, default=5)
+    ap.add_argument(
+        "--full",
+        action="store_true",
+        help="ignore the saved state and re-evaluate every expense (the state is still refreshed)",
+    )
     args = ap.parse_args(argv)
 
     if not args.amazon_orders_jsonl and not args.rakuten_orders_jsonl and not args.manual_orders_jsonl:
@@ -488,35 +744,43 @@ def main(argv: list[str] | None = None) -> int:
             "At least one of --amazon-orders-jsonl, --rakuten-orders-jsonl, --manual-orders-jsonl is required."
         )
 
-    amazon_raw = _read_jsonl(Path(args.amazon_orders_jsonl), required=True, strict=True) if args.amazon_orders_jsonl else []
-    rakuten_raw = _read_jsonl(Path(args.rakuten_orders_jsonl), required=True, strict=True) if args.rakuten_orders_jsonl else []
-    manual_raw = _read_jsonl(Path(args.manual_orders_jsonl), required=True, strict=True) if args.manual_orders_jsonl else []
-    exclusions = _load_exclusions(args.exclude_orders_json)
-    if exclusions:
-        amazon_raw = [x for x in amazon_raw if not _is_excluded(x, exclusions, "amazon")]
-        rakuten_raw = [x for x in rakuten_raw if not _is_excluded(x, exclusions, "rakuten")]
-    mf_raw = _read_jsonl(Path(args.mf_expenses_jsonl), required=True, strict=True)
-    orders = [o for o in (Order.from_obj(x, default_source="amazon") for x in amazon_raw) if o]
-    orders += [o for o in (Order.from_obj(x, default_source="rakuten") for x in rakuten_raw) if o]
-    orders += [o for o in (Order.from_obj(x, default_source="manual") for x in manual_raw) if o]
-    orders = _dedupe_orders(orders)
-    mf_expenses = [e for e in (MfExpense.from_obj(x) for x in mf_raw) if e]
+    orders = load_orders(
+        amazon_orders_jsonl=Path(args.amazon_orders_jsonl) if args.amazon_orders_jsonl else None,
+        rakuten_orders_jsonl=Path(args.rakuten_orders_jsonl) if args.rakuten_orders_jsonl else None,
+        manual_orders_jsonl=Path(args.manual_orders_jsonl) if args.manual_orders_jsonl else None,
+        exclude_orders_json=args.exclude_orders_json,
+    )
+    mf_expenses = load_mf_expenses(Path(args.mf_expenses_jsonl))
+    out_json = Path(args.out_json)
+    previous, state = (None, None) if args.full else load_incremental_inputs(out_json)
 
-    data = reconcile(
+    data, new_state = reconcile_incremental(
         orders=orders,
         mf_expenses=mf_expenses,
         year=int(args.year),
         month=int(args.month),
         date_window_days=int(args.date_window_days),
         max_candidates_per_mf=int(args.max_candidates_per_mf),
+        previous=previous,
+        state=state,
     )
+    if args.full:
+        new_state["last_run"]["full_reason"] = "requested"
 
-    _write_json(Path(args.out_json), data)
-    _write_csv(Path(args.out_csv), data["rows"])
+    write_reports(data, out_json=out_json, out_csv=Path(args.out_csv))
+    write_state(new_state, out_json=out_json)
 
     print(
         json.dumps(
-            {"status": "success", "data": {"counts": data["counts"], "out_json": str(Path(args.out_json)), "out_csv": str(Path(args.out_csv))}},
+            {
+                "status": "success",
+                "data": {
+                    "counts": data["counts"],
+                    "out_json": str(out_json),
+                    "out_csv": str(Path(args.out_csv)),
+                    "incremental": new_state["last_run"],
+                },
+            },
             ensure_ascii=False,
         )
     )
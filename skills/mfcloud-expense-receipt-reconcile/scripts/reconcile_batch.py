@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Reconcile a range of months against one shared order index."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import re
+import sys
+from typing import Any
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SKILL_ROOT = SCRIPT_DIR.parent
+if str(SKILL_ROOT) not in sys.path:
+    sys.path.insert(0, str(SKILL_ROOT))
+
+from common import artifact_root as _artifact_root  # noqa: E402
+from common import write_json as _write_json  # noqa: E402
+from common import ym_to_dirname as _ym_to_dirname  # noqa: E402
+from reconcile import (  # noqa: E402
+    MfExpense,
+    Order,
+    OrderIndex,
+    _dedupe_orders,
+    load_mf_expenses,
+    load_orders,
+    reconcile,
+    write_reports,
+)
+
+YM_ARG_RE = re.compile(r"^(\d{4})-(\d{1,2})$")
+DEFAULT_MAX_WORKERS = 4
+
+# Shared index for the worker processes, installed once per worker.
+_worker_index: OrderIndex | None = None
+
+
+@dataclass
+class MonthInputs:
+    year: int
+    month: int
+    root: Path
+    orders: list[Order] = field(default_factory=list)
+    mf_expenses: list[MfExpense] = field(default_factory=list)
+    skip_reason: str | None = None
+
+    @property
+    def ym(self) -> str:
+        return _ym_to_dirname(self.year, self.month)
+
+
+def _parse_ym(value: str) -> tuple[int, int]:
+    m = YM_ARG_RE.match(str(value or "").strip())
+    if not m or not 1 <= int(m.group(2)) <= 12:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}")
+    return int(m.group(1)), int(m.group(2))
+
+
+def _shift_month(year: int, month: int, delta: int) -> tuple[int, int]:
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+def month_range(start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]]:
+    if start > end:
+        raise ValueError("start month must not be after end month.")
+    months: list[tuple[int, int]] = []
+    current = start
+    while current <= end:
+        months.append(current)
+        current = _shift_month(*current, 1)
+    return months
+
+
+def _existing(path: Path) -> Path | None:
+    return path if path.exists() else None
+
+
+def load_month_inputs(root: Path, year: int, month: int, *, require_expenses: bool = True) -> MonthInputs:
+    """Parse one month's order and MF expense files; each file is read once."""
+    inputs = MonthInputs(year=year, month=month, root=root)
+    amazon = _existing(root / "amazon" / "orders.jsonl")
+    rakuten = _existing(root / "rakuten" / "orders.jsonl")
+    manual = _existing(root / "manual" / "orders.jsonl")
+    if not (amazon or rakuten or manual):
+        inputs.skip_reason = "missing_orders"
+        return inputs
+    inputs.orders = load_orders(
+        amazon_orders_jsonl=amazon,
+        rakuten_orders_jsonl=rakuten,
+        manual_orders_jsonl=manual,
+        exclude_orders_json=_existing(root / "reports" / "exclude_orders.json"),
+    )
+    expenses = root / "mfcloud" / "expenses.jsonl"
+    if not expenses.exists():
+        if require_expenses:
+            inputs.skip_reason = "missing_mf_expenses"
+        return inputs
+    inputs.mf_expenses = load_mf_expenses(expenses)
+    return inputs
+
+
+def _install_worker_index(index: OrderIndex | None) -> None:
+    global _worker_index
+    _worker_index = index
+
+
+def _reconcile_month(
+    inputs: MonthInputs,
+    date_window_days: int,
+    max_candidates_per_mf: int,
+    index: OrderIndex | None = None,
+) -> dict[str, Any]:
+    return reconcile(
+        orders=inputs.orders,
+        mf_expenses=inputs.mf_expenses,
+        year=inputs.year,
+        month=inputs.month,
+        date_window_days=date_window_days,
+        max_candidates_per_mf=max_candidates_per_mf,
+        candidate_index=index if index is not None else _worker_index,
+    )
+
+
+def _sum_counts(rows: list[dict[str, Any]]) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for counts in rows:
+        for key, value in counts.items():
+            if isinstance(value, int) and not isinstance(value, bool):
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def run_batch(
+    *,
+    artifact_root: Path,
+    start: tuple[int, int],
+    end: tuple[int, int],
+    date_window_days: int = 7,
+    max_candidates_per_mf: int = 5,
+    spillover: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    summary_json: Path | None = None,
+) -> dict[str, Any]:
+    """
+    Reconcile every month in [start, end] and write the usual per-month
+    reports plus a range summary.
+
+    With `spillover`, all orders of the range and its neighbouring months go
+    into one shared index, so an expense near a month boundary can match an
+    order dated in the next or previous month. Without it every month only
+    sees its own orders and the reports equal single-month reconcile runs.
+    """
+    months = month_range(start, end)
+    inputs = [load_month_inputs(artifact_root / _ym_to_dirname(y, m), y, m) for y, m in months]
+    runnable = [item for item in inputs if item.skip_reason is None]
+
+    index: OrderIndex | None = None
+    index_orders = 0
+    if spillover:
+        pool_orders = [order for item in inputs for order in item.orders]
+        for y, m in (_shift_month(*start, -1), _shift_month(*end, 1)):
+            root = artifact_root / _ym_to_dirname(y, m)
+            if root.exists():
+                pool_orders += load_month_inputs(root, y, m, require_expenses=False).orders
+        shared = _dedupe_orders(pool_orders)
+        index_orders = len(shared)
+        index = OrderIndex(shared)
+
+    workers = max(1, min(int(max_workers), len(runnable)))
+    results: dict[str, dict[str, Any]] = {}
+    if workers <= 1:
+        for item in runnable:
+            results[item.ym] = _reconcile_month(item, date_window_days, max_candidates_per_mf, index)
+    else:
+        # The index is pickled once per worker instead of once per month.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_install_worker_index,
+            initargs=(index,),
+        ) as pool:
+            futures = {
+                item.ym: pool.submit(_reconcile_month, item, date_window_days, max_candidates_per_mf)
+                for item in runnable
+            }
+            for ym, future in futures.items():
+                results[ym] = future.result()
+
+    month_rows: list[dict[str, Any]] = []
+    for item in inputs:
+        if item.skip_reason is not None:
+            month_rows.append({"ym": item.ym, "status": "skipped", "reason": item.skip_reason})
+            continue
+        data = results[item.ym]
+        reports_dir = item.root / "reports"
+        out_json = reports_dir / "missing_evidence_candidates.json"
+        write_reports(data, out_json=out_json, out_csv=reports_dir / "missing_evidence_candidates.csv")
+        month_rows.append({"ym": item.ym, "status": "success", "counts": data["counts"], "out_json": str(out_json)})
+
+    summary = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "start": _ym_to_dirname(*start),
+        "end": _ym_to_dirname(*end),
+        "spillover": bool(spillover),
+        "date_window_days": int(date_window_days),
+        "max_candidates_per_mf": int(max_candidates_per_mf),
+        "workers": workers,
+        "index_orders": index_orders,
+        "months": month_rows,
+        "totals": _sum_counts([row["counts"] for row in month_rows if row["status"] == "success"]),
+    }
+    if summary_json is None:
+        summary_json = artifact_root / "_batch" / f"reconcile_{summary['start']}_{summary['end']}.json"
+    _write_json(summary_json, summary)
+    summary["summary_json"] = str(summary_json)
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Reconcile several months against one shared order index")
+    ap.add_argument("--start", type=_parse_ym, required=True, help="first month (YYYY-MM)")
+    ap.add_argument("--end", type=_parse_ym, required=True, help="last month (YYYY-MM)")
+    ap.add_argument("--artifact-root", help="root holding YYYY-MM month folders (default: AX_HOME artifacts)")
+    ap.add_argument("--date-window-days", type=int, default=7)
+    ap.add_argument("--max-candidates-per-mf", type=int, default=5)
+    ap.add_argument(
+        "--no-spillover",
+        action="store_false",
+        dest="spillover",
+        help="match each month only against its own orders (same as single-month reconcile)",
+    )
+    ap.add_argument("--workers", type=int, default=min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1))
+    ap.add_argument("--summary-json", help="range summary path (default: <artifact-root>/_batch/...)")
+    args = ap.parse_args(argv)
+
+    summary = run_batch(
+        artifact_root=Path(args.artifact_root).expanduser() if args.artifact_root else _artifact_root(),
+        start=args.start,
+        end=args.end,
+        date_window_days=int(args.date_window_days),
+        max_candidates_per_mf=int(args.max_candidates_per_mf),
+        spillover=bool(args.spillover),
+        max_workers=int(args.workers),
+        summary_json=Path(args.summary_json).expanduser() if args.summary_json else None,
+    )
+    print(json.dumps({"status": "success", "data": summary}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -444,6 +444,8 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--skip-rakuten", action="store_true", help="skip Rakuten download step")
     ap.add_argument("--skip-mfcloud", action="store_true", help="skip MF Cloud extract step")
     ap.add_argument("--skip-reconcile", action="store_true", help="skip reconcile step")
+    ap.add_argument("--full-reconcile", action="store_true", help="re-evaluate every MF expense instead of only changed ones")
+    ap.add_argument("--timing-json", help="also write the per-stage timing JSON here (reports/run_timing.json is always written)")
     ap.add_argument(
         "--mf-draft-create",
         action="store_true",
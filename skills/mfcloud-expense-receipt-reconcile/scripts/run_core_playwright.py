@@ -11,6 +11,12 @@ import sys
 import threading
 from typing import Any
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from run_core_telemetry import span as _span  # noqa: E402
+
 
 def _which_any(candidates: tuple[str, ...]) -> str | None:
     for name in candidates:
@@ -35,15 +41,16 @@ def _ensure_playwright_installed(*, package_root: Path, env: dict[str, str]) ->
     if not npm:
         raise FileNotFoundError("npm not found in PATH. Please install Node.js/npm.")
     install_cmd = [npm, "install", "--no-audit", "--no-fund"]
-    res = subprocess.run(
-        install_cmd,
-        cwd=str(package_root),
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=False,
-    )
+    with _span("npm install", kind="subprocess"):
+        res = subprocess.run(
+            install_cmd,
+            cwd=str(package_root),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
     if res.returncode != 0:
         raise RuntimeError(
             "Failed to install Node dependencies:\n"
@@ -72,40 +79,43 @@ def run_node_playwright_script(
     if not node:
         raise FileNotFoundError("node not found in PATH. Please install Node.js.")
     cmd = [node, str(script_path), *args]
-    proc = subprocess.Popen(
-        cmd,
-        cwd=str(package_root),
-        env=merged_env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=False,
-        bufsize=0,
-    )
-
-    stdout_lines: list[str] = []
-    stderr_lines: list[str] = []
-
-    def _drain(stream, sink, is_err: bool = False) -> None:
-        if stream is None:
-            return
-        for raw in iter(stream.readline, b""):
-            try:
-                line = raw.decode("utf-8", errors="replace")
-            except Exception:
-                line = raw.decode(errors="replace")
-            sink.append(line)
-            if is_err:
-                print(line.rstrip("\n"), file=sys.stderr, flush=True)
-            else:
-                print(line.rstrip("\n"), file=sys.stdout, flush=True)
-
-    t_out = threading.Thread(target=_drain, args=(proc.stdout, stdout_lines))
-    t_err = threading.Thread(target=_drain, args=(proc.stderr, stderr_lines, True))
-    t_out.start()
-    t_err.start()
-    returncode = proc.wait()
-    t_out.join()
-    t_err.join()
+    with _span(f"node {script_path.name}", kind="node") as current:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(package_root),
+            env=merged_env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=False,
+            bufsize=0,
+        )
+
+        stdout_lines: list[str] = []
+        stderr_lines: list[str] = []
+
+        def _drain(stream, sink, is_err: bool = False) -> None:
+            if stream is None:
+                return
+            for raw in iter(stream.readline, b""):
+                try:
+                    line = raw.decode("utf-8", errors="replace")
+                except Exception:
+                    line = raw.decode(errors="replace")
+                sink.append(line)
+                if is_err:
+                    print(line.rstrip("\n"), file=sys.stderr, flush=True)
+                else:
+                    print(line.rstrip("\n"), file=sys.stdout, flush=True)
+
+        t_out = threading.Thread(target=_drain, args=(proc.stdout, stdout_lines))
+        t_err = threading.Thread(target=_drain, args=(proc.stderr, stderr_lines, True))
+        t_out.start()
+        t_err.start()
+        returncode = proc.wait()
+        t_out.join()
+        t_err.join()
+        if current is not None:
+            current.set(returncode=returncode)
 
     res_stdout = "".join(stdout_lines)
     res_stderr = "".join(stderr_lines)
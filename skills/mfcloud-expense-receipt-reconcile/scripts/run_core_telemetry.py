@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Span-based timing and resource telemetry for the run pipeline (stdlib only)."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Any, Iterator
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SKILL_ROOT = SCRIPT_DIR.parent
+if str(SKILL_ROOT) not in sys.path:
+    sys.path.insert(0, str(SKILL_ROOT))
+
+from common import write_json as _write_json  # noqa: E402
+
+TIMING_FILE_NAME = "run_timing.json"
+TIMING_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    wall: float
+    cpu: float
+    child_cpu: float
+    peak_rss: int | None
+    child_peak_rss: int | None
+    read_ops: int | None
+    write_ops: int | None
+
+
+def _maxrss_bytes(value: int) -> int:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return int(value) if sys.platform == "darwin" else int(value) * 1024
+
+
+def sample() -> ResourceSample:
+    """Current wall clock, CPU times, high-water RSS and block I/O counters."""
+    times = os.times()
+    peak_rss = child_peak_rss = read_ops = write_ops = None
+    if resource is not None:
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        peak_rss = _maxrss_bytes(own.ru_maxrss)
+        child_peak_rss = _maxrss_bytes(children.ru_maxrss)
+        read_ops = own.ru_inblock + children.ru_inblock
+        write_ops = own.ru_oublock + children.ru_oublock
+    return ResourceSample(
+        wall=time.perf_counter(),
+        cpu=time.process_time(),
+        # Only POSIX reports CPU time of waited-for children.
+        child_cpu=times.children_user + times.children_system,
+        peak_rss=peak_rss,
+        child_peak_rss=child_peak_rss,
+        read_ops=read_ops,
+        write_ops=write_ops,
+    )
+
+
+def _delta(end: int | None, start: int | None) -> int | None:
+    if end is None or start is None:
+        return None
+    return max(0, end - start)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
+
+
+@dataclass
+class Span:
+    span_id: int
+    parent_id: int | None
+    depth: int
+    name: str
+    kind: str
+    start: ResourceSample
+    attrs: dict[str, Any] = field(default_factory=dict)
+    end: ResourceSample | None = None
+    status: str = "running"
+    error: str | None = None
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def to_dict(self, origin: ResourceSample) -> dict[str, Any]:
+        end = self.end or sample()
+        return {
+            "id": self.span_id,
+            "parent_id": self.parent_id,
+            "depth": self.depth,
+            "name": self.name,
+            "kind": self.kind,
+            "status": self.status,
+            "error": self.error,
+            "start_ms": _ms(self.start.wall - origin.wall),
+            "duration_ms": _ms(end.wall - self.start.wall),
+            "cpu_ms": _ms(end.cpu - self.start.cpu),
+            "child_cpu_ms": _ms(end.child_cpu - self.start.child_cpu),
+            # High-water marks at span end, not per-span peaks: RSS never
+            # goes down in getrusage, so a span only shows a rise it caused.
+            "peak_rss_bytes": end.peak_rss,
+            "child_peak_rss_bytes": end.child_peak_rss,
+            "read_ops": _delta(end.read_ops, self.start.read_ops),
+            "write_ops": _delta(end.write_ops, self.start.write_ops),
+            "attrs": dict(self.attrs),
+        }
+
+
+class Tracer:
+    """Collects nested spans for one run; not thread-safe (spans open on one thread)."""
+
+    def __init__(self, name: str, **attrs: Any) -> None:
+        self.name = name
+        self.attrs = dict(attrs)
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.origin = sample()
+        self.spans: list[Span] = []
+        self._stack: list[Span] = []
+
+    @contextmanager
+    def span(self, name: str, *, kind: str = "step", **attrs: Any) -> Iterator[Span]:
+        parent = self._stack[-1] if self._stack else None
+        current = Span(
+            span_id=len(self.spans) + 1,
+            parent_id=parent.span_id if parent else None,
+            depth=len(self._stack),
+            name=name,
+            kind=kind,
+            start=sample(),
+            attrs=dict(attrs),
+        )
+        self.spans.append(current)
+        self._stack.append(current)
+        try:
+            yield current
+            current.status = "success"
+        except BaseException as exc:
+            current.status = "error"
+            current.error = f"{type(exc).__name__}: {exc}"[:500]
+            raise
+        finally:
+            current.end = sample()
+            self._stack.pop()
+
+    def to_dict(self) -> dict[str, Any]:
+        root = self.spans[0] if self.spans else None
+        return {
+            "version": TIMING_VERSION,
+            "name": self.name,
+            "attrs": dict(self.attrs),
+            "started_at": self.started_at,
+            "status": root.status if root else "running",
+            "duration_ms": root.to_dict(self.origin)["duration_ms"] if root else 0.0,
+            "resource_metrics": resource is not None,
+            "spans": [item.to_dict(self.origin) for item in self.spans],
+        }
+
+
+_current_tracer: ContextVar[Tracer | None] = ContextVar("run_core_tracer", default=None)
+
+
+@contextmanager
+def span(name: str, *, kind: str = "step", **attrs: Any) -> Iterator[Span | None]:
+    """Open a span on the active trace; a no-op outside `trace()`."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, kind=kind, **attrs) as current:
+        yield current
+
+
+@contextmanager
+def trace(name: str, *, out_paths: list[Path], **attrs: Any) -> Iterator[Tracer]:
+    """
+    Trace one run under a root span and write the timing JSON to every path
+    in `out_paths` when it ends, also on failure. Write errors are ignored so
+    telemetry never fails a run.
+    """
+    tracer = Tracer(name, **attrs)
+    token = _current_tracer.set(tracer)
+    try:
+        with tracer.span(name, kind="run"):
+            yield tracer
+    finally:
+        _current_tracer.reset(token)
+        payload = {**tracer.to_dict(), "finished_at": datetime.now().isoformat(timespec="seconds")}
+        for path in out_paths:
+            try:
+                _write_json(path, payload)
+            except OSError:
+                pass
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""Write a deterministic synthetic AX_HOME month tree for benchmarks and load tests."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, dataclass, replace
+from datetime import date, datetime, timedelta
+import json
+from pathlib import Path
+import random
+import sys
+from typing import Any
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SKILL_ROOT = SCRIPT_DIR.parent
+if str(SKILL_ROOT) not in sys.path:
+    sys.path.insert(0, str(SKILL_ROOT))
+
+from common import SKILL_SLUG  # noqa: E402
+from common import write_json as _write_json  # noqa: E402
+from common import ym_to_dirname as _ym_to_dirname  # noqa: E402
+from reconcile import load_mf_expenses, load_orders, reconcile, write_reports  # noqa: E402
+
+AMAZON_ITEMS = ("USB-C ケーブル", "コピー用紙 A4 500枚", "トナーカートリッジ", "ワイヤレスマウス", "技術書", "モニターアーム")
+RAKUTEN_ITEMS = ("事務用チェア", "飲料 24本", "プリンター用インク", "デスクライト", "収納ボックス")
+MANUAL_PROVIDERS = ("chatgpt", "claude", "gamma", "aquavoice")
+PROVIDER_VENDORS = {"chatgpt": "OpenAI", "claude": "Anthropic", "gamma": "Gamma", "aquavoice": "Aqua Voice"}
+SOURCE_VENDORS = {"amazon": "Amazon.co.jp", "rakuten": "楽天市場"}
+NOISE_VENDORS = ("JR東日本", "タクシー", "スターバックス", "ヨドバシカメラ", "郵便局")
+RUN_MODES = ("preflight", "amazon_download", "rakuten_download", "mf_reconcile", "amazon_print")
+
+
+@dataclass(frozen=True)
+class MonthSizes:
+    amazon_orders: int = 150
+    rakuten_orders: int = 60
+    manual_orders: int = 20
+    mf_expenses: int = 250
+    runs: int = 40
+    audit_events: int = 400
+    pdfs: bool = True
+
+    def scaled(self, factor: float) -> "MonthSizes":
+        def _n(value: int) -> int:
+            return max(0, int(round(value * factor)))
+
+        return replace(
+            self,
+            amazon_orders=_n(self.amazon_orders),
+            rakuten_orders=_n(self.rakuten_orders),
+            manual_orders=_n(self.manual_orders),
+            mf_expenses=_n(self.mf_expenses),
+            runs=_n(self.runs),
+            audit_events=_n(self.audit_events),
+        )
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def pdf_with_text(lines: list[str]) -> bytes:
+    """One-page PDF whose text layer holds `lines` (ASCII, Helvetica)."""
+    content = "BT /F1 11 Tf 14 TL 72 770 Td " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in lines) + " ET"
+    stream = content.encode("latin-1", errors="replace")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets: list[int] = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def _days_in_month(year: int, month: int) -> int:
+    following = date(year + (month == 12), month % 12 + 1, 1)
+    return (following - timedelta(days=1)).day
+
+
+def _receipt_pdf(path: Path, *, title: str, order_id: str, order_date: str, total_yen: int, item: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(
+        pdf_with_text(
+            [
+                title,
+                f"Order ID: {order_id}",
+                f"Order Date: {order_date}",
+                f"Total: JPY {total_yen:,}",
+                f"Item: {item.encode('ascii', errors='ignore').decode() or 'item'}",
+            ]
+        )
+    )
+
+
+def _amazon_orders(rng: random.Random, root: Path, year: int, month: int, sizes: MonthSizes) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    pdf_dir = root / "amazon" / "pdfs"
+    last_day = _days_in_month(year, month)
+    for _ in range(sizes.amazon_orders):
+        order_id = f"{rng.randint(249, 503)}-{rng.randint(0, 9999999):07d}-{rng.randint(0, 9999999):07d}"
+        order_date = date(year, month, rng.randint(1, last_day)).isoformat()
+        total = rng.randint(3, 600) * 50
+        item = rng.choice(AMAZON_ITEMS)
+        status = rng.choices(("ok", "no_receipt", "gift_card", "error"), weights=(90, 4, 2, 4))[0]
+        pdf_path = pdf_dir / f"{order_date}_amazon_{order_id}.pdf"
+        has_pdf = status == "ok" and sizes.pdfs
+        if has_pdf:
+            _receipt_pdf(pdf_path, title="Amazon.co.jp Receipt", order_id=order_id, order_date=order_date, total_yen=total, item=item)
+        row: dict[str, Any] = {
+            "order_id": order_id,
+            "order_date": order_date,
+            "total_yen": total,
+            "order_total_yen": total,
+            "item_name": item,
+            "payment_method": rng.choice(("クレジットカード", "Amazonギフトカード")),
+            "source": "amazon",
+            "detail_url": f"https://www.amazon.co.jp/gp/your-account/order-details?orderID={order_id}",
+            "receipt_url": f"https://www.amazon.co.jp/gp/css/summary/print.html?orderID={order_id}" if status == "ok" else None,
+            "pdf_path": str(pdf_path) if has_pdf else None,
+            "doc_type": "receipt" if status == "ok" else None,
+            "status": status,
+            "history_only_flow": True,
+        }
+        if status in {"no_receipt", "gift_card"}:
+            row["include"] = False
+        if status == "gift_card":
+            row["gift_card"] = True
+        rows.append(row)
+    return rows
+
+
+def _rakuten_orders(rng: random.Random, root: Path, year: int, month: int, sizes: MonthSizes) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    pdf_dir = root / "rakuten" / "pdfs"
+    last_day = _days_in_month(year, month)
+    for _ in range(sizes.rakuten_orders):
+        day = rng.randint(1, last_day)
+        order_id = f"{rng.randint(100000, 399999)}-{year:04d}{month:02d}{day:02d}-{rng.randint(0, 9999999999):010d}"
+        order_date = date(year, month, day).isoformat()
+        total = rng.randint(5, 400) * 100
+        item = rng.choice(RAKUTEN_ITEMS)
+        pdf_path = pdf_dir / f"{order_date}_rakuten_{order_id}.pdf"
+        if sizes.pdfs:
+            _receipt_pdf(pdf_path, title="Rakuten Ichiba Receipt", order_id=order_id, order_date=order_date, total_yen=total, item=item)
+        rows.append(
+            {
+                "order_id": order_id,
+                "order_date": order_date,
+                "total_yen": total,
+                "item_name": item,
+                "source": "rakuten",
+                "detail_url": f"https://order.my.rakuten.co.jp/?order_number={order_id}",
+                "pdf_path": str(pdf_path) if sizes.pdfs else None,
+                "status": "ok",
+            }
+        )
+    return rows
+
+
+def _manual_orders(rng: random.Random, root: Path, year: int, month: int, sizes: MonthSizes) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    pdf_dir = root / "manual" / "pdfs"
+    last_day = _days_in_month(year, month)
+    for index in range(sizes.manual_orders):
+        provider = rng.choice(MANUAL_PROVIDERS)
+        order_id = f"MANUAL-{year:04d}{month:02d}-{index:04d}"
+        order_date = date(year, month, rng.randint(1, last_day)).isoformat()
+        # USD subscriptions: the yen amount rarely equals the MF card amount.
+        total = rng.choice((2800, 3000, 3100, 3300, 4500))
+        pdf_path = pdf_dir / f"{order_date}_{provider}_{index:04d}.pdf"
+        if sizes.pdfs:
+            _receipt_pdf(pdf_path, title=f"{PROVIDER_VENDORS[provider]} Invoice", order_id=order_id, order_date=order_date, total_yen=total, item=provider)
+        rows.append(
+            {
+                "source": "manual",
+                "provider": provider,
+                "source_hint": provider,
+                "ingestion_channel": "provider_inbox",
+                "order_id": order_id,
+                "order_date": order_date,
+                "total_yen": total,
+                "order_total_yen": total,
+                "item_name": f"{PROVIDER_VENDORS[provider]} subscription",
+                "status": "ok",
+                "doc_type": "provider_upload",
+                "pdf_path": str(pdf_path) if sizes.pdfs else None,
+                "include": True,
+                "import_source_name": pdf_path.name,
+            }
+        )
+    return rows
+
+
+def _mf_expenses(
+    rng: random.Random,
+    year: int,
+    month: int,
+    sizes: MonthSizes,
+    orders: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    last_day = _days_in_month(year, month)
+    payable = [order for order in orders if order.get("include") is not False]
+    for index in range(sizes.mf_expenses):
+        expense_id = f"MF-{year:04d}{month:02d}-{index:05d}"
+        use_day = rng.randint(1, last_day)
+        amount = rng.randint(3, 600) * 50
+        vendor = rng.choice(NOISE_VENDORS)
+        roll = rng.random()
+        if payable and roll < 0.7:
+            # Card charges land a few days after the order, with the store as vendor.
+            order = rng.choice(payable)
+            order_day = int(str(order["order_date"])[8:10])
+            use_day = min(last_day, order_day + rng.choice((0, 0, 1, 2, 3)))
+            amount = int(order["total_yen"])
+            if order["source"] == "manual":
+                vendor = PROVIDER_VENDORS[str(order["provider"])]
+                use_day = order_day
+                amount += rng.choice((0, 120, -80))
+            else:
+                vendor = SOURCE_VENDORS[str(order["source"])]
+        row: dict[str, Any] = {
+            "expense_id": expense_id,
+            "use_date": date(year, month, use_day).isoformat(),
+            "amount_yen": amount,
+            "vendor": vendor,
+            "memo": f"{vendor} 利用分",
+            "has_evidence": rng.random() < 0.15,
+            "detail_url": f"https://expense.moneyforward.com/outgo_input/{expense_id}",
+        }
+        if rng.random() < 0.02:
+            row["use_date"] = None
+        elif rng.random() < 0.02:
+            row["amount_yen"] = None
+        rows.append(row)
+    return rows
+
+
+def _audit_rows(rng: random.Random, year: int, month: int, sizes: MonthSizes, root: Path) -> list[dict[str, Any]]:
+    ym = _ym_to_dirname(year, month)
+    start = datetime(year, month, 1, 9, 0, 0) + timedelta(days=_days_in_month(year, month))
+    rows: list[dict[str, Any]] = []
+    for index in range(sizes.audit_events):
+        ts = start + timedelta(minutes=7 * index)
+        event_type, action = rng.choice(
+            (
+                ("run", "amazon_download"),
+                ("run", "mf_reconcile"),
+                ("exclusions", "save"),
+                ("print", "prepare"),
+                ("print", "complete"),
+                ("archive", "manual_archive"),
+            )
+        )
+        row: dict[str, Any] = {
+            "ts": ts.isoformat(timespec="seconds"),
+            "ym": ym,
+            "year": year,
+            "month": month,
+            "event_type": event_type,
+            "action": action,
+            "status": rng.choices(("success", "failed"), weights=(9, 1))[0],
+            "actor": {"channel": "dashboard", "id": "bench"},
+        }
+        if event_type == "archive":
+            row["details"] = {"archived_to": str(root / "_archive" / ts.strftime("%Y%m%d_%H%M%S"))}
+        rows.append(row)
+    return rows
+
+
+def _write_runs(rng: random.Random, runs_root: Path, year: int, month: int, sizes: MonthSizes) -> int:
+    base = datetime(year, month, 1, 8, 0, 0) + timedelta(days=_days_in_month(year, month))
+    for index in range(sizes.runs):
+        started = base + timedelta(minutes=23 * index, microseconds=index)
+        run_id = f"run_{started.strftime('%Y%m%d_%H%M%S_%f')}"
+        mode = rng.choice(RUN_MODES)
+        failed = rng.random() < 0.1
+        log_path = runs_root / f"{run_id}.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text(
+            "".join(f"[run] {mode} step {step} ok\n" for step in range(rng.randint(5, 40)))
+            + ("[run] failed: synthetic error\n" if failed else "[run] done\n"),
+            encoding="utf-8",
+        )
+        _write_json(
+            runs_root / f"{run_id}.json",
+            {
+                "run_id": run_id,
+                "status": "failed" if failed else "success",
+                "started_at": started.isoformat(timespec="seconds"),
+                "finished_at": (started + timedelta(seconds=rng.randint(20, 900))).isoformat(timespec="seconds"),
+                "pid": None,
+                "returncode": 1 if failed else 0,
+                "actor": {"channel": "dashboard", "id": "bench"},
+                "log_path": str(log_path),
+                "cmd": ["python", "-u", "scripts/run.py", "--year", str(year), "--month", str(month)],
+                "params": {"year": year, "month": month, "mode": mode},
+            },
+        )
+    return sizes.runs
+
+
+def generate_month(
+    artifact_root: Path,
+    year: int,
+    month: int,
+    *,
+    sizes: MonthSizes = MonthSizes(),
+    seed: int = 0,
+    with_reports: bool = True,
+) -> dict[str, Any]:
+    """
+    Write one synthetic month under `artifact_root/YYYY-MM` plus its runs in
+    `artifact_root/_runs`. The same seed and sizes give byte-identical files.
+    """
+    rng = random.Random(f"{seed}:{year:04d}-{month:02d}")
+    root = artifact_root / _ym_to_dirname(year, month)
+    amazon = _amazon_orders(rng, root, year, month, sizes)
+    rakuten = _rakuten_orders(rng, root, year, month, sizes)
+    manual = _manual_orders(rng, root, year, month, sizes)
+    expenses = _mf_expenses(rng, year, month, sizes, [*amazon, *rakuten, *manual])
+    _write_jsonl(root / "amazon" / "orders.jsonl", amazon)
+    _write_jsonl(root / "rakuten" / "orders.jsonl", rakuten)
+    _write_jsonl(root / "manual" / "orders.jsonl", manual)
+    _write_jsonl(root / "mfcloud" / "expenses.jsonl", expenses)
+
+    reports_dir = root / "reports"
+    excluded = rng.sample(amazon, k=min(len(amazon), max(0, len(amazon) // 50)))
+    _write_json(
+        reports_dir / "exclude_orders.json",
+        {"exclude": [{"source": "amazon", "order_id": order["order_id"]} for order in excluded]},
+    )
+    _write_jsonl(reports_dir / "audit_log.jsonl", _audit_rows(rng, year, month, sizes, root))
+    _write_json(
+        root / "run_config.resolved.json",
+        {"year": year, "month": month, "dry_run": True, "output_root": str(root), "synthetic": True},
+    )
+    runs = _write_runs(rng, artifact_root / "_runs", year, month, sizes)
+
+    counts: dict[str, Any] = {}
+    if with_reports:
+        data = reconcile(
+            orders=load_orders(
+                amazon_orders_jsonl=root / "amazon" / "orders.jsonl",
+                rakuten_orders_jsonl=root / "rakuten" / "orders.jsonl",
+                manual_orders_jsonl=root / "manual" / "orders.jsonl",
+                exclude_orders_json=reports_dir / "exclude_orders.json",
+            ),
+            mf_expenses=load_mf_expenses(root / "mfcloud" / "expenses.jsonl"),
+            year=year,
+            month=month,
+            date_window_days=7,
+            max_candidates_per_mf=5,
+        )
+        write_reports(
+            data,
+            out_json=reports_dir / "missing_evidence_candidates.json",
+            out_csv=reports_dir / "missing_evidence_candidates.csv",
+        )
+        counts = data["counts"]
+
+    return {
+        "ym": _ym_to_dirname(year, month),
+        "root": str(root),
+        "amazon_orders": len(amazon),
+        "rakuten_orders": len(rakuten),
+        "manual_orders": len(manual),
+        "mf_expenses": len(expenses),
+        "runs": runs,
+        "audit_events": sizes.audit_events,
+        "reconcile_counts": counts,
+    }
+
+
+def generate_months(
+    ax_home: Path,
+    *,
+    end: tuple[int, int],
+    months: int = 1,
+    sizes: MonthSizes = MonthSizes(),
+    seed: int = 0,
+    with_reports: bool = True,
+) -> dict[str, Any]:
+    """Generate `months` consecutive months ending at `end` under `ax_home`."""
+    artifact_root = ax_home / "artifacts" / SKILL_SLUG
+    index = end[0] * 12 + end[1] - 1
+    generated = [
+        generate_month(
+            artifact_root,
+            (index - offset) // 12,
+            (index - offset) % 12 + 1,
+            sizes=sizes,
+            seed=seed,
+            with_reports=with_reports,
+        )
+        for offset in reversed(range(max(1, int(months))))
+    ]
+    return {
+        "ax_home": str(ax_home),
+        "artifact_root": str(artifact_root),
+        "seed": seed,
+        "sizes": asdict(sizes),
+        "months": generated,
+    }
+
+
+def _parse_ym(value: str) -> tuple[int, int]:
+    try:
+        year, month = (int(part) for part in str(value).split("-", 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}") from None
+    if not 1 <= month <= 12:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}")
+    return year, month
+
+
+def add_size_arguments(ap: argparse.ArgumentParser) -> None:
+    defaults = MonthSizes()
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply every per-month size below")
+    for name in ("amazon_orders", "rakuten_orders", "manual_orders", "mf_expenses", "runs", "audit_events"):
+        ap.add_argument(f"--{name.replace('_', '-')}", type=int, default=getattr(defaults, name))
+    ap.add_argument("--no-pdfs", action="store_true", help="skip writing receipt PDFs")
+
+
+def sizes_from_args(args: argparse.Namespace) -> MonthSizes:
+    sizes = MonthSizes(
+        amazon_orders=args.amazon_orders,
+        rakuten_orders=args.rakuten_orders,
+        manual_orders=args.manual_orders,
+        mf_expenses=args.mf_expenses,
+        runs=args.runs,
+        audit_events=args.audit_events,
+        pdfs=not args.no_pdfs,
+    )
+    return sizes.scaled(args.scale) if args.scale != 1.0 else sizes
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--ax-home", required=True, help="AX_HOME to write into (use a scratch directory)")
+    ap.add_argument("--end", type=_parse_ym, default=(2026, 1), help="last month (YYYY-MM)")
+    ap.add_argument("--months", type=int, default=1)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--no-reports", action="store_true", help="do not run reconcile for each month")
+    add_size_arguments(ap)
+    args = ap.parse_args(argv)
+
+    summary = generate_months(
+        Path(args.ax_home).expanduser(),
+        end=args.end,
+        months=int(args.months),
+        sizes=sizes_from_args(args),
+        seed=int(args.seed),
+        with_reports=not args.no_reports,
+    )
+    print(json.dumps({"status": "success", "data": summary}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
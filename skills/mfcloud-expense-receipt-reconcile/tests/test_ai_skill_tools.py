@@ -256,3 +256,51 @@ def test_execute_skill_reads_ax_home_secrets_env(monkeypatch: pytest.MonkeyPatch
     assert str(result.get("stdout") or "").strip() == "from_ax_home"
     assert result["required_env_keys"] == ["AXHOME_KEY"]
     assert result["injected_env_keys"] == ["AXHOME_KEY"]
+
+
+def test_list_skills_serves_registry_until_skill_tree_changes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import os
+
+    skills_root = tmp_path / "skills"
+    _write_skill(skills_root, "alpha", name="alpha", description="first", with_runner=True)
+    (skills_root / "alpha" / "SKILL.md").write_text(
+        "---\nname: alpha\ndescription: first\n---\n\n## Steps\n- open the report\n- check totals\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("AX_HOME", str(tmp_path / "ax-home"))
+    monkeypatch.setattr(ai_skill_tools, "_skills_root", lambda: skills_root)
+    monkeypatch.setattr(ai_skill_tools, "SKILL_REGISTRY_CHECK_INTERVAL_SECONDS", 0.0)
+    monkeypatch.delenv(ai_skill_tools.ALLOWLIST_ENV, raising=False)
+
+    parsed: list[Path] = []
+    real_parse = ai_skill_tools._parse_front_matter
+
+    def _counting_parse(path: Path) -> dict[str, str]:
+        parsed.append(path)
+        return real_parse(path)
+
+    monkeypatch.setattr(ai_skill_tools, "_parse_front_matter", _counting_parse)
+
+    rows = ai_skill_tools.list_skills()
+    assert [row["id"] for row in rows] == ["alpha"]
+    assert len(parsed) == 1
+    assert ai_skill_tools.list_skills() == rows
+    assert len(parsed) == 1
+
+    routing = ai_skill_tools.skill_routing_index(ai_skill_tools.list_skills())
+    assert routing["ids"] == ("alpha",)
+    assert routing["guidance_steps"]["alpha"] == ["open the report", "check totals"]
+
+    _write_skill(skills_root, "tools/beta", name="beta", description="second")
+    assert {row["id"] for row in ai_skill_tools.list_skills()} == {"alpha", "beta"}
+
+    skill_md = skills_root / "alpha" / "SKILL.md"
+    skill_md.write_text("---\nname: alpha\ndescription: edited\n---\n", encoding="utf-8")
+    stat = skill_md.stat()
+    os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    by_id = {row["id"]: row for row in ai_skill_tools.list_skills()}
+    assert by_id["alpha"]["description"] == "edited"
+
+    ai_skill_tools.set_skill_permission("alpha", False)
+    by_id = {row["id"]: row for row in ai_skill_tools.list_skills()}
+    assert by_id["alpha"]["allowed"] is False
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import io
 import json
 from pathlib import Path
 from typing import Any
-from urllib import error as url_error
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -15,19 +13,22 @@ from dashboard.routes import api_ai_chat_routes
 from dashboard.services import ai_chat
 from dashboard.services import ai_skill_router
 
+# The routes import services under the top-level "services" package, so the
+# backend has to be installed on that module instance.
+ai_model_client = api_ai_chat_routes.ai_chat.ai_model_client
 
-class _FakeUrlResponse:
-    def __init__(self, payload: dict[str, Any]) -> None:
-        self._raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
 
-    def read(self) -> bytes:
-        return self._raw
+@pytest.fixture(autouse=True)
+def _reset_model_backend(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(ai_model_client.MODEL_BACKEND_ENV, raising=False)
+    yield
+    ai_model_client.set_backend(None)
 
-    def __enter__(self) -> "_FakeUrlResponse":
-        return self
 
-    def __exit__(self, exc_type, exc, tb) -> bool:
-        return False
+def _use_fake_backend(responder=None, **kwargs: Any):
+    backend = ai_model_client.FakeModelBackend(responder, **kwargs)
+    ai_model_client.set_backend(backend)
+    return backend
 
 
 def _create_client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> TestClient:
@@ -123,10 +124,9 @@ def test_api_ai_chat_success_returns_reply_and_usage(
     _set_chat_env(monkeypatch, api_key="test-key", model="gemini-2.0-flash")
     captured_payload: dict[str, Any] = {}
 
-    def _fake_urlopen(req, timeout: int = 0):
-        del timeout
-        captured_payload.update(json.loads(req.data.decode("utf-8")))
-        return _FakeUrlResponse(
+    def _respond(body: dict[str, Any]) -> dict[str, Any]:
+        captured_payload.update(body)
+        return (
             {
                 "candidates": [
                     {
@@ -146,7 +146,7 @@ def test_api_ai_chat_success_returns_reply_and_usage(
             }
         )
 
-    monkeypatch.setattr(ai_chat.url_request, "urlopen", _fake_urlopen)
+    _use_fake_backend(_respond)
 
     res = client.post(
         "/api/ai/chat",
@@ -164,7 +164,7 @@ def test_api_ai_chat_success_returns_reply_and_usage(
     assert res.status_code == 200
     body = res.json()
     assert body["status"] == "ok"
-    assert body["provider"] == "gemini"
+    assert body["provider"] == "fake"
     assert body["model"] == "gemini-2.0-flash"
     assert body["reply"] == {"role": "assistant", "content": "Answer A / Answer B"}
     assert body["usage"] == {"prompt_tokens": 12, "completion_tokens": 7, "total_tokens": 19}
@@ -182,9 +182,9 @@ def test_api_ai_chat_enforce_mode_replaces_invalid_reply_format(
     client = _create_client(monkeypatch, tmp_path)
     _set_chat_env(monkeypatch, api_key="test-key", guardrail_mode="enforce")
 
-    def _fake_urlopen(req, timeout: int = 0):
-        del req, timeout
-        return _FakeUrlResponse(
+    def _respond(body: dict[str, Any]) -> dict[str, Any]:
+        del body
+        return (
             {
                 "candidates": [
                     {
@@ -203,7 +203,7 @@ def test_api_ai_chat_enforce_mode_replaces_invalid_reply_format(
             }
         )
 
-    monkeypatch.setattr(ai_chat.url_request, "urlopen", _fake_urlopen)
+    _use_fake_backend(_respond)
 
     res = client.post(
         "/api/ai/chat",
@@ -285,17 +285,11 @@ def test_api_ai_chat_returns_502_on_upstream_http_error(
     client = _create_client(monkeypatch, tmp_path)
     _set_chat_env(monkeypatch, api_key="test-key")
 
-    def _fake_urlopen(*args: Any, **kwargs: Any):
-        del args, kwargs
-        raise url_error.HTTPError(
-            url="https://example.invalid",
-            code=500,
-            msg="Internal Server Error",
-            hdrs=None,
-            fp=io.BytesIO(b'{"error":"upstream"}'),
-        )
+    def _respond(body: dict[str, Any]) -> dict[str, Any]:
+        del body
+        raise ai_model_client.ModelHTTPError(500, '{"error":"upstream"}')
 
-    monkeypatch.setattr(ai_chat.url_request, "urlopen", _fake_urlopen)
+    _use_fake_backend(_respond)
 
     res = client.post(
         "/api/ai/chat",
@@ -314,11 +308,11 @@ def test_api_ai_chat_returns_504_on_timeout(
     client = _create_client(monkeypatch, tmp_path)
     _set_chat_env(monkeypatch, api_key="test-key")
 
-    def _fake_urlopen(*args: Any, **kwargs: Any):
-        del args, kwargs
-        raise url_error.URLError(TimeoutError("timed out"))
+    def _respond(body: dict[str, Any]) -> dict[str, Any]:
+        del body
+        raise ai_model_client.ModelTimeoutError("timed out")
 
-    monkeypatch.setattr(ai_chat.url_request, "urlopen", _fake_urlopen)
+    _use_fake_backend(_respond)
 
     res = client.post(
         "/api/ai/chat",
@@ -779,3 +773,111 @@ def test_api_ai_chat_router_fallback_calls_standard_chat(
     body = res.json()
     assert body["provider"] == "gemini"
     assert body["reply"]["content"] == "fallback"
+
+
+def _sse_events(text: str) -> list[tuple[str, dict[str, Any]]]:
+    events = []
+    for frame in text.strip().split("\n\n"):
+        lines = frame.split("\n")
+        event = lines[0].removeprefix("event: ")
+        events.append((event, json.loads(lines[1].removeprefix("data: "))))
+    return events
+
+
+def test_ai_chat_caches_structured_prompts_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_chat_env(monkeypatch, api_key="test-key")
+    service = api_ai_chat_routes.ai_chat
+    backend = _use_fake_backend()
+    messages = [{"role": "user", "content": '{"task": "select skill"}'}]
+
+    first = service.chat(messages, {}, policy_profile=service.POLICY_PROFILE_STRUCTURED_JSON)
+    second = service.chat(messages, {}, policy_profile=service.POLICY_PROFILE_STRUCTURED_JSON)
+    assert first == second
+    assert len(backend.requests) == 1
+    assert backend.requests[0]["generationConfig"]["temperature"] == 0.0
+
+    service.chat(messages, {}, policy_profile=service.POLICY_PROFILE_DASHBOARD_CHAT_STRICT)
+    service.chat(messages, {}, policy_profile=service.POLICY_PROFILE_DASHBOARD_CHAT_STRICT)
+    assert len(backend.requests) == 3
+
+
+def test_api_ai_chat_stream_emits_deltas_then_done(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    _set_chat_env(monkeypatch, api_key=None)
+    monkeypatch.setenv(ai_model_client.MODEL_BACKEND_ENV, "fake")
+
+    status = client.get("/api/ai/chat/status").json()
+    assert status["ready"] is True
+    assert status["provider"] == "fake"
+
+    res = client.post(
+        "/api/ai/chat/stream",
+        json={"messages": [{"role": "user", "content": "hello"}], "page_context": {"path": "/"}},
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(res.text)
+    deltas = [data["text"] for event, data in events if event == "delta"]
+    assert len(deltas) > 1
+    assert events[-1][0] == "done"
+    done = events[-1][1]
+    assert done["status"] == "ok"
+    assert done["provider"] == "fake"
+    assert done["reply"]["content"] == "".join(deltas).strip()
+    assert done["reply"]["content"].startswith("回答: hello")
+
+
+def test_api_ai_chat_stream_holds_back_deltas_in_enforce_mode(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    _set_chat_env(monkeypatch, api_key="test-key", guardrail_mode="enforce")
+    raw = "This answer does not follow the required section format and streams in several chunks."
+
+    def _respond(body: dict[str, Any]) -> dict[str, Any]:
+        del body
+        return {"candidates": [{"content": {"parts": [{"text": raw}]}}]}
+
+    _use_fake_backend(_respond)
+
+    res = client.post(
+        "/api/ai/chat/stream",
+        json={"messages": [{"role": "user", "content": "確認したいです"}], "page_context": {"path": "/workspace"}},
+    )
+    assert res.status_code == 200
+    events = _sse_events(res.text)
+    assert [event for event, _ in events] == ["done"]
+    content = events[0][1]["reply"]["content"]
+    assert raw not in content
+    assert content.startswith("回答:")
+    assert "根拠:" in content and "不足情報:" in content
+
+
+def test_api_ai_chat_stream_reports_upstream_error_event(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    _set_chat_env(monkeypatch, api_key="test-key")
+
+    def _respond(body: dict[str, Any]) -> dict[str, Any]:
+        del body
+        raise ai_model_client.ModelHTTPError(500, "upstream")
+
+    _use_fake_backend(_respond)
+
+    res = client.post("/api/ai/chat/stream", json={"messages": [{"role": "user", "content": "test"}]})
+    assert res.status_code == 200
+    events = _sse_events(res.text)
+    assert events == [("error", {"status_code": 502, "detail": "Gemini API error: status=500 upstream"})]
+
+
+def test_api_ai_chat_stream_returns_503_when_key_missing(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    _set_chat_env(monkeypatch, api_key=None)
+
+    res = client.post("/api/ai/chat/stream", json={"messages": [{"role": "user", "content": "test"}]})
+    assert res.status_code == 503
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from pathlib import Path
 import subprocess
 import sys
 import threading
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -15,10 +17,12 @@ from pypdf import PdfWriter
 import pytest
 
 from dashboard.routes import api as api_routes
+from dashboard.routes import api_runs
 from dashboard.routes import api_workspace_routes
 from dashboard.services import ai_chat
 from dashboard.services import core_runs
 from services import core as public_core
+from services import core_runs as public_core_runs
 from services import core_scheduler as public_core_scheduler
 
 
@@ -42,6 +46,12 @@ def _workflow_event_retry_jobs_store(ax_home: Path) -> Path:
     return _artifact_root(ax_home) / "_workflow_events" / "retry_jobs.json"
 
 
+def _enable_state_snapshots(monkeypatch: pytest.MonkeyPatch) -> None:
+    # For tests that inspect scheduler_state.json / receipts.json / retry_jobs.json,
+    # which the state store only writes as an opt-in snapshot.
+    monkeypatch.setenv("AX_STATE_STORE_JSON_SNAPSHOT", "1")
+
+
 def _workflow_event_notification_settings_store(ax_home: Path) -> Path:
     return _artifact_root(ax_home) / "_workflow_events" / "notification_settings.json"
 
@@ -630,6 +640,149 @@ def test_api_stop_run_writes_audit(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
     assert last["run_id"] == run_id
 
 
+def _parse_sse_events(body: str) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    for block in body.split("\n\n"):
+        fields: dict[str, Any] = {}
+        for line in block.splitlines():
+            if not line or line.startswith(":"):
+                continue
+            key, _, value = line.partition(": ")
+            fields[key] = value
+        if "event" in fields:
+            fields["data"] = json.loads(fields.get("data") or "{}")
+            events.append(fields)
+    return events
+
+
+def test_api_run_stream_replays_finished_log_and_resumes_from_offset(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    run_id = "run_20260206_130000"
+    runs_dir = _artifact_root(tmp_path) / "_runs"
+    log_path = runs_dir / f"{run_id}.log"
+    _touch(log_path, "first line\nsecond line\n")
+    meta = {
+        "run_id": run_id,
+        "status": "success",
+        "returncode": 0,
+        "pid": None,
+        "log_path": str(log_path),
+        "params": {"year": 2026, "month": 1, "mode": "amazon_download"},
+    }
+    _write_json(runs_dir / f"{run_id}.json", meta)
+
+    res = client.get(f"/api/runs/{run_id}/stream")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse_events(res.text)
+    assert [e["event"] for e in events] == ["status", "log", "end"]
+    assert events[0]["data"]["run"]["status"] == "success"
+    assert events[1]["data"]["text"] == "first line\nsecond line\n"
+    end_offset = log_path.stat().st_size
+    assert events[1]["id"] == str(end_offset)
+    assert events[2]["data"] == {"status": "success", "offset": end_offset}
+
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write("third line")
+    res = client.get(f"/api/runs/{run_id}/stream", headers={"Last-Event-ID": str(end_offset)})
+    logs = [e for e in _parse_sse_events(res.text) if e["event"] == "log"]
+    assert [e["data"]["text"] for e in logs] == ["third line"]
+
+    res = client.get(f"/api/runs/{run_id}/stream", params={"offset": 11})
+    logs = [e for e in _parse_sse_events(res.text) if e["event"] == "log"]
+    assert "".join(e["data"]["text"] for e in logs) == "second line\nthird line"
+
+    assert client.get("/api/runs/run_20260206_999999/stream").status_code == 404
+
+
+def test_api_run_timing_reads_json_next_to_run_log(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    run_id = "run_20260206_150000"
+    runs_dir = _artifact_root(tmp_path) / "_runs"
+    _write_json(runs_dir / f"{run_id}.json", {"run_id": run_id, "status": "success", "log_path": str(runs_dir / f"{run_id}.log")})
+
+    assert client.get(f"/api/runs/{run_id}/timing").status_code == 404
+    timing = {"version": 1, "status": "success", "duration_ms": 12.5, "spans": [{"id": 1, "name": "pipeline"}]}
+    _write_json(runs_dir / f"{run_id}.timing.json", timing)
+    res = client.get(f"/api/runs/{run_id}/timing")
+    assert res.status_code == 200
+    assert res.json() == {"run_id": run_id, "timing": timing}
+    assert client.get("/api/runs/run_20260206_999999/timing").status_code == 404
+
+
+def test_api_run_stream_follows_running_log_until_status_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    run_id = "run_20260206_140000"
+    runs_dir = _artifact_root(tmp_path) / "_runs"
+    log_path = runs_dir / f"{run_id}.log"
+    meta_path = runs_dir / f"{run_id}.json"
+    _touch(log_path, "booting\n")
+    meta = {
+        "run_id": run_id,
+        "status": "running",
+        "pid": os.getpid(),
+        "log_path": str(log_path),
+        "params": {"year": 2026, "month": 1, "mode": "amazon_download"},
+    }
+    _write_json(meta_path, meta)
+
+    def _finish_run() -> None:
+        with log_path.open("a", encoding="utf-8") as f:
+            f.write("downloading\npartial")
+        threading.Event().wait(0.3)
+        with log_path.open("a", encoding="utf-8") as f:
+            f.write(" tail\n")
+        _write_json(meta_path, {**meta, "status": "success", "returncode": 0})
+
+    timer = threading.Timer(0.2, _finish_run)
+    timer.start()
+    try:
+        res = client.get(f"/api/runs/{run_id}/stream")
+    finally:
+        timer.join()
+
+    events = _parse_sse_events(res.text)
+    kinds = [e["event"] for e in events]
+    assert kinds[0] == "status" and kinds[-1] == "end"
+    assert [e["data"]["run"]["status"] for e in events if e["event"] == "status"] == ["running", "success"]
+    text = "".join(e["data"]["text"] for e in events if e["event"] == "log")
+    assert text == "booting\ndownloading\npartial tail\n"
+    assert events[-1]["data"]["offset"] == log_path.stat().st_size
+
+
+def test_run_log_stream_stops_when_client_disconnects(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _create_client(monkeypatch, tmp_path)
+    run_id = "run_20260206_160000"
+    runs_dir = _artifact_root(tmp_path) / "_runs"
+    log_path = runs_dir / f"{run_id}.log"
+    meta_path = runs_dir / f"{run_id}.json"
+    _touch(log_path, "booting\n")
+    meta = {"run_id": run_id, "status": "running", "pid": os.getpid(), "log_path": str(log_path)}
+    _write_json(meta_path, meta)
+
+    class _Request:
+        checks = 0
+
+        async def is_disconnected(self) -> bool:
+            self.checks += 1
+            return self.checks > 2
+
+    async def _collect() -> list[str]:
+        stream = api_runs._iter_run_log_events(_Request(), meta_path, meta, 0, poll_seconds=0.01, max_seconds=60)
+        return [chunk async for chunk in stream]
+
+    started = time.monotonic()
+    chunks = asyncio.run(_collect())
+    assert time.monotonic() - started < 5
+    events = _parse_sse_events("".join(chunks))
+    assert [e["event"] for e in events] == ["status", "log"]
+    assert events[1]["data"]["text"] == "booting\n"
+
+
 def test_api_step_reset_download_clears_source_and_mf_reports(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     client = _create_client(monkeypatch, tmp_path)
     ym = "2026-01"
@@ -747,6 +900,87 @@ def test_api_step_reset_download_removes_exclusion_file_when_only_target_source(
     assert not (reports_dir / "exclude_orders.json").exists()
 
 
+def test_api_reconcile_rows_pages_filters_and_sorts(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    ym = "2026-01"
+    reports = _reports_dir(tmp_path, ym)
+    rows = [
+        {
+            "mf_expense_id": f"MF-{index:03d}",
+            "mf_use_date": f"2026-01-{(index % 28) + 1:02d}" if index % 10 else None,
+            "mf_amount_yen": 1000 + index * 10,
+            "mf_vendor": "Amazon.co.jp" if index % 2 else "楽天市場",
+            "mf_memo": f"memo {index}",
+            "row_type": "candidate" if index % 3 else "needs_review",
+            "review_reason": None if index % 3 else "no_candidate_in_window",
+        }
+        for index in range(120)
+    ]
+    _write_json(reports / "missing_evidence_candidates.json", {"counts": {"mf_missing_evidence": 120}, "rows": rows})
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        url = f"/api/reconcile-rows/{ym}?limit=50" + (f"&cursor={cursor}" if cursor else "")
+        res = client.get(url)
+        assert res.status_code == 200
+        body = res.json()
+        assert body["total"] == 120
+        seen.extend(row["mf_expense_id"] for row in body["rows"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert seen == [row["mf_expense_id"] for row in rows]
+    assert (reports / "missing_evidence_rows.index.json").exists()
+
+    res = client.get(
+        f"/api/reconcile-rows/{ym}",
+        params={"vendor": "amazon", "amount_min": 1500, "amount_max": 1900, "sort": "amount", "order": "desc"},
+    )
+    body = res.json()
+    amounts = [row["mf_amount_yen"] for row in body["rows"]]
+    assert body["matched"] == len(amounts) == 20
+    assert amounts == sorted(amounts, reverse=True)
+    assert all(row["mf_vendor"] == "Amazon.co.jp" for row in body["rows"])
+    assert body["rows"][0]["mf_amount_label"] == "1,890円"
+
+    res = client.get(
+        f"/api/reconcile-rows/{ym}",
+        params={"status": "needs_review", "date_from": "2026-01-05", "date_to": "2026-01-10", "sort": "use_date"},
+    )
+    body = res.json()
+    dates = [row["mf_use_date"] for row in body["rows"]]
+    assert dates and dates == sorted(dates)
+    assert all("2026-01-05" <= value <= "2026-01-10" for value in dates)
+    assert all(row["row_type"] == "needs_review" for row in body["rows"])
+
+    first = client.get(f"/api/reconcile-rows/{ym}?limit=10&sort=amount").json()
+    mismatch = client.get(f"/api/reconcile-rows/{ym}?limit=10&sort=vendor&cursor={first['next_cursor']}")
+    assert mismatch.status_code == 400
+    assert client.get(f"/api/reconcile-rows/{ym}?sort=bogus").status_code == 400
+    assert client.get("/api/reconcile-rows/2025-12").status_code == 404
+
+
+def test_api_reconcile_rows_cursor_is_rejected_after_report_regenerates(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    ym = "2026-01"
+    report = _reports_dir(tmp_path, ym) / "missing_evidence_candidates.json"
+    rows = [{"mf_expense_id": f"MF-{index:03d}", "mf_amount_yen": 1000 + index} for index in range(30)]
+    _write_json(report, {"counts": {}, "rows": rows})
+
+    first = client.get(f"/api/reconcile-rows/{ym}?limit=10").json()
+    assert client.get(f"/api/reconcile-rows/{ym}?limit=10&cursor={first['next_cursor']}").status_code == 200
+
+    # A regenerated report shifts positions; the old cursor must not be reused.
+    _write_json(report, {"counts": {}, "rows": [{"mf_expense_id": "MF-NEW", "mf_amount_yen": 1}, *rows]})
+    stale = client.get(f"/api/reconcile-rows/{ym}?limit=10&cursor={first['next_cursor']}")
+    assert stale.status_code == 409
+    restarted = client.get(f"/api/reconcile-rows/{ym}?limit=10").json()
+    assert restarted["rows"][0]["mf_expense_id"] == "MF-NEW"
+
+
 def test_api_steps_returns_mf_summary(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     client = _create_client(monkeypatch, tmp_path)
     ym = "2026-01"
@@ -820,38 +1054,22 @@ def test_api_archive_success_with_include_pdfs_and_audit(monkeypatch: pytest.Mon
     client = _create_client(monkeypatch, tmp_path)
     ym = "2026-01"
     reports = _reports_dir(tmp_path, ym)
+    root = _artifact_root(tmp_path) / ym
     _write_json(
         reports / "workflow.json",
         {"amazon": {"confirmed_at": "2026-02-08T10:00:00", "printed_at": "2026-02-08T10:10:00"}},
     )
     _touch(reports / "quality_gate.json", "{}")
-
-    calls: list[list[str]] = []
-
-    def _fake_run(cmd: Any, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
-        calls.append([str(c) for c in cmd])
-        return subprocess.CompletedProcess(
-            args=cmd,
-            returncode=0,
-            stdout=(
-                "Archived to: C:\\archive\\20260208_101530\n"
-                "Archive zip: C:\\archive\\20260208_101530\\full_snapshot.zip\n"
-                "Archive manifest: C:\\archive\\20260208_101530\\manifest.json\n"
-                "Archive checksums: C:\\archive\\20260208_101530\\checksums.sha256\n"
-                "Cleanup report: \n"
-                "Cleanup removed: 0\n"
-            ),
-            stderr="",
-        )
-
-    monkeypatch.setattr(core_runs.subprocess, "run", _fake_run)
+    _touch(root / "amazon" / "pdfs" / "AMZ-1.pdf", "%PDF-1.4\n")
+    _touch(root / "manual" / "inbox" / "pending.pdf", "%PDF-1.4\n")
 
     res = client.post("/api/archive/2026-01")
     assert res.status_code == 200
     body = res.json()
     assert body["status"] == "ok"
     assert body["ym"] == "2026-01"
-    assert body["archived_to"] == "C:\\archive\\20260208_101530"
+    archived_to = Path(body["archived_to"])
+    assert archived_to.parent == root / "archive"
     assert body["include_pdfs"] is True
     assert body["include_debug"] is False
     assert body["cleanup"] is False
@@ -863,13 +1081,15 @@ def test_api_archive_success_with_include_pdfs_and_audit(monkeypatch: pytest.Mon
     assert body["history_entry"]["action"] == "manual_archive"
     assert body["history_entry"]["archive_url"] == "/runs/2026-01/archived-receipts"
 
-    assert calls
-    cmd = calls[0]
-    assert any("archive_outputs.ps1" in part for part in cmd)
-    assert "-IncludePdfs" in cmd
-    assert "-IncludeDebug" not in cmd
-    assert "-NoCleanup" in cmd
-    assert "-Cleanup" not in cmd
+    assert (archived_to / "amazon" / "pdfs" / "AMZ-1.pdf").read_text(encoding="utf-8") == "%PDF-1.4\n"
+    assert (root / "manual" / "inbox" / "pending.pdf").exists()
+    manifest = json.loads(Path(body["archive_manifest"]).read_text(encoding="utf-8"))
+    assert manifest["ym"] == "2026-01"
+    assert manifest["options"] == {"include_pdfs": True, "include_debug": False, "cleanup": False}
+    assert "archive" not in manifest["source_top_level"]
+    checksums = Path(body["archive_checksums"]).read_text(encoding="utf-8")
+    assert "  amazon/pdfs/AMZ-1.pdf\n" in checksums
+    assert "  full_snapshot.zip\n" in checksums
 
     entries = _read_audit_entries(tmp_path, ym)
     archive_events = [e for e in entries if e.get("event_type") == "archive"]
@@ -878,7 +1098,7 @@ def test_api_archive_success_with_include_pdfs_and_audit(monkeypatch: pytest.Mon
     assert last["action"] == "manual_archive"
     assert last["status"] == "success"
     details = last.get("details") or {}
-    assert details.get("archived_to") == "C:\\archive\\20260208_101530"
+    assert details.get("archived_to") == body["archived_to"]
     assert details.get("include_pdfs") is True
     assert details.get("include_debug") is False
     assert details.get("cleanup") is False
@@ -912,20 +1132,6 @@ def test_api_archive_writes_excluded_pdfs_manifest(monkeypatch: pytest.MonkeyPat
         + "\n",
     )
 
-    def _fake_run(cmd: Any, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
-        return subprocess.CompletedProcess(
-            args=cmd,
-            returncode=0,
-            stdout=(
-                "Archived to: C:\\archive\\20260208_101530\n"
-                "Cleanup report: \n"
-                "Cleanup removed: 0\n"
-            ),
-            stderr="",
-        )
-
-    monkeypatch.setattr(core_runs.subprocess, "run", _fake_run)
-
     res = client.post("/api/archive/2026-01")
     assert res.status_code == 200
     body = res.json()
@@ -963,23 +1169,10 @@ def test_api_month_close_runs_archive_with_cleanup_and_writes_audit(
         },
     )
     _touch(reports / "quality_gate.json", "{}")
-
-    calls: list[list[str]] = []
-
-    def _fake_run(cmd: Any, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
-        calls.append([str(c) for c in cmd])
-        return subprocess.CompletedProcess(
-            args=cmd,
-            returncode=0,
-            stdout=(
-                "Archived to: C:\\archive\\20260208_101530\n"
-                "Cleanup report: C:\\work\\2026-01\\reports\\archive_cleanup_report.json\n"
-                "Cleanup removed: 3\n"
-            ),
-            stderr="",
-        )
-
-    monkeypatch.setattr(core_runs.subprocess, "run", _fake_run)
+    root = _artifact_root(tmp_path) / ym
+    _touch(root / "manual" / "inbox" / "a.pdf", "%PDF-1.4\n")
+    _touch(root / "mf_bulk_upload" / "inbox" / "b.pdf", "%PDF-1.4\n")
+    _touch(root / "debug" / "trace" / "step.json", "{}")
 
     res = client.post("/api/month-close/2026-01")
     assert res.status_code == 200
@@ -991,10 +1184,14 @@ def test_api_month_close_runs_archive_with_cleanup_and_writes_audit(
     assert body["history_entry"]["action_label"] == "月次クローズ"
     assert body["history_entry"]["archive_url"] == "/runs/2026-01/archived-receipts"
 
-    assert calls
-    cmd = calls[0]
-    assert "-Cleanup" in cmd
-    assert "-NoCleanup" not in cmd
+    archived_to = Path(body["archived_to"])
+    assert (archived_to / "manual" / "inbox" / "a.pdf").exists()
+    assert (archived_to / "debug" / "trace" / "step.json").exists()
+    assert list((root / "manual" / "inbox").iterdir()) == []
+    assert list((root / "debug").iterdir()) == []
+    report = json.loads(Path(body["cleanup_report"]).read_text(encoding="utf-8"))
+    assert report["removed_total"] == 3
+    assert report["archived_to"] == body["archived_to"]
 
     entries = _read_audit_entries(tmp_path, ym)
     archive_events = [e for e in entries if e.get("event_type") == "archive"]
@@ -1031,21 +1228,13 @@ def test_api_month_close_rejects_when_checklist_is_incomplete(
     )
     _touch(reports / "quality_gate.json", "{}")
 
-    calls: list[list[str]] = []
-
-    def _fake_run(cmd: Any, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
-        calls.append([str(c) for c in cmd])
-        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
-
-    monkeypatch.setattr(core_runs.subprocess, "run", _fake_run)
-
     res = client.post("/api/month-close/2026-01")
     assert res.status_code == 409
     detail = str(res.json().get("detail") or "")
     assert "Month close checklist is incomplete" in detail
     assert "expense_submission" in detail
     assert "mf_accounting_link" in detail
-    assert not calls
+    assert not (_artifact_root(tmp_path) / ym / "archive").exists()
 
     entries = _read_audit_entries(tmp_path, ym)
     archive_events = [e for e in entries if e.get("event_type") == "archive"]
@@ -1077,7 +1266,7 @@ def test_api_archive_rejects_when_confirm_print_not_completed(
     assert "Workflow order violation" in str((last.get("details") or {}).get("reason"))
 
 
-def test_api_archive_script_failure_returns_500(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_api_archive_failure_returns_500(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     client = _create_client(monkeypatch, tmp_path)
     ym = "2026-01"
     reports = _reports_dir(tmp_path, ym)
@@ -1087,17 +1276,16 @@ def test_api_archive_script_failure_returns_500(monkeypatch: pytest.MonkeyPatch,
     )
     _touch(reports / "quality_gate.json", "{}")
 
-    def _fake_run(cmd: Any, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
-        return subprocess.CompletedProcess(args=cmd, returncode=1, stdout="OUT", stderr="ERR")
+    def _failing_archive(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        raise OSError("disk full")
 
-    monkeypatch.setattr(core_runs.subprocess, "run", _fake_run)
+    monkeypatch.setattr(public_core_runs, "_archive_month_outputs", _failing_archive)
 
     res = client.post("/api/archive/2026-01")
     assert res.status_code == 500
     detail = str(res.json().get("detail") or "")
-    assert "archive_outputs.ps1 failed" in detail
-    assert "stdout" in detail
-    assert "stderr" in detail
+    assert "archive failed" in detail
+    assert "disk full" in detail
 
     entries = _read_audit_entries(tmp_path, ym)
     archive_events = [e for e in entries if e.get("event_type") == "archive"]
@@ -2422,6 +2610,7 @@ def test_api_scheduler_state_get_returns_default(monkeypatch: pytest.MonkeyPatch
 
 def test_api_scheduler_state_post_persists_context_fields(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
 
     post_res = client.post(
         "/api/scheduler/state",
@@ -3209,6 +3398,7 @@ def test_api_scheduler_state_once_rearm_with_same_slot_is_idempotent(
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
     run_payloads: list[dict[str, Any]] = []
 
     def fake_start_run(payload: dict[str, Any]) -> dict[str, str]:
@@ -3275,6 +3465,7 @@ def test_scheduler_delete_timer_state_removes_once_receipts(
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
 
     def fake_start_run(payload: dict[str, Any]) -> dict[str, str]:
         return {"run_id": "run_001"}
@@ -4144,6 +4335,7 @@ def test_api_save_workflow_template_copy_mode_creates_new_template(monkeypatch:
 
 def test_api_save_workflow_template_copy_mode_copies_source_scheduler_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
     create_payload = {
         "name": "Alpha",
         "year": 2026,
@@ -4258,6 +4450,7 @@ def test_api_delete_workflow_template_removes_template_timer_and_clears_referenc
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
 
     create_res = client.post(
         "/api/workflow-templates",
@@ -4914,6 +5107,7 @@ def test_api_workflow_events_receipt_ttl_expires_duplicate_key(
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
     monkeypatch.setenv("AX_WORKFLOW_EVENT_RECEIPT_TTL_DAYS", "1")
     run_count = 0
 
@@ -4990,6 +5184,7 @@ def test_api_workflow_events_receipt_max_limit_from_env(
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
     monkeypatch.setenv("AX_WORKFLOW_EVENT_MAX_RECEIPTS", "2")
     monkeypatch.setenv("AX_WORKFLOW_EVENT_RECEIPT_TTL_DAYS", "3650")
     run_count = 0
@@ -5069,6 +5264,7 @@ def test_api_workflow_events_run_conflict_writes_classified_audit(
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
 
     def _fake_start_run(payload: dict[str, Any]) -> dict[str, Any]:
         raise HTTPException(status_code=409, detail="Another run is already in progress.")
@@ -5126,6 +5322,7 @@ def test_api_workflow_event_retry_jobs_drain_succeeds_and_marks_receipt(
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
     call_count = 0
 
     def _fake_start_run(payload: dict[str, Any]) -> dict[str, Any]:
@@ -5206,6 +5403,7 @@ def test_api_workflow_event_retry_jobs_drain_escalates_after_max_attempts(
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
     monkeypatch.setenv("AX_WORKFLOW_EVENT_RETRY_MAX_ATTEMPTS", "2")
     monkeypatch.setenv(
         "AX_GOOGLE_CHAT_WEBHOOK_URL",
@@ -5330,6 +5528,7 @@ def test_api_workflow_event_retry_jobs_drain_escalation_notification_failure_doe
     tmp_path: Path,
 ) -> None:
     client = _create_client(monkeypatch, tmp_path)
+    _enable_state_snapshots(monkeypatch)
     monkeypatch.setenv("AX_WORKFLOW_EVENT_RETRY_MAX_ATTEMPTS", "1")
     monkeypatch.setenv(
         "AX_GOOGLE_CHAT_WEBHOOK_URL",
@@ -5667,6 +5866,78 @@ def test_api_workflow_events_summary_returns_aggregated_counts(
     assert str(notification_recent[1].get("at") or "") == "2026-02-20T10:07:30"
 
 
+def test_api_workflow_events_summary_matches_across_sealed_segments(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    import audit_segment_common
+
+    client = _create_client(monkeypatch, tmp_path)
+    ym = "2026-02"
+    reports = _reports_dir(tmp_path, ym)
+    reports.mkdir(parents=True, exist_ok=True)
+    audit_path = reports / "audit_log.jsonl"
+    statuses = ["success", "skipped", "rejected", "failed", "weird"]
+    reason_classes = ["", "auth", "duplicate", "infra"]
+    rows: list[dict[str, Any]] = []
+    for index in range(300):
+        details: dict[str, Any] = {"template_id": f"tpl_{index % 3}", "idempotency_key": f"evt-{index}"}
+        reason_class = reason_classes[index % len(reason_classes)]
+        if reason_class:
+            details["reason_class"] = reason_class
+            details["reason_code"] = f"code_{index % 5}"
+        if index % 7 == 0:
+            details["retry_advice"] = "retry_after_fix"
+        if index % 2 == 0:
+            details["duplicate"] = index % 4 == 0
+        event_type = "workflow_event_notification" if index % 6 == 0 else "workflow_event"
+        rows.append(
+            {
+                "ts": f"2026-02-{1 + index // 24:02d}T{index % 24:02d}:00:00",
+                "event_type": event_type,
+                "action": "preflight",
+                "status": statuses[index % len(statuses)],
+                "details": details,
+            }
+        )
+        if index % 50 == 0:
+            rows.append({"ts": rows[-1]["ts"], "event_type": "run", "status": "success", "details": {}})
+
+    def _write_rows(chunk: list[dict[str, Any]]) -> None:
+        with audit_path.open("a", encoding="utf-8") as handle:
+            for row in chunk:
+                handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def _summary() -> dict[str, Any]:
+        res = client.get(f"/api/workflow-events/summary?ym={ym}&recent_limit=200")
+        assert res.status_code == 200
+        body = res.json()
+        body.pop("retry_queue", None)
+        return body
+
+    _write_rows(rows)
+    expected = _summary()
+    assert expected["total"] > 0
+    assert expected["recent"][0]["at"] == max(row["ts"] for row in rows if row["event_type"] == "workflow_event")
+
+    audit_path.unlink()
+    _write_rows(rows[:120])
+    audit_segment_common.seal_audit_log(audit_path)
+    _write_rows(rows[120:260])
+    audit_segment_common.seal_audit_log(audit_path)
+    _write_rows(rows[260:])
+
+    segments = audit_segment_common.list_audit_segments(audit_path)
+    assert len(segments) == 2
+    assert all(Path(f"{segment}{audit_segment_common.AUDIT_ROLLUP_SUFFIX}").exists() for segment in segments)
+    assert _summary() == expected
+
+    # A stale sidecar is rebuilt from its segment instead of being trusted.
+    sidecar = Path(f"{segments[0]}{audit_segment_common.AUDIT_ROLLUP_SUFFIX}")
+    sidecar.write_text('{"version": 1, "size": -5}', encoding="utf-8")
+    assert _summary() == expected
+
+
 def test_api_workflow_events_summary_returns_empty_when_audit_not_found(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -6097,6 +6368,56 @@ def test_api_document_freshness_respects_limit(monkeypatch: pytest.MonkeyPatch,
     assert len(items) == 2
 
 
+def test_git_history_map_is_single_pass_and_cached_by_head(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    (repo / "docs" / "sub").mkdir(parents=True)
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "t")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "t@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "t")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "t@example.com")
+
+    def _git(*args: str, date: str | None = None) -> None:
+        env = dict(os.environ)
+        if date:
+            env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, env=env)
+
+    _git("init", "-q")
+    (repo / "docs" / "old.md").write_text("old", encoding="utf-8")
+    (repo / "docs" / "sub" / "guide.md").write_text("v1", encoding="utf-8")
+    _git("add", "-A")
+    _git("commit", "-q", "-m", "first", date="2025-01-01T00:00:00+00:00")
+    (repo / "docs" / "sub" / "guide.md").write_text("v2", encoding="utf-8")
+    _git("commit", "-q", "-am", "second", date="2025-03-01T00:00:00+00:00")
+
+    calls: list[list[str]] = []
+    real_run = subprocess.run
+
+    def _counting_run(cmd: Any, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        calls.append([str(c) for c in cmd])
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(api_runs.subprocess, "run", _counting_run)
+    history = api_runs._git_history_map(repo, ["docs"])
+    assert history is not None
+    assert history["docs/old.md"].startswith("2025-01-01")
+    assert history["docs/sub/guide.md"].startswith("2025-03-01")
+    assert api_runs._git_last_updated_at(repo / "docs" / "sub" / "guide.md", repo, history) == history["docs/sub/guide.md"]
+    assert len(calls) == 1
+
+    assert api_runs._git_history_map(repo, ["docs"]) == history
+    assert len(calls) == 1
+
+    monkeypatch.setattr(api_runs.subprocess, "run", real_run)
+    (repo / "docs" / "old.md").write_text("new", encoding="utf-8")
+    _git("commit", "-q", "-am", "third", date="2025-04-01T00:00:00+00:00")
+    monkeypatch.setattr(api_runs.subprocess, "run", _counting_run)
+    refreshed = api_runs._git_history_map(repo, ["docs"])
+    assert refreshed is not None
+    assert refreshed["docs/old.md"].startswith("2025-04-01")
+    assert len(calls) == 2
+
+
 def test_api_error_incidents_returns_degraded_payload_when_tool_fails(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -6185,6 +6506,40 @@ def test_api_error_incident_detail_includes_handoff_payload(
     )
 
 
+def test_api_error_incident_progress_reads_run_progress(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    reports_root = tmp_path / "reports"
+    incident_id = "incident_api_progress_001"
+    _write_json(
+        reports_root / "error_runs" / incident_id / "progress.json",
+        {
+            "incident_id": incident_id,
+            "state": "running",
+            "iteration": 1,
+            "command_index": 2,
+            "command_total": 3,
+            "command": "python -m pytest -q",
+            "output_bytes": 1024,
+            "stdout_tail": "collected 10 items",
+        },
+    )
+    monkeypatch.setattr(api_routes, "_error_reports_root", lambda: reports_root)
+    client = _create_client(monkeypatch, tmp_path)
+
+    res = client.get(f"/api/errors/incidents/{incident_id}/progress")
+    assert res.status_code == 200
+    assert res.headers.get("cache-control") == "no-store"
+    progress = res.json().get("progress")
+    assert progress.get("state") == "running"
+    assert progress.get("command_index") == 2
+    assert progress.get("stdout_tail") == "collected 10 items"
+
+    res_missing = client.get("/api/errors/incidents/incident_api_progress_002/progress")
+    assert res_missing.status_code == 200
+    assert res_missing.json().get("progress") == {}
+
+
 def test_api_error_incident_approve_updates_status(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -6224,6 +6579,32 @@ def test_api_error_incident_approve_updates_status(
     assert (incident_dir / "status.txt").read_text(encoding="utf-8").strip() == "approved"
 
 
+def test_api_error_incident_approve_refreshes_incident_index(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import error_common
+
+    reports_root = tmp_path / "reports"
+    incident_id = "incident_api_approve_index_001"
+    incident_dir = reports_root / "error_inbox" / incident_id
+    error_common.write_json(
+        incident_dir / "incident.json",
+        {"incident_id": incident_id, "status": "plan_proposed", "plan_state": "plan_proposed", "ym": "2026-01"},
+    )
+    error_common.write_status(incident_dir, "plan_proposed")
+    _write_json(reports_root / "error_plans" / incident_id / "plan.json", {"incident_id": incident_id})
+    assert error_common.query_incidents(reports_root, status="plan_proposed")["matched"] == 1
+
+    monkeypatch.setattr(api_routes, "_error_reports_root", lambda: reports_root)
+    client = _create_client(monkeypatch, tmp_path)
+    res = client.post(f"/api/errors/incidents/{incident_id}/approve", json={})
+    assert res.status_code == 200
+
+    rows = error_common.list_inbox_incidents(reports_root)
+    assert [(row["status"], row["plan_state"]) for row in rows] == [("approved", "approved")]
+    assert error_common.query_incidents(reports_root, status="approved")["matched"] == 1
+
+
 def test_api_error_incident_handoff_invokes_handoff_tool(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
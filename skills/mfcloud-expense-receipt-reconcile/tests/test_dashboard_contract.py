@@ -34,6 +34,7 @@ def test_api_router_registers_expected_routes() -> None:
         "/api/errors/incidents/{incident_id}/go",
         "/api/errors/incidents/{incident_id}/handoff",
         "/api/errors/incidents/{incident_id}/plan",
+        "/api/errors/incidents/{incident_id}/progress",
         "/api/errors/incidents/plan-all",
         "/api/exclusions/{ym}",
         "/api/folder/{ym}/receipts",
@@ -72,6 +73,7 @@ def test_api_router_registers_expected_routes() -> None:
         "/api/runs",
         "/api/runs/{run_id}",
         "/api/runs/{run_id}/stop",
+        "/api/runs/{run_id}/timing",
         "/api/scheduler/health",
         "/api/scheduler/restart",
         "/api/scheduler/state",
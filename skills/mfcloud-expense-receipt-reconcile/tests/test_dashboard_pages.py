@@ -843,6 +843,70 @@ def test_run_page_shows_mf_draft_actions_download_when_present(
     assert dl.status_code == 200
 
 
+def test_audit_log_download_includes_sealed_segments(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import audit_segment_common
+
+    client = _create_client(monkeypatch, tmp_path)
+    ym = "2026-01"
+    audit_path = _artifact_root(tmp_path) / ym / "reports" / "audit_log.jsonl"
+    sealed = [{"ts": "2026-01-30T09:00:00", "event_type": "run", "action": "first"}]
+    _write_jsonl(audit_path, sealed)
+    audit_segment_common.seal_audit_log(audit_path)
+    assert client.get(f"/files/{ym}/audit_log").status_code == 200
+
+    _write_jsonl(audit_path, [{"ts": "2026-01-31T09:00:00", "event_type": "run", "action": "second"}])
+    res = client.get(f"/files/{ym}/audit_log")
+    assert res.status_code == 200
+    assert "attachment" in res.headers["content-disposition"]
+    assert [json.loads(line)["action"] for line in res.text.splitlines()] == ["first", "second"]
+
+    audit_path.unlink()
+    for segment in audit_segment_common.list_audit_segments(audit_path):
+        segment.unlink()
+    assert client.get(f"/files/{ym}/audit_log").status_code == 404
+
+
+def test_run_page_renders_stage_timing_waterfall(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from run_core_telemetry import span, trace
+
+    client = _create_client(monkeypatch, tmp_path)
+    ym = "2026-01"
+    reports_dir = _artifact_root(tmp_path) / ym / "reports"
+    with trace("pipeline", out_paths=[reports_dir / "run_timing.json"], year=2026, month=1):
+        with span("reconcile", kind="stage"):
+            with span("reconcile.py", kind="subprocess"):
+                pass
+
+    res = client.get(f"/runs/{ym}")
+    assert res.status_code == 200
+    assert "data-run-timing" in res.text
+    assert res.text.count('class="run-timing-row"') == 3
+    assert 'data-kind="subprocess"' in res.text
+    assert f"/files/{ym}/run_timing" in res.text
+    assert client.get(f"/files/{ym}/run_timing").status_code == 200
+
+
+def test_run_page_renders_first_page_of_reconcile_rows(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    client = _create_client(monkeypatch, tmp_path)
+    ym = "2026-01"
+    reports_dir = _artifact_root(tmp_path) / ym / "reports"
+    rows = [
+        {"mf_expense_id": f"MF-{index:03d}", "mf_use_date": "2026-01-15", "mf_amount_yen": 1000, "mf_vendor": f"vendor-{index:03d}"}
+        for index in range(75)
+    ]
+    _write_json(reports_dir / "missing_evidence_candidates.json", {"counts": {"mf_missing_evidence": 75}, "rows": rows})
+
+    res = client.get(f"/runs/{ym}")
+    assert res.status_code == 200
+    assert "vendor-049" in res.text
+    assert "vendor-050" not in res.text
+    assert "data-reconcile-rows" in res.text
+    assert 'id="reconcile-rows-more"' in res.text
+    assert "50 / 全 75 件" in res.text
+    match = re.search(r'data-next-cursor="([^"]+)"', res.text)
+    assert match is not None
+
+
 def test_archive_receipts_page_lists_archived_pdfs_with_month_switch(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import json
+import os
+import random
+import re
 from pathlib import Path
 from typing import Any
+import shlex
 import subprocess
 import sys
+import time
 import importlib.util
 import pytest
 
@@ -147,6 +152,163 @@ def test_error_capture_and_plan_generation(tmp_path: Path) -> None:
     assert incident_payload.get("status") == "plan_proposed"
 
 
+def test_error_capture_clusters_repeat_failures_by_signature(tmp_path: Path) -> None:
+    root = tmp_path / "reports"
+
+    def _capture(run_id: str, message: str, failure_class: str = "run_failed") -> dict:
+        return _run_json(
+            [
+                sys.executable,
+                str(SCRIPT_DIR / "error_capture.py"),
+                "--root",
+                str(root),
+                "--failure-class",
+                failure_class,
+                "--step",
+                "amazon_download",
+                "--message",
+                message,
+                "--run-id",
+                run_id,
+            ]
+        )
+
+    first = _capture("run_a", "Timeout 30000ms at 2026-02-01T10:00:00Z waiting for order 250-1234567-7654321")
+    second = _capture("run_b", "Timeout 30000ms at 2026-02-02T11:30:05Z waiting for order 250-7654321-1234567")
+    third = _capture("run_c", "Timeout 30000ms at 2026-02-03T09:00:00Z while waiting for order 250-1111111-2222222")
+    other = _capture("run_d", "Timeout 30000ms at 2026-02-03T09:00:00Z", failure_class="auth_required")
+
+    assert first["deduplicated"] is False
+    assert second["deduplicated"] is True
+    assert third["deduplicated"] is True
+    assert second["incident_id"] == third["incident_id"] == first["incident_id"]
+    assert third["occurrence_count"] == 3
+    assert other["incident_id"] != first["incident_id"]
+    assert sorted(p.name for p in (root / "error_inbox").iterdir()) == sorted(
+        [first["incident_id"], other["incident_id"]]
+    )
+
+    incident_dir = root / "error_inbox" / first["incident_id"]
+    incident = json.loads((incident_dir / "incident.json").read_text(encoding="utf-8"))
+    assert incident["occurrence_count"] == 3
+    assert incident["run_ids"] == ["run_a", "run_b", "run_c"]
+    assert incident["first_seen_at"] <= incident["last_seen_at"]
+    occurrences = (incident_dir / "occurrences.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["run_id"] for line in occurrences] == ["run_b", "run_c"]
+
+    # Once the incident leaves the inbox, the same failure opens a new cluster.
+    (root / "error_archive" / "resolved").mkdir(parents=True, exist_ok=True)
+    incident_dir.rename(root / "error_archive" / "resolved" / first["incident_id"])
+    regression = _capture("run_e", "Timeout 30000ms at 2026-02-04T10:00:00Z waiting for order 250-0000000-0000000")
+    assert regression["deduplicated"] is False
+    assert regression["incident_id"] != first["incident_id"]
+
+
+def test_incident_index_filters_paginates_and_repairs_drift(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import error_common
+
+    root = tmp_path / "reports"
+    for number, (status, ym) in enumerate(
+        [("new", "2026-01"), ("plan_proposed", "2026-01"), ("new", "2026-02"), ("new", "2026-01")]
+    ):
+        incident_dir = root / "error_inbox" / f"incident_{number}"
+        error_common.write_json(
+            incident_dir / "incident.json",
+            {"incident_id": incident_dir.name, "ym": ym, "step": "amazon_download", "updated_at": f"2026-02-0{number + 1}"},
+        )
+        error_common.write_status(incident_dir, status)
+
+    first = error_common.query_incidents(root, status="new", ym="2026-01", limit=1)
+    assert [row["incident_id"] for row in first["rows"]] == ["incident_3"]
+    assert (first["total"], first["matched"]) == (4, 2)
+    second = error_common.query_incidents(root, status="new", ym="2026-01", offset=1, limit=1)
+    assert [row["incident_id"] for row in second["rows"]] == ["incident_0"]
+    assert second["rows"][0]["path"] == str(root / "error_inbox" / "incident_0")
+
+    reads: list[str] = []
+    real_row = error_common._incident_index_row
+
+    def _counting_row(incident_dir: Path) -> dict[str, Any]:
+        reads.append(incident_dir.name)
+        return real_row(incident_dir)
+
+    monkeypatch.setattr(error_common, "_incident_index_row", _counting_row)
+
+    # Writers update their own row; an unchanged tree is served without reads.
+    error_common.write_status(root / "error_inbox" / "incident_0", "approved")
+    assert reads == ["incident_0"]
+    assert error_common.query_incidents(root, status="approved")["matched"] == 1
+    assert reads == ["incident_0"]
+
+    # Folders moved by hand are picked up from the directory listing alone.
+    (root / "error_archive" / "resolved").mkdir(parents=True, exist_ok=True)
+    (root / "error_inbox" / "incident_1").rename(root / "error_archive" / "resolved" / "incident_1")
+    (root / "error_inbox" / "incident_new").mkdir()
+    reads.clear()
+    listing = error_common.query_incidents(root)
+    assert sorted(reads) == ["incident_1", "incident_new"]
+    assert listing["counts"] == {"inbox": 4, "resolved": 1, "escalated": 0}
+    resolved = error_common.query_incidents(root, location="resolved")
+    assert [row["incident_id"] for row in resolved["rows"]] == ["incident_1"]
+    assert resolved["rows"][0]["status"] == "plan_proposed"
+
+    # Writers that bypass write_status are caught by the status.txt/incident.json stamps.
+    (root / "error_inbox" / "incident_2" / "status.txt").write_text("escalated\n", encoding="utf-8")
+    reads.clear()
+    assert error_common.query_incidents(root, status="escalated")["matched"] == 1
+    assert reads == ["incident_2"]
+    assert "source_stamp" not in error_common.query_incidents(root)["rows"][0]
+
+
+def _reference_redact_text(text: str) -> str:
+    # The five sequential substitutions redact_text() must stay identical to.
+    value = str(text or "")
+    value = re.sub(
+        r"([?&](?:token|api[_-]?key|access_token|refresh_token|session|sig|signature|key)=)[^&\s]+",
+        r"\1[REDACTED]",
+        value,
+        flags=re.IGNORECASE,
+    )
+    value = re.sub(r"(?im)(authorization\s*:\s*bearer\s+)[A-Za-z0-9._~+/\-]+", r"\1[REDACTED]", value)
+    value = re.sub(r"(?im)(cookie\s*:\s*).+$", r"\1[REDACTED]", value)
+    value = re.sub(
+        r"(?i)\b(api[_-]?key|access[_-]?token|refresh[_-]?token|session[_-]?id|password)\b"
+        r"(\s*[:=]\s*|\"\s*:\s*|'\s*:\s*)"
+        r"([^\s\"'&,]+)",
+        r"\1\2[REDACTED]",
+        value,
+    )
+    return re.sub(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", "[REDACTED_EMAIL]", value)
+
+
+def test_redact_text_matches_sequential_reference_on_random_corpus() -> None:
+    import error_common
+
+    fragments = [
+        "?", "&", "=", ":", "@", ".", ",", "'", '"', " ", "\n", "\t", "/", "-", "_", "+", "%", "~",
+        "token", "api_key", "API-KEY", "apikey", "access_token", "refresh-token", "session", "session_id",
+        "sig", "signature", "key", "password", "PassWord", "Authorization", "authorization: bearer ",
+        "Bearer", "cookie", "Cookie: ", "set-cookie:", "user", "example", "com", "co.jp", "x@y.io",
+        "me@host.password", "2026-01-31T12:00:00", "12:00", "https://example.invalid/a?b=1",
+        "abc", "ABC123", "secret", "[REDACTED]", "日本語", "é",
+        # Characters re.IGNORECASE matches against ASCII letters.
+        "\u0131", "\u0130", "\u017f", "\u212a", "\u017fe\u017f\u017fion_\u0131d", "authori\u0307zation: bearer ",
+        "Author\u0130zation: Bearer ", "coo\u212aie: ", "pa\u017f\u017fword", "api\u212aey",
+    ]
+    rng = random.Random(20260131)
+    corpus = ["", "plain text", "me@host.password=secret", "Cookie: a=b\npassword = x, y@z.com"]
+    for _ in range(4000):
+        corpus.append("".join(rng.choice(fragments) for _ in range(rng.randint(1, 14))))
+    for text in corpus:
+        assert error_common.redact_text(text) == _reference_redact_text(text), text
+
+    nested = {"k": [corpus[2], {"inner": corpus[3]}, 1, None], "plain": "ok"}
+    assert error_common.redact_json(nested) == {
+        "k": [_reference_redact_text(corpus[2]), {"inner": _reference_redact_text(corpus[3])}, 1, None],
+        "plain": "ok",
+    }
+
+
 def test_error_plan_generation_filters_weak_evidence_signals(tmp_path: Path) -> None:
     root = tmp_path / "reports"
     incident_id = "incident_test_case_weak_evidence"
@@ -409,7 +571,7 @@ def test_error_exec_loop_replan_when_no_progress_streak_reaches_limit(tmp_path:
     plan_calls: list[bool] = []
     command_calls: list[str] = []
 
-    def _fake_run_command(command: str) -> dict[str, Any]:
+    def _fake_run_command(command: str, *_args: Any, **_kwargs: Any) -> dict[str, Any]:
         command_calls.append(command)
         return {
             "command": command,
@@ -461,6 +623,139 @@ def test_error_exec_loop_replan_when_no_progress_streak_reaches_limit(tmp_path:
     assert incident.get("status") == "plan_proposed"
 
 
+def test_error_exec_loop_streams_command_output_with_limits(tmp_path: Path) -> None:
+    module = _load_error_exec_loop_module()
+    root = tmp_path / "reports"
+    incident_id = "incident_test_case_stream"
+    python = shlex.quote(sys.executable)
+    _prepare_exec_loop_inputs(
+        root,
+        incident_id,
+        verification_commands=[
+            f"{python} -c \"print('line ' * 4, end=''); [print('x' * 99) for _ in range(20000)]\"",
+            f"{python} -c \"import sys; [sys.stdout.write('y' * 1023 + chr(10)) for _ in range(4096)]\"",
+            f"{python} -c \"import time; print('waiting', flush=True); time.sleep(30)\"",
+        ],
+        status="planned",
+    )
+    args = module.parse_args(
+        [
+            "--incident-id",
+            incident_id,
+            "--root",
+            str(root),
+            "--single-iteration",
+            "--no-commit-on-resolve",
+            "--command-timeout-seconds",
+            "2",
+            "--max-output-mb",
+            "3",
+        ]
+    )
+
+    result = module.execute_error_loop(args)
+    run_dir = Path(result["run_dir"])
+    attempt = json.loads((run_dir / "attempt_01.json").read_text(encoding="utf-8"))
+    full, limited, slow = attempt["command_results"]
+
+    assert full["returncode"] == 0
+    assert full["output_bytes"] == 20 + 20000 * 100
+    assert len(full["stdout"]) == 4000
+    assert full["stdout"].endswith("x" * 99 + "\n")
+    log_text = Path(full["log_path"]).read_text(encoding="utf-8")
+    assert log_text.startswith("line line line line x")
+    assert len(log_text) == full["output_bytes"]
+
+    assert limited["returncode"] == 125
+    assert limited["output_limited"] is True
+    assert "output limit exceeded" in limited["stderr"]
+
+    assert slow["returncode"] == 124
+    assert slow["timed_out"] is True
+    assert slow["stdout"] == "waiting\n"
+    assert slow["stderr"].endswith("command timeout")
+    assert slow["duration_seconds"] < 15
+
+    progress = json.loads((run_dir / "progress.json").read_text(encoding="utf-8"))
+    assert progress["state"] == "completed"
+    assert progress["final_status"] == result["final_status"]
+    assert progress["command_index"] == 3
+    assert progress["command_total"] == 3
+    assert progress["stdout_tail"] == "waiting\n"
+
+
+def test_error_exec_loop_replaces_progress_file_atomically(tmp_path: Path) -> None:
+    module = _load_error_exec_loop_module()
+    run_dir = tmp_path / "error_runs" / "incident_test_case_progress"
+    module._write_progress(run_dir, {"state": "running", "command_index": 1})
+    progress_path = run_dir / "progress.json"
+    # A reader holding the old file keeps a complete document; writes land in a new inode.
+    reader_view = tmp_path / "reader_view.json"
+    os.link(progress_path, reader_view)
+
+    module._write_progress(run_dir, {"state": "running", "command_index": 2})
+
+    assert json.loads(reader_view.read_text(encoding="utf-8"))["command_index"] == 1
+    assert json.loads(progress_path.read_text(encoding="utf-8"))["command_index"] == 2
+    assert sorted(p.name for p in run_dir.iterdir()) == ["progress.json"]
+
+
+def test_error_exec_loop_runs_parallel_groups_with_deterministic_signature(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module = _load_error_exec_loop_module()
+    root = tmp_path / "reports"
+    incident_id = "incident_test_case_parallel"
+    _prepare_exec_loop_inputs(root, incident_id, verification_commands=["unused"], status="planned")
+    plan_path = root / "error_plans" / incident_id / "plan.json"
+    plan = json.loads(plan_path.read_text(encoding="utf-8"))
+    plan["verification_groups"] = [
+        {"name": "checks", "parallel": True, "commands": ["check_a_slow_fail", "check_b_fast_fail", "check_c_hang"]},
+        {"name": "after", "commands": ["lint"]},
+    ]
+    plan_path.write_text(json.dumps(plan), encoding="utf-8")
+    started: list[str] = []
+
+    def _fake_run_command(command: str, *_args: Any, cancel_event: Any = None, **_kwargs: Any) -> dict[str, Any]:
+        started.append(command)
+        if command == "check_a_slow_fail":
+            time.sleep(0.3)
+            return {"command": command, "returncode": 1, "stdout": "", "stderr": "a failed"}
+        if command == "check_b_fast_fail":
+            return {"command": command, "returncode": 2, "stdout": "", "stderr": "b failed"}
+        if command == "check_c_hang":
+            assert cancel_event is not None and cancel_event.wait(5)
+            return {"command": command, "returncode": 130, "stdout": "", "stderr": "cancelled", "cancelled": True}
+        return {"command": command, "returncode": 0, "stdout": "", "stderr": ""}
+
+    monkeypatch.setattr(module, "_run_command", _fake_run_command)
+    args = module.parse_args(
+        [
+            "--incident-id",
+            incident_id,
+            "--root",
+            str(root),
+            "--single-iteration",
+            "--no-commit-on-resolve",
+            "--max-parallel",
+            "3",
+            "--fail-fast",
+        ]
+    )
+
+    result = module.execute_error_loop(args)
+    attempt = json.loads((Path(result["run_dir"]) / "attempt_01.json").read_text(encoding="utf-8"))
+    commands = [item["command"] for item in attempt["command_results"]]
+    assert commands == ["check_a_slow_fail", "check_b_fast_fail", "check_c_hang", "lint"]
+    hang = attempt["command_results"][2]
+    # Either cancelled while running or skipped before it started, depending on timing.
+    assert hang.get("cancelled") is True or hang.get("skipped") is True
+    assert attempt["command_results"][3].get("skipped") is True
+    assert "lint" not in started
+    assert attempt["verification_passed"] is False
+    assert attempt["error_signature"] == "check_a_slow_fail::rc=1"
+
+
 def test_error_exec_loop_commit_success_and_push(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     module = _load_error_exec_loop_module()
     root = tmp_path / "reports"
@@ -472,7 +767,7 @@ def test_error_exec_loop_commit_success_and_push(tmp_path: Path, monkeypatch: py
         status="planned",
     )
 
-    def _fake_run_command(command: str) -> dict[str, Any]:
+    def _fake_run_command(command: str, *_args: Any, **_kwargs: Any) -> dict[str, Any]:
         return {
             "command": command,
             "returncode": 0,
@@ -558,7 +853,7 @@ def test_error_exec_loop_commit_skipped_when_no_changes(tmp_path: Path, monkeypa
         status="planned",
     )
 
-    def _fake_run_command(command: str) -> dict[str, Any]:
+    def _fake_run_command(command: str, *_args: Any, **_kwargs: Any) -> dict[str, Any]:
         return {
             "command": command,
             "returncode": 0,
@@ -620,7 +915,7 @@ def test_error_exec_loop_commit_push_failure_keeps_resolved_status_and_records_e
         status="planned",
     )
 
-    def _fake_run_command(command: str) -> dict[str, Any]:
+    def _fake_run_command(command: str, *_args: Any, **_kwargs: Any) -> dict[str, Any]:
         return {
             "command": command,
             "returncode": 0,
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import analyze_commit  # noqa: E402
+import review_kil_brain  # noqa: E402
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args],
+        text=True,
+        capture_output=True,
+        check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def kil_repo(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[Path, list[str]]:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "kil@example.com")
+    _git(repo, "config", "user.name", "KIL Test")
+    for index in range(4):
+        path = repo / "docs" / f"note{index}.md" if index % 2 else repo / f"file{index}.txt"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"line {index}\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", f"commit {index}", "-m", f"body {index}\n\nwith a blank line")
+    hashes = _git(repo, "log", "--reverse", "--format=%H").splitlines()
+
+    docs_dir = tmp_path / "brain"
+    monkeypatch.setattr(analyze_commit, "ROOT", repo)
+    monkeypatch.setattr(analyze_commit, "DOCS_DIR", docs_dir)
+    monkeypatch.setattr(analyze_commit, "BRAIN_MD", docs_dir / "AGENT_BRAIN.md")
+    monkeypatch.setattr(analyze_commit, "BRAIN_INDEX", docs_dir / "AGENT_BRAIN_INDEX.jsonl")
+    monkeypatch.setattr(analyze_commit, "ERROR_LOG", docs_dir / "AGENT_BRAIN_ERROR.log")
+    monkeypatch.setattr(review_kil_brain, "DOCS_DIR", docs_dir)
+    monkeypatch.setattr(review_kil_brain, "BRAIN_REVIEW", docs_dir / "AGENT_BRAIN_REVIEW.jsonl")
+    monkeypatch.setattr(analyze_commit, "load_secret_env", lambda: None)
+    return repo, hashes
+
+
+def _record(summary: str) -> dict[str, Any]:
+    return {"summary": summary, "scope": ["docs"], "confidence": 0.9, "risk": "low"}
+
+
+def _jsonl(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def test_run_batch_collects_the_range_with_one_git_log(
+    monkeypatch: pytest.MonkeyPatch, kil_repo: tuple[Path, list[str]]
+) -> None:
+    _, hashes = kil_repo
+    git_calls: list[list[str]] = []
+    real_run_git = analyze_commit.run_git
+
+    def _counting_run_git(args: list[str]) -> str:
+        git_calls.append(list(args))
+        return real_run_git(args)
+
+    seen: dict[str, dict[str, Any]] = {}
+
+    def _fake_analyze(metadata: dict[str, str], files: list[dict[str, str]], patch: str) -> dict[str, Any]:
+        seen[metadata["hash"]] = {"metadata": metadata, "files": files, "patch": patch}
+        return _record(metadata["subject"])
+
+    monkeypatch.setattr(analyze_commit, "run_git", _counting_run_git)
+    monkeypatch.setattr(analyze_commit, "analyze_context", _fake_analyze)
+
+    counts = analyze_commit.run_batch(f"{hashes[0]}..HEAD", workers=2)
+
+    assert counts == {"pending": 3, "appended": 3, "fallback": 0, "failed": 0}
+    assert len(git_calls) == 1 and git_calls[0][0] == "log"
+    last = seen[hashes[3]]
+    assert last["metadata"]["subject"] == "commit 3"
+    assert last["metadata"]["body"] == "body 3\n\nwith a blank line"
+    assert last["files"] == [{"status": "A", "path": "docs/note3.md"}]
+    assert "+line 3" in last["patch"]
+
+
+def test_run_batch_skips_commits_already_in_the_brain(
+    monkeypatch: pytest.MonkeyPatch, kil_repo: tuple[Path, list[str]]
+) -> None:
+    _, hashes = kil_repo
+    analyze_commit.DOCS_DIR.mkdir(parents=True, exist_ok=True)
+    analyze_commit.BRAIN_INDEX.write_text(json.dumps({"commit": hashes[1]}) + "\n", encoding="utf-8")
+    analyze_commit.BRAIN_MD.write_text(f"## [2026-01-01] Commit: {hashes[2]}\n- **要約**: done\n", encoding="utf-8")
+    analyzed: list[str] = []
+
+    def _fake_analyze(metadata: dict[str, str], files: list[dict[str, str]], patch: str) -> dict[str, Any]:
+        analyzed.append(metadata["hash"])
+        return _record(metadata["subject"])
+
+    monkeypatch.setattr(analyze_commit, "analyze_context", _fake_analyze)
+
+    counts = analyze_commit.run_batch("HEAD", workers=1)
+
+    assert counts == {"pending": 2, "appended": 2, "fallback": 0, "failed": 0}
+    assert analyzed == [hashes[0], hashes[3]]
+    assert [row["commit"] for row in _jsonl(analyze_commit.BRAIN_INDEX)] == [hashes[1], hashes[0], hashes[3]]
+    assert analyze_commit.run_batch("HEAD", workers=1)["pending"] == 0
+
+
+def test_run_batch_appends_in_commit_order_with_concurrent_workers(
+    monkeypatch: pytest.MonkeyPatch, kil_repo: tuple[Path, list[str]]
+) -> None:
+    _, hashes = kil_repo
+    finished: list[str] = []
+
+    def _slow_for_older(metadata: dict[str, str], files: list[dict[str, str]], patch: str) -> dict[str, Any]:
+        # Older commits finish last, so completion order is the reverse of commit order.
+        time.sleep(0.05 * (len(hashes) - hashes.index(metadata["hash"])))
+        finished.append(metadata["hash"])
+        return _record(metadata["subject"])
+
+    monkeypatch.setattr(analyze_commit, "analyze_context", _slow_for_older)
+
+    counts = analyze_commit.run_batch("HEAD", workers=4)
+
+    assert counts["appended"] == 4
+    assert finished[0] == hashes[-1]
+    assert [row["commit"] for row in _jsonl(analyze_commit.BRAIN_INDEX)] == hashes
+    reviews = _jsonl(review_kil_brain.BRAIN_REVIEW)
+    assert [row["commit"] for row in reviews] == hashes
+    assert all(row["review_decision"] == "GO" for row in reviews)
+    markdown = analyze_commit.BRAIN_MD.read_text(encoding="utf-8")
+    assert [markdown.index(f"Commit: {commit_hash}") for commit_hash in hashes] == sorted(
+        markdown.index(f"Commit: {commit_hash}") for commit_hash in hashes
+    )
+
+
+def test_main_range_limit_keeps_only_the_newest_commits(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], kil_repo: tuple[Path, list[str]]
+) -> None:
+    _, hashes = kil_repo
+    monkeypatch.setattr(analyze_commit, "analyze_context", lambda metadata, files, patch: _record(metadata["subject"]))
+
+    assert analyze_commit.main(["--range", "HEAD", "--limit", "0"]) == 0
+    assert json.loads(capsys.readouterr().out)["pending"] == 0
+    assert analyze_commit.main(["--range", "HEAD", "--limit", "2", "--workers", "3"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"pending": 2, "appended": 2, "fallback": 0, "failed": 0}
+    assert [row["commit"] for row in _jsonl(analyze_commit.BRAIN_INDEX)] == hashes[-2:]
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import json
 from datetime import date
+import random
 from pathlib import Path
 
 import pytest
 
-from reconcile import MfExpense, Order, main as reconcile_main, reconcile
+from reconcile import MfExpense, Order, load_mf_expenses, load_orders, main as reconcile_main, reconcile
 
 
 def _write_jsonl(path: Path, rows: list[dict]) -> None:
@@ -614,3 +615,213 @@ def test_reconcile_main_requires_at_least_one_order_source(tmp_path: Path) -> No
                 "1",
             ]
         )
+
+
+def _write_batch_month(root: Path, ym: str, *, orders: list[dict], expenses: list[dict]) -> None:
+    _write_jsonl(root / ym / "amazon" / "orders.jsonl", orders)
+    _write_jsonl(root / ym / "mfcloud" / "expenses.jsonl", expenses)
+
+
+def _batch_fixture(root: Path) -> None:
+    _write_batch_month(
+        root,
+        "2026-01",
+        orders=[
+            {"order_id": "JAN-1", "order_date": "2026-01-10", "total_yen": 1000, "pdf_path": "a/JAN-1.pdf"},
+            {"order_id": "JAN-2", "order_date": "2026-01-12", "total_yen": 1000, "pdf_path": "a/JAN-2.pdf"},
+        ],
+        expenses=[
+            {"expense_id": "MF-J1", "use_date": "2026-01-11", "amount_yen": 1000, "vendor": "Amazon"},
+            {"expense_id": "MF-J2", "use_date": "2026-01-31", "amount_yen": 2500, "vendor": "Amazon"},
+        ],
+    )
+    _write_batch_month(
+        root,
+        "2026-02",
+        orders=[{"order_id": "FEB-1", "order_date": "2026-02-02", "total_yen": 2500, "pdf_path": "a/FEB-1.pdf"}],
+        expenses=[{"expense_id": "MF-F1", "use_date": "2026-02-27", "amount_yen": 800, "vendor": "Amazon"}],
+    )
+    # Only orders for March: it feeds the shared index but has nothing to reconcile.
+    _write_jsonl(
+        root / "2026-03" / "amazon" / "orders.jsonl",
+        [{"order_id": "MAR-1", "order_date": "2026-03-01", "total_yen": 800, "pdf_path": "a/MAR-1.pdf"}],
+    )
+
+
+def test_reconcile_batch_without_spillover_matches_single_month_runs(tmp_path: Path) -> None:
+    from reconcile_batch import run_batch
+
+    root = tmp_path / "artifacts"
+    _batch_fixture(root)
+    expected: dict[str, dict] = {}
+    for ym, (year, month) in {"2026-01": (2026, 1), "2026-02": (2026, 2)}.items():
+        out_json = tmp_path / f"single_{ym}.json"
+        reconcile_main(
+            [
+                "--amazon-orders-jsonl",
+                str(root / ym / "amazon" / "orders.jsonl"),
+                "--mf-expenses-jsonl",
+                str(root / ym / "mfcloud" / "expenses.jsonl"),
+                "--out-json",
+                str(out_json),
+                "--out-csv",
+                str(tmp_path / f"single_{ym}.csv"),
+                "--year",
+                str(year),
+                "--month",
+                str(month),
+            ]
+        )
+        expected[ym] = json.loads(out_json.read_text(encoding="utf-8"))
+
+    summary = run_batch(artifact_root=root, start=(2026, 1), end=(2026, 3), spillover=False, max_workers=1)
+
+    for ym, single in expected.items():
+        batch = json.loads((root / ym / "reports" / "missing_evidence_candidates.json").read_text(encoding="utf-8"))
+        assert batch == single
+        assert (root / ym / "reports" / "missing_evidence_candidates.csv").read_text(encoding="utf-8") == (
+            tmp_path / f"single_{ym}.csv"
+        ).read_text(encoding="utf-8")
+    statuses = {row["ym"]: row["status"] for row in summary["months"]}
+    assert statuses == {"2026-01": "success", "2026-02": "success", "2026-03": "skipped"}
+    assert summary["totals"]["mf_missing_evidence"] == 3
+    assert Path(summary["summary_json"]).exists()
+
+
+def test_reconcile_batch_spillover_matches_orders_across_month_boundary(tmp_path: Path) -> None:
+    from reconcile_batch import run_batch
+
+    root = tmp_path / "artifacts"
+    _batch_fixture(root)
+
+    serial = run_batch(artifact_root=root, start=(2026, 1), end=(2026, 2), max_workers=1)
+    jan = json.loads((root / "2026-01" / "reports" / "missing_evidence_candidates.json").read_text(encoding="utf-8"))
+    feb = json.loads((root / "2026-02" / "reports" / "missing_evidence_candidates.json").read_text(encoding="utf-8"))
+    parallel = run_batch(artifact_root=root, start=(2026, 1), end=(2026, 2), max_workers=2)
+
+    jan_j2 = [row for row in jan["rows"] if row["mf_expense_id"] == "MF-J2"]
+    assert [row["order_id"] for row in jan_j2] == ["FEB-1"]
+    assert jan_j2[0]["diff_days"] == 2
+    feb_f1 = [row for row in feb["rows"] if row["mf_expense_id"] == "MF-F1"]
+    # The neighbouring month outside the range still feeds the shared index.
+    assert [row["order_id"] for row in feb_f1] == ["MAR-1"]
+    assert jan["counts"]["spillover_candidates"] == 1
+    assert serial["index_orders"] == 4
+    assert parallel["workers"] == 2
+    assert [row["counts"] for row in parallel["months"]] == [row["counts"] for row in serial["months"]]
+    assert json.loads((root / "2026-01" / "reports" / "missing_evidence_candidates.json").read_text(encoding="utf-8")) == jan
+
+
+def _incremental_fixture(rng: random.Random) -> tuple[list[dict], list[dict], list[dict]]:
+    amazon = [
+        {
+            "order_id": f"A-{i}",
+            "order_date": f"2026-01-{rng.randint(1, 31):02d}",
+            "total_yen": rng.choice([500, 1000, 1500, 2000]),
+            "pdf_path": f"a/A-{i}.pdf",
+        }
+        for i in range(40)
+    ]
+    manual = [
+        {
+            "order_id": f"M-{i}",
+            "order_date": f"2026-01-{rng.randint(1, 31):02d}",
+            "total_yen": rng.randint(1, 50) * 100,
+            "provider": rng.choice(["chatgpt", "claude"]),
+            "pdf_path": f"m/M-{i}.pdf",
+        }
+        for i in range(8)
+    ]
+    expenses = [
+        {
+            "expense_id": f"MF-{i}",
+            "use_date": f"2026-01-{rng.randint(1, 31):02d}" if i % 17 else None,
+            "amount_yen": rng.choice([500, 1000, 1500, 2000, 3300]),
+            "vendor": rng.choice(["Amazon", "OpenAI", "Anthropic", "Shop"]),
+            "has_evidence": rng.random() < 0.2,
+        }
+        for i in range(60)
+    ]
+    return amazon, manual, expenses
+
+
+def test_reconcile_incremental_matches_full_run_across_edits(tmp_path: Path) -> None:
+    rng = random.Random(48)
+    amazon, manual, expenses = _incremental_fixture(rng)
+    paths = {
+        "amazon": tmp_path / "amazon" / "orders.jsonl",
+        "manual": tmp_path / "manual" / "orders.jsonl",
+        "mf": tmp_path / "mfcloud" / "expenses.jsonl",
+        "exclude": tmp_path / "reports" / "exclude_orders.json",
+    }
+    out_json = tmp_path / "reports" / "missing_evidence_candidates.json"
+
+    def _run(*extra: str) -> dict:
+        _write_jsonl(paths["amazon"], amazon)
+        _write_jsonl(paths["manual"], manual)
+        _write_jsonl(paths["mf"], expenses)
+        reconcile_main(
+            [
+                "--amazon-orders-jsonl",
+                str(paths["amazon"]),
+                "--manual-orders-jsonl",
+                str(paths["manual"]),
+                "--mf-expenses-jsonl",
+                str(paths["mf"]),
+                *(["--exclude-orders-json", str(paths["exclude"])] if paths["exclude"].exists() else []),
+                "--out-json",
+                str(out_json),
+                "--out-csv",
+                str(tmp_path / "reports" / "missing_evidence_candidates.csv"),
+                "--year",
+                "2026",
+                "--month",
+                "1",
+                *extra,
+            ]
+        )
+        expected = reconcile(
+            orders=load_orders(
+                amazon_orders_jsonl=paths["amazon"],
+                rakuten_orders_jsonl=None,
+                manual_orders_jsonl=paths["manual"],
+                exclude_orders_json=paths["exclude"] if paths["exclude"].exists() else None,
+            ),
+            mf_expenses=load_mf_expenses(paths["mf"]),
+            year=2026,
+            month=1,
+            date_window_days=7,
+            max_candidates_per_mf=5,
+        )
+        assert json.loads(out_json.read_text(encoding="utf-8")) == expected
+        state = json.loads(out_json.with_name("missing_evidence_candidates.state.json").read_text(encoding="utf-8"))
+        return state["last_run"]
+
+    assert _run()["full_reason"] == "no_previous_report"
+    unchanged = _run()
+    assert unchanged["mode"] == "incremental"
+    assert unchanged["reevaluated_expenses"] == 0
+
+    edits = [
+        lambda: amazon[3].update(total_yen=amazon[3]["total_yen"] + 500),
+        lambda: amazon.pop(7),
+        lambda: amazon.append({"order_id": "A-new", "order_date": "2026-01-15", "total_yen": 1000, "pdf_path": "a/n.pdf"}),
+        lambda: manual[2].update(order_date="2026-02-01"),
+        lambda: expenses[5].update(amount_yen=1500, has_evidence=False),
+        lambda: expenses[9].update(has_evidence=not expenses[9]["has_evidence"]),
+        lambda: expenses.pop(11),
+        lambda: expenses.append({"expense_id": "MF-new", "use_date": "2026-01-20", "amount_yen": 2000, "vendor": "Amazon"}),
+        lambda: paths["exclude"].write_text(
+            json.dumps({"exclude": [{"source": "amazon", "order_id": "A-12"}]}), encoding="utf-8"
+        ),
+    ]
+    for edit in edits:
+        edit()
+        last_run = _run()
+        assert last_run["mode"] == "incremental"
+        assert last_run["reused_expenses"] > 0
+
+    assert _run("--full")["full_reason"] == "requested"
+    # A report rewritten by another writer invalidates the saved state.
+    out_json.write_text(json.dumps({"rows": []}), encoding="utf-8")
+    assert _run()["full_reason"] == "no_previous_report"
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import json
 from pathlib import Path
 import subprocess
 from types import SimpleNamespace
 
+import pytest
+
 from scripts import run_core_pipeline
 
 
@@ -234,3 +237,89 @@ def test_execute_pipeline_reconcile_includes_manual_orders_when_available(
     assert result["status"] == "success"
     cmd = captured.get("reconcile_cmd") or []
     assert "--manual-orders-jsonl" in cmd
+
+
+def test_execute_pipeline_writes_nested_stage_timing(monkeypatch, tmp_path: Path) -> None:
+    def _fake_run_node_playwright_script(*, script_path, cwd, args, env=None):  # noqa: ANN001
+        return {"status": "success", "data": {}}
+
+    def _fake_subprocess_run(cmd, *args, **kwargs):  # noqa: ANN001
+        cmd_list = [str(x) for x in cmd]
+        out_json = Path(cmd_list[cmd_list.index("--out-json") + 1])
+        out_json.parent.mkdir(parents=True, exist_ok=True)
+        out_json.write_text('{"year":2026,"month":1,"counts":{},"rows":[]}', encoding="utf-8")
+        stdout = {"status": "success", "data": {"counts": {}, "incremental": {"mode": "incremental", "reevaluated_expenses": 2}}}
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=json.dumps(stdout), stderr="")
+
+    monkeypatch.setattr(run_core_pipeline, "run_node_playwright_script", _fake_run_node_playwright_script)
+    monkeypatch.setattr(run_core_pipeline, "build_quality_gate", lambda **k: {"status": "pass", "ready_for_submission": True})
+    monkeypatch.setattr(run_core_pipeline.subprocess, "run", _fake_subprocess_run)
+
+    args = _args()
+    args.skip_amazon = True
+    args.skip_reconcile = False
+    args.timing_json = str(tmp_path / "_runs" / "run_x.timing.json")
+    rc = _rc(tmp_path)
+    (rc.output_root / "manual").mkdir(parents=True, exist_ok=True)
+    (rc.output_root / "manual" / "orders.jsonl").write_text("", encoding="utf-8")
+    (rc.output_root / "mfcloud").mkdir(parents=True, exist_ok=True)
+    (rc.output_root / "mfcloud" / "expenses.jsonl").write_text("", encoding="utf-8")
+
+    run_core_pipeline.execute_pipeline(
+        args=args,
+        rc=rc,
+        year=2026,
+        month=1,
+        render_monthly_thread=lambda **kwargs: "# thread\n",
+    )
+
+    timing = json.loads((rc.output_root / "reports" / "run_timing.json").read_text(encoding="utf-8"))
+    assert json.loads(Path(args.timing_json).read_text(encoding="utf-8"))["spans"] == timing["spans"]
+    assert timing["status"] == "success"
+    by_name = {span["name"]: span for span in timing["spans"]}
+    assert [span["name"] for span in timing["spans"] if span["depth"] == 1] == [
+        "setup",
+        "reconcile",
+        "quality_gate",
+        "monthly_thread",
+    ]
+    assert by_name["reconcile.py"]["parent_id"] == by_name["reconcile"]["id"]
+    assert by_name["reconcile.py"]["kind"] == "subprocess"
+    assert by_name["reconcile.py"]["attrs"] == {"returncode": 0}
+    assert by_name["reconcile"]["attrs"] == {"mode": "incremental", "reevaluated_expenses": 2}
+    root = by_name["pipeline"]
+    assert root["attrs"] == {} and timing["attrs"]["year"] == 2026
+    for span in timing["spans"]:
+        assert span["start_ms"] >= 0 and span["duration_ms"] >= 0
+        assert span["start_ms"] + span["duration_ms"] <= root["duration_ms"] + 1
+
+
+def test_execute_pipeline_records_timing_for_failed_stage(monkeypatch, tmp_path: Path) -> None:
+    def _fake_subprocess_run(cmd, *args, **kwargs):  # noqa: ANN001
+        return subprocess.CompletedProcess(args=cmd, returncode=2, stdout="", stderr="boom")
+
+    monkeypatch.setattr(run_core_pipeline.subprocess, "run", _fake_subprocess_run)
+    args = _args()
+    args.skip_amazon = True
+    args.skip_reconcile = False
+    rc = _rc(tmp_path)
+    (rc.output_root / "manual").mkdir(parents=True, exist_ok=True)
+    (rc.output_root / "manual" / "orders.jsonl").write_text("", encoding="utf-8")
+    (rc.output_root / "mfcloud").mkdir(parents=True, exist_ok=True)
+    (rc.output_root / "mfcloud" / "expenses.jsonl").write_text("", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="reconcile.py failed"):
+        run_core_pipeline.execute_pipeline(
+            args=args,
+            rc=rc,
+            year=2026,
+            month=1,
+            render_monthly_thread=lambda **kwargs: "# thread\n",
+        )
+
+    timing = json.loads((rc.output_root / "reports" / "run_timing.json").read_text(encoding="utf-8"))
+    assert timing["status"] == "error"
+    statuses = {span["name"]: span["status"] for span in timing["spans"]}
+    assert statuses == {"pipeline": "error", "setup": "success", "reconcile": "error", "reconcile.py": "success"}
+    reconcile = next(span for span in timing["spans"] if span["name"] == "reconcile")
+    assert reconcile["error"].startswith("RuntimeError: reconcile.py failed")
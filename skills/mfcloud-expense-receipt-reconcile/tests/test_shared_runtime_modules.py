@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 import re
@@ -28,9 +29,10 @@ def test_dashboard_app_start_background_workers_starts_scheduler_and_retry(monke
     calls: list[str] = []
     monkeypatch.setattr(dashboard_app.core_scheduler, "start_worker", lambda: calls.append("scheduler_start"))
     monkeypatch.setattr(dashboard_app, "start_workflow_event_retry_worker", lambda: calls.append("retry_start"))
+    monkeypatch.setattr(dashboard_app.ai_skill_tools, "warm_skill_registry", lambda: calls.append("skills_warm") or 0)
 
     dashboard_app._start_background_workers()
-    assert calls == ["scheduler_start", "retry_start"]
+    assert calls == ["scheduler_start", "retry_start", "skills_warm"]
 
 
 def test_common_paths_are_resolved_via_shared_runtime(monkeypatch, tmp_path: Path) -> None:
@@ -220,6 +222,65 @@ def test_common_run_registry_helpers(monkeypatch, tmp_path: Path) -> None:
     assert common.coerce_non_negative_int("3", default=0) == 3
 
 
+def test_common_run_registry_index_tracks_run_files(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AX_HOME", str(tmp_path))
+    runs = tmp_path / "artifacts" / "mfcloud-expense-receipt-reconcile" / "_runs"
+    runs.mkdir(parents=True, exist_ok=True)
+
+    def _meta(run_id: str, status: str, started_at: str, month: int, mode: str) -> dict:
+        return {
+            "run_id": run_id,
+            "status": status,
+            "started_at": started_at,
+            "params": {"year": 2026, "month": month, "mode": mode},
+        }
+
+    for run_id, status, started_at, month, mode in (
+        ("run_20260101_090000", "success", "2026-01-01T09:00:00", 1, "preflight"),
+        ("run_20260102_090000", "failed", "2026-01-02T09:00:00", 1, "amazon_download"),
+        ("run_20260201_090000", "running", "2026-02-01T09:00:00", 2, "rakuten_download"),
+    ):
+        (runs / f"{run_id}.json").write_text(json.dumps(_meta(run_id, status, started_at, month, mode)), encoding="utf-8")
+
+    # The first query imports existing files into the index.
+    jobs = common.list_run_jobs()
+    assert [job["run_id"] for job in jobs] == ["run_20260201_090000", "run_20260102_090000", "run_20260101_090000"]
+    assert (runs / "_index" / "run_registry.sqlite3").exists()
+    assert [job["run_id"] for job in common.list_run_jobs(status="running")] == ["run_20260201_090000"]
+    records = common.list_run_records(year=2026, month=1, mode="amazon_download")
+    assert [(path.name, meta["status"]) for path, meta in records] == [("run_20260102_090000.json", "failed")]
+    assert common.running_mode_for_ym(2026, 2) == "rakuten_download"
+    assert common.running_mode_for_ym(2026, 1) is None
+
+    # Running entries are re-read, so an in-place finish by another writer is seen.
+    running_path = runs / "run_20260201_090000.json"
+    running_path.write_text(
+        json.dumps(_meta("run_20260201_090000", "success", "2026-02-01T09:00:00", 2, "rakuten_download")),
+        encoding="utf-8",
+    )
+    assert common.list_run_jobs(status="running") == []
+    assert common.running_mode_for_ym(2026, 2) is None
+
+    # Writers update finished entries through write_run_meta.
+    cancelled = _meta("run_20260101_090000", "cancelled", "2026-01-01T09:00:00", 1, "preflight")
+    common.write_run_meta(runs / "run_20260101_090000.json", cancelled)
+    assert [job["run_id"] for job in common.list_run_jobs(status="cancelled")] == ["run_20260101_090000"]
+
+    # New and deleted files are picked up from the directory listing.
+    (runs / "run_20260102_090000.json").unlink()
+    common.write_run_meta(
+        runs / "run_20260301_090000.json",
+        _meta("run_20260301_090000", "running", "2026-03-01T09:00:00", 3, "mf_reconcile"),
+    )
+    assert [job["run_id"] for job in common.list_run_jobs()] == [
+        "run_20260301_090000",
+        "run_20260201_090000",
+        "run_20260101_090000",
+    ]
+    assert common.running_mode_for_ym(2026, 3) == "mf_reconcile"
+    assert common.rebuild_run_index() == 3
+
+
 def test_common_archive_helpers(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setenv("AX_HOME", str(tmp_path))
     ym = "2026-01"
@@ -269,3 +330,397 @@ def test_common_archive_helpers(monkeypatch, tmp_path: Path) -> None:
     )
     assert archived["snapshot_count"] == 1
     assert archived["receipt_count"] == 1
+
+
+def test_common_archive_month_outputs_dedupes_and_skips_unchanged(monkeypatch, tmp_path: Path) -> None:
+    import zipfile
+
+    monkeypatch.setenv("AX_HOME", str(tmp_path))
+    artifact_root = tmp_path / "artifacts" / "mfcloud-expense-receipt-reconcile"
+    pdf_bytes = b"%PDF-1.4\nshared receipt\n"
+    for ym in ("2026-01", "2026-02"):
+        pdf = artifact_root / ym / "amazon" / "pdfs" / "A-1.pdf"
+        pdf.parent.mkdir(parents=True, exist_ok=True)
+        pdf.write_bytes(pdf_bytes)
+        (artifact_root / ym / "reports").mkdir(parents=True, exist_ok=True)
+        (artifact_root / ym / "reports" / "note.txt").write_text(ym, encoding="utf-8")
+    runs_root = artifact_root / "_runs"
+    runs_root.mkdir(parents=True, exist_ok=True)
+    (runs_root / "run_20260201_000000.json").write_text(
+        json.dumps({"params": {"year": 2026, "month": 1}}), encoding="utf-8"
+    )
+    (runs_root / "run_20260201_000000.log").write_text("log", encoding="utf-8")
+    (runs_root / "run_20260301_000000.json").write_text(
+        json.dumps({"params": {"year": 2026, "month": 2}}), encoding="utf-8"
+    )
+
+    first = common.archive_month_outputs(artifact_root / "2026-01", cleanup=False)
+    second = common.archive_month_outputs(artifact_root / "2026-02", cleanup=False)
+    jan_pdf = Path(first["archived_to"]) / "amazon" / "pdfs" / "A-1.pdf"
+    feb_pdf = Path(second["archived_to"]) / "amazon" / "pdfs" / "A-1.pdf"
+    assert jan_pdf.read_bytes() == pdf_bytes
+    assert second["deduplicated_files"] >= 1
+    assert jan_pdf.stat().st_ino == feb_pdf.stat().st_ino
+
+    manifest = json.loads(Path(first["archive_manifest"]).read_text(encoding="utf-8"))
+    assert manifest["ym"] == "2026-01"
+    assert manifest["runs"]["meta_files"] == 1
+    assert manifest["runs"]["log_files"] == 1
+    assert manifest["files_total"] == 4
+    assert sorted(item["path"] for item in manifest["files"]) == [
+        "amazon/pdfs/A-1.pdf",
+        "reports/note.txt",
+        "runs/run_20260201_000000.json",
+        "runs/run_20260201_000000.log",
+    ]
+    with zipfile.ZipFile(first["archive_zip"]) as archive:
+        assert archive.read("amazon/pdfs/A-1.pdf") == pdf_bytes
+    checksum_rows = Path(first["archive_checksums"]).read_text(encoding="utf-8").splitlines()
+    assert {row.split("  ", 1)[1] for row in checksum_rows} >= {"amazon/pdfs/A-1.pdf", "manifest.json", "full_snapshot.zip"}
+
+    again = common.archive_month_outputs(artifact_root / "2026-01", cleanup=False)
+    assert again["hashed_files"] == 0
+    assert again["archived_to"] != first["archived_to"]
+    (artifact_root / "2026-01" / "reports" / "note.txt").write_text("changed", encoding="utf-8")
+    changed = common.archive_month_outputs(artifact_root / "2026-01", cleanup=False)
+    assert changed["hashed_files"] == 1
+
+
+def test_common_audit_log_seals_time_bounded_segments(monkeypatch, tmp_path: Path) -> None:
+    import audit_segment_common
+    import run_registry_common
+    from datetime import datetime
+
+    monkeypatch.setenv("AX_HOME", str(tmp_path))
+    monkeypatch.setattr(audit_segment_common, "AUDIT_SEGMENT_MIN_BYTES", 1)
+    ym = "2026-01"
+    audit_path = tmp_path / "artifacts" / "mfcloud-expense-receipt-reconcile" / ym / "reports" / "audit_log.jsonl"
+
+    def _append(now: datetime, event_type: str, action: str, details: dict | None = None) -> None:
+        run_registry_common.append_audit_event(
+            path=audit_path,
+            year=2026,
+            month=1,
+            event_type=event_type,
+            action=action,
+            status="success",
+            details=details,
+            now=lambda: now,
+        )
+
+    _append(datetime(2026, 1, 30, 9, 0, 0), "archive", "manual_archive", {"archived_to": "first"})
+    _append(datetime(2026, 1, 30, 18, 0, 0), "run", "preflight")
+    assert audit_segment_common.list_audit_segments(audit_path) == []
+
+    # The first append on a new day seals the previous day's events.
+    _append(datetime(2026, 1, 31, 8, 0, 0), "archive", "month_close", {"archived_to": "second"})
+    segments = audit_segment_common.list_audit_segments(audit_path)
+    assert [segment.name for segment in segments] == ["audit_log.20260130T090000_20260130T180000.jsonl"]
+    rollups, active_rows = common.read_audit_log(audit_path)
+    assert rollups[0]["rows"] == 2
+    assert rollups[0]["event_types"]["archive"]["by_status"] == {"success": 1}
+    assert [row["action"] for row in active_rows] == ["month_close"]
+
+    history = common.scan_archive_history(
+        ym_matcher=lambda name: bool(re.match(r"^\d{4}-\d{2}$", str(name))),
+        archive_action_label=lambda action: action,
+        limit=10,
+    )
+    assert [row["archived_to"] for row in history] == ["second", "first"]
+    assert [row["action"] for row in common.iter_audit_event_rows(audit_path, "archive")] == [
+        "manual_archive",
+        "month_close",
+    ]
+
+
+def test_audit_log_seal_lost_to_another_process_is_not_an_error(monkeypatch, tmp_path: Path) -> None:
+    import audit_segment_common
+    import run_registry_common
+    from datetime import datetime
+
+    monkeypatch.setattr(audit_segment_common, "AUDIT_SEGMENT_MIN_BYTES", 1)
+    audit_path = tmp_path / "reports" / "audit_log.jsonl"
+    audit_path.parent.mkdir(parents=True)
+    audit_path.write_text('{"ts":"2026-01-30T09:00:00","event_type":"run"}\n', encoding="utf-8")
+
+    real_replace = audit_segment_common.os.replace
+
+    def _replace_after_rival_seal(src, dst):
+        # Another process moves the active log away between the check and our move.
+        if Path(src) == audit_path and ".sealing-" in Path(dst).name:
+            real_replace(src, audit_path.with_name("rival.jsonl"))
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(audit_segment_common.os, "replace", _replace_after_rival_seal)
+    assert audit_segment_common.seal_audit_log(audit_path) is None
+
+    audit_path.write_text('{"ts":"2026-01-30T09:00:00","event_type":"run"}\n', encoding="utf-8")
+    run_registry_common.append_audit_event(
+        path=audit_path,
+        year=2026,
+        month=1,
+        event_type="run",
+        action="preflight",
+        status="success",
+        now=lambda: datetime(2026, 1, 31, 8, 0, 0),
+    )
+    assert audit_segment_common.list_audit_segments(audit_path) == []
+    assert [row["action"] for row in audit_segment_common.iter_audit_rows(audit_path)] == ["preflight"]
+
+
+def test_common_state_store_migrates_json_and_keeps_snapshot(monkeypatch, tmp_path: Path) -> None:
+    import state_store_common
+
+    monkeypatch.setenv("AX_HOME", str(tmp_path))
+    monkeypatch.setenv(state_store_common.STATE_STORE_SNAPSHOT_ENV, "1")
+    source = common.artifact_root() / "_workflow_events" / "retry_jobs.json"
+    source.parent.mkdir(parents=True, exist_ok=True)
+    source.write_text(json.dumps({"jobs": {"t:a": {"template_id": "t", "status": "pending"}}}), encoding="utf-8")
+
+    def _load(raw):
+        jobs = raw.get("jobs") if isinstance(raw, dict) else {}
+        return {"workflow_event_retry_jobs": dict(jobs or {})}
+
+    def _read() -> dict:
+        return common.read_state_collections(
+            ("workflow_event_retry_jobs",), source=source, load_source=_load
+        )["workflow_event_retry_jobs"]
+
+    assert _read() == {"t:a": {"template_id": "t", "status": "pending"}}
+    assert common.state_store_path().exists()
+
+    jobs = {"t:a": {"template_id": "t", "status": "pending"}, "t:b": {"template_id": "t", "status": "running"}}
+    changed = common.write_state_collections(
+        {"workflow_event_retry_jobs": jobs}, source=source, snapshot={"jobs": jobs}
+    )
+    assert changed == 1
+    assert json.loads(source.read_text(encoding="utf-8")) == {"jobs": jobs}
+    assert _read() == jobs
+
+    # Hand edits to the legacy file are imported on the next read.
+    source.write_text(json.dumps({"jobs": {"t:c": {"template_id": "t", "status": "failed"}}}), encoding="utf-8")
+    assert _read() == {"t:c": {"template_id": "t", "status": "failed"}}
+
+    result = state_store_common.benchmark_state_store(tmp_path / "bench", writers=3, updates_per_writer=20, keys=10)
+    assert result["updates"] == 60
+    assert result["json_snapshot"] is True
+    assert result["state_store_updates_per_second"] > 0
+    rows = state_store_common.read_state_collections(
+        db_path=tmp_path / "bench" / state_store_common.STATE_STORE_FILENAME,
+        collections=("workflow_event_retry_jobs",),
+        read_json=common.read_json,
+        load_source=_load,
+    )["workflow_event_retry_jobs"]
+    assert len(rows) == 10
+    assert all(row["status"] == "running" for row in rows.values())
+    assert json.loads((tmp_path / "bench" / "retry_jobs.json").read_text(encoding="utf-8"))["jobs"] == rows
+
+
+def test_common_state_store_writes_touched_rows_only_without_snapshot(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AX_HOME", str(tmp_path))
+    monkeypatch.delenv("AX_STATE_STORE_JSON_SNAPSHOT", raising=False)
+    source = common.artifact_root() / "_workflow_events" / "retry_jobs.json"
+    source.parent.mkdir(parents=True, exist_ok=True)
+    seed = {f"t:{index}": {"status": "pending", "updated_at": f"2026-01-0{index}"} for index in range(1, 6)}
+    source.write_text(json.dumps({"jobs": seed}), encoding="utf-8")
+    legacy = source.read_bytes()
+
+    def _load(raw):
+        jobs = raw.get("jobs") if isinstance(raw, dict) else {}
+        return {"workflow_event_retry_jobs": dict(jobs or {})}
+
+    def _read() -> dict:
+        return common.read_state_collections(
+            ("workflow_event_retry_jobs",), source=source, load_source=_load
+        )["workflow_event_retry_jobs"]
+
+    assert _read() == seed
+
+    def _mutate(collections):
+        jobs = collections["workflow_event_retry_jobs"]
+        jobs["t:1"]["status"] = "running"
+        del jobs["t:2"]
+        jobs.setdefault("t:9", {"status": "pending", "updated_at": "2026-01-09"})
+        assert "t:missing" not in jobs
+        assert sorted(jobs.touched_keys()) == ["t:1", "t:9"]
+        oldest = jobs.select_keys("status = ?", ("pending",), order_by="updated_at", limit=1)
+        return oldest, len(jobs)
+
+    oldest, count = common.update_state_collections(
+        ("workflow_event_retry_jobs",),
+        _mutate,
+        source=source,
+        load_source=_load,
+        snapshot=lambda collections: {"jobs": collections["workflow_event_retry_jobs"]},
+    )
+    assert (oldest, count) == (["t:3"], 5)
+    rows = _read()
+    assert rows["t:1"]["status"] == "running"
+    assert "t:2" not in rows and "t:9" in rows
+    # The legacy file is only the migration source now: not rewritten, and a
+    # stale copy of it is not imported over newer rows.
+    assert source.read_bytes() == legacy
+    source.write_text(json.dumps({"jobs": {"t:1": {"status": "failed"}}}), encoding="utf-8")
+    assert _read() == rows
+
+
+def test_common_state_store_concurrent_writers_keep_each_others_rows(monkeypatch, tmp_path: Path) -> None:
+    import threading
+
+    monkeypatch.setenv("AX_HOME", str(tmp_path))
+    monkeypatch.setenv("AX_STATE_STORE_JSON_SNAPSHOT", "1")
+    source = common.artifact_root() / "_workflow_events" / "retry_jobs.json"
+
+    def _load(raw):
+        jobs = raw.get("jobs") if isinstance(raw, dict) else {}
+        return {"workflow_event_retry_jobs": dict(jobs or {})}
+
+    def _snapshot(collections):
+        return {"jobs": collections["workflow_event_retry_jobs"]}
+
+    def _writer(name: str) -> None:
+        for index in range(40):
+            common.update_state_collections(
+                ("workflow_event_retry_jobs",),
+                lambda c, key=f"{name}:{index:03d}": c["workflow_event_retry_jobs"].update({key: {"status": "pending"}}),
+                source=source,
+                load_source=_load,
+                snapshot=_snapshot,
+            )
+
+    threads = [threading.Thread(target=_writer, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    rows = common.read_state_collections(("workflow_event_retry_jobs",), source=source, load_source=_load)
+    assert len(rows["workflow_event_retry_jobs"]) == 80
+    assert len(json.loads(source.read_text(encoding="utf-8"))["jobs"]) == 80
+
+    # A writer working from an older read deletes only the key it removed itself.
+    base = common.read_state_collections(("workflow_event_retry_jobs",), source=source, load_source=_load)
+    common.update_state_collections(
+        ("workflow_event_retry_jobs",),
+        lambda c: c["workflow_event_retry_jobs"].update({"c:new": {"status": "pending"}}),
+        source=source,
+        load_source=_load,
+        snapshot=_snapshot,
+    )
+    stale = {key: row for key, row in base["workflow_event_retry_jobs"].items() if key != "a:000"}
+    common.write_state_collections(
+        {"workflow_event_retry_jobs": stale}, base=base, source=source, snapshot=_snapshot
+    )
+    final = common.read_state_collections(("workflow_event_retry_jobs",), source=source, load_source=_load)
+    assert "c:new" in final["workflow_event_retry_jobs"]
+    assert "a:000" not in final["workflow_event_retry_jobs"]
+    assert set(json.loads(source.read_text(encoding="utf-8"))["jobs"]) == set(final["workflow_event_retry_jobs"])
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_common_write_json_keeps_file_mode(tmp_path: Path) -> None:
+    import stat
+
+    import skill_runtime_common
+
+    # New files get what open() would create; replaced files keep their mode (mkstemp alone gives 0600).
+    fresh = tmp_path / "fresh.json"
+    skill_runtime_common.write_json(fresh, {"a": 1})
+    assert stat.S_IMODE(fresh.stat().st_mode) == 0o666 & ~skill_runtime_common._UMASK
+
+    shared = tmp_path / "shared.json"
+    shared.write_text("{}", encoding="utf-8")
+    os.chmod(shared, 0o644)
+    skill_runtime_common.write_json(shared, {"a": 2}, durable=False)
+    assert stat.S_IMODE(shared.stat().st_mode) == 0o644
+    assert json.loads(shared.read_text(encoding="utf-8")) == {"a": 2}
+
+
+def test_common_write_json_is_atomic_under_concurrent_readers(tmp_path: Path) -> None:
+    import threading
+
+    import skill_runtime_common
+
+    path = tmp_path / "state" / "doc.json"
+    common.write_json(path, {"writer": -1, "rows": []})
+    stop = threading.Event()
+    errors: list[str] = []
+    reads = [0]
+
+    def reader() -> None:
+        while not stop.is_set():
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:  # pragma: no cover - failure path
+                errors.append(repr(exc))
+                return
+            if len(payload["rows"]) != (0 if payload["writer"] == -1 else 200):  # pragma: no cover
+                errors.append(f"partial rows: {len(payload['rows'])}")
+                return
+            reads[0] += 1
+
+    def writer(index: int) -> None:
+        for step in range(30):
+            rows = [{"writer": index, "step": step, "i": i} for i in range(200)]
+            skill_runtime_common.write_json(path, {"writer": index, "rows": rows}, compact=bool(step % 2), durable=False)
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    writers = [threading.Thread(target=writer, args=(index,)) for index in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert reads[0] > 0
+    assert json.loads(path.read_text(encoding="utf-8"))["writer"] in range(4)
+    assert sorted(p.name for p in path.parent.iterdir()) == ["doc.json"]
+
+    counter = tmp_path / "state" / "counter.json"
+    common.write_json(counter, {"n": 0})
+
+    def increment() -> None:
+        for _ in range(25):
+            with skill_runtime_common.locked_path(counter):
+                value = json.loads(counter.read_text(encoding="utf-8"))["n"]
+                common.write_json(counter, {"n": value + 1})
+
+    workers = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    assert json.loads(counter.read_text(encoding="utf-8")) == {"n": 100}
+
+
+def test_tail_reader_matches_full_read_reference(tmp_path: Path) -> None:
+    import random
+
+    import tail_reader_common
+
+    rng = random.Random(7)
+    words = ["alpha", "é", "日本語", "\r\n", "\n", "\n", " ", "x" * 40]
+    path = tmp_path / "run.log"
+    path.write_text("".join(rng.choice(words) for _ in range(4000)), encoding="utf-8", newline="")
+    raw = path.read_bytes()
+    text = raw.decode("utf-8")
+
+    for max_lines in (0, 1, 3, 50, 10_000):
+        expected = text.splitlines()[-max_lines:] if max_lines else text.splitlines()
+        assert tail_reader_common.tail_lines(path, max_lines=max_lines) == expected
+        for block_size in (1, 7, 64):
+            data = tail_reader_common.tail_bytes(path, max_lines=max_lines, block_size=block_size)
+            lines = data.decode("utf-8").splitlines()
+            assert (lines[-max_lines:] if max_lines else lines) == expected
+
+    for max_bytes in (1, 2, 3, 100, len(raw), len(raw) + 10):
+        got = tail_reader_common.tail_text(path, max_bytes=max_bytes)
+        assert raw.endswith(got.encode("utf-8"))
+        # Starts at most three bytes after the cut, on a character boundary.
+        skipped = len(raw) - len(got.encode("utf-8")) - max(0, len(raw) - max_bytes)
+        assert 0 <= skipped <= 3
+    assert tail_reader_common.tail_text(path) == text
+    assert common.tail_text(tmp_path / "missing.log") == ""
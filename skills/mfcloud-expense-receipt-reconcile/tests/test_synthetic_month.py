@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from bench_skill import compare_results, run_benchmarks
+from synthetic_month import MonthSizes, generate_months
+
+TINY = MonthSizes(amazon_orders=12, rakuten_orders=6, manual_orders=3, mf_expenses=20, runs=4, audit_events=10)
+
+
+def _tree_digest(root: Path) -> dict[str, str]:
+    return {
+        str(path.relative_to(root)): hashlib.sha1(path.read_bytes()).hexdigest()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_generate_months_is_deterministic_and_reconciles(tmp_path: Path) -> None:
+    first = generate_months(tmp_path, end=(2026, 1), months=2, sizes=TINY, seed=7)
+    digest = _tree_digest(tmp_path)
+    generate_months(tmp_path, end=(2026, 1), months=2, sizes=TINY, seed=7)
+
+    assert _tree_digest(tmp_path) == digest
+    assert [row["ym"] for row in first["months"]] == ["2025-12", "2026-01"]
+    month_root = Path(first["months"][-1]["root"])
+    report = json.loads((month_root / "reports" / "missing_evidence_candidates.json").read_text(encoding="utf-8"))
+    assert report["counts"]["mf_expenses_total"] == TINY.mf_expenses
+    assert report["counts"]["matched_expenses"] > 0
+    assert any(row["row_type"] == "candidate" for row in report["rows"])
+    pdfs = sorted((month_root / "rakuten" / "pdfs").glob("*.pdf"))
+    assert len(pdfs) == TINY.rakuten_orders
+    assert pdfs[0].read_bytes().startswith(b"%PDF-1.4") and b"Order ID:" in pdfs[0].read_bytes()
+    assert len(list((tmp_path / "artifacts" / "mfcloud-expense-receipt-reconcile" / "_runs").glob("run_*.json"))) == 8
+
+
+def test_run_benchmarks_times_service_cases_and_flags_regressions(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("AX_HOME", str(tmp_path))
+    generate_months(tmp_path, end=(2026, 1), months=1, sizes=TINY, seed=1)
+
+    bench = run_benchmarks(tmp_path, repeat=1, dashboard=False)
+
+    assert bench["ym"] == "2026-01"
+    assert set(bench["results"]) == {"reconcile", "scan_artifacts", "collect_orders", "list_run_jobs", "scan_archive_history"}
+    baseline = {"results": {"reconcile": {"best_seconds": 0.010}, "list_run_jobs": {"best_seconds": 0.010}}}
+    current = {"results": {"reconcile": {"best_seconds": 0.020}, "list_run_jobs": {"best_seconds": 0.0105}}}
+    regressions = compare_results(current, baseline, tolerance=0.25)
+    assert [row["case"] for row in regressions] == ["reconcile"]
+    assert regressions[0]["ratio"] == 2.0
+
+
+def test_run_benchmarks_handles_month_without_optional_order_files(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("AX_HOME", str(tmp_path))
+    summary = generate_months(tmp_path, end=(2026, 1), months=1, sizes=TINY, seed=3)
+    month_root = Path(summary["months"][-1]["root"])
+    for relative in ("rakuten/orders.jsonl", "manual/orders.jsonl", "reports/exclude_orders.json"):
+        (month_root / relative).unlink(missing_ok=True)
+
+    bench = run_benchmarks(tmp_path, repeat=1, dashboard=False)
+
+    assert bench["results"]["reconcile"]["runs"] == 1
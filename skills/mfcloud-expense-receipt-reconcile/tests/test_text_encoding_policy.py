@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import codecs
+import json
 import os
 import re
 import subprocess
 import shutil
+import sys
 from pathlib import Path
 
 import pytest
@@ -175,3 +177,50 @@ def test_powershell_scripts_do_not_use_utf8_encoding_alias() -> None:
                 )
 
     assert not findings, f"powershell encoding policy violations found: {findings}"
+
+
+def _run_encoding_check(cwd: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, str(REPO_ROOT / "scripts" / "check_text_encoding.py"), "--scope", "tracked", *args],
+        cwd=cwd,
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_check_text_encoding_cache_skips_clean_blobs_but_not_dirty_files(tmp_path: Path) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not available")
+    repo = tmp_path / "repo"
+    subdir = repo / "skills" / "demo"
+    subdir.mkdir(parents=True)
+    (repo / "README.md").write_text("# root\n", encoding="utf-8")
+    skill_md = subdir / "SKILL.md"
+    skill_md.write_text("# demo\n", encoding="utf-8")
+    for args in (
+        ["init", "-q"],
+        ["add", "-A"],
+        ["-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init"],
+    ):
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    first = _run_encoding_check(repo)
+    assert first.returncode == 0, first.stdout
+    cache = repo / ".git" / "text-encoding-check-cache.json"
+    assert len(json.loads(cache.read_text(encoding="utf-8"))["clean"]) == 2
+    # Every file is a cached clean blob now, so nothing is checked and the cache is not rewritten.
+    cached_at = cache.stat().st_mtime_ns
+    assert _run_encoding_check(subdir).returncode == 0
+    assert cache.stat().st_mtime_ns == cached_at
+
+    # A cached "clean" verdict must not hide an unstaged edit, from the root or a subdirectory.
+    skill_md.write_bytes(codecs.BOM_UTF8 + b"# demo\n")
+    for cwd in (subdir, repo):
+        proc = _run_encoding_check(cwd)
+        assert proc.returncode == 1, (cwd, proc.stdout)
+        assert "BOM detected" in proc.stdout
+
+    skill_md.write_text("# demo\n", encoding="utf-8")
+    assert _run_encoding_check(subdir).returncode == 0
+    assert _run_encoding_check(subdir, "--no-cache").returncode == 0
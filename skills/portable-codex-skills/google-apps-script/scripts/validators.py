@@ -9,11 +9,23 @@ Based on Google Apps Script API specifications and best practices.
 """
 
 from typing import Any, List, Tuple, Optional, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import re
+import time
 from datetime import datetime
 
 
+# Pre-compiled patterns shared by the per-call and batch validators
+A1_NOTATION_RE = re.compile(r"^(?:'?[\w\s]+'?!)?[A-Z]+\d+(?::[A-Z]+\d+)?$")
+A1_PARSE_RE = re.compile(r"^(?:(?P<sheet>'?[\w\s]+'?)!)?(?P<start>[A-Z]+\d+)(?::(?P<end>[A-Z]+\d+))?$")
+A1_BOUNDS_RE = re.compile(r"^(?:('?[\w\s]+'?)!)?([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?$")
+CELL_REF_RE = re.compile(r"^(?P<col>[A-Z]+)(?P<row>\d+)$")
+SPREADSHEET_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{44}$')
+SHEET_NAME_INVALID_RE = re.compile(r'[\[\]\*\?:/\\]')
+_NUMERIC_CELL_TYPES = frozenset({int, float, bool})
+
+
 @dataclass
 class ValidationResult:
     """Result of a validation check"""
@@ -26,6 +38,17 @@ class ValidationResult:
             self.warnings = []
 
 
+@dataclass
+class BatchValidationResult:
+    """Result of a batch validation run"""
+    is_valid: bool
+    results: List[ValidationResult]
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    overlaps: List[Tuple[int, int]] = field(default_factory=list)
+    total_cells: int = 0
+
+
 class GoogleAppsScriptValidators:
     """Comprehensive validation for Google Apps Script operations"""
 
@@ -33,6 +56,7 @@ class GoogleAppsScriptValidators:
     MAX_ROWS = 1000000  # 1 million rows
     MAX_COLS = 18278    # Maximum columns (ZZZ in A1 notation)
     MAX_CELL_CHARS = 50000  # Maximum characters per cell
+    MAX_SPREADSHEET_CELLS = 10000000  # Maximum cells per spreadsheet
 
     @staticmethod
     def is_valid_spreadsheet_id(sheet_id: str) -> Tuple[bool, Optional[str]]:
@@ -53,7 +77,7 @@ class GoogleAppsScriptValidators:
         if len(sheet_id) != 44:
             return False, f"Spreadsheet ID must be 44 characters (got {len(sheet_id)})"
 
-        if not re.match(r'^[a-zA-Z0-9_-]{44}$', sheet_id):
+        if not SPREADSHEET_ID_RE.match(sheet_id):
             return False, "Spreadsheet ID contains invalid characters"
 
         return True, None
@@ -78,11 +102,8 @@ class GoogleAppsScriptValidators:
         if not notation or not isinstance(notation, str):
             return False, "A1 notation must be a non-empty string"
 
-        # Pattern for A1 notation
         # Supports: A1, A1:B10, Sheet1!A1, 'Sheet Name'!A1:B10
-        pattern = r"^(?:'?[\w\s]+'?!)?[A-Z]+\d+(?::[A-Z]+\d+)?$"
-
-        if not re.match(pattern, notation):
+        if not A1_NOTATION_RE.match(notation):
             return False, f"Invalid A1 notation: {notation}"
 
         return True, None
@@ -155,8 +176,7 @@ class GoogleAppsScriptValidators:
             return False, f"Sheet name must be ≤100 characters (got {len(name)})"
 
         # Sheet names cannot contain: [ ] * ? : / \
-        invalid_chars = r'[\[\]\*\?:/\\]'
-        if re.search(invalid_chars, name):
+        if SHEET_NAME_INVALID_RE.search(name):
             return False, "Sheet name contains invalid characters: [ ] * ? : / \\"
 
         return True, None
@@ -172,24 +192,122 @@ class GoogleAppsScriptValidators:
         Returns:
             ValidationResult with is_valid and errors
         """
-        errors = []
+        errors = cls._operation_errors(operation)
         warnings = []
 
+        return ValidationResult(
+            is_valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings
+        )
+
+    @classmethod
+    def validate_spreadsheet_operations(
+        cls,
+        operations: List[Dict[str, Any]],
+        max_total_cells: Optional[int] = None,
+    ) -> BatchValidationResult:
+        """
+        Validate a batch of spreadsheet operation payloads.
+
+        Each operation gets the same checks as validate_spreadsheet_operation(),
+        but A1 parsing and column conversions are memoized across the batch.
+        On top of the per-operation checks, the batch is checked for
+        overlapping target ranges (reported as warnings on both operations)
+        and for the total cell count against the spreadsheet cell limit.
+
+        Args:
+            operations: List of operation dictionaries
+            max_total_cells: Cell budget for the whole batch
+                (defaults to MAX_SPREADSHEET_CELLS)
+
+        Returns:
+            BatchValidationResult with per-operation results in input order
+        """
+        budget = cls.MAX_SPREADSHEET_CELLS if max_total_cells is None else max_total_cells
+        results: List[ValidationResult] = []
+        batch_errors: List[str] = []
+        batch_warnings: List[str] = []
+        bounds_by_sheet: Dict[Optional[str], List[Tuple[int, int, int, int, int]]] = {}
+        total_cells = 0
+
+        for index, operation in enumerate(operations):
+            if not isinstance(operation, dict):
+                results.append(ValidationResult(is_valid=False, errors=["Operation must be a dictionary"]))
+                continue
+
+            errors = cls._operation_errors(operation, memoized=True)
+            results.append(ValidationResult(is_valid=len(errors) == 0, errors=errors))
+
+            notation = operation.get('range_notation')
+            bounds = _cached_range_bounds(notation) if isinstance(notation, str) else None
+            if bounds is not None:
+                sheet, start_row, start_col, end_row, end_col = bounds
+                if sheet is None:
+                    sheet = operation.get('sheet_name') if isinstance(operation.get('sheet_name'), str) else None
+                bounds_by_sheet.setdefault(sheet, []).append((start_row, end_row, start_col, end_col, index))
+                total_cells += (end_row - start_row + 1) * (end_col - start_col + 1)
+            else:
+                values = operation.get('values')
+                if isinstance(values, list) and values:
+                    total_cells += len(values) * max(
+                        (len(row) for row in values if isinstance(row, list)), default=0
+                    )
+
+        overlaps = []
+        for sheet_bounds in bounds_by_sheet.values():
+            overlaps.extend(_find_overlaps(sheet_bounds))
+        overlaps.sort()
+        for first, second in overlaps:
+            results[first].warnings.append(f"Range overlaps operation {second}")
+            results[second].warnings.append(f"Range overlaps operation {first}")
+        if overlaps:
+            batch_warnings.append(f"{len(overlaps)} overlapping range pair(s) in batch")
+
+        if total_cells > budget:
+            batch_errors.append(f"Batch writes {total_cells} cells, exceeding the {budget} cell budget")
+
+        return BatchValidationResult(
+            is_valid=not batch_errors and all(result.is_valid for result in results),
+            results=results,
+            errors=batch_errors,
+            warnings=batch_warnings,
+            overlaps=overlaps,
+            total_cells=total_cells,
+        )
+
+    @classmethod
+    def _operation_errors(cls, operation: Dict[str, Any], memoized: bool = False) -> List[str]:
+        """Collect field-level errors for a single operation payload."""
+        errors = []
+
         # Validate spreadsheet ID
         if 'spreadsheet_id' in operation:
-            is_valid, error = cls.is_valid_spreadsheet_id(operation['spreadsheet_id'])
+            value = operation['spreadsheet_id']
+            if memoized and isinstance(value, str):
+                is_valid, error = _cached_spreadsheet_id_check(value)
+            else:
+                is_valid, error = cls.is_valid_spreadsheet_id(value)
             if not is_valid:
                 errors.append(error)
 
         # Validate sheet name
         if 'sheet_name' in operation:
-            is_valid, error = cls.is_valid_sheet_name(operation['sheet_name'])
+            value = operation['sheet_name']
+            if memoized and isinstance(value, str):
+                is_valid, error = _cached_sheet_name_check(value)
+            else:
+                is_valid, error = cls.is_valid_sheet_name(value)
             if not is_valid:
                 errors.append(error)
 
         # Validate range notation
         if 'range_notation' in operation:
-            is_valid, error = cls.is_valid_a1_notation(operation['range_notation'])
+            value = operation['range_notation']
+            if memoized and isinstance(value, str):
+                is_valid, error = _cached_a1_check(value)
+            else:
+                is_valid, error = cls.is_valid_a1_notation(value)
             if not is_valid:
                 errors.append(error)
 
@@ -205,6 +323,12 @@ class GoogleAppsScriptValidators:
                         continue
 
                     for col_idx, cell in enumerate(row):
+                        # Fast path for the common primitive types
+                        cell_type = type(cell)
+                        if cell is None or cell_type in _NUMERIC_CELL_TYPES:
+                            continue
+                        if cell_type is str and len(cell) <= cls.MAX_CELL_CHARS:
+                            continue
                         is_valid, error = cls.is_valid_cell_value(cell)
                         if not is_valid:
                             errors.append(f"Cell [{row_idx}][{col_idx}]: {error}")
@@ -217,11 +341,7 @@ class GoogleAppsScriptValidators:
                     if not is_valid:
                         errors.append(error)
 
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings
-        )
+        return errors
 
     @staticmethod
     def is_valid_email(email: str) -> Tuple[bool, Optional[str]]:
@@ -277,8 +397,7 @@ class GoogleAppsScriptValidators:
             Dictionary with parsed components or None if invalid
         """
         # Match pattern: [Sheet!]A1[:B10]
-        pattern = r"^(?:(?P<sheet>'?[\w\s]+'?)!)?(?P<start>[A-Z]+\d+)(?::(?P<end>[A-Z]+\d+))?$"
-        match = re.match(pattern, notation)
+        match = A1_PARSE_RE.match(notation)
 
         if not match:
             return None
@@ -327,6 +446,96 @@ class GoogleAppsScriptValidators:
         return result
 
 
+@lru_cache(maxsize=256)
+def _cached_spreadsheet_id_check(sheet_id: str) -> Tuple[bool, Optional[str]]:
+    return GoogleAppsScriptValidators.is_valid_spreadsheet_id(sheet_id)
+
+
+@lru_cache(maxsize=1024)
+def _cached_sheet_name_check(name: str) -> Tuple[bool, Optional[str]]:
+    return GoogleAppsScriptValidators.is_valid_sheet_name(name)
+
+
+@lru_cache(maxsize=4096)
+def _cached_a1_check(notation: str) -> Tuple[bool, Optional[str]]:
+    return GoogleAppsScriptValidators.is_valid_a1_notation(notation)
+
+
+@lru_cache(maxsize=1024)
+def _cached_column_number(letter: str) -> int:
+    return GoogleAppsScriptValidators.column_letter_to_number(letter)
+
+
+@lru_cache(maxsize=4096)
+def _cached_range_bounds(notation: str) -> Optional[Tuple[Optional[str], int, int, int, int]]:
+    """Parse A1 notation into (sheet, start_row, start_col, end_row, end_col)."""
+    match = A1_BOUNDS_RE.match(notation)
+    if not match:
+        return None
+    sheet, start_col, start_row, end_col, end_row = match.groups()
+    if end_col is None:
+        end_col, end_row = start_col, start_row
+    start_row, end_row = sorted((int(start_row), int(end_row)))
+    start_col, end_col = sorted((_cached_column_number(start_col), _cached_column_number(end_col)))
+    return (sheet.strip("'") if sheet else None), start_row, start_col, end_row, end_col
+
+
+def _find_overlaps(bounds: List[Tuple[int, int, int, int, int]]) -> List[Tuple[int, int]]:
+    """Sweep (start_row, end_row, start_col, end_col, index) boxes and return overlapping index pairs."""
+    overlaps = []
+    active: List[Tuple[int, int, int, int, int]] = []
+    for box in sorted(bounds):
+        start_row = box[0]
+        active = [other for other in active if other[1] >= start_row]
+        for other in active:
+            if box[2] <= other[3] and other[2] <= box[3]:
+                overlaps.append(tuple(sorted((other[4], box[4]))))
+        active.append(box)
+    return overlaps
+
+
+def benchmark_batch_validation(operation_count: int = 5000, distinct_ranges: int = 200) -> Dict[str, float]:
+    """
+    Time the per-call path against validate_spreadsheet_operations().
+
+    Args:
+        operation_count: Number of synthetic operations to validate
+        distinct_ranges: Number of distinct range notations per sheet; the
+            batch is spread over as many sheets as needed so ranges never overlap
+
+    Returns:
+        Dictionary with elapsed seconds for each path and the speedup ratio
+    """
+    operations = [
+        {
+            'spreadsheet_id': '1BxiMVs0XRA5nFMKUVfIZ-QcubIYvWXQfB9IHUZpLMGk',
+            'sheet_name': f"Sheet{i // distinct_ranges + 1}",
+            'range_notation': f"A{(i % distinct_ranges) * 3 + 1}:C{(i % distinct_ranges) * 3 + 2}",
+            'values': [['a', 1, 2.5], ['b', 2, 3.5]],
+        }
+        for i in range(operation_count)
+    ]
+
+    started = time.perf_counter()
+    for operation in operations:
+        GoogleAppsScriptValidators.validate_spreadsheet_operation(operation)
+        notation = GoogleAppsScriptValidators.parse_a1_notation(operation['range_notation'])
+        for cell in (notation['start_cell'], notation['end_cell']):
+            GoogleAppsScriptValidators.column_letter_to_number(CELL_REF_RE.match(cell).group('col'))
+    per_call = time.perf_counter() - started
+
+    started = time.perf_counter()
+    GoogleAppsScriptValidators.validate_spreadsheet_operations(operations)
+    batch = time.perf_counter() - started
+
+    return {
+        'operations': float(operation_count),
+        'per_call_seconds': per_call,
+        'batch_seconds': batch,
+        'speedup': per_call / batch if batch else 0.0,
+    }
+
+
 # Convenience functions
 def validate_spreadsheet_id(sheet_id: str) -> bool:
     """Quick validation for spreadsheet ID"""
@@ -388,6 +597,15 @@ if __name__ == "__main__":
         back_to_letter = validators.column_number_to_letter(number)
         print(f"{letter:5} -> {number:5} -> {back_to_letter}")
 
+    # Test batch validation
+    batch = validators.validate_spreadsheet_operations([
+        {'sheet_name': 'Sheet1', 'range_notation': 'A1:C10'},
+        {'sheet_name': 'Sheet1', 'range_notation': 'B5:D6'},
+        {'sheet_name': 'Sheet2', 'range_notation': 'A1:C10'},
+    ])
+    print(f"\nBatch validation: {'✅ Valid' if batch.is_valid else '❌ Invalid'}")
+    print(f"Overlaps: {batch.overlaps}, total cells: {batch.total_cells}")
+
     # Test email validation
     emails = [
         'user@example.com',
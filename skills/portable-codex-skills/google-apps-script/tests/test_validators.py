@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+import importlib.util
+import random
+import subprocess
+import sys
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "validators.py"
+SHEET_ID = "1BxiMVs0XRA5nFMKUVfIZ-QcubIYvWXQfB9IHUZpLMGk"
+
+
+def _load_module(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"cannot load module: {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+validators = _load_module(SCRIPT_PATH, "gas_validators")
+V = validators.GoogleAppsScriptValidators
+
+
+def test_batch_reports_overlaps_per_sheet_as_warnings() -> None:
+    batch = V.validate_spreadsheet_operations([
+        {"sheet_name": "Sheet1", "range_notation": "A1:C10"},
+        {"sheet_name": "Sheet1", "range_notation": "B5:D6"},
+        {"sheet_name": "Sheet2", "range_notation": "A1:C10"},
+        {"sheet_name": "Sheet1", "range_notation": "D1:E5"},
+        {"range_notation": "Sheet2!C10"},
+    ])
+
+    assert batch.overlaps == [(0, 1), (1, 3), (2, 4)]
+    assert batch.is_valid
+    assert batch.results[0].warnings == ["Range overlaps operation 1"]
+    assert batch.results[1].warnings == ["Range overlaps operation 0", "Range overlaps operation 3"]
+    assert batch.results[4].warnings == ["Range overlaps operation 2"]
+    assert batch.warnings == ["3 overlapping range pair(s) in batch"]
+    assert batch.total_cells == 30 + 6 + 30 + 10 + 1
+
+
+def test_batch_treats_adjacent_and_reversed_ranges_correctly() -> None:
+    batch = V.validate_spreadsheet_operations([
+        {"sheet_name": "Sheet1", "range_notation": "A1:B2"},
+        {"sheet_name": "Sheet1", "range_notation": "C1:D2"},
+        {"sheet_name": "Sheet1", "range_notation": "A3:B4"},
+        {"sheet_name": "Sheet1", "range_notation": "D4:C2"},
+    ])
+
+    assert batch.overlaps == [(1, 3)]
+    assert batch.results[0].warnings == [] and batch.results[2].warnings == []
+    assert batch.total_cells == 4 + 4 + 4 + 6
+
+
+def test_find_overlaps_matches_pairwise_check() -> None:
+    rng = random.Random(7)
+    boxes = []
+    for index in range(300):
+        start_row, start_col = rng.randint(1, 200), rng.randint(1, 30)
+        boxes.append((start_row, start_row + rng.randint(0, 6), start_col, start_col + rng.randint(0, 3), index))
+
+    expected = sorted(
+        (a[4], b[4])
+        for i, a in enumerate(boxes)
+        for b in boxes[i + 1:]
+        if a[0] <= b[1] and b[0] <= a[1] and a[2] <= b[3] and b[2] <= a[3]
+    )
+    assert sorted(validators._find_overlaps(boxes)) == expected
+
+
+def test_batch_enforces_cell_budget_and_rejects_non_dict_operations() -> None:
+    batch = V.validate_spreadsheet_operations(
+        [
+            {"sheet_name": "Sheet1", "range_notation": "A1:B5"},
+            {"values": [["a", "b", "c"], ["d"]]},
+            "not an operation",
+        ],
+        max_total_cells=15,
+    )
+
+    assert batch.total_cells == 10 + 6
+    assert batch.errors == ["Batch writes 16 cells, exceeding the 15 cell budget"]
+    assert batch.results[2].errors == ["Operation must be a dictionary"]
+    assert not batch.is_valid
+    assert V.validate_spreadsheet_operations([{"range_notation": "A1:B8"}], max_total_cells=16).is_valid
+
+
+def test_batch_results_match_single_operation_validation() -> None:
+    operations = [
+        {"spreadsheet_id": SHEET_ID, "sheet_name": "Sheet1", "range_notation": "A1:B2", "values": [[1, "x"], [None, 2.5]]},
+        {"spreadsheet_id": "short", "sheet_name": "Bad:Name", "range_notation": "1A"},
+        {"spreadsheet_id": 123, "sheet_name": None, "range_notation": ["A1"]},
+        {"values": [["x" * (V.MAX_CELL_CHARS + 1)], "row"]},
+        {"values": "not a list"},
+    ]
+    # Run twice so the second pass is served from the memoized helpers.
+    for _ in range(2):
+        batch = V.validate_spreadsheet_operations(operations)
+        for operation, result in zip(operations, batch.results):
+            single = V.validate_spreadsheet_operation(operation)
+            assert (result.is_valid, result.errors) == (single.is_valid, single.errors)
+    assert [result.is_valid for result in batch.results] == [True, False, False, False, False]
+
+
+def test_cached_helpers_agree_with_validators_and_reuse_entries() -> None:
+    validators._cached_a1_check.cache_clear()
+    for notation in ["A1", "Sheet1!A1:C5", "'My Sheet'!B2", "a1", "A1:"]:
+        assert validators._cached_a1_check(notation) == V.is_valid_a1_notation(notation)
+    validators._cached_a1_check("A1")
+    assert validators._cached_a1_check.cache_info().hits == 1
+
+    for letter in ["A", "Z", "AA", "ZZ", "AAA"]:
+        assert validators._cached_column_number(letter) == V.column_letter_to_number(letter)
+    assert validators._cached_spreadsheet_id_check(SHEET_ID) == (True, None)
+    assert validators._cached_sheet_name_check("Bad?") == V.is_valid_sheet_name("Bad?")
+
+    assert validators._cached_range_bounds("'My Sheet'!C3:A1") == ("My Sheet", 1, 1, 3, 3)
+    assert validators._cached_range_bounds("B7") == (None, 7, 2, 7, 2)
+    assert validators._cached_range_bounds("not a range") is None
+
+
+def test_benchmark_batch_validation_reports_both_paths() -> None:
+    report = validators.benchmark_batch_validation(operation_count=50, distinct_ranges=10)
+
+    assert report["operations"] == 50.0
+    assert report["per_call_seconds"] > 0
+    assert report["batch_seconds"] > 0
+    assert report["speedup"] == report["per_call_seconds"] / report["batch_seconds"]
+
+
+def test_usage_demo_does_not_run_the_benchmark() -> None:
+    completed = subprocess.run(
+        [sys.executable, str(SCRIPT_PATH)],
+        text=True,
+        encoding="utf-8",
+        capture_output=True,
+        check=True,
+    )
+    assert "Batch validation" in completed.stdout
+    assert "benchmark" not in completed.stdout